@@ -0,0 +1,75 @@
+"""add assessment rate samples and stats
+
+Revision ID: a5b6c7d8e9f0
+Revises: f4a5b6c7d8e9
+Create Date: 2026-03-09 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'a5b6c7d8e9f0'
+down_revision = 'f4a5b6c7d8e9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 증분 갱신 시 새로 수집된 개찰결과/기초금액 탐색용
+    op.create_index(
+        'ix_bid_opening_results_fetched_at', 'bid_opening_results', ['fetched_at']
+    )
+
+    op.create_table(
+        'assessment_rate_samples',
+        sa.Column('bid_ntce_no', sa.String(length=50), nullable=False),
+        sa.Column('region_scope', sa.String(length=20), nullable=True),
+        sa.Column('license_group', sa.String(length=20), nullable=True),
+        sa.Column('amount_range', sa.String(length=20), nullable=True),
+        sa.Column('basis_amount', sa.BigInteger(), nullable=True),
+        sa.Column('rate', sa.Float(), nullable=True),
+        sa.Column('bidder_count', sa.Integer(), nullable=False),
+        sa.Column('source_fetched_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            'computed_at', sa.DateTime(timezone=True),
+            server_default=sa.text('now()'), nullable=True,
+        ),
+        sa.PrimaryKeyConstraint('bid_ntce_no'),
+    )
+    op.create_index(
+        'ix_assessment_rate_samples_bucket',
+        'assessment_rate_samples',
+        ['region_scope', 'license_group', 'amount_range'],
+    )
+
+    op.create_table(
+        'assessment_rate_stats',
+        sa.Column('region_scope', sa.String(length=20), nullable=False),
+        sa.Column('license_group', sa.String(length=20), nullable=False),
+        sa.Column('amount_range', sa.String(length=20), nullable=False),
+        sa.Column('sample_count', sa.Integer(), nullable=False),
+        sa.Column('mean', sa.Float(), nullable=False),
+        sa.Column('std', sa.Float(), nullable=False),
+        sa.Column('p10', sa.Float(), nullable=False),
+        sa.Column('p25', sa.Float(), nullable=False),
+        sa.Column('p50', sa.Float(), nullable=False),
+        sa.Column('p75', sa.Float(), nullable=False),
+        sa.Column('p90', sa.Float(), nullable=False),
+        sa.Column(
+            'updated_at', sa.DateTime(timezone=True),
+            server_default=sa.text('now()'), nullable=True,
+        ),
+        sa.PrimaryKeyConstraint('region_scope', 'license_group', 'amount_range'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('assessment_rate_stats')
+    op.drop_index(
+        'ix_assessment_rate_samples_bucket', table_name='assessment_rate_samples'
+    )
+    op.drop_table('assessment_rate_samples')
+    op.drop_index(
+        'ix_bid_opening_results_fetched_at', table_name='bid_opening_results'
+    )
@@ -0,0 +1,28 @@
+"""add hourly_notices to data_sync_log for hourly-to-daily compaction
+
+Revision ID: a9b0c1d2e3f4
+Revises: f8a9b0c1d2e3
+Create Date: 2026-02-27 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'a9b0c1d2e3f4'
+down_revision = 'f8a9b0c1d2e3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 압축된 일별 행의 시간별 공고 수 (적응형 주기 학습 이력 보존)
+    op.add_column(
+        'data_sync_log',
+        sa.Column('hourly_notices', postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('data_sync_log', 'hourly_notices')
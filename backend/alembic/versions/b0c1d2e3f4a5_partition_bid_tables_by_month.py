@@ -0,0 +1,309 @@
+"""partition bid_notices and child tables by registration month
+
+Revision ID: b0c1d2e3f4a5
+Revises: a9b0c1d2e3f4
+Create Date: 2026-03-02 10:00:00.000000
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b0c1d2e3f4a5'
+down_revision = 'a9b0c1d2e3f4'
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+# 원본 rgst_dt(String(30), 형식 혼재) → YYYYMM
+RGST_MONTH_EXPR = (
+    "CASE WHEN regexp_replace(coalesce(rgst_dt, ''), '[^0-9]', '', 'g') = '' "
+    "THEN '' ELSE left(rpad(regexp_replace(rgst_dt, '[^0-9]', '', 'g'), 12, '0'), 6) END"
+)
+
+NOTICE_COLUMNS = (
+    "bid_ntce_no, bid_ntce_ord, rgst_dt, openg_dt, bid_close_dt, presmpt_prce, "
+    "main_cnsty_nm, data, content_hash, fetched_at"
+)
+RGN_COLUMNS = (
+    "bid_ntce_no, bid_ntce_ord, lmt_sno, prtcpt_psbl_rgn_nm, rgst_dt, "
+    "bsns_div_nm, fetched_at"
+)
+LIMIT_COLUMNS = (
+    "bid_ntce_no, bid_ntce_ord, lmt_grp_no, lmt_sno, lcns_lmt_nm, "
+    "permsn_indstryty_list, bsns_div_nm, rgst_dt, indstryty_mfrc_fld_list, "
+    "fetched_at"
+)
+
+
+def _add_months(month: str, n: int) -> str:
+    index = int(month[:4]) * 12 + int(month[4:6]) - 1 + n
+    return f"{index // 12:04d}{index % 12 + 1:02d}"
+
+
+def _month_range(key_expr: str, table: str) -> list:
+    """기존 데이터의 최소 월부터 현재 + MONTHS_AHEAD개월까지."""
+    current = datetime.now().strftime("%Y%m")
+    first = op.get_bind().execute(
+        sa.text(
+            f"SELECT min(left({key_expr}, 6)) FROM {table} "
+            f"WHERE {key_expr} ~ '^[0-9]{{6}}'"
+        )
+    ).scalar()
+    first = min(first or current, current)
+    last = _add_months(current, MONTHS_AHEAD)
+    months = []
+    month = first
+    while month <= last:
+        months.append(month)
+        month = _add_months(month, 1)
+    return months
+
+
+def _create_partitions(table: str, months: list) -> None:
+    for month in months:
+        op.execute(
+            f"CREATE TABLE {table}_p{month} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month}') TO ('{_add_months(month, 1)}')"
+        )
+    op.execute(f"CREATE TABLE {table}_pdefault PARTITION OF {table} DEFAULT")
+
+
+def upgrade() -> None:
+    # 1. 기존 테이블을 *_old로 이름 변경 (인덱스 이름 충돌 방지)
+    op.execute("ALTER TABLE bid_notices RENAME TO bid_notices_old")
+    op.execute("ALTER INDEX bid_notices_pkey RENAME TO bid_notices_old_pkey")
+    for name in (
+        'ix_bid_notices_rgst_dt', 'ix_bid_notices_openg_dt',
+        'ix_bid_notices_bid_close_dt', 'ix_bid_notices_presmpt_prce',
+        'ix_bid_notices_cnstrtsite',
+    ):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.execute("ALTER TABLE bid_prtcpt_psbl_rgns RENAME TO bid_prtcpt_psbl_rgns_old")
+    op.execute(
+        "ALTER INDEX bid_prtcpt_psbl_rgns_pkey RENAME TO bid_prtcpt_psbl_rgns_old_pkey"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_bid_prtcpt_psbl_rgns_rgn_nm")
+    op.execute("DROP INDEX IF EXISTS ix_bid_prtcpt_psbl_rgns_bid_ntce")
+
+    op.execute("ALTER TABLE bid_license_limits RENAME TO bid_license_limits_old")
+    op.execute(
+        "ALTER INDEX bid_license_limits_pkey RENAME TO bid_license_limits_old_pkey"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_bid_license_limits_permsn_indstryty_list")
+
+    # 2. 파티션 테이블 생성 (파티션 키가 PK에 포함되어야 함)
+    op.execute("""
+        CREATE TABLE bid_notices (
+            bid_ntce_no VARCHAR(50) NOT NULL,
+            bid_ntce_ord VARCHAR(10) NOT NULL,
+            rgst_dt VARCHAR(14) NOT NULL DEFAULT '',
+            openg_dt VARCHAR(14),
+            bid_close_dt VARCHAR(14),
+            presmpt_prce BIGINT,
+            main_cnsty_nm VARCHAR(200),
+            data JSONB NOT NULL,
+            content_hash VARCHAR(64),
+            fetched_at TIMESTAMPTZ DEFAULT now(),
+            CONSTRAINT bid_notices_pkey
+                PRIMARY KEY (bid_ntce_no, bid_ntce_ord, rgst_dt)
+        ) PARTITION BY RANGE (rgst_dt)
+    """)
+    op.execute("""
+        CREATE TABLE bid_prtcpt_psbl_rgns (
+            bid_ntce_no VARCHAR(50) NOT NULL,
+            bid_ntce_ord VARCHAR(10) NOT NULL,
+            lmt_sno INTEGER NOT NULL,
+            rgst_month VARCHAR(6) NOT NULL DEFAULT '',
+            prtcpt_psbl_rgn_nm VARCHAR(200),
+            rgst_dt VARCHAR(30),
+            bsns_div_nm VARCHAR(50),
+            fetched_at TIMESTAMPTZ DEFAULT now(),
+            CONSTRAINT bid_prtcpt_psbl_rgns_pkey
+                PRIMARY KEY (bid_ntce_no, bid_ntce_ord, lmt_sno, rgst_month)
+        ) PARTITION BY RANGE (rgst_month)
+    """)
+    op.execute("""
+        CREATE TABLE bid_license_limits (
+            bid_ntce_no VARCHAR(50) NOT NULL,
+            bid_ntce_ord VARCHAR(10) NOT NULL DEFAULT '000',
+            lmt_grp_no VARCHAR(10) NOT NULL,
+            lmt_sno VARCHAR(10) NOT NULL,
+            rgst_month VARCHAR(6) NOT NULL DEFAULT '',
+            lcns_lmt_nm VARCHAR(500),
+            permsn_indstryty_list TEXT,
+            bsns_div_nm VARCHAR(30),
+            rgst_dt VARCHAR(30),
+            indstryty_mfrc_fld_list TEXT,
+            fetched_at TIMESTAMPTZ DEFAULT now(),
+            CONSTRAINT bid_license_limits_pkey PRIMARY KEY
+                (bid_ntce_no, bid_ntce_ord, lmt_grp_no, lmt_sno, rgst_month)
+        ) PARTITION BY RANGE (rgst_month)
+    """)
+
+    _create_partitions('bid_notices', _month_range('rgst_dt', 'bid_notices_old'))
+    _create_partitions(
+        'bid_prtcpt_psbl_rgns',
+        _month_range(f"({RGST_MONTH_EXPR})", 'bid_prtcpt_psbl_rgns_old'),
+    )
+    _create_partitions(
+        'bid_license_limits',
+        _month_range(f"({RGST_MONTH_EXPR})", 'bid_license_limits_old'),
+    )
+
+    # 3. 데이터 복사 후 기존 테이블 삭제
+    op.execute(
+        f"INSERT INTO bid_notices ({NOTICE_COLUMNS}) "
+        f"SELECT bid_ntce_no, bid_ntce_ord, coalesce(rgst_dt, ''), openg_dt, "
+        f"bid_close_dt, presmpt_prce, main_cnsty_nm, data, content_hash, "
+        f"fetched_at FROM bid_notices_old"
+    )
+    op.execute(
+        f"INSERT INTO bid_prtcpt_psbl_rgns ({RGN_COLUMNS}, rgst_month) "
+        f"SELECT {RGN_COLUMNS}, {RGST_MONTH_EXPR} FROM bid_prtcpt_psbl_rgns_old"
+    )
+    op.execute(
+        f"INSERT INTO bid_license_limits ({LIMIT_COLUMNS}, rgst_month) "
+        f"SELECT {LIMIT_COLUMNS}, {RGST_MONTH_EXPR} FROM bid_license_limits_old"
+    )
+    op.execute("DROP TABLE bid_notices_old")
+    op.execute("DROP TABLE bid_prtcpt_psbl_rgns_old")
+    op.execute("DROP TABLE bid_license_limits_old")
+
+    # 4. 인덱스 재생성 (부모에 생성 → 모든 파티션에 전파)
+    op.create_index('ix_bid_notices_rgst_dt', 'bid_notices', ['rgst_dt'])
+    op.create_index('ix_bid_notices_openg_dt', 'bid_notices', ['openg_dt'])
+    op.create_index('ix_bid_notices_bid_close_dt', 'bid_notices', ['bid_close_dt'])
+    op.create_index('ix_bid_notices_presmpt_prce', 'bid_notices', ['presmpt_prce'])
+    op.execute(
+        "CREATE INDEX ix_bid_notices_cnstrtsite ON bid_notices "
+        "((data->>'cnstrtsiteRgnNm')) "
+        "WHERE data->>'cnstrtsiteRgnNm' IS NOT NULL"
+    )
+    op.create_index(
+        'ix_bid_prtcpt_psbl_rgns_rgn_nm',
+        'bid_prtcpt_psbl_rgns',
+        ['prtcpt_psbl_rgn_nm'],
+    )
+    op.create_index(
+        'ix_bid_prtcpt_psbl_rgns_bid_ntce',
+        'bid_prtcpt_psbl_rgns',
+        ['bid_ntce_no', 'bid_ntce_ord'],
+    )
+    op.create_index(
+        'ix_bid_license_limits_permsn_indstryty_list',
+        'bid_license_limits',
+        ['permsn_indstryty_list'],
+    )
+    op.execute("ANALYZE bid_notices")
+    op.execute("ANALYZE bid_prtcpt_psbl_rgns")
+    op.execute("ANALYZE bid_license_limits")
+
+
+def downgrade() -> None:
+    for table in ('bid_notices', 'bid_prtcpt_psbl_rgns', 'bid_license_limits'):
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_part")
+        op.execute(f"ALTER INDEX {table}_pkey RENAME TO {table}_part_pkey")
+    for name in (
+        'ix_bid_notices_rgst_dt', 'ix_bid_notices_openg_dt',
+        'ix_bid_notices_bid_close_dt', 'ix_bid_notices_presmpt_prce',
+        'ix_bid_notices_cnstrtsite', 'ix_bid_prtcpt_psbl_rgns_rgn_nm',
+        'ix_bid_prtcpt_psbl_rgns_bid_ntce',
+        'ix_bid_license_limits_permsn_indstryty_list',
+    ):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.execute("""
+        CREATE TABLE bid_notices (
+            bid_ntce_no VARCHAR(50) NOT NULL,
+            bid_ntce_ord VARCHAR(10) NOT NULL,
+            rgst_dt VARCHAR(14),
+            openg_dt VARCHAR(14),
+            bid_close_dt VARCHAR(14),
+            presmpt_prce BIGINT,
+            main_cnsty_nm VARCHAR(200),
+            data JSONB NOT NULL,
+            content_hash VARCHAR(64),
+            fetched_at TIMESTAMPTZ DEFAULT now(),
+            CONSTRAINT bid_notices_pkey PRIMARY KEY (bid_ntce_no, bid_ntce_ord)
+        )
+    """)
+    op.execute("""
+        CREATE TABLE bid_prtcpt_psbl_rgns (
+            bid_ntce_no VARCHAR(50) NOT NULL,
+            bid_ntce_ord VARCHAR(10) NOT NULL,
+            lmt_sno INTEGER NOT NULL,
+            prtcpt_psbl_rgn_nm VARCHAR(200),
+            rgst_dt VARCHAR(30),
+            bsns_div_nm VARCHAR(50),
+            fetched_at TIMESTAMPTZ DEFAULT now(),
+            CONSTRAINT bid_prtcpt_psbl_rgns_pkey
+                PRIMARY KEY (bid_ntce_no, bid_ntce_ord, lmt_sno)
+        )
+    """)
+    op.execute("""
+        CREATE TABLE bid_license_limits (
+            bid_ntce_no VARCHAR(50) NOT NULL,
+            bid_ntce_ord VARCHAR(10) NOT NULL DEFAULT '000',
+            lmt_grp_no VARCHAR(10) NOT NULL,
+            lmt_sno VARCHAR(10) NOT NULL,
+            lcns_lmt_nm VARCHAR(500),
+            permsn_indstryty_list TEXT,
+            bsns_div_nm VARCHAR(30),
+            rgst_dt VARCHAR(30),
+            indstryty_mfrc_fld_list TEXT,
+            fetched_at TIMESTAMPTZ DEFAULT now(),
+            CONSTRAINT bid_license_limits_pkey
+                PRIMARY KEY (bid_ntce_no, bid_ntce_ord, lmt_grp_no, lmt_sno)
+        )
+    """)
+
+    # 같은 키가 여러 월에 있으면 최신 등록월 row만 유지
+    op.execute(
+        f"INSERT INTO bid_notices ({NOTICE_COLUMNS}) "
+        f"SELECT DISTINCT ON (bid_ntce_no, bid_ntce_ord) {NOTICE_COLUMNS} "
+        f"FROM bid_notices_part ORDER BY bid_ntce_no, bid_ntce_ord, rgst_dt DESC"
+    )
+    op.execute(
+        f"INSERT INTO bid_prtcpt_psbl_rgns ({RGN_COLUMNS}) "
+        f"SELECT DISTINCT ON (bid_ntce_no, bid_ntce_ord, lmt_sno) {RGN_COLUMNS} "
+        f"FROM bid_prtcpt_psbl_rgns_part "
+        f"ORDER BY bid_ntce_no, bid_ntce_ord, lmt_sno, rgst_month DESC"
+    )
+    op.execute(
+        f"INSERT INTO bid_license_limits ({LIMIT_COLUMNS}) "
+        f"SELECT DISTINCT ON (bid_ntce_no, bid_ntce_ord, lmt_grp_no, lmt_sno) "
+        f"{LIMIT_COLUMNS} FROM bid_license_limits_part "
+        f"ORDER BY bid_ntce_no, bid_ntce_ord, lmt_grp_no, lmt_sno, rgst_month DESC"
+    )
+    for table in ('bid_notices', 'bid_prtcpt_psbl_rgns', 'bid_license_limits'):
+        op.execute(f"DROP TABLE {table}_part CASCADE")
+
+    op.create_index('ix_bid_notices_rgst_dt', 'bid_notices', ['rgst_dt'])
+    op.create_index('ix_bid_notices_openg_dt', 'bid_notices', ['openg_dt'])
+    op.create_index('ix_bid_notices_bid_close_dt', 'bid_notices', ['bid_close_dt'])
+    op.create_index('ix_bid_notices_presmpt_prce', 'bid_notices', ['presmpt_prce'])
+    op.execute(
+        "CREATE INDEX ix_bid_notices_cnstrtsite ON bid_notices "
+        "((data->>'cnstrtsiteRgnNm')) "
+        "WHERE data->>'cnstrtsiteRgnNm' IS NOT NULL"
+    )
+    op.create_index(
+        'ix_bid_prtcpt_psbl_rgns_rgn_nm',
+        'bid_prtcpt_psbl_rgns',
+        ['prtcpt_psbl_rgn_nm'],
+    )
+    op.create_index(
+        'ix_bid_prtcpt_psbl_rgns_bid_ntce',
+        'bid_prtcpt_psbl_rgns',
+        ['bid_ntce_no', 'bid_ntce_ord'],
+    )
+    op.create_index(
+        'ix_bid_license_limits_permsn_indstryty_list',
+        'bid_license_limits',
+        ['permsn_indstryty_list'],
+    )
@@ -0,0 +1,94 @@
+"""add competitor index over opening results
+
+Revision ID: b6c7d8e9f0a1
+Revises: a5b6c7d8e9f0
+Create Date: 2026-03-10 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'b6c7d8e9f0a1'
+down_revision = 'a5b6c7d8e9f0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 개찰결과 JSONB → 업체별 투찰 기록
+    op.create_table(
+        'competitor_bids',
+        sa.Column('bid_ntce_no', sa.String(length=50), nullable=False),
+        sa.Column('prcbdr_bizno', sa.String(length=20), nullable=False),
+        sa.Column('prcbdr_nm', sa.String(length=200), nullable=True),
+        sa.Column('bid_ntce_nm', sa.String(length=500), nullable=True),
+        sa.Column('bid_amount', sa.BigInteger(), nullable=True),
+        sa.Column('bid_rate', sa.Float(), nullable=True),
+        sa.Column('opening_rank', sa.Integer(), nullable=True),
+        sa.Column('won', sa.Boolean(), nullable=False),
+        sa.Column('segments', postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column('opened_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('bid_ntce_no', 'prcbdr_bizno'),
+    )
+    # 업체별 최근 투찰 목록 페이지네이션 + 재집계 대상 조회
+    op.create_index(
+        'ix_competitor_bids_bizno_opened',
+        'competitor_bids',
+        ['prcbdr_bizno', sa.text('opened_at DESC NULLS LAST')],
+    )
+
+    op.create_table(
+        'competitor_indexed_notices',
+        sa.Column('bid_ntce_no', sa.String(length=50), nullable=False),
+        sa.Column('source_fetched_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            'indexed_at', sa.DateTime(timezone=True),
+            server_default=sa.text('now()'), nullable=True,
+        ),
+        sa.PrimaryKeyConstraint('bid_ntce_no'),
+    )
+
+    op.create_table(
+        'competitor_stats',
+        sa.Column('segment', sa.String(length=300), nullable=False),
+        sa.Column('prcbdr_bizno', sa.String(length=20), nullable=False),
+        sa.Column('prcbdr_nm', sa.String(length=200), nullable=True),
+        sa.Column('bid_count', sa.Integer(), nullable=False),
+        sa.Column('win_count', sa.Integer(), nullable=False),
+        sa.Column('avg_bid_rate', sa.Float(), nullable=True),
+        sa.Column(
+            'rate_histogram', postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.Column('last_opened_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            'updated_at', sa.DateTime(timezone=True),
+            server_default=sa.text('now()'), nullable=True,
+        ),
+        sa.PrimaryKeyConstraint('segment', 'prcbdr_bizno'),
+    )
+    # 세그먼트 내 순위 페이지네이션 (참여순 / 낙찰순)
+    op.create_index(
+        'ix_competitor_stats_segment_rank',
+        'competitor_stats',
+        ['segment', sa.text('bid_count DESC'), 'prcbdr_bizno'],
+    )
+    op.create_index(
+        'ix_competitor_stats_segment_wins',
+        'competitor_stats',
+        ['segment', sa.text('win_count DESC'), 'prcbdr_bizno'],
+    )
+    op.create_index(
+        'ix_competitor_stats_bizno', 'competitor_stats', ['prcbdr_bizno']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_competitor_stats_bizno', table_name='competitor_stats')
+    op.drop_index('ix_competitor_stats_segment_wins', table_name='competitor_stats')
+    op.drop_index('ix_competitor_stats_segment_rank', table_name='competitor_stats')
+    op.drop_table('competitor_stats')
+    op.drop_table('competitor_indexed_notices')
+    op.drop_index('ix_competitor_bids_bizno_opened', table_name='competitor_bids')
+    op.drop_table('competitor_bids')
@@ -0,0 +1,90 @@
+"""store notice dates and amounts as typed columns
+
+Revision ID: c1d2e3f4a5b6
+Revises: b0c1d2e3f4a5
+Create Date: 2026-03-03 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c1d2e3f4a5b6'
+down_revision = 'b0c1d2e3f4a5'
+branch_labels = None
+depends_on = None
+
+# YYYYMMDDHHMM(KST) 문자열 → timestamptz
+KST_TS = (
+    "CASE WHEN {col} ~ '^[0-9]{{12}}$' "
+    "THEN to_timestamp({col}, 'YYYYMMDDHH24MI')::timestamp "
+    "AT TIME ZONE 'Asia/Seoul' END"
+)
+# 금액 문자열 → bigint (빈 값은 NULL)
+AMOUNT = (
+    "CASE WHEN data->>'{key}' ~ '^\\s*-?[0-9]+(\\.[0-9]+)?\\s*$' "
+    "THEN trunc((data->>'{key}')::numeric)::bigint END"
+)
+
+
+def upgrade() -> None:
+    # 부모 테이블에 추가 → 모든 파티션에 전파
+    op.add_column('bid_notices', sa.Column('openg_at', sa.DateTime(timezone=True)))
+    op.add_column('bid_notices', sa.Column('bid_close_at', sa.DateTime(timezone=True)))
+    op.add_column('bid_notices', sa.Column('bdgt_amt', sa.BigInteger()))
+    op.add_column('bid_notices', sa.Column('asign_bdgt_amt', sa.BigInteger()))
+
+    op.execute(
+        "UPDATE bid_notices SET "
+        f"openg_at = {KST_TS.format(col='openg_dt')}, "
+        f"bid_close_at = {KST_TS.format(col='bid_close_dt')}, "
+        f"bdgt_amt = {AMOUNT.format(key='bdgtAmt')}, "
+        f"asign_bdgt_amt = {AMOUNT.format(key='asignBdgtAmt')}"
+    )
+
+    op.drop_index('ix_bid_notices_openg_dt', table_name='bid_notices')
+    op.drop_index('ix_bid_notices_bid_close_dt', table_name='bid_notices')
+    op.drop_column('bid_notices', 'openg_dt')
+    op.drop_column('bid_notices', 'bid_close_dt')
+
+    # orderBy 옵션별 asc / desc NULLS LAST 인덱스 (rgstDt는 기존 인덱스 사용)
+    op.create_index('ix_bid_notices_openg_at', 'bid_notices', ['openg_at'])
+    op.create_index('ix_bid_notices_bid_close_at', 'bid_notices', ['bid_close_at'])
+    op.execute(
+        "CREATE INDEX ix_bid_notices_bid_close_at_desc ON bid_notices "
+        "(bid_close_at DESC NULLS LAST)"
+    )
+    op.execute(
+        "CREATE INDEX ix_bid_notices_presmpt_prce_desc ON bid_notices "
+        "(presmpt_prce DESC NULLS LAST)"
+    )
+    op.create_index('ix_bid_notices_bdgt_amt', 'bid_notices', ['bdgt_amt'])
+    op.execute(
+        "CREATE INDEX ix_bid_notices_bdgt_amt_desc ON bid_notices "
+        "(bdgt_amt DESC NULLS LAST)"
+    )
+    op.execute("ANALYZE bid_notices")
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bid_notices_bdgt_amt_desc', table_name='bid_notices')
+    op.drop_index('ix_bid_notices_bdgt_amt', table_name='bid_notices')
+    op.drop_index('ix_bid_notices_presmpt_prce_desc', table_name='bid_notices')
+    op.drop_index('ix_bid_notices_bid_close_at_desc', table_name='bid_notices')
+    op.drop_index('ix_bid_notices_bid_close_at', table_name='bid_notices')
+    op.drop_index('ix_bid_notices_openg_at', table_name='bid_notices')
+
+    op.add_column('bid_notices', sa.Column('openg_dt', sa.String(14)))
+    op.add_column('bid_notices', sa.Column('bid_close_dt', sa.String(14)))
+    op.execute(
+        "UPDATE bid_notices SET "
+        "openg_dt = to_char(openg_at AT TIME ZONE 'Asia/Seoul', 'YYYYMMDDHH24MI'), "
+        "bid_close_dt = to_char(bid_close_at AT TIME ZONE 'Asia/Seoul', 'YYYYMMDDHH24MI')"
+    )
+    op.create_index('ix_bid_notices_openg_dt', 'bid_notices', ['openg_dt'])
+    op.create_index('ix_bid_notices_bid_close_dt', 'bid_notices', ['bid_close_dt'])
+
+    op.drop_column('bid_notices', 'asign_bdgt_amt')
+    op.drop_column('bid_notices', 'bdgt_amt')
+    op.drop_column('bid_notices', 'bid_close_at')
+    op.drop_column('bid_notices', 'openg_at')
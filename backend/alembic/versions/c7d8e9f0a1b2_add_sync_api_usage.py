@@ -0,0 +1,33 @@
+"""add per-day sync API usage counter
+
+Revision ID: c7d8e9f0a1b2
+Revises: b6c7d8e9f0a1
+Create Date: 2026-03-12 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c7d8e9f0a1b2'
+down_revision = 'b6c7d8e9f0a1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 일일 API 예산 사용량 (재시작/리더 교체 후에도 유지)
+    op.create_table(
+        'sync_api_usage',
+        sa.Column('usage_date', sa.String(length=8), nullable=False),
+        sa.Column('calls', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column(
+            'updated_at', sa.DateTime(timezone=True),
+            server_default=sa.text('now()'), nullable=True,
+        ),
+        sa.PrimaryKeyConstraint('usage_date'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('sync_api_usage')
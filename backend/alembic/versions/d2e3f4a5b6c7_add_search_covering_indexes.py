@@ -0,0 +1,60 @@
+"""add covering indexes for /bids/search query shapes
+
+Revision ID: d2e3f4a5b6c7
+Revises: c1d2e3f4a5b6
+Create Date: 2026-03-04 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'd2e3f4a5b6c7'
+down_revision = 'c1d2e3f4a5b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 날짜 범위 + 가격/마감 필터 + 건수 조회 → index-only scan
+    op.create_index(
+        'ix_bid_notices_rgst_dt_cover',
+        'bid_notices',
+        ['rgst_dt'],
+        postgresql_include=['bid_close_at', 'presmpt_prce', 'bdgt_amt'],
+    )
+    op.create_index(
+        'ix_bid_notices_openg_at_cover',
+        'bid_notices',
+        ['openg_at'],
+        postgresql_include=['rgst_dt', 'bid_close_at', 'presmpt_prce'],
+    )
+    # 같은 키의 단일 컬럼 인덱스는 INCLUDE 인덱스로 대체
+    op.drop_index('ix_bid_notices_rgst_dt', table_name='bid_notices')
+    op.drop_index('ix_bid_notices_openg_at', table_name='bid_notices')
+    # 마감 전 공고(bid_close_at > now()) 인덱스 ix_bid_notices_bid_close_at은
+    # 전후 실측 없이 바꾸지 않고 유지
+
+    # 지역 EXISTS (공고번호+차수 → 지역명) index-only scan
+    op.create_index(
+        'ix_bid_prtcpt_psbl_rgns_bid_ntce_rgn',
+        'bid_prtcpt_psbl_rgns',
+        ['bid_ntce_no', 'bid_ntce_ord', 'prtcpt_psbl_rgn_nm'],
+    )
+    op.drop_index(
+        'ix_bid_prtcpt_psbl_rgns_bid_ntce', table_name='bid_prtcpt_psbl_rgns'
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_bid_prtcpt_psbl_rgns_bid_ntce',
+        'bid_prtcpt_psbl_rgns',
+        ['bid_ntce_no', 'bid_ntce_ord'],
+    )
+    op.drop_index(
+        'ix_bid_prtcpt_psbl_rgns_bid_ntce_rgn', table_name='bid_prtcpt_psbl_rgns'
+    )
+    op.create_index('ix_bid_notices_openg_at', 'bid_notices', ['openg_at'])
+    op.create_index('ix_bid_notices_rgst_dt', 'bid_notices', ['rgst_dt'])
+    op.drop_index('ix_bid_notices_openg_at_cover', table_name='bid_notices')
+    op.drop_index('ix_bid_notices_rgst_dt_cover', table_name='bid_notices')
@@ -0,0 +1,43 @@
+"""add content hash to bid_notices and write counts to data_sync_log
+
+Revision ID: d6e7f8a9b0c1
+Revises: c3e4f5a6b7c8
+Create Date: 2026-02-24 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'd6e7f8a9b0c1'
+down_revision = 'c3e4f5a6b7c8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 정규화된 BidItem의 sha256 (NULL이면 다음 동기화 시 1회 갱신)
+    op.add_column(
+        'bid_notices',
+        sa.Column('content_hash', sa.String(64), nullable=True),
+    )
+
+    op.add_column(
+        'data_sync_log',
+        sa.Column('notices_inserted', sa.Integer(), server_default='0'),
+    )
+    op.add_column(
+        'data_sync_log',
+        sa.Column('notices_updated', sa.Integer(), server_default='0'),
+    )
+    op.add_column(
+        'data_sync_log',
+        sa.Column('notices_unchanged', sa.Integer(), server_default='0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('data_sync_log', 'notices_unchanged')
+    op.drop_column('data_sync_log', 'notices_updated')
+    op.drop_column('data_sync_log', 'notices_inserted')
+    op.drop_column('bid_notices', 'content_hash')
@@ -0,0 +1,50 @@
+"""key data_sync_log by (sync_timestamp, window_end)
+
+00시 시간별 윈도우(YYYYMMDD0000~0059)와 일별 행(YYYYMMDD0000~2359)이
+같은 sync_timestamp를 쓰므로 window_end까지 기본 키에 포함합니다.
+
+Revision ID: d8e9f0a1b2c3
+Revises: c7d8e9f0a1b2
+Create Date: 2026-03-13 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'd8e9f0a1b2c3'
+down_revision = 'c7d8e9f0a1b2'
+branch_labels = None
+depends_on = None
+
+
+def _drop_primary_key() -> None:
+    # f6a7b8c9d0e1에서 rename 후 재생성한 테이블이라 제약 이름이 환경마다 다를 수 있음
+    conn = op.get_bind()
+    name = conn.execute(
+        sa.text(
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = 'data_sync_log'::regclass AND contype = 'p'"
+        )
+    ).scalar()
+    if name:
+        op.drop_constraint(name, 'data_sync_log', type_='primary')
+
+
+def upgrade() -> None:
+    _drop_primary_key()
+    op.create_primary_key(
+        'data_sync_log_pkey', 'data_sync_log', ['sync_timestamp', 'window_end']
+    )
+
+
+def downgrade() -> None:
+    # 같은 시작 시각에 일별 행이 있으면 시간별/기타 윈도우 행을 제거
+    op.execute(sa.text(
+        "DELETE FROM data_sync_log h USING data_sync_log d "
+        "WHERE h.sync_timestamp = d.sync_timestamp "
+        "AND h.window_end <> d.window_end "
+        "AND d.window_end LIKE '%2359' AND d.sync_timestamp LIKE '%0000'"
+    ))
+    _drop_primary_key()
+    op.create_primary_key('data_sync_log_pkey', 'data_sync_log', ['sync_timestamp'])
@@ -0,0 +1,142 @@
+"""add precomputed bid_region_eligibility table
+
+Revision ID: e3f4a5b6c7d8
+Revises: d2e3f4a5b6c7
+Create Date: 2026-03-05 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'e3f4a5b6c7d8'
+down_revision = 'd2e3f4a5b6c7'
+branch_labels = None
+depends_on = None
+
+# 이 리비전 시점의 app.services.region_hierarchy 매핑 (이후 앱 코드가 바뀌어도
+# 마이그레이션 결과가 달라지지 않도록 그대로 고정)
+UNRESTRICTED = '00'
+DESCENDANT_PREFIX = '>'
+SIDO_CODES = {
+    '서울특별시': '11', '서울': '11', '서울시': '11',
+    '부산광역시': '26', '부산': '26', '부산시': '26',
+    '대구광역시': '27', '대구': '27', '대구시': '27',
+    '인천광역시': '28', '인천': '28', '인천시': '28',
+    '광주광역시': '29', '광주': '29', '광주시': '29',
+    '대전광역시': '30', '대전': '30', '대전시': '30',
+    '울산광역시': '31', '울산': '31', '울산시': '31',
+    '세종특별자치시': '36', '세종': '36', '세종시': '36',
+    '경기도': '41', '경기': '41',
+    '충청북도': '43', '충북': '43',
+    '충청남도': '44', '충남': '44',
+    '전라남도': '46', '전남': '46',
+    '경상북도': '47', '경북': '47',
+    '경상남도': '48', '경남': '48',
+    '제주특별자치도': '50', '제주': '50', '제주도': '50',
+    '강원특별자치도': '51', '강원': '51', '강원도': '51',
+    '전북특별자치도': '52', '전북': '52', '전라북도': '52',
+}
+
+
+def _region_code(name) -> str:
+    parts = (name or '').split()
+    if not parts or parts == ['전체']:
+        return UNRESTRICTED
+    parts[0] = SIDO_CODES.get(parts[0], parts[0])
+    return '/'.join(parts)
+
+
+def _ancestor_codes(code: str) -> list:
+    if code == UNRESTRICTED:
+        return []
+    parts = code.split('/')
+    return ['/'.join(parts[:i]) for i in range(1, len(parts))]
+
+
+def _add_months(month: str, n: int) -> str:
+    index = int(month[:4]) * 12 + int(month[4:6]) - 1 + n
+    return f"{index // 12:04d}{index % 12 + 1:02d}"
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE bid_region_eligibility (
+            bid_ntce_no VARCHAR(50) NOT NULL,
+            bid_ntce_ord VARCHAR(10) NOT NULL,
+            region_code VARCHAR(200) NOT NULL,
+            rgst_month VARCHAR(6) NOT NULL DEFAULT '',
+            CONSTRAINT bid_region_eligibility_pkey PRIMARY KEY
+                (bid_ntce_no, bid_ntce_ord, region_code, rgst_month)
+        ) PARTITION BY RANGE (rgst_month)
+    """)
+
+    # bid_prtcpt_psbl_rgns와 같은 월 파티션 구성
+    bind = op.get_bind()
+    months = bind.execute(sa.text(
+        "SELECT substring(c.relname FROM '_p([0-9]{6})$') FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = 'bid_prtcpt_psbl_rgns'"
+    )).scalars().all()
+    for month in sorted(m for m in months if m):
+        op.execute(
+            f"CREATE TABLE bid_region_eligibility_p{month} "
+            f"PARTITION OF bid_region_eligibility "
+            f"FOR VALUES FROM ('{month}') TO ('{_add_months(month, 1)}')"
+        )
+    op.execute(
+        "CREATE TABLE bid_region_eligibility_pdefault "
+        "PARTITION OF bid_region_eligibility DEFAULT"
+    )
+
+    # 지역명 → 지역코드 매핑 (서로 다른 지역명 수만큼만 Python에서 계산)
+    names = bind.execute(sa.text(
+        "SELECT DISTINCT coalesce(prtcpt_psbl_rgn_nm, '') FROM bid_prtcpt_psbl_rgns"
+    )).scalars().all()
+    op.execute(
+        "CREATE TEMP TABLE _region_codes "
+        "(rgn_nm VARCHAR(200), region_code VARCHAR(200)) ON COMMIT DROP"
+    )
+    mapping = []
+    for name in names:
+        code = _region_code(name)
+        mapping.append({"rgn_nm": name, "region_code": code})
+        for ancestor in _ancestor_codes(code):
+            mapping.append(
+                {"rgn_nm": name, "region_code": DESCENDANT_PREFIX + ancestor}
+            )
+    if mapping:
+        bind.execute(
+            sa.text(
+                "INSERT INTO _region_codes (rgn_nm, region_code) "
+                "VALUES (:rgn_nm, :region_code)"
+            ),
+            mapping,
+        )
+
+    op.execute("""
+        INSERT INTO bid_region_eligibility
+            (bid_ntce_no, bid_ntce_ord, region_code, rgst_month)
+        SELECT DISTINCT r.bid_ntce_no, r.bid_ntce_ord, c.region_code, r.rgst_month
+        FROM bid_prtcpt_psbl_rgns r
+        JOIN _region_codes c ON c.rgn_nm = coalesce(r.prtcpt_psbl_rgn_nm, '')
+        ON CONFLICT DO NOTHING
+    """)
+    # 참가가능지역이 없는 공고 → 제한 없음
+    op.execute(f"""
+        INSERT INTO bid_region_eligibility
+            (bid_ntce_no, bid_ntce_ord, region_code, rgst_month)
+        SELECT n.bid_ntce_no, n.bid_ntce_ord, '{UNRESTRICTED}', left(n.rgst_dt, 6)
+        FROM bid_notices n
+        WHERE NOT EXISTS (
+            SELECT 1 FROM bid_prtcpt_psbl_rgns r
+            WHERE r.bid_ntce_no = n.bid_ntce_no
+              AND r.bid_ntce_ord = n.bid_ntce_ord
+        )
+        ON CONFLICT DO NOTHING
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS bid_region_eligibility")
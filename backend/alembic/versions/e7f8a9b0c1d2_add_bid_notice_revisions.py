@@ -0,0 +1,39 @@
+"""add bid_notice_revisions table
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2026-02-25 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = 'e7f8a9b0c1d2'
+down_revision = 'd6e7f8a9b0c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'bid_notice_revisions',
+        sa.Column('revision_id', sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column('bid_ntce_no', sa.String(50), nullable=False),
+        sa.Column('bid_ntce_ord', sa.String(10), nullable=False),
+        sa.Column('prev_ord', sa.String(10), nullable=True),
+        sa.Column('revision_type', sa.String(10), nullable=False),
+        sa.Column('changes', JSONB(), nullable=False),
+        sa.Column('detected_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index(
+        'ix_bid_notice_revisions_notice',
+        'bid_notice_revisions',
+        ['bid_ntce_no', 'detected_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bid_notice_revisions_notice', table_name='bid_notice_revisions')
+    op.drop_table('bid_notice_revisions')
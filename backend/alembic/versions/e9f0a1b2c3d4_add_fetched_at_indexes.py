@@ -0,0 +1,30 @@
+"""add fetched_at indexes for the open bid hot set refresh
+
+핫셋 증분 갱신(fetched_at >= watermark)이 공고/참가가능지역/면허제한의
+모든 파티션을 순차 스캔하지 않도록 파티션 부모에 인덱스를 만듭니다
+(기존·신규 월 파티션에 자동 적용).
+
+Revision ID: e9f0a1b2c3d4
+Revises: d8e9f0a1b2c3
+Create Date: 2026-03-14 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e9f0a1b2c3d4'
+down_revision = 'd8e9f0a1b2c3'
+branch_labels = None
+depends_on = None
+
+TABLES = ('bid_notices', 'bid_prtcpt_psbl_rgns', 'bid_license_limits')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.create_index(f'ix_{table}_fetched_at', table, ['fetched_at'])
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_fetched_at', table_name=table)
@@ -0,0 +1,50 @@
+"""add UNLOGGED search response cache tables
+
+Revision ID: f4a5b6c7d8e9
+Revises: e3f4a5b6c7d8
+Create Date: 2026-03-06 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'f4a5b6c7d8e9'
+down_revision = 'e3f4a5b6c7d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 세대 카운터는 크래시 후에도 남아야 하므로 일반 테이블
+    op.create_table(
+        'search_cache_generation',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('generation', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute("INSERT INTO search_cache_generation (id, generation) VALUES (1, 0)")
+
+    # 응답 캐시 → WAL 미기록(UNLOGGED), 크래시 복구 시 비워짐
+    op.create_table(
+        'search_response_cache',
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('generation', sa.BigInteger(), nullable=False),
+        sa.Column('body', sa.LargeBinary(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('cache_key'),
+        prefixes=['UNLOGGED'],
+    )
+    op.create_index(
+        'ix_search_response_cache_expires_at',
+        'search_response_cache',
+        ['expires_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_search_response_cache_expires_at', table_name='search_response_cache'
+    )
+    op.drop_table('search_response_cache')
+    op.drop_table('search_cache_generation')
@@ -0,0 +1,53 @@
+"""add sync_jobs queue table
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2026-02-26 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = 'f8a9b0c1d2e3'
+down_revision = 'e7f8a9b0c1d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sync_jobs',
+        sa.Column('job_id', sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column('window_start', sa.String(12), nullable=False),
+        sa.Column('window_end', sa.String(12), nullable=False),
+        sa.Column('priority', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('status', sa.String(10), nullable=False, server_default='pending'),
+        sa.Column('checkpoints', JSONB(), nullable=False, server_default='{}'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('locked_by', sa.String(100), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index(
+        'ix_sync_jobs_claim',
+        'sync_jobs',
+        ['status', 'priority', 'created_at'],
+    )
+    # 같은 윈도우의 활성 작업은 하나만 (enqueue 중복 방지)
+    op.create_index(
+        'uq_sync_jobs_active_window',
+        'sync_jobs',
+        ['window_start', 'window_end'],
+        unique=True,
+        postgresql_where=sa.text("status IN ('pending', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_sync_jobs_active_window', table_name='sync_jobs')
+    op.drop_index('ix_sync_jobs_claim', table_name='sync_jobs')
+    op.drop_table('sync_jobs')
@@ -0,0 +1,34 @@
+import logging
+
+from app.api.auth import get_admin_user
+from app.core.profiling import request_profiler
+from app.models.user import User
+from fastapi import APIRouter, Depends, status
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get("/profiles")
+async def get_request_profiles(
+    current_user: User = Depends(get_admin_user),
+):
+    """최근 느린 요청 프로파일 (최근 순, 구간별 시간 + SQL + EXPLAIN)
+
+    X-Profile: <PROFILING_SECRET> 헤더 또는 PROFILING_SAMPLE_RATE로 프로파일된
+    요청 중 PROFILING_SLOW_MS 이상 걸린 요청만 보관합니다 (워커 프로세스별).
+    """
+    return {
+        "slowMs": request_profiler.slow_ms,
+        "sampleRate": request_profiler.sample_rate,
+        "maxEntries": request_profiler.max_entries,
+        "items": [profile.to_dict() for profile in request_profiler.recent()],
+    }
+
+
+@router.delete("/profiles", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_request_profiles(
+    current_user: User = Depends(get_admin_user),
+):
+    """보관된 프로파일 초기화"""
+    request_profiler.clear()
@@ -2,29 +2,56 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.auth import get_admin_user, get_current_user
-from app.db.database import get_db
+from app.core.profiling import phase
+from app.db.database import AsyncSessionLocal, get_db
 from app.models.user import User, UserBookmark
 from app.schemas.bid import (
+    AssessmentRateItem,
+    AssessmentRateTableResponse,
     BidApiResponse,
     BidAValueItem,
     BidItem,
+    BidNoticeRevisionItem,
+    BidPriceBatchRequest,
+    BidPriceBatchResponse,
     BidResultItem,
     BidResultResponse,
     BidSearchParams,
     DataSyncResponse,
+    DaySyncStatus,
     PrtcptPsblRgnItem,
+    SyncStatusResponse,
+    WinProbabilityRequest,
+    WinProbabilityResponse,
 )
 from app.schemas.user import BookmarkCreate, BookmarkResponse, BookmarkUpdate
-from app.services.bid_data_service import bid_data_service
+from app.services.assessment_rate_stats import assessment_rate_stats
+from app.services.bid_data_service import SearchPage, bid_data_service, format_kst
+from app.services.bid_price_engine import (
+    AMOUNT_RANGES,
+    LICENSE_GROUPS,
+    REGION_SCOPES,
+    bid_price_engine,
+)
 from app.services.narajangter import narajangter_service
+from app.services.search_cache import search_cache, search_cache_key
+from app.services.search_export import WRITERS, search_exporter
+from app.services.sync_job_queue import PRIORITY_SEARCH, sync_job_queue
+from app.services.upstream_resilience import UpstreamError, UpstreamRejected
+from app.services.win_probability import (
+    WinProbabilityError,
+    win_probability_service,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/bids", tags=["Bid Notices"])
@@ -36,13 +63,19 @@ async def search_bids(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """입찰공고 검색 - DB 우선, API 폴백 (공고게시일시 div=1 기준만 동기화)
+    """입찰공고 검색 - 항상 DB에서 조회 (공고게시일시 div=1 기준만 동기화)
 
     API 호출 최소화 전략:
     - 날짜별 동기화 상태를 추적 (div=1 공고게시일시 기준)
-    - synced → DB만 사용 (API 0회)
-    - not synced → API 호출 → 저장 → synced 마킹
+    - synced → DB 결과 반환 (API 0회)
+    - not synced → 미동기화 날짜를 sync_jobs 큐에 높은 우선순위로 등록하고
+      현재 DB 결과(부분)를 즉시 반환. syncComplete=False + 날짜별 syncStatus를
+      함께 내려주므로 클라이언트는 /bids/sync-status 폴링 또는
+      /bids/sync-status/stream 구독 후 재검색
     - 개찰일시(div=2) 검색은 항상 DB에서 조회 (동기화된 데이터 활용)
+
+    응답은 SearchPage.to_json(orjson)으로 직접 직렬화하여 반환합니다
+    (response_model은 문서용 — 저장된 JSONB를 재검증하지 않음).
     """
     logger.info(
         f"search_bids called by user: {current_user.username} with params: {search_params}"
@@ -52,69 +85,50 @@ async def search_bids(
         start_date = search_params.inqryBgnDt[:8]
         end_date = search_params.inqryEndDt[:8]
 
+        # 응답 캐시 (동기화 완료 결과만 저장 → 적중 시 DB/Pydantic 생략)
+        # 미적중이면 조회 시점 세대를 저장 시 넘겨, 검색 도중 동기화가 끝났으면 저장 안 함
+        cache_key = None
+        cache_generation = None
+        if search_cache.enabled:
+            with phase("cache_lookup"):
+                cache_key = await _search_cache_key(db, search_params, current_user)
+                cached = await search_cache.get(db, cache_key)
+            if cached.body is not None:
+                return Response(content=cached.body, media_type="application/json")
+            cache_generation = cached.generation
+
         # 개찰일시(div=2) 검색은 항상 DB에서 조회
         if inqry_div == "2":
-            return await bid_data_service.search_from_db(
+            page = await bid_data_service.search_page(
                 db, search_params, current_user.user_id
             )
+            return await _cached_response(db, cache_key, cache_generation, page)
 
         # div=1: 해당 날짜범위가 동기화 완료인지 확인
         is_synced = False
         try:
-            is_synced = await bid_data_service.has_synced_data(
-                db, start_date, end_date
-            )
+            with phase("sync_check"):
+                is_synced = await bid_data_service.has_synced_data(
+                    db, start_date, end_date
+                )
         except Exception as e:
             logger.warning(f"has_synced_data failed (migration not applied?): {e}")
 
         if is_synced:
-            return await bid_data_service.search_from_db(
+            page = await bid_data_service.search_page(
                 db, search_params, current_user.user_id
             )
+            return await _cached_response(db, cache_key, cache_generation, page)
 
-        # 동기화 안됨 → 공사+용역 API 호출
-        api_params = BidSearchParams(
-            inqryDiv="1",
-            inqryBgnDt=search_params.inqryBgnDt,
-            inqryEndDt=search_params.inqryEndDt,
-            prtcptLmtRgnNm=search_params.prtcptLmtRgnNm,
-            indstrytyNm=search_params.indstrytyNm,
-            indstrytyCd=search_params.indstrytyCd,
-            presmptPrceBgn=search_params.presmptPrceBgn,
-            presmptPrceEnd=search_params.presmptPrceEnd,
-            bidClseExcpYn=search_params.bidClseExcpYn,
-            numOfRows=search_params.numOfRows,
-            pageNo=search_params.pageNo,
-        )
-        cnstwk_result = await narajangter_service.search_bids(
-            "contract", api_params
+        # 동기화 안됨 → 미동기화 날짜 작업 등록 후 부분 결과 즉시 반환
+        _check_sync_range(start_date, end_date)
+        day_status = await _enqueue_missing_days(db, start_date, end_date)
+        page = await bid_data_service.search_page(
+            db, search_params, current_user.user_id
         )
-        servc_result = await narajangter_service.search_bids(
-            "service", api_params
-        )
-
-        # 결과 병합 (중복 제거)
-        seen: set[str] = set()
-        merged_items = []
-        for item in list(cnstwk_result.items) + list(servc_result.items):
-            key = f"{item.bidNtceNo}-{item.bidNtceOrd}"
-            if key not in seen:
-                seen.add(key)
-                merged_items.append(item)
-
-        result = BidApiResponse(
-            items=merged_items,
-            totalCount=len(merged_items),
-            numOfRows=api_params.numOfRows,
-            pageNo=api_params.pageNo,
-        )
-
-        # 백그라운드에서 날짜별 전체 동기화 (scheduler 활용)
-        asyncio.create_task(
-            _sync_date_range(start_date, end_date, result)
-        )
-
-        return result
+        with phase("serialize"):
+            body = page.to_json(_is_range_complete(day_status), day_status)
+        return Response(content=body, media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -125,41 +139,199 @@ async def search_bids(
         )
 
 
-async def _sync_date_range(
-    start_date: str,
-    end_date: str,
-    initial_result: BidApiResponse | None = None,
+@router.post("/search/export")
+async def export_search(
+    search_params: BidSearchParams,
+    format: Literal["csv", "xlsx"] = "csv",
+    current_user: User = Depends(get_current_user),
 ):
-    """날짜 범위를 일별 윈도우로 동기화 (백그라운드).
+    """검색 결과 전체 내보내기 (CSV / XLSX 스트리밍)
 
-    scheduler의 sync_window를 활용하여 공사+용역+지역+면허제한 모두 동기화.
+    /bids/search와 같은 조건으로 DB에 동기화된 공고를 최대
+    SearchExporter.MAX_ROWS건까지 내보냅니다 (pageNo/numOfRows 무시).
+    서버 측 커서로 읽으면서 바로 응답하므로 건수와 무관하게 메모리 사용이
+    일정합니다.
     """
-    from app.services.bid_sync_scheduler import bid_sync_scheduler
+    media_type = WRITERS[format][1]
+    filename = (
+        f"bids_{search_params.inqryBgnDt[:8]}_{search_params.inqryEndDt[:8]}.{format}"
+    )
 
-    try:
-        if initial_result and initial_result.items:
-            async with (await _get_session()) as db:
-                await bid_data_service.save_bid_notices(db, initial_result.items)
+    async def body():
+        # 스트림 동안 커서를 유지할 전용 세션 (요청 세션과 분리)
+        async with AsyncSessionLocal() as db:
+            async for chunk in search_exporter.stream(
+                db, search_params, format, current_user.user_id
+            ):
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+async def _search_cache_key(
+    db: AsyncSession, search_params: BidSearchParams, user: User
+) -> str:
+    location_name = None
+    if search_params.useLocationFilter:
+        location = await bid_data_service.get_user_location(db, user.user_id)
+        location_name = location.location_name if location else None
+    return search_cache_key(search_params, location_name)
+
+
+async def _cached_response(
+    db: AsyncSession,
+    cache_key: str | None,
+    cache_generation: int | None,
+    page: SearchPage,
+) -> Response:
+    """검색 결과를 직렬화하여 캐시에 저장하고 그대로 응답합니다."""
+    with phase("serialize"):
+        body = page.to_json()
+    if cache_key is not None:
+        with phase("cache_store"):
+            await search_cache.set(db, cache_key, body, cache_generation)
+    return Response(content=body, media_type="application/json")
+
+
+SYNC_STATUS_POLL_SECONDS = 5
+SYNC_STATUS_STREAM_TIMEOUT = 600
+MAX_SYNC_RANGE_DAYS = 92  # 날짜별로 상태 조회·작업 등록하는 범위 상한
 
+
+def _is_range_complete(day_status: List[DaySyncStatus]) -> bool:
+    # 오늘 이후(live)는 시간별 동기화가 최신 상태를 유지
+    return all(d.status in ("synced", "live") for d in day_status)
+
+
+def _check_sync_range(start_date: str, end_date: str) -> None:
+    """동기화 대상 날짜 범위가 MAX_SYNC_RANGE_DAYS를 넘으면 422."""
+    try:
         start_dt = datetime.strptime(start_date[:8], "%Y%m%d")
         end_dt = datetime.strptime(end_date[:8], "%Y%m%d")
-        current = start_dt
+    except ValueError:
+        return
+    if (end_dt - start_dt).days + 1 > MAX_SYNC_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=(
+                f"Date range must be at most {MAX_SYNC_RANGE_DAYS} days "
+                "when sync is required"
+            ),
+        )
+
 
-        while current <= end_dt:
-            d = current.strftime("%Y%m%d")
-            await bid_sync_scheduler.sync_window(d + "0000", d + "2359")
-            current += timedelta(days=1)
-            await asyncio.sleep(1)
+async def _enqueue_missing_days(
+    db: AsyncSession, start_date: str, end_date: str
+) -> List[DaySyncStatus]:
+    """날짜별 동기화 상태를 조회하고, 작업이 없는 날짜를 큐에 등록합니다.
 
+    작업 워커가 공사+용역+지역+면허제한을 페이지 체크포인트 단위로 동기화하므로
+    서버가 재시작되어도 진행 상황이 유지됩니다. 오늘 이후 날짜(live)는
+    시간별 동기화가 담당하므로 등록하지 않습니다. 범위 상한은 호출 측에서
+    _check_sync_range로 확인합니다.
+    """
+    try:
+        day_status = await bid_data_service.get_range_sync_status(
+            db, start_date, end_date
+        )
     except Exception as e:
-        logger.error(f"Background sync failed: {e}")
+        logger.warning(f"get_range_sync_status failed: {e}")
+        return []
+
+    for day in day_status:
+        if day.status in ("missing", "failed"):
+            try:
+                await sync_job_queue.enqueue(
+                    db, day.date + "0000", day.date + "2359", PRIORITY_SEARCH
+                )
+                day.status = "pending"
+            except Exception as e:
+                logger.error(f"Sync enqueue failed for {day.date}: {e}")
+                await db.rollback()
+    return day_status
+
+
+@router.get("/sync-status", response_model=SyncStatusResponse)
+async def get_sync_status(
+    inqryBgnDt: str,
+    inqryEndDt: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """날짜 범위의 동기화 진행 상태 조회 (검색 결과 syncComplete=False일 때 폴링)"""
+    _check_sync_range(inqryBgnDt, inqryEndDt)
+    day_status = await bid_data_service.get_range_sync_status(
+        db, inqryBgnDt[:8], inqryEndDt[:8]
+    )
+    return SyncStatusResponse(
+        complete=_is_range_complete(day_status), days=day_status
+    )
 
 
-async def _get_session():
-    """비동기 세션 팩토리 (백그라운드 작업용)"""
-    from app.db.database import AsyncSessionLocal
+@router.get("/sync-status/stream")
+async def stream_sync_status(
+    inqryBgnDt: str,
+    inqryEndDt: str,
+    current_user: User = Depends(get_current_user),
+):
+    """동기화 진행 상태 SSE 스트림
 
-    return AsyncSessionLocal()
+    상태가 바뀔 때마다 `status` 이벤트를 보내고, 범위 전체가 동기화되면
+    `complete` 이벤트 후 종료합니다 (최대 SYNC_STATUS_STREAM_TIMEOUT초).
+    """
+    start_date, end_date = inqryBgnDt[:8], inqryEndDt[:8]
+    _check_sync_range(start_date, end_date)
+
+    async def events():
+        last_payload = None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SYNC_STATUS_STREAM_TIMEOUT
+        while True:
+            # 스트림 수명 동안 요청 세션을 붙잡지 않도록 조회마다 세션 생성
+            async with AsyncSessionLocal() as db:
+                day_status = await bid_data_service.get_range_sync_status(
+                    db, start_date, end_date
+                )
+            response = SyncStatusResponse(
+                complete=_is_range_complete(day_status), days=day_status
+            )
+            payload = response.model_dump_json()
+            if response.complete:
+                yield f"event: complete\ndata: {payload}\n\n"
+                return
+            if payload != last_payload:
+                yield f"event: status\ndata: {payload}\n\n"
+                last_payload = payload
+            if loop.time() >= deadline:
+                return
+            await asyncio.sleep(SYNC_STATUS_POLL_SECONDS)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _upstream_http_error(e: UpstreamError) -> HTTPException:
+    """나라장터 호출 실패 → 502 (요청 거부) / 503 (호출 제한·장애, Retry-After 포함)"""
+    if isinstance(e, UpstreamRejected):
+        return HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"NaraJangter API rejected the request: {e.reason}",
+        )
+    headers = None
+    if e.retry_after:
+        headers = {"Retry-After": str(math.ceil(e.retry_after))}
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=f"NaraJangter API temporarily unavailable: {e.reason}",
+        headers=headers,
+    )
 
 
 def _has_bssamt(item: BidAValueItem) -> bool:
@@ -193,23 +365,18 @@ async def _should_retry_bssamt(
 
     # 2. 개찰일 3일 이내인지 확인
     result = await db.execute(
-        select(BidNotice.openg_dt).where(
-            BidNotice.bid_ntce_no == bid_ntce_no,
-        )
+        select(BidNotice.openg_at)
+        .where(BidNotice.bid_ntce_no == bid_ntce_no)
+        .order_by(BidNotice.bid_ntce_ord.desc())
+        .limit(1)
     )
-    openg_dt_str = result.scalar_one_or_none()
-    if not openg_dt_str:
+    openg_at = result.scalar_one_or_none()
+    if not openg_at:
         return True  # 개찰일 정보 없으면 시도
 
-    try:
-        # YYYYMMDDHHMM 또는 "YYYY-MM-DD HH:MM:SS" 포맷 처리
-        clean = openg_dt_str.replace("-", "").replace(":", "").replace(" ", "")[:12]
-        openg_dt = datetime.strptime(clean, "%Y%m%d%H%M").replace(tzinfo=timezone.utc)
-        now = datetime.now(timezone.utc)
-        days_until_openg = (openg_dt - now).total_seconds() / 86400
-        return days_until_openg <= BSSAMT_RETRY_WINDOW_DAYS
-    except (ValueError, TypeError):
-        return True  # 파싱 실패 시 시도
+    now = datetime.now(timezone.utc)
+    days_until_openg = (openg_at - now).total_seconds() / 86400
+    return days_until_openg <= BSSAMT_RETRY_WINDOW_DAYS
 
 
 async def _fetch_and_cache_a_value(
@@ -295,7 +462,11 @@ async def get_bid_a_value(
                 db, bidNtceNo, cached_row.fetched_at if cached_row else None
             )
             if should_retry:
-                await _refresh_bid_notice(db, bidNtceNo, bid_type)
+                try:
+                    await _refresh_bid_notice(db, bidNtceNo, bid_type)
+                except UpstreamError as e:
+                    # 공고 재조회는 부가 정보 → 가진 데이터로 응답
+                    logger.warning(f"Bid notice refresh skipped: {e}")
                 # 쿨다운 타이머 리셋
                 if cached_row:
                     await bid_data_service.touch_basis_amount_fetched_at(
@@ -312,6 +483,9 @@ async def get_bid_a_value(
         )
     except HTTPException:
         raise
+    except UpstreamError as e:
+        logger.warning(f"A-value upstream failure: {e}")
+        raise _upstream_http_error(e)
     except Exception as e:
         logger.error(f"Error fetching A-value: {str(e)}")
         raise HTTPException(
@@ -320,6 +494,97 @@ async def get_bid_a_value(
         )
 
 
+@router.post("/price-calculations", response_model=BidPriceBatchResponse)
+async def calculate_bid_prices(
+    request: BidPriceBatchRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """공고 목록의 추천 투찰가 일괄 계산 (검색 페이지/북마크 테이블용)
+
+    DB에 캐시된 기초금액만 사용합니다. 기초금액이 아직 없는 공고는
+    배정예산금액으로 계산되며(usedFallback), 정확한 값은 /a-value로 조회하세요.
+    """
+    if len(request.items) > bid_price_engine.MAX_BATCH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A maximum of {bid_price_engine.MAX_BATCH} notices can be calculated at once",
+        )
+    rate_table = await assessment_rate_stats.rate_table(db)
+    items = await bid_price_engine.calculate(
+        db, [(item.bidNtceNo, item.bidNtceOrd) for item in request.items], rate_table
+    )
+    return BidPriceBatchResponse(items=items)
+
+
+@router.get("/assessment-rates", response_model=AssessmentRateTableResponse)
+async def get_assessment_rates(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """사정율 테이블 (개찰결과 통계 + 표본 부족 버킷은 기본값)
+
+    추천 투찰가 계산(/price-calculations)이 사용하는 값과 동일합니다.
+    """
+    stats = {
+        (s.region_scope, s.license_group, s.amount_range): s
+        for s in await assessment_rate_stats.get_stats(db)
+    }
+    table = assessment_rate_stats.build_rate_table(list(stats.values()))
+    items = []
+    for r, region in enumerate(REGION_SCOPES):
+        for l, license_group in enumerate(LICENSE_GROUPS):
+            for a, amount_range in enumerate(AMOUNT_RANGES):
+                stat = stats.get((region, license_group, amount_range))
+                learned = (
+                    stat is not None
+                    and stat.sample_count >= assessment_rate_stats.MIN_SAMPLES
+                )
+                item = AssessmentRateItem(
+                    regionScope=region,
+                    licenseGroup=license_group,
+                    amountRange=amount_range,
+                    rate=float(table[r, l, a]),
+                    source="learned" if learned else "static",
+                )
+                if stat is not None:
+                    item.sampleCount = stat.sample_count
+                    item.mean = stat.mean
+                    item.std = stat.std
+                    item.p10 = stat.p10
+                    item.p25 = stat.p25
+                    item.p50 = stat.p50
+                    item.p75 = stat.p75
+                    item.p90 = stat.p90
+                    item.updatedAt = stat.updated_at
+                items.append(item)
+    return AssessmentRateTableResponse(
+        items=items, minSamples=assessment_rate_stats.MIN_SAMPLES
+    )
+
+
+@router.post(
+    "/{bidNtceNo}/win-probability", response_model=WinProbabilityResponse
+)
+async def get_win_probability(
+    bidNtceNo: str,
+    request: WinProbabilityRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """후보 투찰가별 낙찰 확률 곡선 (예정가격 추첨 몬테카를로)
+
+    DB에 캐시된 기초금액(/a-value로 먼저 조회)과 같은 버킷 과거 개찰결과의
+    경쟁사 투찰 분포를 사용합니다.
+    """
+    try:
+        return await win_probability_service.simulate(db, bidNtceNo, request)
+    except WinProbabilityError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+
+
 @router.get("/{bidNtceNo}/detail", response_model=BidItem)
 async def get_bid_detail(
     bidNtceNo: str,
@@ -345,6 +610,23 @@ async def get_bid_detail(
     return BidItem(**row.data)
 
 
+@router.get(
+    "/{bidNtceNo}/revisions",
+    response_model=List[BidNoticeRevisionItem],
+)
+async def get_bid_revisions(
+    bidNtceNo: str,
+    limit: int = 100,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """공고 변경 이력 조회 (재공고 차수 변경 + 필드 단위 diff, 최신순)"""
+    revisions = await bid_data_service.get_notice_revisions(
+        db, bidNtceNo, limit=min(max(limit, 1), 500)
+    )
+    return [BidNoticeRevisionItem.model_validate(r) for r in revisions]
+
+
 @router.get(
     "/{bidNtceNo}/regions",
     response_model=List[PrtcptPsblRgnItem],
@@ -381,9 +663,12 @@ async def get_bid_regions(
         ]
 
     # DB에 없으면 API 조회 후 저장
-    api_regions = await narajangter_service.get_prtcpt_psbl_rgn_by_bid(
-        bidNtceNo, bidNtceOrd
-    )
+    try:
+        api_regions = await narajangter_service.get_prtcpt_psbl_rgn_by_bid(
+            bidNtceNo, bidNtceOrd
+        )
+    except UpstreamError as e:
+        raise _upstream_http_error(e)
     if api_regions:
         await bid_data_service.save_prtcpt_psbl_rgns(db, api_regions)
 
@@ -395,16 +680,18 @@ async def trigger_sync(
     days: int = 30,
     current_user: User = Depends(get_admin_user),
 ):
-    """데이터 동기화 트리거 (백그라운드 실행)"""
+    """데이터 동기화 트리거 (미동기화 날짜를 작업 큐에 등록)"""
     from app.services.bid_sync_scheduler import bid_sync_scheduler
 
-    asyncio.create_task(bid_sync_scheduler.sync_recent_data(days=days))
+    enqueued = await bid_sync_scheduler.sync_recent_data(days=days)
 
     return DataSyncResponse(
         synced=False,
         total_notices=0,
         total_regions=0,
-        message=f"최근 {days}일 동기화가 백그라운드에서 시작되었습니다.",
+        message=(
+            f"최근 {days}일 중 {enqueued}일의 동기화 작업이 큐에 등록되었습니다."
+        ),
     )
 
 
@@ -474,20 +761,20 @@ async def get_bookmarks(
 
     all_bid_nos = [b.bid_notice_no for b in bookmarks]
 
-    # 공고 일정 enrichment (bid_close_dt, openg_dt)
+    # 공고 일정 enrichment (bid_close_dt, openg_dt: YYYYMMDDHHMM KST)
     notice_map: dict[str, dict] = {}
     if all_bid_nos:
         notice_res = await db.execute(
             select(
                 BidNotice.bid_ntce_no,
-                BidNotice.bid_close_dt,
-                BidNotice.openg_dt,
+                BidNotice.bid_close_at,
+                BidNotice.openg_at,
             ).where(BidNotice.bid_ntce_no.in_(all_bid_nos))
         )
         for row in notice_res.all():
             notice_map[row[0]] = {
-                "bid_close_dt": row[1],
-                "openg_dt": row[2],
+                "bid_close_dt": format_kst(row[1]),
+                "openg_dt": format_kst(row[2]),
             }
 
     # 개찰결과 enrichment
@@ -700,11 +987,15 @@ async def get_bid_results(
                         set_={"data": items_data, "fetched_at": func.now()},
                     )
                 )
+                # fetched_at 갱신 → 다음 동기화 사이클의 competitor_index.refresh가
+                # 재색인 (요청 경로에서는 재집계하지 않음)
                 await db.execute(stmt)
                 await db.commit()
         except Exception as e:
             logger.error(f"Failed to fetch bid results: {e}")
-            items_data = []
+            if items_data is None:
+                # 호출 제한/장애 시 만료된 캐시라도 반환
+                items_data = cached.data if cached else []
 
     # 4. 결과 빌드
     results = [BidResultItem(**item) for item in items_data]
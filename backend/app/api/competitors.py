@@ -0,0 +1,145 @@
+import logging
+from typing import Literal, Optional
+
+from app.api.auth import get_current_user
+from app.db.database import get_db
+from app.models.user import User
+from app.schemas.bid import (
+    CompetitorBidItem,
+    CompetitorBidListResponse,
+    CompetitorDetailResponse,
+    CompetitorListResponse,
+    CompetitorRateBin,
+    CompetitorSegmentItem,
+    CompetitorSummary,
+)
+from app.services.competitor_index import (
+    ALL_SEGMENT,
+    INDUSTRY_PREFIX,
+    RATE_BIN_EDGES,
+    REGION_PREFIX,
+    SIDO_NAMES,
+    competitor_index,
+    normalize_bizno,
+    segment_of,
+)
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/competitors", tags=["Competitors"])
+
+
+def _summary(stat) -> dict:
+    return {
+        "prcbdrBizno": stat.prcbdr_bizno,
+        "prcbdrNm": stat.prcbdr_nm,
+        "bidCount": stat.bid_count,
+        "winCount": stat.win_count,
+        "avgBidRate": stat.avg_bid_rate,
+        "lastOpenedAt": stat.last_opened_at,
+    }
+
+
+def _rate_bins(histogram: list) -> list[CompetitorRateBin]:
+    edges = [None, *RATE_BIN_EDGES.tolist(), None]
+    return [
+        CompetitorRateBin(low=edges[i], high=edges[i + 1], count=count)
+        for i, count in enumerate(histogram)
+    ]
+
+
+@router.get("", response_model=CompetitorListResponse)
+async def list_competitors(
+    region: Optional[str] = None,
+    industry: Optional[str] = None,
+    sort: Literal["bid_count", "win_count"] = "bid_count",
+    pageNo: int = Query(1, ge=1),
+    numOfRows: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """지역(시도)/업종별 경쟁사 순위 (참여순 또는 낙찰순)"""
+    segment = segment_of(region, industry)
+    total, stats = await competitor_index.list_competitors(
+        db, segment, sort, pageNo, numOfRows
+    )
+    return CompetitorListResponse(
+        segment=segment,
+        totalCount=total,
+        pageNo=pageNo,
+        numOfRows=numOfRows,
+        items=[CompetitorSummary(**_summary(s)) for s in stats],
+    )
+
+
+@router.get("/{bizno}", response_model=CompetitorDetailResponse)
+async def get_competitor(
+    bizno: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """업체 전체 집계 + 투찰률 분포 + 지역/업종별 참여 현황"""
+    stats = await competitor_index.get_competitor(db, bizno)
+    overall = next((s for s in stats if s.segment == ALL_SEGMENT), None)
+    if overall is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="개찰결과에 해당 업체의 투찰 기록이 없습니다",
+        )
+
+    regions, industries = [], []
+    for stat in stats:
+        # 시도×업종 조합 세그먼트는 목록 조회용
+        if "|" in stat.segment:
+            continue
+        item = {
+            "bidCount": stat.bid_count,
+            "winCount": stat.win_count,
+            "avgBidRate": stat.avg_bid_rate,
+        }
+        if stat.segment.startswith(REGION_PREFIX):
+            code = stat.segment[len(REGION_PREFIX):]
+            regions.append(CompetitorSegmentItem(
+                code=code, name=SIDO_NAMES.get(code, code), **item
+            ))
+        elif stat.segment.startswith(INDUSTRY_PREFIX):
+            name = stat.segment[len(INDUSTRY_PREFIX):]
+            industries.append(CompetitorSegmentItem(code=name, name=name, **item))
+
+    return CompetitorDetailResponse(
+        **_summary(overall),
+        rateHistogram=_rate_bins(overall.rate_histogram),
+        regions=regions,
+        industries=industries,
+    )
+
+
+@router.get("/{bizno}/bids", response_model=CompetitorBidListResponse)
+async def list_competitor_bids(
+    bizno: str,
+    pageNo: int = Query(1, ge=1),
+    numOfRows: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """업체의 최근 투찰 기록 (개찰일시 내림차순)"""
+    total, bids = await competitor_index.list_bids(db, bizno, pageNo, numOfRows)
+    return CompetitorBidListResponse(
+        prcbdrBizno=normalize_bizno(bizno),
+        totalCount=total,
+        pageNo=pageNo,
+        numOfRows=numOfRows,
+        items=[
+            CompetitorBidItem(
+                bidNtceNo=bid.bid_ntce_no,
+                bidNtceNm=bid.bid_ntce_nm,
+                bidAmount=bid.bid_amount,
+                bidRate=bid.bid_rate,
+                openingRank=bid.opening_rank,
+                won=bid.won,
+                openedAt=bid.opened_at,
+            )
+            for bid in bids
+        ],
+    )
@@ -33,6 +33,17 @@ class Settings(BaseSettings):
     ENABLE_EMAIL_NOTIFICATIONS: bool = True
     NOTIFICATION_CHECK_INTERVAL: int = 3600  # seconds (1 hour)
     ENABLE_BID_SYNC: bool = True
+    SYNC_DAILY_API_BUDGET: int = 1000  # 동기화 스케줄러 일일 API 호출 예산
+    BID_DATA_RETENTION_MONTHS: int = 0  # 공고 파티션 보관 개월 수 (0이면 삭제 안 함)
+    OPEN_BIDS_HOT_SET_ENABLED: bool = True  # 진행 중 공고 검색을 인메모리 핫셋으로 처리
+    SEARCH_CACHE_BACKEND: str = "memory"  # 검색 응답 캐시: memory(단일 워커) | postgres(멀티 워커) | "" 비활성
+    SEARCH_CACHE_TTL: int = 60  # 검색 응답 캐시 유효 시간 (초)
+    SEARCH_CACHE_MAX_ENTRIES: int = 1000  # memory 백엔드 최대 항목 수
+    PROFILING_SAMPLE_RATE: float = 0.0  # 요청 프로파일링 샘플링 비율
+    PROFILING_SECRET: str = ""  # X-Profile 헤더 값이 이 값과 같으면 항상 프로파일 (미설정 시 헤더 무시)
+    PROFILING_SLOW_MS: int = 500  # 이 시간 이상 걸린 프로파일 요청은 SQL + EXPLAIN 보관
+    PROFILING_MAX_ENTRIES: int = 50  # 보관하는 최근 느린 요청 수
+    METRICS_TOKEN: str = ""  # GET /metrics Bearer 토큰 (미설정 시 /metrics 비활성 → 404)
     ALERT_EMAIL: str = ""  # 동기화 실패 알림 수신 이메일 (미설정 시 FROM_EMAIL 사용)
     
     @property
@@ -0,0 +1,221 @@
+"""Prometheus 메트릭 (GET /metrics)
+
+- 나라장터 API: 엔드포인트 × HTTP 상태 × resultCode별 응답 시간, 재시도 횟수,
+  서킷 브레이커 상태
+- DB: BidDataService 메서드별 소요 시간, 커넥션 풀 사용량
+- 동기화 스케줄러: 윈도우 소요 시간, 피드별 페이지/행 수, 호출 간격 대기 시간,
+  남은 일일 API 예산
+
+엔드포인트 이름/풀 크기/동기화 상태가 노출되므로 METRICS_TOKEN을 설정한
+경우에만 제공하며, 스크레이퍼는 Authorization: Bearer <METRICS_TOKEN>으로
+요청합니다.
+"""
+import functools
+import hmac
+import inspect
+import re
+import time
+from typing import Callable, Optional, Tuple
+
+import httpx
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+UPSTREAM_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 3, 5, 10, 20, 30)
+DB_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+WINDOW_BUCKETS = (1, 2, 5, 10, 20, 30, 60, 120, 300, 600)
+
+UPSTREAM_LATENCY = Histogram(
+    "narajangter_request_duration_seconds",
+    "나라장터 API 응답 시간",
+    ["endpoint", "status", "result_code"],
+    buckets=UPSTREAM_BUCKETS,
+)
+UPSTREAM_ERRORS = Counter(
+    "narajangter_request_errors_total",
+    "응답을 받지 못한 나라장터 API 호출 (타임아웃/연결 오류)",
+    ["endpoint", "error"],
+)
+UPSTREAM_RETRIES = Counter(
+    "narajangter_retries_total",
+    "재시도한 나라장터 API 호출 (reason: throttled, unavailable)",
+    ["endpoint", "reason"],
+)
+UPSTREAM_CIRCUIT_STATE = Gauge(
+    "narajangter_circuit_state",
+    "엔드포인트별 서킷 상태 (0: closed, 1: half-open, 2: open)",
+    ["endpoint"],
+)
+UPSTREAM_CIRCUIT_REJECTED = Counter(
+    "narajangter_circuit_rejected_total",
+    "서킷이 열려 있어 보내지 않은 나라장터 API 호출",
+    ["endpoint"],
+)
+
+DB_METHOD_LATENCY = Histogram(
+    "bid_data_service_duration_seconds",
+    "BidDataService 메서드별 소요 시간 (DB 왕복 포함)",
+    ["method", "outcome"],
+    buckets=DB_BUCKETS,
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "DB 커넥션 풀 상태 (size: 기본 크기, checked_out: 사용 중, "
+    "overflow: 기본 크기 초과분, capacity: 최대 크기)",
+    ["state"],
+)
+
+SYNC_WINDOW_DURATION = Histogram(
+    "sync_window_duration_seconds",
+    "동기화 윈도우 1건 처리 시간",
+    ["outcome"],
+    buckets=WINDOW_BUCKETS,
+)
+SYNC_PAGES = Counter(
+    "sync_pages_total", "동기화한 API 페이지 수", ["feed"]
+)
+SYNC_ROWS = Counter(
+    "sync_rows_total", "동기화한 행 수", ["feed"]
+)
+SYNC_RATE_LIMIT_WAIT = Counter(
+    "sync_rate_limit_wait_seconds_total",
+    "API 호출 간격 유지를 위한 대기 시간 (page: 페이지 간, window: 윈도우 간)",
+    ["reason"],
+)
+SYNC_API_BUDGET_REMAINING = Gauge(
+    "sync_api_budget_remaining",
+    "오늘 남은 동기화 API 호출 예산",
+)
+
+# 응답 앞부분에서 resultCode 추출 (JSON 헤더 또는 공공데이터포털 XML 오류 응답)
+_RESULT_CODE = re.compile(
+    rb'"resultCode"\s*:\s*"(\w+)"|<returnReasonCode>(\w+)<|<resultCode>(\w+)<'
+)
+_RESULT_CODE_SCAN_BYTES = 1024
+
+
+def endpoint_label(url: httpx.URL) -> str:
+    """요청 URL → 오퍼레이션명 (예: getBidPblancListInfoPrtcptPsblRgn)."""
+    return url.path.rstrip("/").rsplit("/", 1)[-1] or "unknown"
+
+
+def result_code_of(content: bytes) -> str:
+    match = _RESULT_CODE.search(content[:_RESULT_CODE_SCAN_BYTES])
+    if not match:
+        return "none"
+    return next(group for group in match.groups() if group).decode()
+
+
+async def _stamp_request(request: httpx.Request) -> None:
+    request.extensions["metrics_started_at"] = time.perf_counter()
+
+
+async def _observe_response(response: httpx.Response) -> None:
+    started = response.request.extensions.get("metrics_started_at")
+    if started is None:
+        return
+    # 응답 본문은 어차피 호출자가 모두 읽으므로 여기서 미리 읽어 둡니다
+    await response.aread()
+    UPSTREAM_LATENCY.labels(
+        endpoint_label(response.request.url),
+        str(response.status_code),
+        result_code_of(response.content),
+    ).observe(time.perf_counter() - started)
+
+
+class InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """연결 오류/타임아웃도 엔드포인트별로 집계하는 transport."""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        try:
+            return await super().handle_async_request(request)
+        except httpx.TransportError as e:
+            UPSTREAM_ERRORS.labels(
+                endpoint_label(request.url), type(e).__name__
+            ).inc()
+            raise
+
+
+def upstream_client_options() -> dict:
+    """나라장터 API용 httpx.AsyncClient 인자 (응답 시간 계측 hook 포함)."""
+    return {
+        "transport": InstrumentedTransport(),
+        "event_hooks": {
+            "request": [_stamp_request],
+            "response": [_observe_response],
+        },
+    }
+
+
+def instrument_methods(
+    histogram: Histogram = DB_METHOD_LATENCY,
+) -> Callable[[type], type]:
+    """클래스의 public async 메서드 소요 시간을 기록하는 클래스 데코레이터.
+
+    메서드 시그니처는 그대로 유지됩니다 (functools.wraps).
+    """
+
+    def wrap(method: Callable) -> Callable:
+        name = method.__name__
+
+        @functools.wraps(method)
+        async def timed(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await method(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                histogram.labels(name, outcome).observe(
+                    time.perf_counter() - started
+                )
+
+        return timed
+
+    def decorate(cls: type) -> type:
+        for name, member in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.iscoroutinefunction(member):
+                setattr(cls, name, wrap(member))
+        return cls
+
+    return decorate
+
+
+def register_pool_metrics(engine) -> None:
+    """AsyncEngine 커넥션 풀 상태를 scrape 시점에 읽도록 연결합니다."""
+    pool = engine.sync_engine.pool
+    if not hasattr(pool, "checkedout"):
+        return  # NullPool 등 크기 개념이 없는 풀
+    DB_POOL_CONNECTIONS.labels("size").set_function(pool.size)
+    DB_POOL_CONNECTIONS.labels("checked_out").set_function(pool.checkedout)
+    DB_POOL_CONNECTIONS.labels("overflow").set_function(
+        lambda: max(pool.overflow(), 0)
+    )
+    DB_POOL_CONNECTIONS.labels("capacity").set_function(
+        lambda: pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+    )
+
+
+def metrics_authorized(authorization: Optional[str], token: str) -> bool:
+    """Authorization 헤더가 Bearer <token>인지 확인합니다 (token 미설정 시 항상 False)."""
+    if not token or not authorization:
+        return False
+    scheme, _, value = authorization.partition(" ")
+    if scheme.lower() != "bearer":
+        return False
+    return hmac.compare_digest(value.strip(), token)
+
+
+def render_metrics(
+    registry: Optional[CollectorRegistry] = None,
+) -> Tuple[bytes, str]:
+    """(text exposition 본문, Content-Type)"""
+    return generate_latest(registry or REGISTRY), CONTENT_TYPE_LATEST
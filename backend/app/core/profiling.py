@@ -0,0 +1,255 @@
+"""요청 단위 프로파일링 (검색 지연 원인 분석용)
+
+X-Profile: <PROFILING_SECRET> 헤더를 보내거나 PROFILING_SAMPLE_RATE 확률로
+샘플링된 요청에서
+- phase(): 구간별 소요 시간 (건수 쿼리 / 본 쿼리 / enrichment / 직렬화 등)
+- SQLAlchemy 이벤트: 실행된 SQL과 소요 시간
+을 기록합니다. 응답에는 Server-Timing 헤더로 구간 시간이 붙고,
+PROFILING_SLOW_MS 이상 걸린 요청은 가장 느린 SELECT의 EXPLAIN을 떠서
+최근 PROFILING_MAX_ENTRIES건을 보관합니다 (GET /admin/profiles).
+헤더는 비밀값이 설정되어 있고 일치할 때만 인정합니다 (인증 없는 요청이
+EXPLAIN을 유발하지 못하도록).
+"""
+import hmac
+import logging
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterator, List, Optional
+
+from sqlalchemy import event
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+MAX_EXPLAINS = 3  # 느린 요청당 EXPLAIN 하는 쿼리 수 (느린 순)
+MAX_PARAMS_LENGTH = 500
+
+
+@dataclass
+class QueryTiming:
+    sql: str
+    params: str
+    ms: float
+    plan: Optional[list] = None
+    raw_params: Any = field(default=None, repr=False)  # EXPLAIN 재실행용
+
+
+@dataclass
+class RequestProfile:
+    method: str
+    path: str
+    query_string: str
+    started_at: datetime = field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+    phases: List[tuple] = field(default_factory=list)  # (구간, ms)
+    queries: List[QueryTiming] = field(default_factory=list)
+    total_ms: float = 0.0
+    status_code: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "method": self.method,
+            "path": self.path,
+            "queryString": self.query_string,
+            "startedAt": self.started_at.isoformat(),
+            "statusCode": self.status_code,
+            "totalMs": round(self.total_ms, 2),
+            "phases": [
+                {"name": name, "ms": round(ms, 2)} for name, ms in self.phases
+            ],
+            "queries": [
+                {
+                    "sql": q.sql,
+                    "params": q.params,
+                    "ms": round(q.ms, 2),
+                    "plan": q.plan,
+                }
+                for q in self.queries
+            ],
+        }
+
+
+_current: ContextVar[Optional[RequestProfile]] = ContextVar(
+    "request_profile", default=None
+)
+
+
+def current_profile() -> Optional[RequestProfile]:
+    return _current.get()
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """프로파일 중인 요청이면 구간 소요 시간을 기록합니다 (아니면 no-op)."""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.phases.append((name, (time.perf_counter() - started) * 1000))
+
+
+class RequestProfiler:
+    """느린 요청 프로파일 보관소 (최근 max_entries건)."""
+
+    def __init__(
+        self,
+        sample_rate: float = settings.PROFILING_SAMPLE_RATE,
+        slow_ms: float = settings.PROFILING_SLOW_MS,
+        max_entries: int = settings.PROFILING_MAX_ENTRIES,
+        secret: str = settings.PROFILING_SECRET,
+    ):
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.max_entries = max_entries
+        self._secret = secret.encode("latin-1")
+        self._engine = None
+        # 오래된 항목부터 밀려남 (최근 회귀가 과거의 느린 요청에 가려지지 않도록)
+        self._recent: deque = deque(maxlen=max_entries)
+
+    # --- SQL 수집 ---
+
+    def attach(self, engine) -> None:
+        """AsyncEngine에 SQL 수집 이벤트를 연결합니다 (EXPLAIN에도 사용)."""
+        self._engine = engine
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_execute)
+
+    @staticmethod
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            conn.info.setdefault("profile_started", []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_execute(conn, cursor, statement, parameters, context, executemany):
+        profile = _current.get()
+        if profile is None:
+            return
+        stack = conn.info.get("profile_started")
+        if not stack:
+            return
+        elapsed = (time.perf_counter() - stack.pop()) * 1000
+        profile.queries.append(QueryTiming(
+            sql=statement,
+            params=repr(parameters)[:MAX_PARAMS_LENGTH],
+            ms=elapsed,
+            raw_params=None if executemany else parameters,
+        ))
+
+    # --- 요청 수명 ---
+
+    def should_profile(self, headers) -> bool:
+        if self._secret:
+            for key, value in headers:
+                if key == PROFILE_HEADER:
+                    if hmac.compare_digest(value, self._secret):
+                        return True
+                    break
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def start(self, profile: RequestProfile):
+        return _current.set(profile)
+
+    async def finish(self, profile: RequestProfile, token) -> None:
+        _current.reset(token)
+        if profile.total_ms < self.slow_ms:
+            return
+        await self._explain(profile)
+        self._recent.append(profile)
+        logger.info(
+            f"Slow request profiled: {profile.method} {profile.path} "
+            f"{profile.total_ms:.0f}ms ({len(profile.queries)} queries)"
+        )
+
+    async def _explain(self, profile: RequestProfile) -> None:
+        """가장 느린 SELECT 몇 개의 실행 계획 (ANALYZE 없이 — 재실행 비용 없음)."""
+        if self._engine is None:
+            return
+        selects = [
+            q for q in profile.queries
+            if q.sql.lstrip().upper().startswith(("SELECT", "WITH"))
+        ]
+        selects.sort(key=lambda q: q.ms, reverse=True)
+        try:
+            async with self._engine.connect() as conn:
+                for query in selects[:MAX_EXPLAINS]:
+                    result = await conn.exec_driver_sql(
+                        f"EXPLAIN (FORMAT JSON) {query.sql}",
+                        query.raw_params or (),
+                    )
+                    query.plan = result.scalar()
+        except Exception as e:
+            logger.warning(f"EXPLAIN for profiled request failed: {e}")
+
+    def recent(self) -> List[RequestProfile]:
+        """보관된 느린 요청 (최근 순)."""
+        return list(reversed(self._recent))
+
+    def clear(self) -> None:
+        self._recent.clear()
+
+
+request_profiler = RequestProfiler()
+
+
+class ProfilingMiddleware:
+    """프로파일 대상 요청에 컨텍스트를 열고 Server-Timing 헤더를 붙입니다.
+
+    EXPLAIN은 응답 전송이 끝난 뒤에 수행하므로 응답 시간에 포함되지 않습니다.
+    """
+
+    def __init__(self, app, profiler: RequestProfiler = request_profiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.profiler.should_profile(
+            scope.get("headers") or ()
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(
+            method=scope["method"],
+            path=scope["path"],
+            query_string=(scope.get("query_string") or b"").decode("latin-1"),
+        )
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+                profile.total_ms = (time.perf_counter() - started) * 1000
+                timing = ", ".join(
+                    [f'{name};dur={ms:.1f}' for name, ms in profile.phases]
+                    + [f"db;dur={sum(q.ms for q in profile.queries):.1f}",
+                       f"total;dur={profile.total_ms:.1f}"]
+                )
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (b"server-timing", timing.encode("latin-1")),
+                    ],
+                }
+            await send(message)
+
+        token = self.profiler.start(profile)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            # 스트리밍 응답은 본문 전송까지 포함
+            profile.total_ms = (time.perf_counter() - started) * 1000
+            await self.profiler.finish(profile, token)
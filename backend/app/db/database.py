@@ -1,12 +1,16 @@
+import orjson
+
 from app.core.config import settings
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
 # Create async engine
+# JSONB(공고 data)는 orjson으로 역직렬화 (검색 페이지마다 수백 건 파싱)
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=True,
-    future=True
+    future=True,
+    json_deserializer=orjson.loads,
 )
 
 # Create async session factory
@@ -1,10 +1,14 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.core.config import settings
-from app.api import auth, preferences, bids, notifications, locations, profile
+from app.core.metrics import metrics_authorized, register_pool_metrics, render_metrics
+from app.core.profiling import ProfilingMiddleware, request_profiler
+from app.db.database import engine
+from app.api import admin, auth, preferences, bids, notifications, locations, profile, competitors
 from app.services.scheduler import notification_scheduler
 from app.services.bid_sync_scheduler import bid_sync_scheduler
+from app.services.leader_election import LeaderElection
 import asyncio
 import logging
 
@@ -17,27 +21,50 @@ is_production = settings.ENV == "production"
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events
+
+    Schedulers run only in the process holding their leader lock, so
+    multiple uvicorn workers/replicas do not duplicate API calls or emails.
+    The sync job worker runs everywhere (jobs are claimed with SKIP LOCKED).
     """
-    # Startup: Start the notification scheduler
-    if settings.ENABLE_EMAIL_NOTIFICATIONS:
-        asyncio.create_task(notification_scheduler.start())
-        logger.info("Email notification scheduler started")
+    leaders: list[LeaderElection] = []
 
-    # Startup: Start bid data sync scheduler
+    # Startup: Elect the notification scheduler leader
+    if settings.ENABLE_EMAIL_NOTIFICATIONS:
+        leaders.append(
+            LeaderElection(
+                "notification_scheduler",
+                notification_scheduler.start,
+                notification_scheduler.stop,
+            )
+        )
+        logger.info("Email notification scheduler leader election started")
+
+    # Startup: Elect the bid data sync scheduler leader + start job worker
     if settings.ENABLE_BID_SYNC:
-        asyncio.create_task(bid_sync_scheduler.start())
-        logger.info("Bid data sync scheduler started")
+        leaders.append(
+            LeaderElection(
+                "bid_sync_scheduler",
+                bid_sync_scheduler.start,
+                bid_sync_scheduler.stop,
+            )
+        )
+        logger.info("Bid data sync scheduler leader election started")
+        asyncio.create_task(bid_sync_scheduler.run_job_worker())
+        logger.info("Sync job worker started")
+
+    for leader in leaders:
+        asyncio.create_task(leader.run())
 
     yield
 
-    # Shutdown
-    if settings.ENABLE_EMAIL_NOTIFICATIONS:
-        await notification_scheduler.stop()
-        logger.info("Email notification scheduler stopped")
+    # Shutdown: stop schedulers and release leader locks
+    for leader in leaders:
+        await leader.shutdown()
+        logger.info(f"{leader.name} leadership released")
 
     if settings.ENABLE_BID_SYNC:
-        await bid_sync_scheduler.stop()
-        logger.info("Bid data sync scheduler stopped")
+        await bid_sync_scheduler.stop_job_worker()
+        logger.info("Sync job worker stopped")
 
 
 app = FastAPI(
@@ -58,6 +85,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 요청 프로파일링 (X-Profile: <PROFILING_SECRET> 헤더 또는 PROFILING_SAMPLE_RATE 샘플링)
+app.add_middleware(ProfilingMiddleware)
+request_profiler.attach(engine)
 
 # Include routers
 app.include_router(auth.router)
@@ -66,6 +96,8 @@ app.include_router(bids.router)
 app.include_router(notifications.router)
 app.include_router(locations.router)
 app.include_router(profile.router)
+app.include_router(competitors.router)
+app.include_router(admin.router)
 
 
 @app.get("/")
@@ -78,6 +110,22 @@ async def root():
     }
 
 
+register_pool_metrics(engine)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(authorization: str | None = Header(default=None)):
+    """Prometheus scrape endpoint (Bearer METRICS_TOKEN required)."""
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=404)
+    if not metrics_authorized(authorization, settings.METRICS_TOKEN):
+        raise HTTPException(
+            status_code=401, headers={"WWW-Authenticate": "Bearer"}
+        )
+    body, content_type = render_metrics()
+    return Response(content=body, headers={"Content-Type": content_type})
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -1,31 +1,88 @@
 import uuid
 
 from app.db.database import Base
-from sqlalchemy import Column, DateTime, Index, Integer, PrimaryKeyConstraint, String, BigInteger, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import Boolean, Column, DateTime, Float, Index, Integer, LargeBinary, PrimaryKeyConstraint, String, BigInteger, Text, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.sql import func
 
 
 class BidNotice(Base):
-    """입찰공고 데이터 - API에서 가져온 공고 정보를 DB에 저장"""
+    """입찰공고 데이터 - API에서 가져온 공고 정보를 DB에 저장
+
+    등록일시(rgst_dt) 기준 월별 RANGE 파티션 (bid_notices_pYYYYMM,
+    범위 밖/빈 값은 bid_notices_pdefault). 파티션 키가 PK에 포함되므로
+    rgst_dt가 바뀐 공고는 저장 시 기존 row를 삭제 후 새 파티션에 기록합니다.
+    rgst_dt는 파티션 키라 정규화 문자열로 유지하고(사전순 = 시간순),
+    나머지 일시/금액은 저장 시 timestamptz/bigint로 변환합니다.
+    """
     __tablename__ = "bid_notices"
     __table_args__ = (
-        Index('ix_bid_notices_rgst_dt', 'rgst_dt'),
-        Index('ix_bid_notices_openg_dt', 'openg_dt'),
-        Index('ix_bid_notices_bid_close_dt', 'bid_close_dt'),
+        # 검색 필터 컬럼을 INCLUDE → 건수 조회/필터를 index-only scan으로 처리
+        Index(
+            'ix_bid_notices_rgst_dt_cover', 'rgst_dt',
+            postgresql_include=['bid_close_at', 'presmpt_prce', 'bdgt_amt'],
+        ),
+        Index(
+            'ix_bid_notices_openg_at_cover', 'openg_at',
+            postgresql_include=['rgst_dt', 'bid_close_at', 'presmpt_prce'],
+        ),
+        # 마감 전 공고(bid_close_at > now()) 범위 스캔 + 마감순 정렬
+        Index('ix_bid_notices_bid_close_at', 'bid_close_at'),
+        Index(
+            'ix_bid_notices_bid_close_at_desc',
+            text('bid_close_at DESC NULLS LAST'),
+        ),
+        Index('ix_bid_notices_presmpt_prce', 'presmpt_prce'),
+        Index(
+            'ix_bid_notices_presmpt_prce_desc',
+            text('presmpt_prce DESC NULLS LAST'),
+        ),
+        Index('ix_bid_notices_bdgt_amt', 'bdgt_amt'),
+        Index(
+            'ix_bid_notices_bdgt_amt_desc',
+            text('bdgt_amt DESC NULLS LAST'),
+        ),
+        # 핫셋 증분 갱신 (fetched_at >= watermark)
+        Index('ix_bid_notices_fetched_at', 'fetched_at'),
+        {"postgresql_partition_by": "RANGE (rgst_dt)"},
     )
 
     bid_ntce_no = Column(String(50), primary_key=True)
     bid_ntce_ord = Column(String(10), primary_key=True)
-    rgst_dt = Column(String(14))         # 등록일시 normalized YYYYMMDDHHMM
-    openg_dt = Column(String(14))        # 개찰일시 normalized YYYYMMDDHHMM
-    bid_close_dt = Column(String(14))    # 입찰마감일시 normalized YYYYMMDDHHMM
+    rgst_dt = Column(String(14), primary_key=True, server_default="")  # 등록일시 normalized YYYYMMDDHHMM (파티션 키)
+    openg_at = Column(DateTime(timezone=True))      # 개찰일시
+    bid_close_at = Column(DateTime(timezone=True))  # 입찰마감일시
     presmpt_prce = Column(BigInteger)    # 추정가격 (숫자)
+    bdgt_amt = Column(BigInteger)        # 예산금액
+    asign_bdgt_amt = Column(BigInteger)  # 배정예산금액
     main_cnsty_nm = Column(String(200))  # 주공종명
     data = Column(JSONB, nullable=False) # 전체 BidItem 데이터
+    content_hash = Column(String(64))    # 정규화된 BidItem sha256 (변경 감지용)
     fetched_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
+class BidNoticeRevision(Base):
+    """입찰공고 변경 이력 (append-only, 필드 단위 diff)
+
+    revision_type:
+    - update: 같은 차수 공고의 데이터 변경 (일정, 금액 등)
+    - reissue: 새 차수(bidNtceOrd)로 재공고 — prev_ord 차수 대비 diff
+    changes: {"필드명": [이전값, 새값], ...} (변경된 필드만 저장)
+    """
+    __tablename__ = "bid_notice_revisions"
+    __table_args__ = (
+        Index('ix_bid_notice_revisions_notice', 'bid_ntce_no', 'detected_at'),
+    )
+
+    revision_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    bid_ntce_no = Column(String(50), nullable=False)
+    bid_ntce_ord = Column(String(10), nullable=False)
+    prev_ord = Column(String(10))        # reissue일 때 비교 기준 차수
+    revision_type = Column(String(10), nullable=False)
+    changes = Column(JSONB, nullable=False)
+    detected_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class BidBasisAmount(Base):
     """기초금액 정보 (공사/용역)"""
     __tablename__ = "bid_basis_amounts"
@@ -38,18 +95,47 @@ class BidBasisAmount(Base):
 
 
 class BidPrtcptPsblRgn(Base):
-    """참가가능지역 정보"""
+    """참가가능지역 정보 (rgst_month 기준 월별 RANGE 파티션)"""
     __tablename__ = "bid_prtcpt_psbl_rgns"
+    __table_args__ = (
+        # 지역 EXISTS 서브쿼리를 index-only scan으로 처리
+        Index(
+            'ix_bid_prtcpt_psbl_rgns_bid_ntce_rgn',
+            'bid_ntce_no', 'bid_ntce_ord', 'prtcpt_psbl_rgn_nm',
+        ),
+        Index('ix_bid_prtcpt_psbl_rgns_fetched_at', 'fetched_at'),
+        {"postgresql_partition_by": "RANGE (rgst_month)"},
+    )
 
     bid_ntce_no = Column(String(50), primary_key=True)
     bid_ntce_ord = Column(String(10), primary_key=True)
     lmt_sno = Column(Integer, primary_key=True)
+    rgst_month = Column(String(6), primary_key=True, server_default="")  # 등록월 YYYYMM (파티션 키)
     prtcpt_psbl_rgn_nm = Column(String(200), index=True)
     rgst_dt = Column(String(30))
     bsns_div_nm = Column(String(50))
     fetched_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
+class BidRegionEligibility(Base):
+    """공고별 참가가능 지역코드 (지역 필터용 사전 계산, rgst_month 기준 월별 RANGE 파티션)
+
+    region_code (region_hierarchy 참고):
+    - "00": 지역 제한 없음 (참가가능지역 없음 또는 "전체")
+    - "41", "41/성남시": 참가가능지역 자체
+    - ">41": 41의 하위 지역으로 제한 — 상위 지역 필터/소재지 매칭용
+    """
+    __tablename__ = "bid_region_eligibility"
+    __table_args__ = (
+        {"postgresql_partition_by": "RANGE (rgst_month)"},
+    )
+
+    bid_ntce_no = Column(String(50), primary_key=True)
+    bid_ntce_ord = Column(String(10), primary_key=True)
+    region_code = Column(String(200), primary_key=True)
+    rgst_month = Column(String(6), primary_key=True, server_default="")  # 등록월 YYYYMM (파티션 키)
+
+
 class UserLocation(Base):
     """사용자 소재지 정보"""
     __tablename__ = "user_locations"
@@ -64,6 +150,9 @@ class UserLocation(Base):
 class BidOpeningResult(Base):
     """개찰결과 데이터 캐시"""
     __tablename__ = "bid_opening_results"
+    __table_args__ = (
+        Index('ix_bid_opening_results_fetched_at', 'fetched_at'),
+    )
 
     bid_ntce_no = Column(String(50), primary_key=True)
     data = Column(JSONB, nullable=False)  # 전체 개찰결과 리스트
@@ -71,16 +160,21 @@ class BidOpeningResult(Base):
 
 
 class BidLicenseLimit(Base):
-    """면허제한 정보 - 허용업종 필터링용"""
+    """면허제한 정보 - 허용업종 필터링용 (rgst_month 기준 월별 RANGE 파티션)"""
     __tablename__ = "bid_license_limits"
     __table_args__ = (
-        PrimaryKeyConstraint("bid_ntce_no", "bid_ntce_ord", "lmt_grp_no", "lmt_sno"),
+        PrimaryKeyConstraint(
+            "bid_ntce_no", "bid_ntce_ord", "lmt_grp_no", "lmt_sno", "rgst_month"
+        ),
+        Index('ix_bid_license_limits_fetched_at', 'fetched_at'),
+        {"postgresql_partition_by": "RANGE (rgst_month)"},
     )
 
     bid_ntce_no = Column(String(50), nullable=False)
     bid_ntce_ord = Column(String(10), nullable=False, default="000")
     lmt_grp_no = Column(String(10), nullable=False)
     lmt_sno = Column(String(10), nullable=False)
+    rgst_month = Column(String(6), nullable=False, server_default="")  # 등록월 YYYYMM (파티션 키)
     lcns_lmt_nm = Column(String(500), nullable=True)
     permsn_indstryty_list = Column(Text, nullable=True, index=True)
     bsns_div_nm = Column(String(30), nullable=True)
@@ -96,12 +190,203 @@ class DataSyncLog(Base):
     window_end: 윈도우 끝 (YYYYMMDDHH59 또는 YYYYMMDD2359)
     - 시간별: 202602111300 ~ 202602111359
     - 일별 백필: 202602100000 ~ 202602102359
+    - 일별 압축: 24개 시간별 윈도우가 모두 확정되면 일별 행으로 합치고
+      시간별 공고 수는 hourly_notices([00시, ..., 23시])에 보존
+    00시 윈도우와 일별 행은 시작이 같으므로 (sync_timestamp, window_end)가 키
     """
     __tablename__ = "data_sync_log"
 
     sync_timestamp = Column(String(12), primary_key=True)
-    window_end = Column(String(12), nullable=False)
+    window_end = Column(String(12), primary_key=True)
     total_notices = Column(Integer, default=0)
     total_regions = Column(Integer, default=0)
     total_license_limits = Column(Integer, default=0)
+    notices_inserted = Column(Integer, default=0)   # 신규 저장된 공고 수
+    notices_updated = Column(Integer, default=0)    # 내용 변경으로 갱신된 공고 수
+    notices_unchanged = Column(Integer, default=0)  # 해시 동일로 쓰기 생략된 공고 수
+    hourly_notices = Column(JSONB, nullable=True)   # 압축된 일별 행의 시간별 공고 수
     synced_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class SyncApiUsage(Base):
+    """동기화 스케줄러 일별 API 호출 수 (KST 날짜별 카운터)
+
+    재시작이나 리더 교체 후에도 일일 예산(SYNC_DAILY_API_BUDGET)이
+    이어지도록 프로세스 메모리가 아닌 DB에 누적합니다.
+    """
+    __tablename__ = "sync_api_usage"
+
+    usage_date = Column(String(8), primary_key=True)  # YYYYMMDD (KST)
+    calls = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class SyncJob(Base):
+    """영속 동기화 작업 큐 - 피드·페이지 단위 체크포인트로 재시작 후 이어서 처리
+
+    status: pending → running → done (실패 시 pending 재시도, 한도 초과 시 failed)
+    checkpoints: {"contract": {"page": 3, "count": 300, "done": false}, ...}
+    - page: 마지막으로 저장 완료된 페이지 (재개 시 page + 1부터 조회)
+    워커는 SELECT ... FOR UPDATE SKIP LOCKED로 작업을 가져가므로
+    여러 프로세스/레플리카가 동시에 처리할 수 있습니다.
+    """
+    __tablename__ = "sync_jobs"
+    __table_args__ = (
+        Index('ix_sync_jobs_claim', 'status', 'priority', 'created_at'),
+        Index(
+            'uq_sync_jobs_active_window',
+            'window_start',
+            'window_end',
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
+
+    job_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    window_start = Column(String(12), nullable=False)  # YYYYMMDDHHMM
+    window_end = Column(String(12), nullable=False)    # YYYYMMDDHHMM
+    priority = Column(Integer, nullable=False, default=0)  # 클수록 먼저 처리
+    status = Column(String(10), nullable=False, default="pending")
+    checkpoints = Column(JSONB, nullable=False, default=dict)
+    attempts = Column(Integer, nullable=False, default=0)
+    locked_by = Column(String(100))
+    heartbeat_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class SearchCacheGeneration(Base):
+    """검색 응답 캐시 세대 카운터 (단일 row, 동기화 완료마다 +1)
+
+    크래시 후에도 row가 남아야 하므로 일반(logged) 테이블입니다.
+    """
+    __tablename__ = "search_cache_generation"
+
+    id = Column(Integer, primary_key=True, default=1)
+    generation = Column(BigInteger, nullable=False, default=0)
+
+
+class SearchResponseCacheEntry(Base):
+    """/bids/search 직렬화 응답 캐시 (UNLOGGED — 크래시 시 비워져도 무방)"""
+    __tablename__ = "search_response_cache"
+    __table_args__ = (
+        Index('ix_search_response_cache_expires_at', 'expires_at'),
+        {"prefixes": ["UNLOGGED"]},
+    )
+
+    cache_key = Column(String(64), primary_key=True)  # search_cache_key sha256
+    generation = Column(BigInteger, nullable=False)
+    body = Column(LargeBinary, nullable=False)        # 응답 JSON bytes
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class AssessmentRateSample(Base):
+    """개찰결과에서 추출한 공고별 실제 사정율 (예정가격 / 기초금액 × 100)
+
+    source_fetched_at: 추출에 사용한 개찰결과/기초금액 fetched_at 중 최신값.
+    이보다 새로 수집된 개찰결과나 기초금액이 있으면 다시 추출합니다.
+    기초금액이 없는 등 추출할 수 없는 공고도 rate=NULL로 기록하여
+    매 갱신마다 다시 읽지 않습니다.
+    """
+    __tablename__ = "assessment_rate_samples"
+    __table_args__ = (
+        Index(
+            'ix_assessment_rate_samples_bucket',
+            'region_scope', 'license_group', 'amount_range',
+        ),
+    )
+
+    bid_ntce_no = Column(String(50), primary_key=True)
+    region_scope = Column(String(20))   # province | city
+    license_group = Column(String(20))  # general | landscaping
+    amount_range = Column(String(20))   # under1 | from1to3 | over3
+    basis_amount = Column(BigInteger)   # 기초금액
+    rate = Column(Float)                # 사정율 (%)
+    bidder_count = Column(Integer, nullable=False, default=0)
+    source_fetched_at = Column(DateTime(timezone=True), nullable=False)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class AssessmentRateStat(Base):
+    """지역범위 × 면허유형 × 금액범위별 사정율 분포 (assessment_rate_samples 집계)"""
+    __tablename__ = "assessment_rate_stats"
+
+    region_scope = Column(String(20), primary_key=True)
+    license_group = Column(String(20), primary_key=True)
+    amount_range = Column(String(20), primary_key=True)
+    sample_count = Column(Integer, nullable=False)
+    mean = Column(Float, nullable=False)
+    std = Column(Float, nullable=False)
+    p10 = Column(Float, nullable=False)
+    p25 = Column(Float, nullable=False)
+    p50 = Column(Float, nullable=False)
+    p75 = Column(Float, nullable=False)
+    p90 = Column(Float, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class CompetitorBid(Base):
+    """개찰결과 JSONB를 업체 단위로 펼친 투찰 기록 (경쟁사 인덱스 원천)
+
+    segments: 집계 대상 세그먼트 — "*"(전체), "rgn:<시도코드>",
+    "ind:<업종명>", "rgn:<시도코드>|ind:<업종명>"
+    """
+    __tablename__ = "competitor_bids"
+    __table_args__ = (
+        # 업체별 최근 투찰 목록 (개찰일시 내림차순 페이지네이션)
+        Index(
+            'ix_competitor_bids_bizno_opened',
+            'prcbdr_bizno', text('opened_at DESC NULLS LAST'),
+        ),
+    )
+
+    bid_ntce_no = Column(String(50), primary_key=True)
+    prcbdr_bizno = Column(String(20), primary_key=True)  # 사업자번호 ('-' 제거)
+    prcbdr_nm = Column(String(200))
+    bid_ntce_nm = Column(String(500))
+    bid_amount = Column(BigInteger)
+    bid_rate = Column(Float)             # 투찰률 (%)
+    opening_rank = Column(Integer)       # 개찰순위 (미달 등은 NULL)
+    won = Column(Boolean, nullable=False, default=False)
+    segments = Column(ARRAY(String), nullable=False)
+    opened_at = Column(DateTime(timezone=True))  # 개찰일시
+
+
+class CompetitorIndexedNotice(Base):
+    """경쟁사 인덱스에 반영된 개찰결과 (source_fetched_at 이후 재수집 시 재반영)"""
+    __tablename__ = "competitor_indexed_notices"
+
+    bid_ntce_no = Column(String(50), primary_key=True)
+    source_fetched_at = Column(DateTime(timezone=True), nullable=False)
+    indexed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class CompetitorStat(Base):
+    """세그먼트 × 업체별 투찰 집계 (competitor_bids에서 영향받은 업체만 재집계)
+
+    rate_histogram: CompetitorIndex.RATE_BIN_EDGES 구간별 투찰 건수
+    (첫 칸은 하한 미만, 마지막 칸은 상한 이상)
+    """
+    __tablename__ = "competitor_stats"
+    __table_args__ = (
+        Index(
+            'ix_competitor_stats_segment_rank',
+            'segment', text('bid_count DESC'), 'prcbdr_bizno',
+        ),
+        Index(
+            'ix_competitor_stats_segment_wins',
+            'segment', text('win_count DESC'), 'prcbdr_bizno',
+        ),
+        Index('ix_competitor_stats_bizno', 'prcbdr_bizno'),
+    )
+
+    segment = Column(String(300), primary_key=True)
+    prcbdr_bizno = Column(String(20), primary_key=True)
+    prcbdr_nm = Column(String(200))
+    bid_count = Column(Integer, nullable=False)
+    win_count = Column(Integer, nullable=False)
+    avg_bid_rate = Column(Float)
+    rate_histogram = Column(JSONB, nullable=False)
+    last_opened_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class BidSearchParams(BaseModel):
@@ -75,11 +76,168 @@ class BidItem(BaseModel):
     indstrytyMfrcFldListNms: Optional[str] = None # 주력분야목록 (검색결과용, 쉼표구분)
 
 
+class DaySyncStatus(BaseModel):
+    date: str  # YYYYMMDD
+    status: str  # synced | running | pending | failed | missing | live(오늘 이후)
+
+
 class BidApiResponse(BaseModel):
     items: List[BidItem]
     totalCount: int
     numOfRows: int
     pageNo: int
+    syncComplete: Optional[bool] = None  # False면 일부 날짜 동기화 진행 중 (부분 결과)
+    syncStatus: Optional[List[DaySyncStatus]] = None  # 미동기화 범위일 때 날짜별 상태
+
+
+class BidPriceRequestItem(BaseModel):
+    bidNtceNo: str
+    bidNtceOrd: str = "000"
+
+
+class BidPriceBatchRequest(BaseModel):
+    items: List[BidPriceRequestItem]
+
+
+class BidPriceRange(BaseModel):
+    low: int
+    high: int
+
+
+class BidPriceCalculation(BaseModel):
+    """적격심사 추천 투찰가 (frontend bidCalculations.ts와 같은 필드)"""
+    bidNtceNo: str
+    bidNtceOrd: str
+    ok: bool
+    error: Optional[str] = None
+    optimalBidPrice: Optional[int] = None  # 추천 투찰금액 (원)
+    estimatedLowerBound: Optional[int] = None  # 추정 낙찰하한가 (원)
+    estimatedPrice: Optional[int] = None  # 추정 예정가격 (원)
+    confidenceRange: Optional[BidPriceRange] = None
+    basisAmount: Optional[float] = None  # 기초금액 (또는 배정예산금액 fallback)
+    usedFallback: Optional[bool] = None  # 배정예산금액을 기초금액 대신 사용했는지
+    aValue: Optional[float] = None
+    assessmentRate: Optional[float] = None  # 사정율 (%)
+    lowerLimitRate: Optional[float] = None  # 낙찰하한율 (%)
+    margin: Optional[str] = None
+    note: Optional[str] = None
+
+
+class BidPriceBatchResponse(BaseModel):
+    items: List[BidPriceCalculation]
+
+
+class AssessmentRateItem(BaseModel):
+    """지역범위 × 면허유형 × 금액범위 사정율 (개찰결과 통계)"""
+    regionScope: str  # province | city
+    licenseGroup: str  # general | landscaping
+    amountRange: str  # under1 | from1to3 | over3
+    rate: float  # 추천 투찰가 계산에 쓰는 사정율 (%)
+    source: str  # learned (표본 충분) | static (기본 테이블)
+    sampleCount: int = 0
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    p10: Optional[float] = None
+    p25: Optional[float] = None
+    p50: Optional[float] = None
+    p75: Optional[float] = None
+    p90: Optional[float] = None
+    updatedAt: Optional[datetime] = None
+
+
+class AssessmentRateTableResponse(BaseModel):
+    items: List[AssessmentRateItem]
+    minSamples: int
+
+
+class WinProbabilityRequest(BaseModel):
+    simulations: int = Field(100_000, ge=1_000, le=1_000_000)  # 예정가격 추첨 횟수
+    prices: Optional[List[int]] = Field(None, max_length=500)  # 후보 투찰가 (없으면 자동 구간)
+    points: int = Field(60, ge=2, le=500)  # 자동 구간 후보 수
+    competitors: Optional[int] = Field(None, ge=0, le=10_000)  # 경쟁사 수 고정 (없으면 과거 분포)
+    seed: Optional[int] = None
+
+
+class WinProbabilityPoint(BaseModel):
+    price: int
+    bidRate: float  # 기초금액 대비 투찰률 (%)
+    winProbability: float
+
+
+class WinProbabilityResponse(BaseModel):
+    bidNtceNo: str
+    basisAmount: float
+    aValue: float
+    lowerLimitRate: float
+    rangeBgnRate: float  # 예비가격 범위 (%)
+    rangeEndRate: float
+    simulations: int
+    historyNotices: int  # 경쟁사 분포에 사용한 과거 공고 수
+    historyBids: int
+    bestPrice: int
+    bestProbability: float
+    points: List[WinProbabilityPoint]
+
+
+class CompetitorSummary(BaseModel):
+    """세그먼트 내 업체 집계"""
+    prcbdrBizno: str
+    prcbdrNm: Optional[str] = None
+    bidCount: int
+    winCount: int
+    avgBidRate: Optional[float] = None  # 평균 투찰률 (%)
+    lastOpenedAt: Optional[datetime] = None
+
+
+class CompetitorListResponse(BaseModel):
+    segment: str
+    totalCount: int
+    pageNo: int
+    numOfRows: int
+    items: List[CompetitorSummary]
+
+
+class CompetitorRateBin(BaseModel):
+    low: Optional[float] = None  # None = 하한 없음
+    high: Optional[float] = None  # None = 상한 없음
+    count: int
+
+
+class CompetitorSegmentItem(BaseModel):
+    code: str  # 시도 코드 또는 업종명
+    name: str
+    bidCount: int
+    winCount: int
+    avgBidRate: Optional[float] = None
+
+
+class CompetitorDetailResponse(CompetitorSummary):
+    rateHistogram: List[CompetitorRateBin]
+    regions: List[CompetitorSegmentItem]
+    industries: List[CompetitorSegmentItem]
+
+
+class CompetitorBidItem(BaseModel):
+    bidNtceNo: str
+    bidNtceNm: Optional[str] = None
+    bidAmount: Optional[int] = None
+    bidRate: Optional[float] = None
+    openingRank: Optional[int] = None
+    won: bool
+    openedAt: Optional[datetime] = None
+
+
+class CompetitorBidListResponse(BaseModel):
+    prcbdrBizno: str
+    totalCount: int
+    pageNo: int
+    numOfRows: int
+    items: List[CompetitorBidItem]
+
+
+class SyncStatusResponse(BaseModel):
+    complete: bool
+    days: List[DaySyncStatus]
 
 
 class BidAValueItem(BaseModel):
@@ -176,3 +334,16 @@ class BidResultResponse(BaseModel):
     results: List[BidResultItem]
     user_rank: Optional[BidResultItem] = None
     total_bidders: int
+
+
+class BidNoticeRevisionItem(BaseModel):
+    revision_id: int
+    bid_ntce_no: str
+    bid_ntce_ord: str
+    prev_ord: Optional[str] = None  # reissue일 때 비교 기준 차수
+    revision_type: str  # update | reissue
+    changes: Dict[str, List[Any]]  # {"필드명": [이전값, 새값]}
+    detected_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,373 @@
+import logging
+import time
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import delete, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.bid import (
+    AssessmentRateSample,
+    AssessmentRateStat,
+    BidBasisAmount,
+    BidNotice,
+    BidOpeningResult,
+)
+from app.services.bid_data_service import bid_data_service
+from app.services.bid_price_engine import (
+    AMOUNT_RANGES,
+    LICENSE_GROUPS,
+    RATE_TABLE,
+    REGION_SCOPES,
+    amount_range_of,
+    determine_license_group,
+    determine_region_scope,
+    pick_basis_amount,
+    safe_num,
+)
+
+logger = logging.getLogger(__name__)
+
+Bucket = Tuple[str, str, str]  # (region_scope, license_group, amount_range)
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def bucket_of(
+    region_names: Sequence[str], license_names: Sequence[str], basis_amount: float
+) -> Bucket:
+    """공고의 참가가능지역/허용업종 이름 목록 + 기초금액 → 통계 버킷."""
+    return (
+        REGION_SCOPES[determine_region_scope(", ".join(region_names))],
+        LICENSE_GROUPS[determine_license_group(", ".join(license_names))],
+        AMOUNT_RANGES[amount_range_of(basis_amount)],
+    )
+
+
+def extract_rates(
+    results: Sequence[Optional[list]], basis_amounts: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """공고별 개찰결과 → (사정율 %, 유효 투찰 업체 수)
+
+    각 업체의 투찰금액 / 투찰률 × 100이 예정가격이므로 업체별 역산값의
+    중앙값을 예정가격으로 보고 기초금액 대비 비율을 구합니다 (투찰률 반올림
+    오차 완화). 계산할 수 없거나 AssessmentRateStats.RATE_BOUNDS를 벗어나면 NaN.
+    """
+    owners: List[int] = []
+    amounts: List[float] = []
+    bid_rates: List[float] = []
+    for i, items in enumerate(results):
+        for item in items or ():
+            owners.append(i)
+            amounts.append(safe_num(item.get("bidprcAmt")) or 0.0)
+            bid_rates.append(safe_num(item.get("bidprcrt")) or 0.0)
+
+    n = len(results)
+    owner = np.array(owners, dtype=np.int64)
+    amount = np.array(amounts, dtype=np.float64)
+    bid_rate = np.array(bid_rates, dtype=np.float64)
+    valid = (amount > 0) & (bid_rate > 0)
+    owner, planned = owner[valid], amount[valid] * 100 / bid_rate[valid]
+
+    # 공고별 예정가격 중앙값 (공고 → 값 순 정렬 후 그룹 중간 원소)
+    order = np.lexsort((planned, owner))
+    owner, planned = owner[order], planned[order]
+    groups, starts, counts = np.unique(owner, return_index=True, return_counts=True)
+    median = (
+        planned[starts + (counts - 1) // 2] + planned[starts + counts // 2]
+    ) / 2
+
+    bidder_count = np.zeros(n, dtype=np.int64)
+    bidder_count[groups] = counts
+    rates = np.full(n, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates[groups] = median / basis_amounts[groups] * 100
+    low, high = AssessmentRateStats.RATE_BOUNDS
+    rates[~((rates >= low) & (rates <= high))] = np.nan
+    return rates, bidder_count
+
+
+def bucket_stats(buckets: Sequence[Bucket], rates: np.ndarray) -> Dict[Bucket, dict]:
+    """버킷별 사정율 분포 (건수/평균/표준편차/백분위)."""
+    if not len(rates):
+        return {}
+    labels, codes = np.unique(
+        np.array(["\0".join(b) for b in buckets]), return_inverse=True
+    )
+    order = np.lexsort((rates, codes))
+    codes, rates = codes[order], rates[order]
+    _, starts, counts = np.unique(codes, return_index=True, return_counts=True)
+
+    stats = {}
+    for label, start, count in zip(labels, starts, counts):
+        values = rates[start:start + count]
+        percentiles = np.percentile(values, PERCENTILES)
+        stats[tuple(label.split("\0"))] = {
+            "sample_count": int(count),
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+            **{f"p{p}": float(v) for p, v in zip(PERCENTILES, percentiles)},
+        }
+    return stats
+
+
+class AssessmentRateStats:
+    """개찰결과 기반 사정율 통계 (정적 RATE_TABLE 대체)
+
+    - refresh: 새로 수집/갱신된 개찰결과·기초금액만 읽어 공고별 사정율을
+      assessment_rate_samples에 기록하고, 영향받은 버킷의 분포만 다시 집계
+    - rate_table: 표본이 MIN_SAMPLES 이상인 버킷은 중앙값(p50), 나머지는
+      정적 테이블 값으로 채운 [지역범위, 면허유형, 금액범위] 사정율 배열
+    """
+
+    BATCH_SIZE = 1000
+    MIN_SAMPLES = 30
+    RATE_BOUNDS = (90.0, 110.0)  # 이 범위 밖 사정율은 데이터 오류로 제외
+    TABLE_CACHE_TTL = 600
+
+    def __init__(self):
+        self._table: Optional[np.ndarray] = None
+        self._table_loaded_at = 0.0
+
+    async def refresh(self, db: AsyncSession) -> int:
+        """증분 갱신 → 새로 기록한 표본 수."""
+        touched: Set[Bucket] = set()
+        total = 0
+        while True:
+            candidates = await self._candidates(db)
+            if not candidates:
+                break
+            total += await self._save_samples(db, candidates, touched)
+            await db.commit()
+            if len(candidates) < self.BATCH_SIZE:
+                break
+
+        if touched:
+            await self._recompute(db, touched)
+            await db.commit()
+            self._table = None
+            logger.info(
+                f"Assessment rate stats refreshed: {total} samples, "
+                f"{len(touched)} buckets"
+            )
+        return total
+
+    async def _candidates(self, db: AsyncSession) -> list:
+        """표본이 없거나 이후 개찰결과/기초금액이 새로 수집된 공고."""
+        basis_latest = (
+            select(
+                BidBasisAmount.bid_ntce_no,
+                func.max(BidBasisAmount.fetched_at).label("fetched_at"),
+            )
+            .group_by(BidBasisAmount.bid_ntce_no)
+            .subquery()
+        )
+        source_fetched_at = func.greatest(
+            BidOpeningResult.fetched_at,
+            func.coalesce(basis_latest.c.fetched_at, BidOpeningResult.fetched_at),
+        )
+        result = await db.execute(
+            select(
+                BidOpeningResult.bid_ntce_no,
+                BidOpeningResult.data,
+                source_fetched_at,
+                AssessmentRateSample.region_scope,
+                AssessmentRateSample.license_group,
+                AssessmentRateSample.amount_range,
+            )
+            .outerjoin(
+                basis_latest,
+                basis_latest.c.bid_ntce_no == BidOpeningResult.bid_ntce_no,
+            )
+            .outerjoin(
+                AssessmentRateSample,
+                AssessmentRateSample.bid_ntce_no == BidOpeningResult.bid_ntce_no,
+            )
+            .where(
+                or_(
+                    AssessmentRateSample.bid_ntce_no.is_(None),
+                    source_fetched_at > AssessmentRateSample.source_fetched_at,
+                )
+            )
+            .order_by(BidOpeningResult.bid_ntce_no)
+            .limit(self.BATCH_SIZE)
+        )
+        return result.all()
+
+    async def _save_samples(
+        self, db: AsyncSession, candidates: list, touched: Set[Bucket]
+    ) -> int:
+        bid_nos = [row[0] for row in candidates]
+
+        # 공고 (차수가 여러 개면 마지막 차수 기준)
+        notice_result = await db.execute(
+            select(BidNotice.bid_ntce_no, BidNotice.data)
+            .where(BidNotice.bid_ntce_no.in_(bid_nos))
+            .order_by(BidNotice.bid_ntce_no, BidNotice.bid_ntce_ord)
+        )
+        notices = {no: data for no, data in notice_result.all()}
+
+        basis_result = await db.execute(
+            select(
+                BidBasisAmount.bid_ntce_no,
+                BidBasisAmount.bid_type,
+                BidBasisAmount.data,
+            ).where(BidBasisAmount.bid_ntce_no.in_(bid_nos))
+        )
+        basis_map: Dict[str, Dict[str, dict]] = {}
+        for no, bid_type, data in basis_result.all():
+            basis_map.setdefault(no, {})[bid_type] = data
+
+        rgn_map, lic_map, _ = await bid_data_service.get_enrichment_maps(
+            db, bid_nos
+        )
+
+        basis_values = []
+        for no in bid_nos:
+            basis = pick_basis_amount(notices.get(no) or {}, basis_map.get(no, {}))
+            basis_values.append(safe_num(basis.get("bssamt")) if basis else None)
+        basis_amounts = np.array(
+            [np.nan if v is None else v for v in basis_values], dtype=np.float64
+        )
+        rates, bidder_counts = extract_rates(
+            [row[1] for row in candidates], basis_amounts
+        )
+
+        values = []
+        for (no, _, source_fetched_at, *old_bucket), basis, rate, bidders in zip(
+            candidates, basis_amounts.tolist(), rates.tolist(), bidder_counts.tolist()
+        ):
+            if all(old_bucket):
+                touched.add(tuple(old_bucket))
+            bucket = (None, None, None)
+            if not np.isnan(rate):
+                bucket = bucket_of(
+                    rgn_map.get(no, []), lic_map.get(no, []), basis
+                )
+                touched.add(bucket)
+            values.append({
+                "bid_ntce_no": no,
+                "region_scope": bucket[0],
+                "license_group": bucket[1],
+                "amount_range": bucket[2],
+                "basis_amount": None if np.isnan(basis) else int(basis),
+                "rate": None if np.isnan(rate) else rate,
+                "bidder_count": bidders,
+                "source_fetched_at": source_fetched_at,
+            })
+
+        stmt = insert(AssessmentRateSample).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["bid_ntce_no"],
+            set_={
+                column: stmt.excluded[column]
+                for column in (
+                    "region_scope", "license_group", "amount_range",
+                    "basis_amount", "rate", "bidder_count", "source_fetched_at",
+                )
+            } | {"computed_at": func.now()},
+        )
+        await db.execute(stmt)
+        return sum(1 for v in values if v["rate"] is not None)
+
+    async def _recompute(self, db: AsyncSession, buckets: Set[Bucket]) -> None:
+        """영향받은 버킷의 분포를 표본에서 다시 집계합니다."""
+        bucket_columns = tuple_(
+            AssessmentRateSample.region_scope,
+            AssessmentRateSample.license_group,
+            AssessmentRateSample.amount_range,
+        )
+        result = await db.execute(
+            select(
+                AssessmentRateSample.region_scope,
+                AssessmentRateSample.license_group,
+                AssessmentRateSample.amount_range,
+                AssessmentRateSample.rate,
+            ).where(
+                bucket_columns.in_(list(buckets)),
+                AssessmentRateSample.rate.is_not(None),
+            )
+        )
+        rows = result.all()
+        stats = bucket_stats(
+            [tuple(row[:3]) for row in rows],
+            np.array([row[3] for row in rows], dtype=np.float64),
+        )
+
+        empty = buckets - set(stats)
+        if empty:
+            await db.execute(
+                delete(AssessmentRateStat).where(
+                    tuple_(
+                        AssessmentRateStat.region_scope,
+                        AssessmentRateStat.license_group,
+                        AssessmentRateStat.amount_range,
+                    ).in_(list(empty))
+                )
+            )
+        if stats:
+            stmt = insert(AssessmentRateStat).values([
+                {
+                    "region_scope": bucket[0],
+                    "license_group": bucket[1],
+                    "amount_range": bucket[2],
+                    **values,
+                }
+                for bucket, values in stats.items()
+            ])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["region_scope", "license_group", "amount_range"],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in (
+                        "sample_count", "mean", "std",
+                        *(f"p{p}" for p in PERCENTILES),
+                    )
+                } | {"updated_at": func.now()},
+            )
+            await db.execute(stmt)
+
+    async def get_stats(self, db: AsyncSession) -> List[AssessmentRateStat]:
+        result = await db.execute(
+            select(AssessmentRateStat).order_by(
+                AssessmentRateStat.region_scope,
+                AssessmentRateStat.license_group,
+                AssessmentRateStat.amount_range,
+            )
+        )
+        return list(result.scalars().all())
+
+    @classmethod
+    def build_rate_table(cls, stats: Sequence[AssessmentRateStat]) -> np.ndarray:
+        """표본이 충분한 버킷은 중앙값, 나머지는 정적 테이블 값."""
+        table = RATE_TABLE.copy()
+        for stat in stats:
+            if stat.sample_count < cls.MIN_SAMPLES:
+                continue
+            try:
+                index = (
+                    REGION_SCOPES.index(stat.region_scope),
+                    LICENSE_GROUPS.index(stat.license_group),
+                    AMOUNT_RANGES.index(stat.amount_range),
+                )
+            except ValueError:
+                continue
+            table[index] = stat.p50
+        return table
+
+    async def rate_table(self, db: AsyncSession) -> np.ndarray:
+        """추천 투찰가 계산용 사정율 테이블 (TABLE_CACHE_TTL 동안 캐시)."""
+        now = time.monotonic()
+        if self._table is None or now - self._table_loaded_at > self.TABLE_CACHE_TTL:
+            try:
+                self._table = self.build_rate_table(await self.get_stats(db))
+            except Exception as e:
+                logger.warning(f"Failed to load assessment rate stats: {e}")
+                await db.rollback()
+                return RATE_TABLE
+            self._table_loaded_at = now
+        return self._table
+
+
+assessment_rate_stats = AssessmentRateStats()
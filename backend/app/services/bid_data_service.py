@@ -1,18 +1,44 @@
+import hashlib
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import BigInteger, and_, cast, exists, func, nullslast, or_, select
+import orjson
+from sqlalchemy import (
+    String,
+    and_,
+    column,
+    delete,
+    exists,
+    func,
+    literal,
+    literal_column,
+    nullslast,
+    or_,
+    select,
+    tuple_,
+    values,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
+from sqlalchemy.sql import Select
 
+from app.core.config import settings
+from app.core.metrics import instrument_methods
+from app.core.profiling import phase
 from app.models.bid import (
     BidBasisAmount,
     BidLicenseLimit,
     BidNotice,
+    BidNoticeRevision,
     BidPrtcptPsblRgn,
+    BidRegionEligibility,
     DataSyncLog,
+    SyncApiUsage,
+    SyncJob,
     UserLocation,
 )
 from app.schemas.bid import (
@@ -20,12 +46,91 @@ from app.schemas.bid import (
     BidAValueItem,
     BidItem,
     BidSearchParams,
+    DaySyncStatus,
     LicenseLimitItem,
     PrtcptPsblRgnItem,
 )
+from app.services.open_bid_hot_set import open_bid_hot_set
+from app.services.region_hierarchy import (
+    UNRESTRICTED,
+    eligibility_codes,
+    filter_match_codes,
+    location_match_codes,
+)
+from app.services.search_cache import search_cache
+from app.services.sync_coverage import is_daily_window, sync_coverage
 
 logger = logging.getLogger(__name__)
 
+KST = timezone(timedelta(hours=9))
+
+# 검색 결과 enrichment 전용 필드 (원본 API 데이터가 아님 → 해시 제외)
+SEARCH_ONLY_FIELDS = {
+    "prtcptPsblRgnNms",
+    "permsnIndstrytyListNms",
+    "indstrytyMfrcFldListNms",
+}
+NOTICE_UPSERT_BATCH_SIZE = 500
+ITEM_FIELDS = tuple(BidItem.model_fields)
+
+
+@dataclass
+class NoticeUpsertResult:
+    """공고 bulk upsert 결과 건수"""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+    def add(self, other: "NoticeUpsertResult") -> None:
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+
+
+@dataclass
+class SearchPage:
+    """검색 결과 페이지 (BidItem 필드 순서의 row dict)
+
+    to_json은 Pydantic 검증 없이 orjson으로 바로 응답 bytes를 만들고,
+    to_response는 BidApiResponse 모델이 필요한 호출자용입니다.
+    """
+
+    rows: List[dict]
+    total_count: int
+    num_of_rows: int
+    page_no: int
+
+    def to_response(self) -> BidApiResponse:
+        return BidApiResponse(
+            items=[BidItem(**row) for row in self.rows],
+            totalCount=self.total_count,
+            numOfRows=self.num_of_rows,
+            pageNo=self.page_no,
+        )
+
+    def to_json(
+        self,
+        sync_complete: Optional[bool] = None,
+        sync_status: Optional[List[DaySyncStatus]] = None,
+    ) -> bytes:
+        """BidApiResponse와 같은 형태의 JSON bytes."""
+        return orjson.dumps({
+            "items": self.rows,
+            "totalCount": self.total_count,
+            "numOfRows": self.num_of_rows,
+            "pageNo": self.page_no,
+            "syncComplete": sync_complete,
+            "syncStatus": (
+                None if sync_status is None
+                else [day.model_dump() for day in sync_status]
+            ),
+        })
+
 
 def normalize_date_str(date_str: Optional[str]) -> str:
     """Normalize date string to YYYYMMDDHHMM format for DB comparison."""
@@ -37,6 +142,59 @@ def normalize_date_str(date_str: Optional[str]) -> str:
     return cleaned.ljust(12, "0")
 
 
+def parse_kst_datetime(date_str: Optional[str]) -> Optional[datetime]:
+    """API 일시 문자열(KST)을 timezone-aware datetime으로 변환합니다."""
+    normalized = normalize_date_str(date_str)
+    if not normalized:
+        return None
+    try:
+        return datetime.strptime(normalized, "%Y%m%d%H%M").replace(tzinfo=KST)
+    except ValueError:
+        return None
+
+
+def format_kst(dt: Optional[datetime]) -> Optional[str]:
+    """datetime을 YYYYMMDDHHMM(KST) 문자열로 변환합니다."""
+    if dt is None:
+        return None
+    return dt.astimezone(KST).strftime("%Y%m%d%H%M")
+
+
+def rgst_month(date_str: Optional[str]) -> str:
+    """등록일시에서 파티션 키 YYYYMM을 추출합니다 (없으면 빈 문자열)."""
+    return normalize_date_str(date_str)[:6]
+
+
+def child_month_filter(month_col, params: BidSearchParams) -> list:
+    """공고 EXISTS 서브쿼리용 자식 테이블 rgst_month 조건 (partition pruning).
+
+    자식 row의 등록월은 공고 등록월(rgst_dt 앞 6자리)이고, 등록일시가 없으면
+    ''(default 파티션)입니다. 상관 조건은 실행 시점 pruning, 검색 기간 범위는
+    계획 시점 pruning에 쓰입니다.
+    """
+    conditions = [month_col.in_([func.left(BidNotice.rgst_dt, 6), ""])]
+    if params.inqryDiv == "1":
+        conditions.append(
+            or_(
+                month_col == "",
+                month_col.between(params.inqryBgnDt[:6], params.inqryEndDt[:6]),
+            )
+        )
+    else:
+        # 개찰일시 검색: 등록은 개찰보다 앞섬 ('' 포함)
+        conditions.append(month_col <= params.inqryEndDt[:6])
+    return conditions
+
+
+def escape_like(value: str) -> str:
+    """LIKE 패턴 특수문자(\\, %, _)를 이스케이프합니다 (ESCAPE '\\'와 함께 사용).
+
+    입력을 와일드카드가 아닌 부분 문자열로 매칭하여 핫셋(Python `in`)과
+    같은 결과가 나오도록 합니다.
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 def parse_price(price_str: Optional[str]) -> int:
     """Parse price string to integer."""
     if not price_str:
@@ -47,30 +205,70 @@ def parse_price(price_str: Optional[str]) -> int:
         return 0
 
 
-def get_matching_regions(location_name: str) -> List[str]:
-    """소재지에서 참가가능지역 매칭 패턴을 생성합니다.
+def parse_amount(amount_str: Optional[str]) -> Optional[int]:
+    """금액 문자열을 정수로 변환합니다 (없거나 잘못된 값은 None)."""
+    if not amount_str or not amount_str.strip():
+        return None
+    try:
+        return int(float(amount_str))
+    except (ValueError, TypeError):
+        return None
+
+
+def compute_content_hash(item: BidItem) -> str:
+    """정규화된 BidItem의 sha256 해시를 계산합니다 (변경 감지용)."""
+    payload = item.model_dump(exclude=SEARCH_ONLY_FIELDS)
+    encoded = json.dumps(
+        payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
 
-    예: "경기도 성남시" → ["전체", "", "경기도", "경기도 성남시"]
+def diff_notice_data(old: dict, new: dict) -> dict:
+    """두 공고 데이터의 필드 단위 diff를 계산합니다.
+
+    Returns:
+        {"필드명": [이전값, 새값]} — 변경된 필드만 포함
     """
-    parts = location_name.split()
-    regions = ["전체", ""]
-    current = ""
-    for part in parts:
-        current = f"{current} {part}".strip()
-        regions.append(current)
-    return regions
+    changes = {}
+    for key in old.keys() | new.keys():
+        if key in SEARCH_ONLY_FIELDS:
+            continue
+        before = old.get(key)
+        after = new.get(key)
+        if before != after:
+            changes[key] = [before, after]
+    return dict(sorted(changes.items()))
 
 
+@instrument_methods()
 class BidDataService:
-    """DB 기반 입찰 데이터 서비스"""
+    """DB 기반 입찰 데이터 서비스 (public 메서드 소요 시간은 /metrics에 기록)"""
 
-    async def search_from_db(
+    async def _resolve_region_codes(
+        self, db: AsyncSession, params: BidSearchParams, user_id=None
+    ) -> List[str]:
+        """참가가능지역 필터에 매칭할 지역코드 목록 (필터 없으면 빈 목록)."""
+        if params.useLocationFilter and user_id:
+            location = await self.get_user_location(db, user_id)
+            if location:
+                return location_match_codes(location.location_name)
+        elif params.prtcptLmtRgnNm:
+            regions = [r.strip() for r in params.prtcptLmtRgnNm.split(",")]
+            return filter_match_codes(regions)
+        return []
+
+    async def build_search_queries(
         self,
         db: AsyncSession,
         params: BidSearchParams,
         user_id=None,
-    ) -> BidApiResponse:
-        """DB에서 입찰공고를 검색합니다."""
+    ) -> tuple[Select, Select]:
+        """검색 조건으로 (전체 건수 쿼리, 페이지 쿼리)를 생성합니다.
+
+        search_from_db와 쿼리 형태 벤치마크(scripts/bench_search_queries.py)가
+        같은 쿼리를 쓰도록 분리되어 있습니다.
+        """
         query = select(BidNotice)
 
         # 날짜 범위 필터
@@ -78,51 +276,29 @@ class BidDataService:
             query = query.where(BidNotice.rgst_dt >= params.inqryBgnDt)
             query = query.where(BidNotice.rgst_dt <= params.inqryEndDt)
         else:
-            query = query.where(BidNotice.openg_dt >= params.inqryBgnDt)
-            query = query.where(BidNotice.openg_dt <= params.inqryEndDt)
-
-        # 참가가능지역 필터 (소재지 기준)
-        needs_region_join = False
-        region_conditions = []
-        like_conditions = []  # 하위 지역 LIKE 매칭용
+            openg_bgn = parse_kst_datetime(params.inqryBgnDt)
+            openg_end = parse_kst_datetime(params.inqryEndDt)
+            if openg_bgn:
+                query = query.where(BidNotice.openg_at >= openg_bgn)
+            if openg_end:
+                query = query.where(BidNotice.openg_at <= openg_end)
+            # 등록은 개찰보다 앞서므로 이후 월 파티션은 제외 (partition pruning).
+            # 등록일시가 없는 공고(빈 문자열 → default 파티션)도 이 조건에 포함
+            query = query.where(BidNotice.rgst_dt <= params.inqryEndDt)
 
-        if params.useLocationFilter and user_id:
-            location = await self.get_user_location(db, user_id)
-            if location:
-                matching = get_matching_regions(location.location_name)
-                region_conditions = matching
-                # 소재지의 마지막(가장 구체적) 지역으로 하위 LIKE 매칭
-                like_conditions = [location.location_name]
-                needs_region_join = True
-        elif params.prtcptLmtRgnNm:
-            regions = [r.strip() for r in params.prtcptLmtRgnNm.split(",")]
-            region_conditions = ["전체", ""] + regions
-            like_conditions = regions  # 하위 지역도 매칭
-            needs_region_join = True
-
-        if needs_region_join and region_conditions:
-            RgnAlias = aliased(BidPrtcptPsblRgn)
-            no_region = ~exists(
-                select(RgnAlias.bid_ntce_no).where(
-                    RgnAlias.bid_ntce_no == BidNotice.bid_ntce_no,
-                    RgnAlias.bid_ntce_ord == BidNotice.bid_ntce_ord,
-                )
-            )
-            region_match_conds = [
-                RgnAlias.prtcpt_psbl_rgn_nm.in_(region_conditions),
-            ]
-            for rgn in like_conditions:
-                region_match_conds.append(
-                    RgnAlias.prtcpt_psbl_rgn_nm.like(f"{rgn} %")
-                )
-            has_matching_region = exists(
-                select(RgnAlias.bid_ntce_no).where(
-                    RgnAlias.bid_ntce_no == BidNotice.bid_ntce_no,
-                    RgnAlias.bid_ntce_ord == BidNotice.bid_ntce_ord,
-                    or_(*region_match_conds),
+        # 참가가능지역 필터 (사전 계산된 지역코드 semi-join)
+        region_codes = await self._resolve_region_codes(db, params, user_id)
+        if region_codes:
+            query = query.where(
+                exists(
+                    select(BidRegionEligibility.bid_ntce_no).where(
+                        BidRegionEligibility.bid_ntce_no == BidNotice.bid_ntce_no,
+                        BidRegionEligibility.bid_ntce_ord == BidNotice.bid_ntce_ord,
+                        *child_month_filter(BidRegionEligibility.rgst_month, params),
+                        BidRegionEligibility.region_code.in_(region_codes),
+                    )
                 )
             )
-            query = query.where(or_(no_region, has_matching_region))
 
         # 업종명 필터 (면허제한명 + 허용업종목록 기반, EXISTS)
         if params.indstrytyNm:
@@ -130,17 +306,19 @@ class BidDataService:
             industries = [i.strip() for i in params.indstrytyNm.split(",")]
             industry_conditions = []
             for ind in industries:
+                pattern = f"%{escape_like(ind)}%"
                 industry_conditions.append(
-                    LicAlias.lcns_lmt_nm.ilike(f"%{ind}%")
+                    LicAlias.lcns_lmt_nm.ilike(pattern, escape="\\")
                 )
                 industry_conditions.append(
-                    LicAlias.permsn_indstryty_list.ilike(f"%{ind}%")
+                    LicAlias.permsn_indstryty_list.ilike(pattern, escape="\\")
                 )
             query = query.where(
                 exists(
                     select(LicAlias.bid_ntce_no).where(
                         LicAlias.bid_ntce_no == BidNotice.bid_ntce_no,
                         LicAlias.bid_ntce_ord == BidNotice.bid_ntce_ord,
+                        *child_month_filter(LicAlias.rgst_month, params),
                         or_(*industry_conditions),
                     )
                 )
@@ -158,174 +336,455 @@ class BidDataService:
 
         # 입찰마감 제외
         if params.bidClseExcpYn == "Y":
-            now_str = datetime.now().strftime("%Y%m%d%H%M")
-            query = query.where(BidNotice.bid_close_dt > now_str)
+            query = query.where(BidNotice.bid_close_at > func.now())
 
         # 공사현장지역명 필터
         if params.cnstrtsiteRgnNm:
             query = query.where(
                 BidNotice.data["cnstrtsiteRgnNm"].astext.ilike(
-                    f"%{params.cnstrtsiteRgnNm}%"
+                    f"%{escape_like(params.cnstrtsiteRgnNm)}%", escape="\\"
                 )
             )
 
-        # 전체 건수 조회
+        # 전체 건수
         count_query = select(func.count()).select_from(
             query.with_only_columns(BidNotice.bid_ntce_no).subquery()
         )
-        total_result = await db.execute(count_query)
-        total_count = total_result.scalar() or 0
 
-        # 정렬
+        # 정렬 (각 컬럼은 asc / desc NULLS LAST 인덱스로 처리)
         order_columns = {
             "rgstDt": BidNotice.rgst_dt,
-            "bidClseDt": BidNotice.bid_close_dt,
+            "bidClseDt": BidNotice.bid_close_at,
             "presmptPrce": BidNotice.presmpt_prce,
-            "bdgtAmt": cast(
-                func.nullif(BidNotice.data["bdgtAmt"].astext, ""),
-                BigInteger,
-            ),
+            "bdgtAmt": BidNotice.bdgt_amt,
         }
         order_col = order_columns.get(params.orderBy or "")
-        if order_col is not None:
-            if params.orderDir == "asc":
-                query = query.order_by(nullslast(order_col.asc()))
-            else:
-                query = query.order_by(nullslast(order_col.desc()))
-        else:
+        if order_col is None:
             query = query.order_by(BidNotice.rgst_dt.desc())
+        elif order_col is BidNotice.rgst_dt:
+            # 파티션 키는 NOT NULL → NULLS LAST 불필요 (기본 인덱스 역방향 스캔)
+            query = query.order_by(
+                order_col.asc() if params.orderDir == "asc" else order_col.desc()
+            )
+        elif params.orderDir == "asc":
+            query = query.order_by(nullslast(order_col.asc()))
+        else:
+            query = query.order_by(nullslast(order_col.desc()))
         offset = (params.pageNo - 1) * params.numOfRows
         query = query.offset(offset).limit(params.numOfRows)
+        return count_query, query
+
+    async def search_from_db(
+        self,
+        db: AsyncSession,
+        params: BidSearchParams,
+        user_id=None,
+    ) -> BidApiResponse:
+        """DB에서 입찰공고를 검색합니다 (BidApiResponse 모델로 반환)."""
+        page = await self.search_page(db, params, user_id)
+        with phase("pydantic"):
+            return page.to_response()
+
+    async def search_page(
+        self,
+        db: AsyncSession,
+        params: BidSearchParams,
+        user_id=None,
+    ) -> SearchPage:
+        """DB에서 입찰공고를 검색합니다 (검증 전 row dict 페이지).
+
+        진행 중 공고 검색(bidClseExcpYn=Y)은 인메모리 핫셋에서 필터/정렬 후
+        해당 페이지 공고만 PK로 읽고, 그 외에는 SQL로 처리합니다.
+        """
+        with phase("hot_set"):
+            page = await self._search_hot_set(db, params, user_id)
+        if page is not None:
+            notices, total_count = page
+        else:
+            with phase("build_query"):
+                count_query, query = await self.build_search_queries(
+                    db, params, user_id
+                )
+            with phase("count_query"):
+                total_result = await db.execute(count_query)
+                total_count = total_result.scalar() or 0
 
-        result = await db.execute(query)
-        notices = result.scalars().all()
+            with phase("main_query"):
+                result = await db.execute(query)
+                notices = result.scalars().all()
 
         # 참가가능지역 + 허용업종목록을 각 공고에 추가
-        items = []
+        rows: List[dict] = []
         if notices:
-            bid_nos = list({n.bid_ntce_no for n in notices})
+            with phase("enrichment"):
+                rgn_map, lic_map, mfrc_map = await self.get_enrichment_maps(
+                    db,
+                    list({n.bid_ntce_no for n in notices}),
+                    {n.rgst_dt[:6] for n in notices},
+                )
 
-            # 참가가능지역
-            rgn_query = select(
-                BidPrtcptPsblRgn.bid_ntce_no,
-                BidPrtcptPsblRgn.prtcpt_psbl_rgn_nm,
-            ).where(
-                BidPrtcptPsblRgn.bid_ntce_no.in_(bid_nos)
+            with phase("build_rows"):
+                for notice in notices:
+                    # 동기화 시 BidItem으로 검증된 JSONB → 필드 순서로만 재구성
+                    data = notice.data
+                    row = {field: data.get(field) for field in ITEM_FIELDS}
+                    row["prtcptPsblRgnNms"] = ", ".join(
+                        rgn_map.get(notice.bid_ntce_no, [])
+                    )
+                    row["permsnIndstrytyListNms"] = ", ".join(
+                        lic_map.get(notice.bid_ntce_no, [])
+                    )
+                    row["indstrytyMfrcFldListNms"] = ", ".join(
+                        mfrc_map.get(notice.bid_ntce_no, [])
+                    )
+                    rows.append(row)
+
+        return SearchPage(
+            rows=rows,
+            total_count=total_count,
+            num_of_rows=params.numOfRows,
+            page_no=params.pageNo,
+        )
+
+    async def get_enrichment_maps(
+        self,
+        db: AsyncSession,
+        bid_nos: List[str],
+        months: Optional[Iterable[str]] = None,
+    ) -> Tuple[dict, dict, dict]:
+        """공고번호별 (참가가능지역, 허용업종목록, 주력분야) 이름 목록.
+
+        months(공고 등록월 YYYYMM)를 알면 해당 월 + 미상('') 파티션만 읽습니다.
+        """
+        month_keys = sorted(set(months) | {""}) if months is not None else None
+
+        # 참가가능지역
+        rgn_query = select(
+            BidPrtcptPsblRgn.bid_ntce_no,
+            BidPrtcptPsblRgn.prtcpt_psbl_rgn_nm,
+        ).where(
+            BidPrtcptPsblRgn.bid_ntce_no.in_(bid_nos)
+        )
+        if month_keys is not None:
+            rgn_query = rgn_query.where(
+                BidPrtcptPsblRgn.rgst_month.in_(month_keys)
             )
-            rgn_result = await db.execute(rgn_query)
-            rgn_rows = rgn_result.all()
-
-            rgn_map: dict[str, list[str]] = {}
-            for row in rgn_rows:
-                if row[1]:
-                    rgn_map.setdefault(row[0], []).append(row[1])
-            for k in rgn_map:
-                rgn_map[k] = list(dict.fromkeys(rgn_map[k]))
-
-            # 면허제한명 + 허용업종목록 + 주력분야
-            lic_query = select(
-                BidLicenseLimit.bid_ntce_no,
-                BidLicenseLimit.lcns_lmt_nm,
-                BidLicenseLimit.permsn_indstryty_list,
-                BidLicenseLimit.indstryty_mfrc_fld_list,
-            ).where(
-                BidLicenseLimit.bid_ntce_no.in_(bid_nos)
+        rgn_result = await db.execute(rgn_query)
+        rgn_rows = rgn_result.all()
+
+        rgn_map: dict[str, list[str]] = {}
+        for row in rgn_rows:
+            if row[1]:
+                rgn_map.setdefault(row[0], []).append(row[1])
+        for k in rgn_map:
+            rgn_map[k] = list(dict.fromkeys(rgn_map[k]))
+
+        # 면허제한명 + 허용업종목록 + 주력분야
+        lic_query = select(
+            BidLicenseLimit.bid_ntce_no,
+            BidLicenseLimit.lcns_lmt_nm,
+            BidLicenseLimit.permsn_indstryty_list,
+            BidLicenseLimit.indstryty_mfrc_fld_list,
+        ).where(
+            BidLicenseLimit.bid_ntce_no.in_(bid_nos)
+        )
+        if month_keys is not None:
+            lic_query = lic_query.where(
+                BidLicenseLimit.rgst_month.in_(month_keys)
             )
-            lic_result = await db.execute(lic_query)
-            lic_rows = lic_result.all()
-
-            lic_map: dict[str, list[str]] = {}
-            mfrc_map: dict[str, list[str]] = {}
-            for row in lic_rows:
-                bid_no = row[0]
-                # lcns_lmt_nm: "조경식재ㆍ시설물공사업/4993" → "조경식재ㆍ시설물공사업"
-                if row[1]:
-                    name = row[1].rsplit("/", 1)[0] if "/" in row[1] else row[1]
-                    lic_map.setdefault(bid_no, []).append(name)
-                elif row[2]:
-                    lic_map.setdefault(bid_no, []).append(row[2])
-                # indstryty_mfrc_fld_list: "[1^철근·콘크리트공사]" → "철근·콘크리트공사"
-                if row[3]:
-                    raw = row[3].strip("[]")
-                    fields = [f for f in raw.split("^") if f and not f.isdigit()]
-                    for f in fields:
-                        mfrc_map.setdefault(bid_no, []).append(f)
-            for k in lic_map:
-                lic_map[k] = list(dict.fromkeys(lic_map[k]))
-            for k in mfrc_map:
-                mfrc_map[k] = list(dict.fromkeys(mfrc_map[k]))
-
-            for notice in notices:
-                data = dict(notice.data)
-                data["prtcptPsblRgnNms"] = ", ".join(
-                    rgn_map.get(notice.bid_ntce_no, [])
-                )
-                data["permsnIndstrytyListNms"] = ", ".join(
-                    lic_map.get(notice.bid_ntce_no, [])
-                )
-                data["indstrytyMfrcFldListNms"] = ", ".join(
-                    mfrc_map.get(notice.bid_ntce_no, [])
-                )
-                items.append(BidItem(**data))
+        lic_result = await db.execute(lic_query)
+        lic_rows = lic_result.all()
 
-        return BidApiResponse(
-            items=items,
-            totalCount=total_count,
-            numOfRows=params.numOfRows,
-            pageNo=params.pageNo,
+        lic_map: dict[str, list[str]] = {}
+        mfrc_map: dict[str, list[str]] = {}
+        for row in lic_rows:
+            bid_no = row[0]
+            # lcns_lmt_nm: "조경식재ㆍ시설물공사업/4993" → "조경식재ㆍ시설물공사업"
+            if row[1]:
+                name = row[1].rsplit("/", 1)[0] if "/" in row[1] else row[1]
+                lic_map.setdefault(bid_no, []).append(name)
+            elif row[2]:
+                lic_map.setdefault(bid_no, []).append(row[2])
+            # indstryty_mfrc_fld_list: "[1^철근·콘크리트공사]" → "철근·콘크리트공사"
+            if row[3]:
+                raw = row[3].strip("[]")
+                fields = [f for f in raw.split("^") if f and not f.isdigit()]
+                for f in fields:
+                    mfrc_map.setdefault(bid_no, []).append(f)
+        for k in lic_map:
+            lic_map[k] = list(dict.fromkeys(lic_map[k]))
+        for k in mfrc_map:
+            mfrc_map[k] = list(dict.fromkeys(mfrc_map[k]))
+
+        return rgn_map, lic_map, mfrc_map
+
+    async def _search_hot_set(
+        self, db: AsyncSession, params: BidSearchParams, user_id=None
+    ) -> Optional[tuple[List[BidNotice], int]]:
+        """핫셋으로 처리 가능한 검색이면 (페이지 공고, 전체 건수), 아니면 None."""
+        if not (
+            settings.OPEN_BIDS_HOT_SET_ENABLED
+            and open_bid_hot_set.can_serve(params)
+        ):
+            return None
+        # 로드/갱신은 백그라운드 작업 (요청은 현재 스냅샷으로 처리)
+        open_bid_hot_set.schedule_refresh()
+        if not open_bid_hot_set.is_loaded:
+            return None
+
+        region_codes = await self._resolve_region_codes(db, params, user_id)
+        keys, total_count = open_bid_hot_set.search(params, region_codes)
+        if not keys:
+            return [], total_count
+
+        result = await db.execute(
+            select(BidNotice).where(
+                tuple_(
+                    BidNotice.bid_ntce_no,
+                    BidNotice.bid_ntce_ord,
+                    BidNotice.rgst_dt,
+                ).in_(keys)
+            )
         )
+        by_key = {
+            (n.bid_ntce_no, n.bid_ntce_ord, n.rgst_dt): n
+            for n in result.scalars().all()
+        }
+        return [by_key[key] for key in keys if key in by_key], total_count
 
     async def save_bid_notices(
         self, db: AsyncSession, items: List[BidItem]
-    ) -> int:
-        """입찰공고 데이터를 DB에 저장합니다 (upsert)."""
-        saved = 0
+    ) -> NoticeUpsertResult:
+        """입찰공고 데이터를 DB에 저장합니다 (bulk upsert).
+
+        content_hash가 동일한 기존 row는 갱신하지 않으므로 (WHERE 조건부
+        ON CONFLICT) 변경 없는 재동기화는 DB 쓰기가 발생하지 않습니다.
+        rgst_dt(파티션 키)가 바뀐 공고는 기존 row를 삭제 후 새로 기록합니다.
+        """
+        # 같은 배치 내 중복 키는 마지막 항목 우선 (ON CONFLICT 중복 갱신 방지)
+        rows: dict[tuple[str, str], dict] = {}
         for item in items:
-            stmt = (
-                insert(BidNotice)
-                .values(
-                    bid_ntce_no=item.bidNtceNo,
-                    bid_ntce_ord=item.bidNtceOrd,
-                    rgst_dt=normalize_date_str(item.rgstDt),
-                    openg_dt=normalize_date_str(item.opengDt),
-                    bid_close_dt=normalize_date_str(item.bidClseDt),
-                    presmpt_prce=parse_price(item.presmptPrce),
-                    main_cnsty_nm=item.mainCnsttyNm,
-                    data=item.model_dump(),
+            rows[(item.bidNtceNo, item.bidNtceOrd)] = {
+                "bid_ntce_no": item.bidNtceNo,
+                "bid_ntce_ord": item.bidNtceOrd,
+                "rgst_dt": normalize_date_str(item.rgstDt),
+                "openg_at": parse_kst_datetime(item.opengDt),
+                "bid_close_at": parse_kst_datetime(item.bidClseDt),
+                "presmpt_prce": parse_price(item.presmptPrce),
+                "bdgt_amt": parse_amount(item.bdgtAmt),
+                "asign_bdgt_amt": parse_amount(item.asignBdgtAmt),
+                "main_cnsty_nm": item.mainCnsttyNm,
+                "data": item.model_dump(),
+                "content_hash": compute_content_hash(item),
+            }
+
+        result = NoticeUpsertResult()
+        values = list(rows.values())
+        for i in range(0, len(values), NOTICE_UPSERT_BATCH_SIZE):
+            batch = values[i:i + NOTICE_UPSERT_BATCH_SIZE]
+            revisions, moved = await self._detect_revisions(db, batch)
+            if revisions:
+                await db.execute(insert(BidNoticeRevision).values(revisions))
+            if moved:
+                await db.execute(
+                    delete(BidNotice).where(
+                        tuple_(
+                            BidNotice.bid_ntce_no,
+                            BidNotice.bid_ntce_ord,
+                            BidNotice.rgst_dt,
+                        ).in_(moved)
+                    )
                 )
-                .on_conflict_do_update(
-                    index_elements=["bid_ntce_no", "bid_ntce_ord"],
-                    set_={
-                        "data": item.model_dump(),
-                        "rgst_dt": normalize_date_str(item.rgstDt),
-                        "openg_dt": normalize_date_str(item.opengDt),
-                        "bid_close_dt": normalize_date_str(item.bidClseDt),
-                        "presmpt_prce": parse_price(item.presmptPrce),
-                        "main_cnsty_nm": item.mainCnsttyNm,
-                        "fetched_at": func.now(),
-                    },
+
+            stmt = insert(BidNotice).values(batch)
+            excluded = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["bid_ntce_no", "bid_ntce_ord", "rgst_dt"],
+                set_={
+                    "data": excluded.data,
+                    "openg_at": excluded.openg_at,
+                    "bid_close_at": excluded.bid_close_at,
+                    "presmpt_prce": excluded.presmpt_prce,
+                    "bdgt_amt": excluded.bdgt_amt,
+                    "asign_bdgt_amt": excluded.asign_bdgt_amt,
+                    "main_cnsty_nm": excluded.main_cnsty_nm,
+                    "content_hash": excluded.content_hash,
+                    "fetched_at": func.now(),
+                },
+                where=BidNotice.content_hash.is_distinct_from(
+                    excluded.content_hash
+                ),
+            ).returning(literal_column("(xmax = 0)").label("inserted"))
+            written = (await db.execute(stmt)).scalars().all()
+
+            # 파티션 이동 row는 삭제 후 재삽입되므로 갱신으로 집계
+            inserted = sum(1 for flag in written if flag) - len(moved)
+            result.inserted += inserted
+            result.updated += len(written) - inserted
+            result.unchanged += len(batch) - len(written)
+            await self._ensure_region_placeholders(db, batch)
+        await db.commit()
+        logger.info(
+            f"Saved bid notices to DB: {result.inserted} inserted, "
+            f"{result.updated} updated, {result.unchanged} unchanged"
+        )
+        return result
+
+    async def _ensure_region_placeholders(
+        self, db: AsyncSession, batch: List[dict]
+    ) -> None:
+        """지역코드가 아직 없는 공고에 "00"(제한 없음) row를 추가합니다.
+
+        참가가능지역이 저장되면 save_prtcpt_psbl_rgns에서 실제 코드로 교체됩니다.
+        """
+        keys = values(
+            column("bid_ntce_no", String),
+            column("bid_ntce_ord", String),
+            column("rgst_month", String),
+            name="notice_keys",
+        ).data([
+            (row["bid_ntce_no"], row["bid_ntce_ord"], row["rgst_dt"][:6])
+            for row in batch
+        ])
+        has_codes = exists(
+            select(BidRegionEligibility.bid_ntce_no).where(
+                BidRegionEligibility.bid_ntce_no == keys.c.bid_ntce_no,
+                BidRegionEligibility.bid_ntce_ord == keys.c.bid_ntce_ord,
+            )
+        )
+        stmt = insert(BidRegionEligibility).from_select(
+            ["bid_ntce_no", "bid_ntce_ord", "region_code", "rgst_month"],
+            select(
+                keys.c.bid_ntce_no,
+                keys.c.bid_ntce_ord,
+                literal(UNRESTRICTED),
+                keys.c.rgst_month,
+            ).where(~has_codes),
+        ).on_conflict_do_nothing()
+        await db.execute(stmt)
+
+    async def _detect_revisions(
+        self, db: AsyncSession, batch: List[dict]
+    ) -> tuple[List[dict], List[tuple[str, str, str]]]:
+        """저장 예정 row를 현재 DB row와 비교하여 변경 이력을 생성합니다.
+
+        - 같은 차수 + content_hash 다름 → update (필드 diff)
+        - 새 차수 + 이전 차수 존재 → reissue (직전 차수 대비 diff)
+        해시가 같은 row는 data를 읽지 않으므로 변경 없는 재동기화 비용은
+        (공고번호, 차수, 해시) 조회 1회뿐입니다.
+
+        Returns:
+            (변경 이력 row 목록, rgst_dt가 바뀌어 삭제할 기존 PK 목록)
+        """
+        bid_nos = list({row["bid_ntce_no"] for row in batch})
+        existing = await db.execute(
+            select(
+                BidNotice.bid_ntce_no,
+                BidNotice.bid_ntce_ord,
+                BidNotice.rgst_dt,
+                BidNotice.content_hash,
+            ).where(BidNotice.bid_ntce_no.in_(bid_nos))
+        )
+        hashes: dict[tuple[str, str], Optional[str]] = {}
+        rgst_dts: dict[tuple[str, str], str] = {}
+        ords_by_no: dict[str, list[str]] = {}
+        for no, ord_, rgst_dt, content_hash in existing.all():
+            hashes[(no, ord_)] = content_hash
+            rgst_dts[(no, ord_)] = rgst_dt
+            ords_by_no.setdefault(no, []).append(ord_)
+
+        # rgst_dt가 바뀐 공고 → 기존 파티션의 row 삭제 대상
+        moved: list[tuple[str, str, str]] = []
+        for row in batch:
+            key = (row["bid_ntce_no"], row["bid_ntce_ord"])
+            if key in rgst_dts and rgst_dts[key] != row["rgst_dt"]:
+                moved.append((*key, rgst_dts[key]))
+
+        # (새 row, 비교 대상 키, revision_type)
+        pending: list[tuple[dict, tuple[str, str], str]] = []
+        for row in batch:
+            key = (row["bid_ntce_no"], row["bid_ntce_ord"])
+            if key in hashes:
+                if hashes[key] != row["content_hash"]:
+                    pending.append((row, key, "update"))
+                continue
+            prior = [
+                o for o in ords_by_no.get(key[0], []) if o < key[1]
+            ]
+            if prior:
+                pending.append((row, (key[0], max(prior)), "reissue"))
+
+        if not pending:
+            return [], moved
+
+        data_result = await db.execute(
+            select(
+                BidNotice.bid_ntce_no,
+                BidNotice.bid_ntce_ord,
+                BidNotice.data,
+            ).where(
+                tuple_(BidNotice.bid_ntce_no, BidNotice.bid_ntce_ord).in_(
+                    list({base for _, base, _ in pending})
                 )
             )
-            await db.execute(stmt)
-            saved += 1
-        await db.commit()
-        logger.info(f"Saved {saved} bid notices to DB")
-        return saved
+        )
+        base_data = {(r[0], r[1]): r[2] for r in data_result.all()}
+
+        revisions = []
+        for row, base_key, revision_type in pending:
+            old = base_data.get(base_key)
+            if old is None:
+                continue
+            changes = diff_notice_data(old, row["data"])
+            if not changes:
+                continue
+            revisions.append({
+                "bid_ntce_no": row["bid_ntce_no"],
+                "bid_ntce_ord": row["bid_ntce_ord"],
+                "prev_ord": base_key[1] if revision_type == "reissue" else None,
+                "revision_type": revision_type,
+                "changes": changes,
+            })
+        return revisions, moved
+
+    async def get_notice_revisions(
+        self, db: AsyncSession, bid_ntce_no: str, limit: int = 100
+    ) -> List[BidNoticeRevision]:
+        """공고의 변경 이력을 최신순으로 조회합니다."""
+        result = await db.execute(
+            select(BidNoticeRevision)
+            .where(BidNoticeRevision.bid_ntce_no == bid_ntce_no)
+            .order_by(
+                BidNoticeRevision.detected_at.desc(),
+                BidNoticeRevision.revision_id.desc(),
+            )
+            .limit(limit)
+        )
+        return list(result.scalars().all())
 
     async def save_prtcpt_psbl_rgns(
         self, db: AsyncSession, regions: List[PrtcptPsblRgnItem]
     ) -> int:
-        """참가가능지역 데이터를 DB에 저장합니다 (upsert)."""
+        """참가가능지역 데이터를 DB에 저장합니다 (upsert).
+
+        공고별 지역코드(bid_region_eligibility)도 함께 확장하여 저장합니다.
+        """
         saved = 0
+        names_by_notice: dict[tuple[str, str], tuple[str, list]] = {}
         for rgn in regions:
             if not rgn.bidNtceNo or rgn.lmtSno is None:
                 continue
+            key = (rgn.bidNtceNo, rgn.bidNtceOrd or "000")
+            names_by_notice.setdefault(key, (rgst_month(rgn.rgstDt), []))[1].append(
+                rgn.prtcptPsblRgnNm
+            )
             stmt = (
                 insert(BidPrtcptPsblRgn)
                 .values(
                     bid_ntce_no=rgn.bidNtceNo,
                     bid_ntce_ord=rgn.bidNtceOrd or "000",
                     lmt_sno=rgn.lmtSno,
+                    rgst_month=rgst_month(rgn.rgstDt),
                     prtcpt_psbl_rgn_nm=rgn.prtcptPsblRgnNm,
                     rgst_dt=rgn.rgstDt,
                     bsns_div_nm=rgn.bsnsDivNm,
@@ -334,10 +793,48 @@ class BidDataService:
             )
             await db.execute(stmt)
             saved += 1
+        if names_by_notice:
+            await self._save_region_eligibility(db, names_by_notice)
         await db.commit()
         logger.info(f"Saved {saved} participation eligible regions to DB")
         return saved
 
+    async def _save_region_eligibility(
+        self,
+        db: AsyncSession,
+        names_by_notice: dict[tuple[str, str], tuple[str, list]],
+    ) -> None:
+        """공고별 참가가능지역을 지역코드로 확장하여 저장합니다."""
+        rows = []
+        restricted = []
+        for (no, ord_), (month, names) in names_by_notice.items():
+            codes = eligibility_codes(names)
+            if UNRESTRICTED not in codes:
+                restricted.append((no, ord_))
+            rows.extend(
+                {
+                    "bid_ntce_no": no,
+                    "bid_ntce_ord": ord_,
+                    "region_code": code,
+                    "rgst_month": month,
+                }
+                for code in codes
+            )
+        await db.execute(
+            insert(BidRegionEligibility).values(rows).on_conflict_do_nothing()
+        )
+        # 지역 제한이 확인된 공고의 "00" placeholder 제거
+        if restricted:
+            await db.execute(
+                delete(BidRegionEligibility).where(
+                    tuple_(
+                        BidRegionEligibility.bid_ntce_no,
+                        BidRegionEligibility.bid_ntce_ord,
+                    ).in_(restricted),
+                    BidRegionEligibility.region_code == UNRESTRICTED,
+                )
+            )
+
     async def save_license_limits(
         self, db: AsyncSession, items: List[LicenseLimitItem]
     ) -> int:
@@ -353,6 +850,7 @@ class BidDataService:
                     bid_ntce_ord=item.bidNtceOrd or "000",
                     lmt_grp_no=item.lmtGrpNo or "0",
                     lmt_sno=item.lmtSno or "0",
+                    rgst_month=rgst_month(item.rgstDt),
                     lcns_lmt_nm=item.lcnsLmtNm,
                     permsn_indstryty_list=item.permsnIndstrytyList,
                     bsns_div_nm=item.bsnsDivNm,
@@ -452,39 +950,224 @@ class BidDataService:
         각 날짜에 대해 일별 윈도우(YYYYMMDD0000~YYYYMMDD2359)가 존재해야
         해당 날짜가 완전히 동기화된 것으로 판단합니다.
         시간별 윈도우만 있는 경우는 부분 동기화로 간주합니다.
+        판정은 인메모리 커버리지 인덱스(sync_coverage)로 처리합니다.
         """
-        start_d = start_date[:8]
-        end_d = end_date[:8]
-
         try:
-            start_dt = datetime.strptime(start_d, "%Y%m%d")
-            end_dt = datetime.strptime(end_d, "%Y%m%d")
+            datetime.strptime(start_date[:8], "%Y%m%d")
+            datetime.strptime(end_date[:8], "%Y%m%d")
         except ValueError:
             return False
 
-        expected_days = (end_dt - start_dt).days + 1
+        await sync_coverage.ensure_loaded(db)
+        return sync_coverage.is_covered(
+            start_date[:8] + "0000", end_date[:8] + "2359"
+        )
 
-        result = await db.execute(
-            select(func.count()).select_from(DataSyncLog).where(
-                DataSyncLog.sync_timestamp >= start_d + "0000",
-                DataSyncLog.sync_timestamp <= end_d + "0000",
-                DataSyncLog.window_end.like("%2359"),
+    async def get_range_sync_status(
+        self, db: AsyncSession, start_date: str, end_date: str
+    ) -> List[DaySyncStatus]:
+        """날짜 범위(YYYYMMDD)의 일별 동기화 상태를 조회합니다.
+
+        synced: 일별 윈도우 동기화 완료 (인메모리 커버리지 인덱스로 판정)
+        running / pending / failed: sync_jobs 큐의 작업 상태
+        missing: 동기화 기록도 작업도 없음
+        live: 오늘(KST) 이후 — 시간별 동기화가 담당하며 일별 작업 대상 아님
+        """
+        try:
+            start_dt = datetime.strptime(start_date[:8], "%Y%m%d")
+            end_dt = datetime.strptime(end_date[:8], "%Y%m%d")
+        except ValueError:
+            return []
+
+        days = []
+        current = start_dt
+        while current <= end_dt:
+            days.append(current.strftime("%Y%m%d"))
+            current += timedelta(days=1)
+        if not days:
+            return []
+
+        today = datetime.now(KST).strftime("%Y%m%d")
+        await sync_coverage.ensure_loaded(db)
+        missing = set(sync_coverage.missing_days(days[0], days[-1]))
+        synced = set(days) - missing
+
+        # 미동기화 과거 날짜의 가장 최근 작업 상태 (일별 윈도우 키로 조회)
+        pending_days = [d for d in days if d in missing and d < today]
+        job_status = {}
+        if pending_days:
+            job_result = await db.execute(
+                select(SyncJob.window_start, SyncJob.status)
+                .where(
+                    tuple_(SyncJob.window_start, SyncJob.window_end).in_(
+                        [(d + "0000", d + "2359") for d in pending_days]
+                    )
+                )
+                .order_by(SyncJob.created_at)
             )
-        )
-        synced_days = result.scalar() or 0
-        return synced_days >= expected_days
+            job_status = {row[0][:8]: row[1] for row in job_result.all()}
+
+        statuses = []
+        for day in days:
+            if day >= today:
+                status = "live"
+            elif day in synced:
+                status = "synced"
+            else:
+                status = job_status.get(day, "missing")
+                if status == "done":
+                    # 작업 완료 후 마킹 전이거나 마킹 실패 → 재동기화 필요
+                    status = "missing"
+            statuses.append(DaySyncStatus(date=day, status=status))
+        return statuses
 
     async def get_sync_entry(
-        self, db: AsyncSession, sync_timestamp: str
+        self, db: AsyncSession, sync_timestamp: str, window_end: str
     ) -> DataSyncLog | None:
         """특정 윈도우의 sync 엔트리를 조회합니다."""
         result = await db.execute(
             select(DataSyncLog).where(
-                DataSyncLog.sync_timestamp == sync_timestamp
+                DataSyncLog.sync_timestamp == sync_timestamp,
+                DataSyncLog.window_end == window_end,
             )
         )
         return result.scalar_one_or_none()
 
+    async def get_hourly_sync_history(
+        self, db: AsyncSession, since_ts: str, until_ts: str
+    ) -> List[tuple[str, int]]:
+        """시간별 윈도우의 (sync_timestamp, total_notices) 이력을 조회합니다.
+
+        since_ts 이상, until_ts 미만의 시간별 윈도우(YYYYMMDDHH00~HH59)만
+        대상으로 하며 일별 윈도우는 제외합니다. 일별 행으로 압축된 날짜는
+        hourly_notices에서 시간별 건수를 복원합니다.
+        """
+        result = await db.execute(
+            select(DataSyncLog.sync_timestamp, DataSyncLog.total_notices)
+            .where(
+                DataSyncLog.sync_timestamp >= since_ts,
+                DataSyncLog.sync_timestamp < until_ts,
+                func.left(DataSyncLog.window_end, 10)
+                == func.left(DataSyncLog.sync_timestamp, 10),
+            )
+            .order_by(DataSyncLog.sync_timestamp)
+        )
+        history = [(row[0], row[1] or 0) for row in result.all()]
+
+        compacted = await db.execute(
+            select(DataSyncLog.sync_timestamp, DataSyncLog.hourly_notices).where(
+                DataSyncLog.sync_timestamp >= since_ts[:8] + "0000",
+                DataSyncLog.sync_timestamp < until_ts,
+                DataSyncLog.hourly_notices.isnot(None),
+            )
+        )
+        for day_ts, counts in compacted.all():
+            for hour, count in enumerate(counts or []):
+                ts = f"{day_ts[:8]}{hour:02d}00"
+                if since_ts <= ts < until_ts:
+                    history.append((ts, count or 0))
+
+        history.sort()
+        return history
+
+    async def get_api_usage(self, db: AsyncSession, usage_date: str) -> int:
+        """해당 날짜(YYYYMMDD, KST)에 사용한 동기화 API 호출 수."""
+        result = await db.execute(
+            select(SyncApiUsage.calls).where(
+                SyncApiUsage.usage_date == usage_date
+            )
+        )
+        return result.scalar_one_or_none() or 0
+
+    async def add_api_usage(
+        self, db: AsyncSession, usage_date: str, calls: int
+    ) -> int:
+        """날짜별 API 호출 수를 누적하고 누적 합계를 반환합니다."""
+        stmt = insert(SyncApiUsage).values(usage_date=usage_date, calls=calls)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["usage_date"],
+            set_={
+                "calls": SyncApiUsage.calls + stmt.excluded.calls,
+                "updated_at": func.now(),
+            },
+        ).returning(SyncApiUsage.calls)
+        total = (await db.execute(stmt)).scalar_one()
+        await db.commit()
+        return total
+
+    async def _hourly_rows(
+        self, db: AsyncSession, date_str: str
+    ) -> Dict[str, DataSyncLog]:
+        """날짜의 시간별 윈도우 행을 {HH: row}로 조회합니다 (일별 행 제외)."""
+        result = await db.execute(
+            select(DataSyncLog).where(
+                DataSyncLog.sync_timestamp >= date_str + "0000",
+                DataSyncLog.sync_timestamp <= date_str + "2359",
+                func.left(DataSyncLog.window_end, 10)
+                == func.left(DataSyncLog.sync_timestamp, 10),
+            )
+        )
+        return {row.sync_timestamp[8:10]: row for row in result.scalars().all()}
+
+    async def _delete_hourly_rows(
+        self, db: AsyncSession, date_str: str
+    ) -> None:
+        """날짜의 시간별 윈도우 행을 삭제합니다 (일별 행은 window_end로 구분되어 유지)."""
+        await db.execute(
+            delete(DataSyncLog).where(
+                DataSyncLog.sync_timestamp >= date_str + "0000",
+                DataSyncLog.sync_timestamp <= date_str + "2359",
+                func.left(DataSyncLog.window_end, 10)
+                == func.left(DataSyncLog.sync_timestamp, 10),
+            )
+        )
+
+    async def compact_hourly_windows(
+        self, db: AsyncSession, date_str: str
+    ) -> bool:
+        """하루치 시간별 윈도우 24개를 일별 행 하나로 합칩니다.
+
+        각 윈도우가 확정(늦게 등록되는 공고까지 반영)되었는지는 호출 측에서
+        판단합니다. 일별 행은 (YYYYMMDD0000, YYYYMMDD2359) 키로 저장하고
+        00시 윈도우를 포함한 24개 시간별 행은 삭제합니다.
+
+        Returns:
+            압축 여부 (24개가 모두 없으면 False)
+        """
+        day_start, day_end = date_str + "0000", date_str + "2359"
+        by_hour = await self._hourly_rows(db, date_str)
+        hours = [f"{h:02d}" for h in range(24)]
+        if any(h not in by_hour for h in hours):
+            return False
+
+        rows = [by_hour[h] for h in hours]
+        values = {
+            "total_notices": sum(r.total_notices or 0 for r in rows),
+            "total_regions": sum(r.total_regions or 0 for r in rows),
+            "total_license_limits": sum(
+                r.total_license_limits or 0 for r in rows
+            ),
+            "notices_inserted": sum(r.notices_inserted or 0 for r in rows),
+            "notices_updated": sum(r.notices_updated or 0 for r in rows),
+            "notices_unchanged": sum(r.notices_unchanged or 0 for r in rows),
+            "hourly_notices": [r.total_notices or 0 for r in rows],
+            "synced_at": max(r.synced_at for r in rows),
+        }
+        await db.execute(
+            insert(DataSyncLog)
+            .values(sync_timestamp=day_start, window_end=day_end, **values)
+            .on_conflict_do_update(
+                index_elements=["sync_timestamp", "window_end"], set_=values
+            )
+        )
+        await self._delete_hourly_rows(db, date_str)
+        await db.commit()
+
+        for r in rows:
+            sync_coverage.discard(r.sync_timestamp)
+        sync_coverage.record(day_start, day_end, values["synced_at"])
+        return True
+
     async def mark_window_synced(
         self,
         db: AsyncSession,
@@ -493,30 +1176,49 @@ class BidDataService:
         total_notices: int,
         total_regions: int,
         total_license_limits: int = 0,
+        write_result: Optional[NoticeUpsertResult] = None,
     ) -> None:
-        """시간 윈도우를 동기화 완료로 마킹합니다."""
+        """시간 윈도우를 동기화 완료로 마킹합니다.
+
+        일별 윈도우(재조회로 하루를 확정한 경우 포함)는 남아 있는 시간별
+        행을 함께 정리합니다. 24개가 모두 있으면 시간별 공고 수를
+        hourly_notices로 옮겨 도착률 학습 이력을 유지합니다.
+        """
+        write_result = write_result or NoticeUpsertResult()
+        values = {
+            "total_notices": total_notices,
+            "total_regions": total_regions,
+            "total_license_limits": total_license_limits,
+            "notices_inserted": write_result.inserted,
+            "notices_updated": write_result.updated,
+            "notices_unchanged": write_result.unchanged,
+        }
+        hourly_ts: List[str] = []
+        if is_daily_window(sync_timestamp, window_end):
+            by_hour = await self._hourly_rows(db, sync_timestamp[:8])
+            hourly_ts = [row.sync_timestamp for row in by_hour.values()]
+            if len(by_hour) == 24:
+                values["hourly_notices"] = [
+                    by_hour[f"{h:02d}"].total_notices or 0 for h in range(24)
+                ]
+
         stmt = (
             insert(DataSyncLog)
-            .values(
-                sync_timestamp=sync_timestamp,
-                window_end=window_end,
-                total_notices=total_notices,
-                total_regions=total_regions,
-                total_license_limits=total_license_limits,
-            )
+            .values(sync_timestamp=sync_timestamp, window_end=window_end, **values)
             .on_conflict_do_update(
-                index_elements=["sync_timestamp"],
-                set_={
-                    "synced_at": func.now(),
-                    "window_end": window_end,
-                    "total_notices": total_notices,
-                    "total_regions": total_regions,
-                    "total_license_limits": total_license_limits,
-                },
+                index_elements=["sync_timestamp", "window_end"],
+                set_={"synced_at": func.now(), **values},
             )
         )
         await db.execute(stmt)
+        if hourly_ts:
+            await self._delete_hourly_rows(db, sync_timestamp[:8])
+        await search_cache.bump_generation(db)
         await db.commit()
+        for ts in hourly_ts:
+            sync_coverage.discard(ts)
+        sync_coverage.record(sync_timestamp, window_end)
+        open_bid_hot_set.mark_stale()
 
     async def get_user_location(
         self, db: AsyncSession, user_id
@@ -0,0 +1,409 @@
+import logging
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.bid import BidBasisAmount, BidNotice
+from app.schemas.bid import BidPriceCalculation, BidPriceRange
+from app.services.bid_data_service import bid_data_service
+
+logger = logging.getLogger(__name__)
+
+NoticeKey = Tuple[str, str]  # (bid_ntce_no, bid_ntce_ord)
+
+MARGIN = 1.001
+RANGE_LOW_PCT = 97
+RANGE_HIGH_PCT = 103
+DEFAULT_LOWER_LIMIT_RATE = 87.745
+
+MARGIN_LABEL = "0.01%"
+NOTE = "낙찰하한가 +0.01% 전략"
+NO_BASIS_ERROR = "기초금액을 확인할 수 없습니다. 공고 원문을 확인하세요."
+NOT_FOUND_ERROR = "공고를 찾을 수 없습니다."
+
+# 지역범위 / 면허유형 / 금액범위 index (라벨은 frontend와 동일)
+PROVINCE, CITY = 0, 1
+GENERAL, LANDSCAPING = 0, 1
+REGION_SCOPES = ("province", "city")
+LICENSE_GROUPS = ("general", "landscaping")
+AMOUNT_RANGES = ("under1", "from1to3", "over3")
+AMOUNT_BOUNDS = np.array([100_000_000, 300_000_000], dtype=np.float64)
+
+# 통계 기반 최적 사정율 (%) — regionScope → licenseGroup → amountRange
+# None은 frontend getOptimalAssessmentRate의 fallback 순서로 채웁니다.
+_RATE_TABLE = {
+    (PROVINCE, GENERAL): (99.930, 100.092, 100.140),
+    (PROVINCE, LANDSCAPING): (99.321, 99.822, 99.502),
+    (CITY, GENERAL): (99.536, 99.994, None),
+    (CITY, LANDSCAPING): (None, None, None),
+}
+
+# A값 구성항목 (항상 합산)
+A_VALUE_FIELDS = (
+    "sftyMngcst",
+    "sftyChckMngcst",
+    "rtrfundNon",
+    "mrfnHealthInsrprm",
+    "npnInsrprm",
+    "odsnLngtrmrcprInsrprm",
+    "envCnsrvcst",
+)
+# (금액 필드, 적용여부 필드) — 적용여부가 Y일 때만 합산
+A_VALUE_FLAGGED_FIELDS = (
+    ("qltyMngcst", "qltyMngcstAObjYn"),
+    ("smkpAmt", "smkpAmtYn"),
+)
+
+_CITY_PATTERN = re.compile(r"\s+\S+(시|군|구)$")
+
+
+def _lookup_rate(region: int, license: int, amount: int) -> float:
+    """사정율 lookup (fallback 포함)
+
+    정확한 매칭 → province + 동일 면허 → 동일 지역 + general
+    → province + general → 100.0
+    """
+    for key in ((region, license), (PROVINCE, license), (region, GENERAL), (PROVINCE, GENERAL)):
+        rate = _RATE_TABLE[key][amount]
+        if rate is not None:
+            return rate
+    return 100.0
+
+
+# [regionScope, licenseGroup, amountRange] → 사정율 (fallback 반영 완료)
+RATE_TABLE = np.array(
+    [
+        [[_lookup_rate(r, l, a) for a in range(3)] for l in (GENERAL, LANDSCAPING)]
+        for r in (PROVINCE, CITY)
+    ],
+    dtype=np.float64,
+)
+
+
+def safe_num(value) -> Optional[float]:
+    """JS Number()처럼 숫자 문자열을 변환 (빈 값/비숫자/무한대 → None)."""
+    if value is None or value == "":
+        return None
+    try:
+        n = float(value)
+    except (TypeError, ValueError):
+        return None
+    return n if math.isfinite(n) else None
+
+
+def determine_region_scope(prtcpt_psbl_rgn_nms: Optional[str]) -> int:
+    """참가가능지역 → 지역범위 (여러 지역/시도 단위 → province, 단일 시군구 → city)."""
+    if not prtcpt_psbl_rgn_nms or "," in prtcpt_psbl_rgn_nms:
+        return PROVINCE
+    if _CITY_PATTERN.search(prtcpt_psbl_rgn_nms.strip()):
+        return CITY
+    return PROVINCE
+
+
+def determine_license_group(permsn_indstryty_list_nms: Optional[str]) -> int:
+    """허용업종 → 면허유형 (조경식재/나무병원 포함 시 landscaping)."""
+    if permsn_indstryty_list_nms and (
+        "조경식재" in permsn_indstryty_list_nms
+        or "나무병원" in permsn_indstryty_list_nms
+    ):
+        return LANDSCAPING
+    return GENERAL
+
+
+def a_value_of(data: Optional[dict]) -> float:
+    """기초금액 data(JSONB)의 A값 합계."""
+    if not data:
+        return 0.0
+    total = 0.0
+    for field in A_VALUE_FIELDS:
+        total += safe_num(data.get(field)) or 0.0
+    for field, flag in A_VALUE_FLAGGED_FIELDS:
+        if data.get(flag) == "Y":
+            total += safe_num(data.get(field)) or 0.0
+    return total
+
+
+def amount_range_of(amount: float) -> int:
+    """기초금액 → 금액범위 (1억 미만 / 1~3억 / 3억 이상)."""
+    return int(np.searchsorted(AMOUNT_BOUNDS, amount, side="right"))
+
+
+def _has_bssamt(data: Optional[dict]) -> bool:
+    value = safe_num(data.get("bssamt")) if data else None
+    return value is not None and value > 0
+
+
+def pick_basis_amount(notice: dict, by_type: Dict[str, dict]) -> Optional[dict]:
+    """/bids/a-value와 같은 우선순위로 기초금액 data 선택
+
+    공고 유형(공사/용역) row → 다른 유형 row 순으로 bssamt가 있는 것을,
+    없으면 있는 row 아무거나 (A값만 사용).
+    """
+    preferred = (
+        "cnstwk"
+        if notice.get("mainCnsttyNm") or notice.get("cnstrtsiteRgnNm")
+        else "servc"
+    )
+    alt = "servc" if preferred == "cnstwk" else "cnstwk"
+    candidates = [by_type.get(preferred), by_type.get(alt)]
+    for data in candidates:
+        if _has_bssamt(data):
+            return data
+    return next((data for data in candidates if data), None)
+
+
+@dataclass
+class BidPriceInputs:
+    """공고 N건의 계산 입력 (index i = keys[i])
+
+    금액 배열의 NaN은 값 없음을 뜻합니다.
+    """
+
+    keys: List[NoticeKey]
+    basis_amount: np.ndarray  # 기초금액 (bssamt)
+    fallback_amount: np.ndarray  # 배정예산금액 (asignBdgtAmt)
+    a_value: np.ndarray
+    lower_limit_rate: np.ndarray  # 낙찰하한율 (NaN → 기본값)
+    region_scope: np.ndarray  # PROVINCE | CITY
+    license_group: np.ndarray  # GENERAL | LANDSCAPING
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[dict]) -> "BidPriceInputs":
+        """row dict 목록 → 배열
+
+        row 키: key, bssamt, asignBdgtAmt, aValue, sucsfbidLwltRate,
+        prtcptPsblRgnNms, permsnIndstrytyListNms
+        """
+
+        def column(field: str) -> np.ndarray:
+            values = [safe_num(row.get(field)) for row in rows]
+            return np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+
+        return cls(
+            keys=[row["key"] for row in rows],
+            basis_amount=column("bssamt"),
+            fallback_amount=column("asignBdgtAmt"),
+            a_value=np.array(
+                [row.get("aValue") or 0.0 for row in rows], dtype=np.float64
+            ),
+            lower_limit_rate=column("sucsfbidLwltRate"),
+            region_scope=np.array(
+                [determine_region_scope(row.get("prtcptPsblRgnNms")) for row in rows],
+                dtype=np.int8,
+            ),
+            license_group=np.array(
+                [
+                    determine_license_group(row.get("permsnIndstrytyListNms"))
+                    for row in rows
+                ],
+                dtype=np.int8,
+            ),
+        )
+
+
+@dataclass
+class BidPriceBatch:
+    """벡터화 계산 결과 (ok=False인 index의 다른 값은 의미 없음)"""
+
+    keys: List[NoticeKey]
+    ok: np.ndarray
+    used_fallback: np.ndarray
+    basis_amount: np.ndarray
+    assessment_rate: np.ndarray
+    estimated_price: np.ndarray
+    a_value: np.ndarray
+    lower_limit_rate: np.ndarray
+    estimated_lower_bound: np.ndarray
+    optimal_bid_price: np.ndarray
+    range_low: np.ndarray
+    range_high: np.ndarray
+
+    def to_items(self) -> List[BidPriceCalculation]:
+        columns = zip(
+            self.ok.tolist(),
+            self.used_fallback.tolist(),
+            self.basis_amount.tolist(),
+            self.assessment_rate.tolist(),
+            self.estimated_price.tolist(),
+            self.a_value.tolist(),
+            self.lower_limit_rate.tolist(),
+            self.estimated_lower_bound.tolist(),
+            self.optimal_bid_price.tolist(),
+            self.range_low.tolist(),
+            self.range_high.tolist(),
+        )
+        items = []
+        for (no, ord_), (
+            ok, fallback, basis, rate, price, a_value, lower,
+            lower_bound, optimal, low, high,
+        ) in zip(self.keys, columns):
+            if not ok:
+                items.append(BidPriceCalculation(
+                    bidNtceNo=no, bidNtceOrd=ord_, ok=False, error=NO_BASIS_ERROR,
+                ))
+                continue
+            items.append(BidPriceCalculation(
+                bidNtceNo=no,
+                bidNtceOrd=ord_,
+                ok=True,
+                optimalBidPrice=int(optimal),
+                estimatedLowerBound=int(lower_bound),
+                estimatedPrice=int(price),
+                confidenceRange=BidPriceRange(low=int(low), high=int(high)),
+                basisAmount=basis,
+                usedFallback=fallback,
+                aValue=a_value,
+                assessmentRate=rate,
+                lowerLimitRate=lower,
+                margin=MARGIN_LABEL,
+                note=NOTE,
+            ))
+        return items
+
+
+def compute_bid_prices(
+    inputs: BidPriceInputs, rate_table: np.ndarray = RATE_TABLE
+) -> BidPriceBatch:
+    """적격심사제 최적 투찰가 (S1 전략)를 배열 단위로 계산합니다.
+
+    frontend bidCalculations.ts의 calculateOptimalBidPrice와 같은 연산 순서를
+    float64로 수행하므로 결과가 일치합니다 (Math.round → floor(x + 0.5)).
+    rate_table: [지역범위, 면허유형, 금액범위] 사정율 (기본: 정적 테이블)
+    """
+    basis = inputs.basis_amount
+    fallback = inputs.fallback_amount
+    has_basis = basis > 0  # NaN 비교는 False
+    used_fallback = ~has_basis & (fallback > 0)
+    basis = np.where(has_basis, basis, fallback)
+    ok = basis > 0
+    safe_basis = np.where(ok, basis, 0.0)
+
+    # Step 1: 사정율 lookup (지역범위 × 면허유형 × 금액범위) → 추정 예정가격
+    amount_range = np.searchsorted(AMOUNT_BOUNDS, safe_basis, side="right")
+    rate = rate_table[inputs.region_scope, inputs.license_group, amount_range]
+    estimated_price = np.floor(safe_basis * rate / 100 + 0.5)
+
+    # Step 2~3: A값, 낙찰하한율
+    a_value = inputs.a_value
+    lower = np.where(
+        np.isnan(inputs.lower_limit_rate),
+        DEFAULT_LOWER_LIMIT_RATE,
+        inputs.lower_limit_rate,
+    )
+
+    # Step 4~5: 추정 낙찰하한가 → 최적 투찰금액
+    lower_bound = np.ceil((estimated_price - a_value) * lower / 100 + a_value)
+    optimal = np.ceil(lower_bound * MARGIN)
+
+    # Step 6: 신뢰 구간 (예비가격 ±3% 범위 기반)
+    range_low = np.ceil(
+        (safe_basis * RANGE_LOW_PCT / 100 - a_value) * lower / 100 + a_value
+    )
+    range_high = np.ceil(
+        (safe_basis * RANGE_HIGH_PCT / 100 - a_value) * lower / 100 + a_value
+    )
+
+    return BidPriceBatch(
+        keys=inputs.keys,
+        ok=ok,
+        used_fallback=used_fallback,
+        basis_amount=safe_basis,
+        assessment_rate=rate,
+        estimated_price=estimated_price,
+        a_value=a_value,
+        lower_limit_rate=lower,
+        estimated_lower_bound=lower_bound,
+        optimal_bid_price=optimal,
+        range_low=range_low,
+        range_high=range_high,
+    )
+
+
+class BidPriceEngine:
+    """공고 목록(검색 페이지/북마크)의 추천 투찰가 일괄 계산
+
+    bid_notices + bid_basis_amounts + 참가가능지역/허용업종을 한 번에 읽어
+    compute_bid_prices로 계산합니다. DB에 캐시된 기초금액만 사용하며
+    (나라장터 API 호출 없음), 기초금액이 없으면 배정예산금액으로 대체합니다.
+    """
+
+    MAX_BATCH = 500
+
+    async def load_inputs(
+        self, db: AsyncSession, keys: Sequence[NoticeKey]
+    ) -> Tuple[BidPriceInputs, List[NoticeKey]]:
+        """(계산 입력, DB에 없는 공고 key 목록)"""
+        result = await db.execute(
+            select(BidNotice.bid_ntce_no, BidNotice.bid_ntce_ord, BidNotice.data)
+            .where(tuple_(BidNotice.bid_ntce_no, BidNotice.bid_ntce_ord).in_(keys))
+        )
+        notices: Dict[NoticeKey, dict] = {
+            (row[0], row[1]): row[2] for row in result.all()
+        }
+        bid_nos = list({key[0] for key in notices})
+        if not bid_nos:
+            return BidPriceInputs.from_rows([]), list(keys)
+
+        basis_result = await db.execute(
+            select(
+                BidBasisAmount.bid_ntce_no,
+                BidBasisAmount.bid_type,
+                BidBasisAmount.data,
+            ).where(BidBasisAmount.bid_ntce_no.in_(bid_nos))
+        )
+        basis_map: Dict[str, Dict[str, dict]] = {}
+        for no, bid_type, data in basis_result.all():
+            basis_map.setdefault(no, {})[bid_type] = data
+
+        rgn_map, lic_map, _ = await bid_data_service.get_enrichment_maps(
+            db, bid_nos
+        )
+
+        rows, missing = [], []
+        for key in keys:
+            data = notices.get(key)
+            if data is None:
+                missing.append(key)
+                continue
+            basis = pick_basis_amount(data, basis_map.get(key[0], {}))
+            rows.append({
+                "key": key,
+                "bssamt": basis.get("bssamt") if basis else None,
+                "asignBdgtAmt": data.get("asignBdgtAmt"),
+                "aValue": a_value_of(basis),
+                "sucsfbidLwltRate": data.get("sucsfbidLwltRate"),
+                "prtcptPsblRgnNms": ", ".join(rgn_map.get(key[0], [])),
+                "permsnIndstrytyListNms": ", ".join(lic_map.get(key[0], [])),
+            })
+        return BidPriceInputs.from_rows(rows), missing
+
+    async def calculate(
+        self,
+        db: AsyncSession,
+        keys: Sequence[NoticeKey],
+        rate_table: np.ndarray = RATE_TABLE,
+    ) -> List[BidPriceCalculation]:
+        """요청 순서대로 공고별 계산 결과 (중복 key는 한 번만)."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return []
+        inputs, missing = await self.load_inputs(db, keys)
+        computed = {
+            (item.bidNtceNo, item.bidNtceOrd): item
+            for item in compute_bid_prices(inputs, rate_table).to_items()
+        }
+        for no, ord_ in missing:
+            computed[(no, ord_)] = BidPriceCalculation(
+                bidNtceNo=no, bidNtceOrd=ord_, ok=False, error=NOT_FOUND_ERROR,
+            )
+        return [computed[key] for key in keys]
+
+
+bid_price_engine = BidPriceEngine()
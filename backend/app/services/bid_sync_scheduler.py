@@ -1,54 +1,118 @@
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 
+import httpx
+
+from app.core.config import settings
+from app.core.metrics import (
+    SYNC_API_BUDGET_REMAINING,
+    SYNC_PAGES,
+    SYNC_RATE_LIMIT_WAIT,
+    SYNC_ROWS,
+    SYNC_WINDOW_DURATION,
+    endpoint_label,
+)
 from app.db.database import AsyncSessionLocal
 from app.schemas.bid import BidSearchParams
-from app.services.bid_data_service import bid_data_service
+from app.services.assessment_rate_stats import assessment_rate_stats
+from app.services.bid_data_service import NoticeUpsertResult, bid_data_service
+from app.services.competitor_index import competitor_index
+from app.models.bid import SyncJob
 from app.services.narajangter import NaraJangterService, narajangter_service
+from app.services.partition_manager import partition_manager
+from app.services.search_cache import search_cache
+from app.services.sync_cadence import AdaptiveSyncCadence, SyncPlan
+from app.services.sync_coverage import sync_coverage
+from app.services.sync_job_queue import (
+    PRIORITY_BACKFILL,
+    PRIORITY_MANUAL,
+    default_worker_id,
+    sync_job_queue,
+)
+from app.services.upstream_resilience import CircuitOpenError, upstream_guard
 
 logger = logging.getLogger(__name__)
 
 KST = timezone(timedelta(hours=9))
 ALERT_THROTTLE_SECONDS = 3600  # 알림 최소 간격: 1시간
+SYNC_FEEDS = ("contract", "service", "regions", "license_limits")
+# 동기화가 호출하는 엔드포인트 (하나라도 서킷이 열리면 동기화 일시 중지)
+SYNC_ENDPOINTS = tuple(
+    endpoint_label(httpx.URL(url))
+    for url in (
+        NaraJangterService.BASE_CNST_URL,
+        NaraJangterService.BASE_SERV_URL,
+        NaraJangterService.PRTCPT_PSBL_RGN_URL,
+        NaraJangterService.LICENSE_LIMIT_URL,
+    )
+)
 
 
 class BidDataSyncScheduler:
     """시간 윈도우 기반 증분 동기화 스케줄러
 
     전략:
-    1. 시간별 동기화 (매시간):
-       - 최근 3시간 윈도우 (현재, -1h, -2h)
+    1. 시간별 동기화 (적응형 주기):
+       - 요일·시간대별 도착률(DataSyncLog.total_notices)로 주기/윈도우 결정
+       - 바쁜 시간대: 15분까지 단축, 한산한 시간대: 3시간까지 연장
        - 현재 시간: 항상 재동기화
-       - 이전 시간: synced_at > 1시간이면 재동기화
-       - 2시간 오버랩으로 늦게 등록되는 공고 커버
+       - 이전 시간: synced_at이 주기보다 오래되면 재동기화
+       - 1~2시간 오버랩으로 늦게 등록되는 공고 커버
 
     2. 일별 백필 (매 실행 시):
-       - 전일 이전 날짜 중 미동기화 건
-       - 실행당 최대 MAX_BACKFILL_PER_RUN일 처리
+       - 24개 시간별 윈도우가 모두 확정된 날짜는 일별 행으로 압축 (API 0회)
+       - 그 외 전일 이전 미동기화 날짜는 누락 시간 또는 하루 전체를
+         sync_jobs 큐에 등록
+       - 작업 워커가 피드·페이지 단위 체크포인트로 처리 (재시작 시 재개)
        - 일별 윈도우 (YYYYMMDD0000 ~ YYYYMMDD2359)
 
     3. API 사용량 제한:
        - 페이지 간 0.5초, 윈도우 간 1초 대기
        - 실행당 최대 API 호출 수 제한
+       - 일일 호출 예산(SYNC_DAILY_API_BUDGET)을 자정까지 균등 배분
        - asyncio.Lock으로 동시 실행 방지
+       - 재시도/서킷 브레이커는 upstream_guard가 담당. 동기화 엔드포인트의
+         서킷이 열려 있으면 사이클·작업 워커가 닫힐 때까지 쉼
+       - 모든 피드를 끝 페이지까지 받은 윈도우만 동기화 완료로 기록
+         (호출 제한/오류로 중단된 피드가 있으면 다음 사이클·재시도에서 이어서)
 
     4. 실패 알림:
        - 사이클 내 실패 윈도우를 모아 이메일 발송
        - 1시간에 최대 1회 (throttle)
+
+    5. 파티션 관리 (하루 1회):
+       - 향후 월 파티션 생성, BID_DATA_RETENTION_MONTHS 경과 파티션 삭제
     """
 
-    SYNC_INTERVAL = 3600  # 1시간
-    RECENT_HOURS = 3  # 최근 3시간 재동기화
+    SYNC_INTERVAL = 3600  # 기본 주기 1시간 (도착률 이력 없을 때)
+    RECENT_HOURS = 3  # 기본 재동기화 윈도우 수 (도착률 이력 없을 때)
     BACKFILL_DAYS = 30
-    MAX_BACKFILL_PER_RUN = 5
     MAX_API_CALLS_PER_RUN = 80
+    JOB_POLL_INTERVAL = 30  # 작업 큐가 비었을 때 대기 (초)
+    # 시간 종료 후 이 시간이 지나 재조회되면 확정. 바쁜 시간대(윈도우 2시간)는
+    # 그 전에 재동기화 윈도우에서 빠지므로 지난 날짜 정리 때 일별 재조회로 확정
+    HOURLY_SETTLE_MINUTES = 60
+    MAX_HOURLY_REPAIR = 6  # 이보다 많은 시간이 미확정이면 일별 윈도우로 재조회
 
     def __init__(self):
         self.is_running = False
+        self._job_worker_running = False
+        self._worker_id = default_worker_id()
         self._sync_lock = asyncio.Lock()
         self._last_alert_at: datetime | None = None
         self._failed_windows: list[str] = []
+        self._partitions_maintained_on: str | None = None
+        self._cadence = AdaptiveSyncCadence(settings.SYNC_DAILY_API_BUDGET)
+        self._plan = SyncPlan(
+            interval=self.SYNC_INTERVAL,
+            window_hours=self.RECENT_HOURS,
+            busy_factor=1.0,
+        )
+        SYNC_API_BUDGET_REMAINING.set_function(
+            lambda: self._cadence.remaining_budget(datetime.now(KST))
+        )
 
     async def start(self):
         if self.is_running:
@@ -62,9 +126,9 @@ class BidDataSyncScheduler:
         except Exception as e:
             logger.error(f"Initial sync cycle failed: {e}")
 
-        # 주기적 실행
+        # 주기적 실행 (적응형 주기)
         while self.is_running:
-            await asyncio.sleep(self.SYNC_INTERVAL)
+            await asyncio.sleep(max(self._plan.interval, self._upstream_pause()))
             try:
                 await self._run_sync_cycle()
             except Exception as e:
@@ -74,147 +138,427 @@ class BidDataSyncScheduler:
         self.is_running = False
         logger.info("Bid data sync scheduler stopped")
 
+    async def stop_job_worker(self):
+        self._job_worker_running = False
+        logger.info("Sync job worker stopped")
+
     async def _run_sync_cycle(self):
         """한 번의 동기화 사이클."""
         async with self._sync_lock:
             self._failed_windows = []
+            await self._maintain_partitions()
+            await self._refresh_cadence()
+            now = datetime.now(KST)
+            self._plan = self._cadence.plan(now)
+            logger.info(
+                f"Sync plan: window_hours={self._plan.window_hours}, "
+                f"next_interval={self._plan.interval}s, "
+                f"busy_factor={self._plan.busy_factor}, "
+                f"remaining_budget={self._cadence.remaining_budget(now)}"
+            )
+
             api_calls = 0
             api_calls = await self._sync_recent_hours(api_calls)
-            await self._backfill_past_days(api_calls)
+            api_calls = await self._backfill_past_days(api_calls)
+
+            try:
+                async with AsyncSessionLocal() as db:
+                    await sync_job_queue.purge_finished(db)
+            except Exception as e:
+                logger.warning(f"Failed to purge finished sync jobs: {e}")
+            try:
+                async with AsyncSessionLocal() as db:
+                    await search_cache.purge_expired(db)
+            except Exception as e:
+                logger.warning(f"Failed to purge search cache: {e}")
+            try:
+                async with AsyncSessionLocal() as db:
+                    await assessment_rate_stats.refresh(db)
+            except Exception as e:
+                logger.warning(f"Failed to refresh assessment rate stats: {e}")
+            try:
+                async with AsyncSessionLocal() as db:
+                    await competitor_index.refresh(db)
+            except Exception as e:
+                logger.warning(f"Failed to refresh competitor index: {e}")
 
             if self._failed_windows:
                 await self._send_failure_alert()
 
+            # 이번 사이클 사용량 반영 후 다음 주기 재계산
+            self._plan = self._cadence.plan(datetime.now(KST))
+
+    async def _maintain_partitions(self) -> None:
+        """월 파티션 생성 + 보관 기간이 지난 파티션 삭제 (하루 1회)."""
+        now = datetime.now(KST)
+        today = now.strftime("%Y%m%d")
+        if self._partitions_maintained_on == today:
+            return
+        try:
+            async with AsyncSessionLocal() as db:
+                await partition_manager.maintain(
+                    db, now, settings.BID_DATA_RETENTION_MONTHS
+                )
+            self._partitions_maintained_on = today
+        except Exception as e:
+            logger.error(f"Partition maintenance failed: {e}")
+
+    async def _refresh_cadence(self) -> None:
+        """최근 HISTORY_DAYS일의 시간별 윈도우 이력으로 도착률을 재학습하고
+        오늘 사용한 API 요청 수를 DB에서 복원합니다.
+
+        진행 중인 현재 시간 윈도우는 부분 데이터이므로 제외합니다.
+        """
+        now = datetime.now(KST)
+        since = now - timedelta(days=AdaptiveSyncCadence.HISTORY_DAYS)
+        try:
+            async with AsyncSessionLocal() as db:
+                rows = await bid_data_service.get_hourly_sync_history(
+                    db,
+                    since.strftime("%Y%m%d%H") + "00",
+                    now.strftime("%Y%m%d%H") + "00",
+                )
+                used = await bid_data_service.get_api_usage(
+                    db, now.strftime("%Y%m%d")
+                )
+            self._cadence.load(rows)
+            self._cadence.load_usage(now, used)
+        except Exception as e:
+            logger.warning(f"Failed to load sync cadence history: {e}")
+
+    def _call_limit(self, limit: int) -> int:
+        """실행당 호출 한도를 남은 일일 예산으로 제한합니다."""
+        return min(limit, self._cadence.remaining_budget(datetime.now(KST)))
+
+    async def _record_calls(self, calls: int, windows: int = 1) -> None:
+        """사용한 요청 수를 일일 예산에 반영합니다 (DB 누적 → 재시작/리더 교체 후에도 유지)."""
+        now = datetime.now(KST)
+        self._cadence.record_calls(calls, now, windows)
+        if calls <= 0:
+            return
+        try:
+            async with AsyncSessionLocal() as db:
+                total = await bid_data_service.add_api_usage(
+                    db, now.strftime("%Y%m%d"), calls
+                )
+            self._cadence.load_usage(now, total)
+        except Exception as e:
+            logger.warning(f"Failed to persist sync API usage: {e}")
+
+    @staticmethod
+    def _upstream_pause() -> float:
+        """동기화 엔드포인트 서킷이 다시 호출을 허용할 때까지 남은 시간 (초)."""
+        return upstream_guard.paused_for(SYNC_ENDPOINTS)
+
+    @staticmethod
+    async def _throttle(seconds: float, reason: str) -> None:
+        """API 호출 간격 대기 (대기 시간은 /metrics에 누적)."""
+        SYNC_RATE_LIMIT_WAIT.labels(reason).inc(seconds)
+        await asyncio.sleep(seconds)
+
     async def _sync_recent_hours(self, api_calls: int) -> int:
-        """최근 N시간을 시간별 윈도우로 동기화합니다."""
+        """최근 N시간을 시간별 윈도우로 동기화합니다 (N은 적응형 계획)."""
         now = datetime.now(KST)
+        call_limit = self._call_limit(self.MAX_API_CALLS_PER_RUN)
 
-        for offset in range(self.RECENT_HOURS):
-            if api_calls >= self.MAX_API_CALLS_PER_RUN:
+        async with AsyncSessionLocal() as db:
+            await sync_coverage.ensure_loaded(db)
+
+        for offset in range(self._plan.window_hours):
+            if api_calls >= call_limit:
                 logger.info("API call limit reached, stopping recent sync")
                 break
+            paused = self._upstream_pause()
+            if paused:
+                logger.warning(
+                    f"Upstream circuit open, pausing recent sync for {paused:.0f}s"
+                )
+                break
 
             hour_dt = now - timedelta(hours=offset)
             ts = hour_dt.strftime("%Y%m%d%H") + "00"
             end = hour_dt.strftime("%Y%m%d%H") + "59"
 
-            async with AsyncSessionLocal() as db:
-                entry = await bid_data_service.get_sync_entry(db, ts)
-
+            entry = sync_coverage.entry(ts)
             if entry and offset > 0:
-                age = (now - entry.synced_at.astimezone(KST)).total_seconds()
-                if age < self.SYNC_INTERVAL:
+                _, synced_at = entry
+                age = (now - synced_at.astimezone(KST)).total_seconds()
+                if age < self._plan.interval:
                     continue
 
             logger.info(f"Syncing hourly window: {ts} ~ {end}")
             calls = await self._sync_window_internal(ts, end)
+            await self._record_calls(calls)
             api_calls += calls
-            await asyncio.sleep(1)
+            await self._throttle(1, "window")
 
         return api_calls
 
     async def _backfill_past_days(self, api_calls: int) -> int:
-        """전일 이전 날짜를 일별 윈도우로 백필합니다."""
+        """전일 이전 미동기화 날짜를 정리합니다 (이 단계는 API 호출 없음).
+
+        - 24개 시간별 윈도우가 모두 확정된 날짜: 일별 행으로 압축 (재다운로드 없음)
+        - 확정 대기 중인 시간이 남은 날짜: 다음 사이클로 미룸
+        - 일부 시간만 누락/미확정: 해당 시간별 윈도우만 작업 큐에 등록
+        - 누락/미확정이 MAX_HOURLY_REPAIR를 넘는 날짜 (바쁜 시간대가 있던 날):
+          일별 윈도우 1회 재조회로 확정 — 완료 시 mark_window_synced가 남은
+          시간별 행을 일별 행으로 정리
+        실제 동기화는 작업 워커(run_job_worker)가 체크포인트 단위로 처리합니다.
+        """
         now = datetime.now(KST)
-        today = now.strftime("%Y%m%d")
-        backfilled = 0
+        # 오늘은 시간별 동기화가 담당
+        first = (now - timedelta(days=self.BACKFILL_DAYS)).strftime("%Y%m%d")
+        last = (now - timedelta(days=1)).strftime("%Y%m%d")
+        compacted = 0
+        enqueued = 0
 
-        for day_offset in range(1, self.BACKFILL_DAYS + 1):
-            if backfilled >= self.MAX_BACKFILL_PER_RUN:
-                break
-            if api_calls >= self.MAX_API_CALLS_PER_RUN:
-                logger.info("API call limit reached, stopping backfill")
-                break
+        async with AsyncSessionLocal() as db:
+            await sync_coverage.ensure_loaded(db)
+            # 최근 날짜부터 처리
+            for date_str in reversed(sync_coverage.missing_days(first, last)):
+                settled, waiting, repair = self._classify_hours(date_str, now)
+
+                if len(settled) == 24:
+                    if await bid_data_service.compact_hourly_windows(
+                        db, date_str
+                    ):
+                        compacted += 1
+                    else:
+                        # 인덱스가 DB와 어긋남 → 다음 사이클에 재로드 후 재시도
+                        sync_coverage.invalidate()
+                    continue
 
-            date = now - timedelta(days=day_offset)
-            date_str = date.strftime("%Y%m%d")
+                if waiting:
+                    # 확정 전 일별 재조회는 늦게 등록되는 공고를 놓침
+                    continue
 
-            # 오늘은 시간별 동기화가 담당
-            if date_str == today:
-                continue
+                if len(repair) > self.MAX_HOURLY_REPAIR:
+                    await sync_job_queue.enqueue(
+                        db, date_str + "0000", date_str + "2359",
+                        PRIORITY_BACKFILL,
+                    )
+                    enqueued += 1
+                    continue
 
-            ts = date_str + "0000"
-            end = date_str + "2359"
+                for ts, end in repair:
+                    await sync_job_queue.enqueue(db, ts, end, PRIORITY_BACKFILL)
+                    enqueued += 1
 
-            async with AsyncSessionLocal() as db:
-                entry = await bid_data_service.get_sync_entry(db, ts)
+        if compacted or enqueued:
+            logger.info(
+                f"Backfill: compacted {compacted} days, enqueued {enqueued} jobs"
+            )
 
-            if entry:
-                continue
+        return api_calls
 
-            logger.info(f"Backfilling day: {date_str}")
-            calls = await self._sync_window_internal(ts, end)
-            api_calls += calls
-            backfilled += 1
-            await asyncio.sleep(2)
+    def _classify_hours(
+        self, date_str: str, now: datetime
+    ) -> tuple[list[str], list[str], list[tuple[str, str]]]:
+        """날짜의 시간별 윈도우를 (확정, 대기, 복구 필요)로 분류합니다.
 
-        if backfilled > 0:
-            logger.info(f"Backfill completed: {backfilled} days")
+        확정: 시간 종료 + HOURLY_SETTLE_MINUTES 이후에 동기화됨
+        대기: 아직 확정 시점 전 (시간별 동기화가 재조회 예정)
+        복구 필요: 확정 시점이 지났는데 누락되었거나 확정 전 데이터만 있음
+        """
+        day = datetime.strptime(date_str, "%Y%m%d").replace(tzinfo=KST)
+        settled: list[str] = []
+        waiting: list[str] = []
+        repair: list[tuple[str, str]] = []
+
+        for hour in range(24):
+            ts = f"{date_str}{hour:02d}00"
+            end = f"{date_str}{hour:02d}59"
+            settle_at = day + timedelta(
+                hours=hour + 1, minutes=self.HOURLY_SETTLE_MINUTES
+            )
+            entry = sync_coverage.entry(ts)
+            if entry and entry[0] == end and entry[1] >= settle_at:
+                settled.append(ts)
+            elif now < settle_at:
+                waiting.append(ts)
+            else:
+                repair.append((ts, end))
 
-        return api_calls
+        return settled, waiting, repair
 
     async def sync_window(self, window_start: str, window_end: str) -> None:
         """외부 호출용: lock 포함 윈도우 동기화."""
         async with self._sync_lock:
-            await self._sync_window_internal(window_start, window_end)
+            calls = await self._sync_window_internal(window_start, window_end)
+            await self._record_calls(
+                calls, self._window_hours(window_start, window_end)
+            )
+
+    @staticmethod
+    def _window_hours(window_start: str, window_end: str) -> int:
+        """윈도우가 덮는 시간 수 (시간별 1, 일별 24) — 윈도우당 호출 수 추정용."""
+        start = datetime.strptime(window_start, "%Y%m%d%H%M")
+        end = datetime.strptime(window_end, "%Y%m%d%H%M")
+        return max(1, round((end - start).total_seconds() / 3600))
+
+    # --- 영속 작업 큐 워커 ---
+
+    async def run_job_worker(self):
+        """sync_jobs 큐를 처리하는 워커 루프 (레플리카마다 실행 가능)."""
+        if self._job_worker_running:
+            return
+        self._job_worker_running = True
+        logger.info(f"Sync job worker started ({self._worker_id})")
+        try:
+            # 재시작 직후에도 오늘 이미 쓴 예산부터 이어서 계산
+            now = datetime.now(KST)
+            async with AsyncSessionLocal() as db:
+                used = await bid_data_service.get_api_usage(
+                    db, now.strftime("%Y%m%d")
+                )
+            self._cadence.load_usage(now, used)
+        except Exception as e:
+            logger.warning(f"Failed to load sync API usage: {e}")
+
+        while self._job_worker_running:
+            try:
+                processed = await self.process_next_job()
+            except Exception as e:
+                logger.error(f"Sync job worker error: {e}")
+                processed = False
+            if not processed:
+                await asyncio.sleep(
+                    max(self.JOB_POLL_INTERVAL, self._upstream_pause())
+                )
+
+    async def process_next_job(self) -> bool:
+        """큐에서 작업 한 건을 선점하여 처리합니다. 처리했으면 True."""
+        if self._cadence.remaining_budget(datetime.now(KST)) <= 0:
+            return False
+        if self._upstream_pause() > 0:
+            return False
+
+        # lock을 먼저 잡고 선점 — 리더 사이클을 기다리는 동안 heartbeat가
+        # STALE_LOCK_SECONDS를 넘겨 다른 워커가 같은 작업을 재선점하지 않도록
+        async with self._sync_lock:
+            if self._cadence.remaining_budget(datetime.now(KST)) <= 0:
+                return False
+            if self._upstream_pause() > 0:
+                return False
+
+            async with AsyncSessionLocal() as db:
+                job = await sync_job_queue.claim(db, self._worker_id)
+            if job is None:
+                return False
+
+            logger.info(
+                f"Processing sync job {job.job_id}: "
+                f"{job.window_start}~{job.window_end} "
+                f"(priority={job.priority}, attempt={job.attempts})"
+            )
+            try:
+                calls = await self._sync_window_internal(
+                    job.window_start, job.window_end, job=job
+                )
+                await self._record_calls(
+                    calls, self._window_hours(job.window_start, job.window_end)
+                )
+            except Exception as e:
+                async with AsyncSessionLocal() as db:
+                    await sync_job_queue.release(db, job.job_id, str(e))
+                raise
+        await self._throttle(1, "window")
+        return True
+
+    @staticmethod
+    def _feed_resume(job: SyncJob | None, feed: str) -> tuple[int, int, bool]:
+        """작업 체크포인트에서 (시작 페이지, 기존 건수, 완료 여부)를 읽습니다."""
+        if job is None:
+            return 1, 0, False
+        cp = (job.checkpoints or {}).get(feed) or {}
+        return cp.get("page", 0) + 1, cp.get("count", 0), cp.get("done", False)
+
+    @staticmethod
+    def _checkpointer(db, job: SyncJob | None, feed: str):
+        """페이지 저장 후 호출할 체크포인트 콜백 (작업이 없으면 None)."""
+        if job is None:
+            return None
+
+        async def _save(page: int, count: int, done: bool = False) -> None:
+            await sync_job_queue.checkpoint(
+                db, job.job_id, feed, page, count, done
+            )
+
+        return _save
 
     async def _sync_window_internal(
-        self, window_start: str, window_end: str
+        self, window_start: str, window_end: str, job: SyncJob | None = None
     ) -> int:
         """단일 시간 윈도우를 동기화합니다. lock 없이 내부 호출용.
 
+        job이 주어지면 피드별 체크포인트에서 이어서 조회하고, 페이지마다
+        진행 상황을 기록하며, 끝나면 작업을 완료/재시도 처리합니다.
+        끝 페이지까지 받지 못한 피드가 있으면 (호출 제한, 오류) 윈도우를
+        완료로 기록하지 않습니다.
+
         Returns:
             사용된 API 호출 수
         """
         api_calls = 0
-        any_success = False
+        incomplete: list[str] = []
+        started = time.perf_counter()
 
         async with AsyncSessionLocal() as db:
-            total_notices = 0
-            total_regions = 0
-            total_license_limits = 0
-
-            # 1. 공사(contract) 공고
-            count, success = await self._fetch_notices(
-                db, "contract", window_start, window_end
-            )
-            total_notices += count
-            api_calls += 1
-            any_success = any_success or success
+            totals: dict[str, int] = {}
+            write_result = NoticeUpsertResult()
 
-            # 2. 용역(service) 공고
-            count, success = await self._fetch_notices(
-                db, "service", window_start, window_end
-            )
-            total_notices += count
-            api_calls += 1
-            any_success = any_success or success
-
-            # 3. 참가가능지역
-            count, success = await self._fetch_regions(
-                db, window_start, window_end
-            )
-            total_regions = count
-            api_calls += 1
-            any_success = any_success or success
-
-            # 4. 면허제한
-            count, success = await self._fetch_license_limits(
-                db, window_start, window_end
-            )
-            total_license_limits = count
-            api_calls += 1
-            any_success = any_success or success
+            for feed in SYNC_FEEDS:
+                start_page, prior_count, done = self._feed_resume(job, feed)
+                if done:
+                    totals[feed] = prior_count
+                    continue
 
-            # 5. 모든 API 실패 시 마킹하지 않음 (다음 사이클에 재시도)
-            if not any_success:
+                checkpoint = self._checkpointer(db, job, feed)
+                if feed in ("contract", "service"):
+                    # 1~2. 공사(contract) / 용역(service) 공고
+                    count, finished, requests = await self._fetch_notices(
+                        db, feed, window_start, window_end, write_result,
+                        start_page, prior_count, checkpoint,
+                    )
+                elif feed == "regions":
+                    # 3. 참가가능지역
+                    count, finished, requests = await self._fetch_regions(
+                        db, window_start, window_end,
+                        start_page, prior_count, checkpoint,
+                    )
+                else:
+                    # 4. 면허제한
+                    count, finished, requests = await self._fetch_license_limits(
+                        db, window_start, window_end,
+                        start_page, prior_count, checkpoint,
+                    )
+                totals[feed] = count
+                api_calls += requests
+                if not finished:
+                    incomplete.append(feed)
+
+            total_notices = totals["contract"] + totals["service"]
+            total_regions = totals["regions"]
+            total_license_limits = totals["license_limits"]
+
+            # 5. 끝까지 받지 못한 피드가 있으면 마킹하지 않음 (다음 사이클에 재시도)
+            if incomplete:
+                error = f"incomplete feeds: {', '.join(incomplete)}"
                 logger.warning(
-                    f"All API calls failed for {window_start}~{window_end}, "
-                    f"skipping mark"
+                    f"Sync {window_start}~{window_end} {error}, skipping mark"
                 )
                 self._failed_windows.append(
                     f"{window_start}~{window_end}"
                 )
+                if job is not None:
+                    if self._upstream_pause():
+                        # 서킷 open으로 중단 → 시도 횟수를 소모하지 않음
+                        await sync_job_queue.defer(db, job.job_id, error)
+                    else:
+                        await sync_job_queue.release(db, job.job_id, error)
+                SYNC_WINDOW_DURATION.labels("failed").observe(
+                    time.perf_counter() - started
+                )
                 return api_calls
 
             try:
@@ -225,25 +569,48 @@ class BidDataSyncScheduler:
                     total_notices,
                     total_regions,
                     total_license_limits,
+                    write_result,
                 )
             except Exception as e:
                 logger.warning(f"mark_window_synced failed: {e}")
 
+            if job is not None:
+                await sync_job_queue.complete(db, job.job_id)
+
             logger.info(
                 f"Synced {window_start}~{window_end}: "
-                f"{total_notices} notices, {total_regions} regions, "
+                f"{total_notices} notices "
+                f"({write_result.inserted} new, {write_result.updated} updated, "
+                f"{write_result.unchanged} unchanged), "
+                f"{total_regions} regions, "
                 f"{total_license_limits} license limits"
             )
 
+        SYNC_WINDOW_DURATION.labels("synced").observe(time.perf_counter() - started)
         return api_calls
 
     async def _fetch_notices(
-        self, db, work_type: str, bgn: str, end: str
-    ) -> tuple[int, bool]:
-        """공고를 페이지별로 조회하여 저장합니다. (count, success)"""
-        total = 0
-        page = 1
-        success = False
+        self,
+        db,
+        work_type: str,
+        bgn: str,
+        end: str,
+        write_result: NoticeUpsertResult,
+        start_page: int = 1,
+        prior_count: int = 0,
+        checkpoint=None,
+    ) -> tuple[int, bool, int]:
+        """공고를 페이지별로 조회하여 저장합니다. (count, finished, requests)
+
+        finished는 끝 페이지(빈 페이지 또는 마지막 부분 페이지)까지 받았는지
+        여부입니다. 호출 제한/오류로 중간에 멈추면 False.
+        requests는 실제로 보낸 페이지 요청 수 (실패한 요청 포함, 일일 예산 집계용).
+        저장 건수(신규/갱신/변경없음)는 write_result에 누적됩니다.
+        """
+        total = prior_count
+        page = start_page
+        finished = False
+        requests = 0
 
         while True:
             try:
@@ -257,122 +624,164 @@ class BidDataSyncScheduler:
                 result = await narajangter_service.search_bids(
                     work_type, params
                 )
-                success = True
             except Exception as e:
+                if not isinstance(e, CircuitOpenError):
+                    requests += 1  # 실패한 요청도 일일 한도를 소모
                 logger.error(
                     f"Failed to fetch {work_type} bids "
                     f"{bgn}~{end} page {page}: {e}"
                 )
                 break
+            requests += 1
 
             if not result.items:
+                page -= 1
+                finished = True
                 break
 
-            await bid_data_service.save_bid_notices(db, result.items)
+            saved = await bid_data_service.save_bid_notices(db, result.items)
+            write_result.add(saved)
             total += len(result.items)
+            SYNC_PAGES.labels(work_type).inc()
+            SYNC_ROWS.labels(work_type).inc(len(result.items))
+            if checkpoint:
+                await checkpoint(page, total)
 
             if len(result.items) < 100:
+                finished = True
                 break
             page += 1
-            await asyncio.sleep(0.5)
+            await self._throttle(0.5, "page")
 
-        return total, success
+        if checkpoint and finished:
+            await checkpoint(page, total, True)
+        return total, finished, requests
 
     async def _fetch_regions(
-        self, db, bgn: str, end: str
-    ) -> tuple[int, bool]:
-        """참가가능지역을 페이지별로 조회하여 저장합니다."""
-        total = 0
-        page = 1
-        success = False
+        self,
+        db,
+        bgn: str,
+        end: str,
+        start_page: int = 1,
+        prior_count: int = 0,
+        checkpoint=None,
+    ) -> tuple[int, bool, int]:
+        """참가가능지역을 페이지별로 조회하여 저장합니다. (count, finished, requests)"""
+        total = prior_count
+        page = start_page
+        finished = False
+        requests = 0
 
         while True:
             try:
                 regions = await narajangter_service.get_prtcpt_psbl_rgn_by_date(
                     bgn, end, page
                 )
-                success = True
             except Exception as e:
+                if not isinstance(e, CircuitOpenError):
+                    requests += 1  # 실패한 요청도 일일 한도를 소모
                 logger.error(
                     f"Failed to fetch regions {bgn}~{end} page {page}: {e}"
                 )
                 break
+            requests += 1
 
             if not regions:
+                page -= 1
+                finished = True
                 break
 
             await bid_data_service.save_prtcpt_psbl_rgns(db, regions)
             total += len(regions)
+            SYNC_PAGES.labels("regions").inc()
+            SYNC_ROWS.labels("regions").inc(len(regions))
+            if checkpoint:
+                await checkpoint(page, total)
 
             if len(regions) < NaraJangterService.MAX_PAGE_SIZE:
+                finished = True
                 break
             page += 1
-            await asyncio.sleep(0.5)
+            await self._throttle(0.5, "page")
 
-        return total, success
+        if checkpoint and finished:
+            await checkpoint(page, total, True)
+        return total, finished, requests
 
     async def _fetch_license_limits(
-        self, db, bgn: str, end: str
-    ) -> tuple[int, bool]:
-        """면허제한 정보를 페이지별로 조회하여 저장합니다."""
-        total = 0
-        page = 1
-        success = False
+        self,
+        db,
+        bgn: str,
+        end: str,
+        start_page: int = 1,
+        prior_count: int = 0,
+        checkpoint=None,
+    ) -> tuple[int, bool, int]:
+        """면허제한 정보를 페이지별로 조회하여 저장합니다. (count, finished, requests)"""
+        total = prior_count
+        page = start_page
+        finished = False
+        requests = 0
 
         while True:
             try:
                 limits = await narajangter_service.get_license_limit_by_date(
                     bgn, end, page
                 )
-                success = True
             except Exception as e:
+                if not isinstance(e, CircuitOpenError):
+                    requests += 1  # 실패한 요청도 일일 한도를 소모
                 logger.error(
                     f"Failed to fetch license limits {bgn}~{end} page {page}: {e}"
                 )
                 break
+            requests += 1
 
             if not limits:
+                page -= 1
+                finished = True
                 break
 
             await bid_data_service.save_license_limits(db, limits)
             total += len(limits)
+            SYNC_PAGES.labels("license_limits").inc()
+            SYNC_ROWS.labels("license_limits").inc(len(limits))
+            if checkpoint:
+                await checkpoint(page, total)
 
             if len(limits) < NaraJangterService.MAX_PAGE_SIZE:
+                finished = True
                 break
             page += 1
-            await asyncio.sleep(0.5)
-
-        return total, success
-
-    async def sync_recent_data(self, days: int = 30):
-        """수동 트리거용: 과거 N일 동기화."""
-        async with self._sync_lock:
-            self._failed_windows = []
-            now = datetime.now(KST)
-            api_calls = 0
+            await self._throttle(0.5, "page")
 
-            for day_offset in range(days, -1, -1):
-                if api_calls >= self.MAX_API_CALLS_PER_RUN * 2:
-                    logger.info("API call limit reached during manual sync")
-                    break
+        if checkpoint and finished:
+            await checkpoint(page, total, True)
+        return total, finished, requests
 
-                date = now - timedelta(days=day_offset)
-                date_str = date.strftime("%Y%m%d")
-                ts = date_str + "0000"
-                end = date_str + "2359"
+    async def sync_recent_data(self, days: int = 30) -> int:
+        """수동 트리거용: 과거 N일 중 미동기화 날짜를 작업 큐에 등록합니다.
 
-                async with AsyncSessionLocal() as db:
-                    entry = await bid_data_service.get_sync_entry(db, ts)
+        오늘은 시간별 동기화가 담당하므로 어제까지만 등록합니다.
 
-                if entry:
-                    continue
+        Returns:
+            등록된 작업 수
+        """
+        now = datetime.now(KST)
+        first = (now - timedelta(days=days)).strftime("%Y%m%d")
+        last = (now - timedelta(days=1)).strftime("%Y%m%d")
+        enqueued = 0
 
-                calls = await self._sync_window_internal(ts, end)
-                api_calls += calls
-                await asyncio.sleep(1)
+        async with AsyncSessionLocal() as db:
+            await sync_coverage.ensure_loaded(db)
+            for date_str in sync_coverage.missing_days(first, last):
+                await sync_job_queue.enqueue(
+                    db, date_str + "0000", date_str + "2359", PRIORITY_MANUAL
+                )
+                enqueued += 1
 
-            if self._failed_windows:
-                await self._send_failure_alert()
+        logger.info(f"Manual sync enqueued {enqueued} days")
+        return enqueued
 
     async def _send_failure_alert(self):
         """동기화 실패 시 이메일 알림 (1시간에 최대 1회)."""
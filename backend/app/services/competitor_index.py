@@ -0,0 +1,410 @@
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.bid import (
+    BidNotice,
+    BidOpeningResult,
+    CompetitorBid,
+    CompetitorIndexedNotice,
+    CompetitorStat,
+)
+from app.services.bid_data_service import bid_data_service
+from app.services.bid_price_engine import safe_num
+from app.services.leader_election import try_advisory_lock
+from app.services.region_hierarchy import SIDO, UNRESTRICTED, region_code
+
+logger = logging.getLogger(__name__)
+
+ALL_SEGMENT = "*"
+REGION_PREFIX = "rgn:"
+INDUSTRY_PREFIX = "ind:"
+
+# 투찰률(%) 히스토그램 구간 경계 — 앞뒤로 미만/이상 칸이 하나씩 붙습니다
+RATE_BIN_EDGES = np.round(np.arange(85.0, 95.01, 0.5), 1)
+
+SIDO_NAMES: Dict[str, str] = {UNRESTRICTED: "전체"}
+for _code, _name, _ in SIDO:
+    SIDO_NAMES[_code] = _name
+
+
+def normalize_bizno(bizno: Optional[str]) -> str:
+    return (bizno or "").replace("-", "").strip()
+
+
+def region_segment(code: str) -> str:
+    return f"{REGION_PREFIX}{code}"
+
+
+def industry_segment(name: str) -> str:
+    return f"{INDUSTRY_PREFIX}{name}"
+
+
+def segment_of(region: Optional[str] = None, industry: Optional[str] = None) -> str:
+    """조회 조건(지역명, 업종명) → 세그먼트. 지역은 시도 단위로 묶습니다."""
+    parts = []
+    if region:
+        parts.append(region_segment(region_code(region).split("/")[0]))
+    if industry:
+        parts.append(industry_segment(industry))
+    return "|".join(parts) or ALL_SEGMENT
+
+
+def notice_segments(
+    region_names: Sequence[str], license_names: Sequence[str]
+) -> List[str]:
+    """공고의 참가가능지역/허용업종 → 집계 세그먼트 목록.
+
+    지역은 시도 코드(제한 없음은 "00"), 업종은 허용업종명 그대로 쓰고
+    지역 × 업종 조합 세그먼트도 함께 만듭니다.
+    """
+    regions = list(dict.fromkeys(
+        region_code(name).split("/")[0] for name in region_names
+    )) or [UNRESTRICTED]
+    industries = list(dict.fromkeys(name for name in license_names if name))
+
+    segments = [ALL_SEGMENT]
+    segments += [region_segment(code) for code in regions]
+    segments += [industry_segment(name) for name in industries]
+    segments += [
+        f"{region_segment(code)}|{industry_segment(name)}"
+        for code in regions
+        for name in industries
+    ]
+    return segments
+
+
+def flatten_results(items: Optional[list]) -> List[dict]:
+    """개찰결과 JSONB → 업체별 투찰 (사업자번호 중복 시 첫 항목)."""
+    bids: Dict[str, dict] = {}
+    for item in items or ():
+        bizno = normalize_bizno(item.get("prcbdrBizno"))
+        if not bizno or bizno in bids:
+            continue
+        rank = (item.get("opengRank") or "").strip()
+        amount = safe_num(item.get("bidprcAmt"))
+        bids[bizno] = {
+            "prcbdr_bizno": bizno,
+            "prcbdr_nm": item.get("prcbdrNm"),
+            "bid_amount": int(amount) if amount else None,
+            "bid_rate": safe_num(item.get("bidprcrt")),
+            "opening_rank": int(rank) if rank.isdigit() else None,
+            "won": rank == "1",
+        }
+    return list(bids.values())
+
+
+def aggregate_stats(
+    keys: Sequence[Tuple[str, str]],
+    rates: np.ndarray,
+    won: np.ndarray,
+    opened_at: np.ndarray,
+) -> Dict[Tuple[str, str], dict]:
+    """(세그먼트, 사업자번호)별 투찰 건수/낙찰 건수/평균 투찰률/히스토그램.
+
+    rates: 투찰률 (없으면 NaN), opened_at: 개찰일시 epoch 초 (없으면 NaN)
+    """
+    if not len(keys):
+        return {}
+    labels, codes = np.unique(
+        np.array(["\0".join(k) for k in keys]), return_inverse=True
+    )
+    groups = len(labels)
+
+    bid_count = np.bincount(codes, minlength=groups)
+    win_count = np.bincount(codes, weights=won.astype(np.float64), minlength=groups)
+
+    has_rate = ~np.isnan(rates)
+    rate_count = np.bincount(codes[has_rate], minlength=groups)
+    rate_sum = np.bincount(codes[has_rate], weights=rates[has_rate], minlength=groups)
+
+    bins = len(RATE_BIN_EDGES) + 1
+    slots = np.searchsorted(RATE_BIN_EDGES, rates[has_rate], side="right")
+    histogram = np.bincount(
+        codes[has_rate] * bins + slots, minlength=groups * bins
+    ).reshape(groups, bins)
+
+    last_opened = np.full(groups, -np.inf)
+    has_opened = ~np.isnan(opened_at)
+    np.maximum.at(last_opened, codes[has_opened], opened_at[has_opened])
+
+    stats = {}
+    for i, label in enumerate(labels.tolist()):
+        stats[tuple(label.split("\0"))] = {
+            "bid_count": int(bid_count[i]),
+            "win_count": int(win_count[i]),
+            "avg_bid_rate": (
+                float(rate_sum[i] / rate_count[i]) if rate_count[i] else None
+            ),
+            "rate_histogram": histogram[i].tolist(),
+            "last_opened_at": (
+                float(last_opened[i]) if np.isfinite(last_opened[i]) else None
+            ),
+        }
+    return stats
+
+
+class CompetitorIndex:
+    """개찰결과 기반 경쟁사 인덱스
+
+    - competitor_bids: 개찰결과 JSONB를 업체 단위로 펼친 투찰 기록
+    - competitor_stats: 세그먼트(전체/시도/업종/시도×업종) × 업체 집계
+    동기화 사이클(refresh)마다 새로 수집된 공고만 다시 펼치고, 영향받은
+    업체의 집계만 다시 계산합니다. 요청 경로는 개찰결과를 저장(fetched_at
+    갱신)하는 것만으로 재색인 대상이 되며 직접 재집계하지 않습니다.
+    """
+
+    BATCH_SIZE = 200
+    RECOMPUTE_CHUNK = 500  # 재집계 시 한 번에 읽는 업체 수
+    INSERT_CHUNK = 2000  # bind parameter 한도 회피용 INSERT 단위
+    LOCK_NAME = "competitor_index_refresh"
+
+    async def refresh(self, db: AsyncSession) -> int:
+        """인덱스에 없거나 이후 재수집된 개찰결과를 반영 → 반영한 공고 수.
+
+        competitor_stats의 delete+insert 재집계가 겹치지 않도록 advisory lock을
+        보유한 프로세스 하나만 실행합니다 (이미 실행 중이면 0).
+        """
+        async with try_advisory_lock(self.LOCK_NAME) as acquired:
+            if not acquired:
+                logger.info("Competitor index refresh already running, skipped")
+                return 0
+            return await self._refresh(db)
+
+    async def _refresh(self, db: AsyncSession) -> int:
+        touched: Set[str] = set()
+        total = 0
+        while True:
+            candidates = await self._candidates(db)
+            if not candidates:
+                break
+            touched |= await self._index(db, candidates)
+            await db.commit()
+            total += len(candidates)
+            if len(candidates) < self.BATCH_SIZE:
+                break
+
+        if touched:
+            await self._recompute(db, touched)
+            await db.commit()
+            logger.info(
+                f"Competitor index refreshed: {total} notices, "
+                f"{len(touched)} companies"
+            )
+        return total
+
+    async def _candidates(self, db: AsyncSession) -> list:
+        result = await db.execute(
+            select(
+                BidOpeningResult.bid_ntce_no,
+                BidOpeningResult.data,
+                BidOpeningResult.fetched_at,
+            )
+            .outerjoin(
+                CompetitorIndexedNotice,
+                CompetitorIndexedNotice.bid_ntce_no == BidOpeningResult.bid_ntce_no,
+            )
+            .where(
+                or_(
+                    CompetitorIndexedNotice.bid_ntce_no.is_(None),
+                    BidOpeningResult.fetched_at
+                    > CompetitorIndexedNotice.source_fetched_at,
+                )
+            )
+            .order_by(BidOpeningResult.bid_ntce_no)
+            .limit(self.BATCH_SIZE)
+        )
+        return result.all()
+
+    async def _index(self, db: AsyncSession, rows: list) -> Set[str]:
+        """공고의 투찰 기록을 다시 펼칩니다 → 영향받은 사업자번호."""
+        bid_nos = [row[0] for row in rows]
+
+        # 공고 (차수가 여러 개면 마지막 차수 기준)
+        notice_result = await db.execute(
+            select(
+                BidNotice.bid_ntce_no,
+                BidNotice.openg_at,
+                BidNotice.data["bidNtceNm"].astext,
+            )
+            .where(BidNotice.bid_ntce_no.in_(bid_nos))
+            .order_by(BidNotice.bid_ntce_no, BidNotice.bid_ntce_ord)
+        )
+        notices = {no: (openg_at, name) for no, openg_at, name in notice_result.all()}
+        rgn_map, lic_map, _ = await bid_data_service.get_enrichment_maps(
+            db, bid_nos
+        )
+
+        # 이전에 기록된 업체도 재집계 대상 (재수집으로 빠진 업체 포함)
+        old_result = await db.execute(
+            select(CompetitorBid.prcbdr_bizno).where(
+                CompetitorBid.bid_ntce_no.in_(bid_nos)
+            )
+        )
+        touched = set(old_result.scalars().all())
+        await db.execute(
+            delete(CompetitorBid).where(CompetitorBid.bid_ntce_no.in_(bid_nos))
+        )
+
+        values = []
+        for no, data, _ in rows:
+            openg_at, name = notices.get(no, (None, None))
+            segments = notice_segments(rgn_map.get(no, []), lic_map.get(no, []))
+            for bid in flatten_results(data):
+                touched.add(bid["prcbdr_bizno"])
+                values.append({
+                    "bid_ntce_no": no,
+                    "bid_ntce_nm": name,
+                    "segments": segments,
+                    "opened_at": openg_at,
+                    **bid,
+                })
+        for start in range(0, len(values), self.INSERT_CHUNK):
+            await db.execute(
+                insert(CompetitorBid).values(
+                    values[start:start + self.INSERT_CHUNK]
+                )
+            )
+
+        stmt = insert(CompetitorIndexedNotice).values([
+            {"bid_ntce_no": no, "source_fetched_at": fetched_at}
+            for no, _, fetched_at in rows
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["bid_ntce_no"],
+            set_={
+                "source_fetched_at": stmt.excluded.source_fetched_at,
+                "indexed_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
+        return touched
+
+    async def _recompute(self, db: AsyncSession, biznos: Set[str]) -> None:
+        """업체별 집계를 competitor_bids에서 다시 계산합니다."""
+        ordered = sorted(biznos)
+        for start in range(0, len(ordered), self.RECOMPUTE_CHUNK):
+            chunk = ordered[start:start + self.RECOMPUTE_CHUNK]
+            segment = func.unnest(CompetitorBid.segments)
+            result = await db.execute(
+                select(
+                    segment,
+                    CompetitorBid.prcbdr_bizno,
+                    CompetitorBid.prcbdr_nm,
+                    CompetitorBid.bid_rate,
+                    CompetitorBid.won,
+                    CompetitorBid.opened_at,
+                ).where(CompetitorBid.prcbdr_bizno.in_(chunk))
+            )
+            rows = result.all()
+
+            # 업체명은 가장 최근 개찰 기준
+            names: Dict[str, Tuple[float, Optional[str]]] = {}
+            opened = []
+            for _, bizno, name, _, _, opened_at in rows:
+                ts = opened_at.timestamp() if opened_at else np.nan
+                opened.append(ts)
+                key = -np.inf if np.isnan(ts) else ts
+                if name and (bizno not in names or key >= names[bizno][0]):
+                    names[bizno] = (key, name)
+
+            stats = aggregate_stats(
+                [(row[0], row[1]) for row in rows],
+                np.array(
+                    [np.nan if row[3] is None else row[3] for row in rows],
+                    dtype=np.float64,
+                ),
+                np.array([bool(row[4]) for row in rows], dtype=bool),
+                np.array(opened, dtype=np.float64),
+            )
+
+            await db.execute(
+                delete(CompetitorStat).where(CompetitorStat.prcbdr_bizno.in_(chunk))
+            )
+            values = [
+                {
+                    "segment": segment_key,
+                    "prcbdr_bizno": bizno,
+                    "prcbdr_nm": names.get(bizno, (None, None))[1],
+                    **stat,
+                    "last_opened_at": (
+                        datetime.fromtimestamp(stat["last_opened_at"], tz=timezone.utc)
+                        if stat["last_opened_at"] is not None
+                        else None
+                    ),
+                }
+                for (segment_key, bizno), stat in stats.items()
+            ]
+            for offset in range(0, len(values), self.INSERT_CHUNK):
+                await db.execute(
+                    insert(CompetitorStat).values(
+                        values[offset:offset + self.INSERT_CHUNK]
+                    )
+                )
+
+    async def list_competitors(
+        self,
+        db: AsyncSession,
+        segment: str,
+        sort: str,
+        page_no: int,
+        num_of_rows: int,
+    ) -> Tuple[int, List[CompetitorStat]]:
+        """세그먼트 내 업체 순위 (참여순 / 낙찰순)."""
+        count_result = await db.execute(
+            select(func.count()).select_from(CompetitorStat).where(
+                CompetitorStat.segment == segment
+            )
+        )
+        order = (
+            CompetitorStat.win_count if sort == "win_count" else CompetitorStat.bid_count
+        )
+        result = await db.execute(
+            select(CompetitorStat)
+            .where(CompetitorStat.segment == segment)
+            .order_by(order.desc(), CompetitorStat.prcbdr_bizno)
+            .offset((page_no - 1) * num_of_rows)
+            .limit(num_of_rows)
+        )
+        return count_result.scalar_one(), list(result.scalars().all())
+
+    async def get_competitor(
+        self, db: AsyncSession, bizno: str
+    ) -> List[CompetitorStat]:
+        """업체의 모든 세그먼트 집계."""
+        result = await db.execute(
+            select(CompetitorStat)
+            .where(CompetitorStat.prcbdr_bizno == normalize_bizno(bizno))
+            .order_by(CompetitorStat.bid_count.desc(), CompetitorStat.segment)
+        )
+        return list(result.scalars().all())
+
+    async def list_bids(
+        self, db: AsyncSession, bizno: str, page_no: int, num_of_rows: int
+    ) -> Tuple[int, List[CompetitorBid]]:
+        """업체의 최근 투찰 기록."""
+        bizno = normalize_bizno(bizno)
+        count_result = await db.execute(
+            select(func.count()).select_from(CompetitorBid).where(
+                CompetitorBid.prcbdr_bizno == bizno
+            )
+        )
+        result = await db.execute(
+            select(CompetitorBid)
+            .where(CompetitorBid.prcbdr_bizno == bizno)
+            .order_by(
+                CompetitorBid.opened_at.desc().nulls_last(),
+                CompetitorBid.bid_ntce_no.desc(),
+            )
+            .offset((page_no - 1) * num_of_rows)
+            .limit(num_of_rows)
+        )
+        return count_result.scalar_one(), list(result.scalars().all())
+
+
+competitor_index = CompetitorIndex()
@@ -0,0 +1,184 @@
+import asyncio
+import hashlib
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+def advisory_lock_key(name: str) -> int:
+    """이름에서 pg_advisory_lock용 signed 64bit 키를 만듭니다."""
+    digest = hashlib.sha256(name.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+@asynccontextmanager
+async def try_advisory_lock(name: str) -> AsyncIterator[bool]:
+    """전용 연결에서 세션 레벨 advisory lock을 시도하고 획득 여부를 yield합니다.
+
+    작업 세션이 중간에 커밋해도(연결 반납) 블록이 끝날 때까지 잠금이 유지되며,
+    다른 프로세스가 보유 중이면 기다리지 않고 False를 yield합니다.
+    """
+    key = advisory_lock_key(name)
+    conn = await engine.connect()
+    try:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        acquired = bool(
+            (
+                await conn.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"), {"key": key}
+                )
+            ).scalar()
+        )
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": key}
+                )
+    finally:
+        await conn.close()
+
+
+class LeaderElection:
+    """Postgres advisory lock 기반 리더 선출
+
+    - 세션 레벨 pg_try_advisory_lock을 전용 연결로 보유 → 보유한 프로세스만
+      start()로 스케줄러를 실행 (uvicorn 워커/레플리카 중 정확히 하나)
+    - 리스 갱신: RENEW_INTERVAL마다 보유 연결에서 잠금 보유 여부 확인,
+      RENEW_TIMEOUT 내 응답이 없거나 연결이 끊기면 즉시 스케줄러 중지
+    - 장애 조치: 리더 프로세스가 죽으면 PG가 연결 종료와 함께 잠금을 해제하고,
+      대기 중인 프로세스가 RETRY_INTERVAL 내에 잠금을 획득하여 승계
+    """
+
+    RENEW_INTERVAL = 10
+    RENEW_TIMEOUT = 5
+    RETRY_INTERVAL = 15
+
+    def __init__(
+        self,
+        name: str,
+        start: Callable[[], Awaitable[None]],
+        stop: Callable[[], Awaitable[None]],
+    ):
+        self.name = name
+        self.lock_key = advisory_lock_key(name)
+        self._start = start
+        self._stop = stop
+        self._conn: Optional[AsyncConnection] = None
+        self._task: Optional[asyncio.Task] = None
+        self.is_leader = False
+        self.is_running = False
+
+    async def run(self) -> None:
+        """리더 선출 루프. shutdown() 호출 시까지 실행됩니다."""
+        if self.is_running:
+            return
+        self.is_running = True
+
+        while self.is_running:
+            try:
+                if self.is_leader:
+                    await asyncio.wait_for(
+                        self._renew(), timeout=self.RENEW_TIMEOUT
+                    )
+                elif await self._try_acquire():
+                    self._become_leader()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self.is_leader:
+                    logger.error(f"Leader lease for {self.name} lost: {e}")
+                    await self._step_down()
+                else:
+                    logger.warning(f"Leader election for {self.name} failed: {e}")
+
+            await asyncio.sleep(
+                self.RENEW_INTERVAL if self.is_leader else self.RETRY_INTERVAL
+            )
+
+    async def shutdown(self) -> None:
+        """루프를 종료하고 리더였다면 스케줄러 중지 + 잠금 해제."""
+        self.is_running = False
+        await self._step_down()
+
+    def _become_leader(self) -> None:
+        self.is_leader = True
+        logger.info(f"Acquired leadership for {self.name}")
+        self._task = asyncio.create_task(self._start())
+
+    async def _try_acquire(self) -> bool:
+        conn = await engine.connect()
+        try:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            acquired = (
+                await conn.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"),
+                    {"key": self.lock_key},
+                )
+            ).scalar()
+        except Exception:
+            await conn.close()
+            raise
+
+        if acquired:
+            self._conn = conn
+            return True
+        await conn.close()
+        return False
+
+    async def _renew(self) -> None:
+        """보유 연결에서 advisory lock을 여전히 보유 중인지 확인합니다."""
+        if self._conn is None:
+            raise RuntimeError("leader connection missing")
+        unsigned = self.lock_key & 0xFFFFFFFFFFFFFFFF
+        held = (
+            await self._conn.execute(
+                text(
+                    "SELECT EXISTS (SELECT 1 FROM pg_locks "
+                    "WHERE locktype = 'advisory' AND granted "
+                    "AND pid = pg_backend_pid() "
+                    "AND classid::bigint = :hi AND objid::bigint = :lo "
+                    "AND objsubid = 1)"
+                ),
+                {"hi": unsigned >> 32, "lo": unsigned & 0xFFFFFFFF},
+            )
+        ).scalar()
+        if not held:
+            raise RuntimeError("advisory lock no longer held")
+
+    async def _step_down(self) -> None:
+        was_leader = self.is_leader
+        self.is_leader = False
+
+        if was_leader:
+            try:
+                await self._stop()
+            except Exception as e:
+                logger.warning(f"Failed to stop {self.name}: {e}")
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            try:
+                await conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": self.lock_key},
+                )
+            except Exception:
+                # 연결이 이미 끊긴 경우 PG가 잠금을 해제함
+                await conn.invalidate()
+            finally:
+                await conn.close()
+
+        if was_leader:
+            logger.info(f"Released leadership for {self.name}")
@@ -3,6 +3,7 @@ from typing import List, Optional, Tuple
 
 import httpx
 from app.core.config import settings
+from app.core.metrics import endpoint_label, upstream_client_options
 from app.schemas.bid import (
     BidApiResponse,
     BidAValueItem,
@@ -12,12 +13,18 @@ from app.schemas.bid import (
     LicenseLimitItem,
     PrtcptPsblRgnItem,
 )
+from app.services.upstream_resilience import RESULT_NODATA, upstream_guard
 
 logger = logging.getLogger(__name__)
 
 
 class NaraJangterService:
-    """Service for interacting with 나라장터 API."""
+    """Service for interacting with 나라장터 API.
+
+    모든 호출은 upstream_guard(재시도 + 엔드포인트별 서킷 브레이커)를
+    거칩니다. 404와 NODATA(03)는 "데이터 없음"(None / [])으로 반환하고,
+    호출 제한·일시 오류·서킷 open은 UpstreamError로 올립니다.
+    """
 
     MAX_PAGE_SIZE = 999
     DEFAULT_TIMEOUT_SECONDS = 30.0
@@ -34,6 +41,20 @@ class NaraJangterService:
         'service': BASE_SERV_URL,
     }
 
+    def _client(self) -> httpx.AsyncClient:
+        """응답 시간/resultCode 계측 hook이 붙은 클라이언트."""
+        return httpx.AsyncClient(
+            timeout=self.DEFAULT_TIMEOUT_SECONDS, **upstream_client_options()
+        )
+
+    async def _get(self, url: str, params: dict) -> httpx.Response:
+        """재시도/서킷 브레이커를 거친 GET (404는 그대로 반환)."""
+        endpoint = endpoint_label(httpx.URL(url))
+        async with self._client() as client:
+            return await upstream_guard.call(
+                endpoint, lambda: client.get(url, params=params)
+            )
+
     def _parse_api_response(
         self, data: dict, context: str
     ) -> Tuple[List[dict], Optional[dict]]:
@@ -47,6 +68,8 @@ class NaraJangterService:
             return [], None
 
         header = data["response"]["header"]
+        if header["resultCode"] == RESULT_NODATA:
+            return [], data["response"].get("body") or {}
         if header["resultCode"] != "00":
             logger.error(f"{context}: API Error: {header['resultMsg']}")
             return [], None
@@ -104,38 +127,38 @@ class NaraJangterService:
         if params.bidClseExcpYn:
             query_params["bidClseExcpYn"] = params.bidClseExcpYn
 
-        async with httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT_SECONDS) as client:
-            response = await client.get(url=url, params=query_params)
-            response.raise_for_status()
+        response = await self._get(url, query_params)
+        response.raise_for_status()
 
-            try:
-                data = response.json()
-            except ValueError:
-                raise Exception(f"Failed to parse JSON response from search_bids: {response.text}")
+        try:
+            data = response.json()
+        except ValueError:
+            raise Exception(f"Failed to parse JSON response from search_bids: {response.text}")
 
-            if "response" not in data:
-                raise Exception(f"API response missing 'response' key: {data}")
+        if "response" not in data:
+            raise Exception(f"API response missing 'response' key: {data}")
 
-            if data["response"]["header"]["resultCode"] != "00":
-                raise Exception(f"API Error: {data['response']['header']['resultMsg']}")
+        result_code = data["response"]["header"]["resultCode"]
+        if result_code not in ("00", RESULT_NODATA):
+            raise Exception(f"API Error: {data['response']['header']['resultMsg']}")
 
-            body = data["response"]["body"]
-            items_data = body.get("items", [])
+        body = data["response"].get("body") or {}
+        items_data = body.get("items", [])
 
-            if isinstance(items_data, dict):
-                items_data = [items_data]
-            elif items_data is None:
-                items_data = []
+        if isinstance(items_data, dict):
+            items_data = [items_data]
+        elif items_data is None:
+            items_data = []
 
-            logger.info(f"Received {len(items_data)} items from NaraJangter API")
-            items = [BidItem(**item) for item in items_data]
+        logger.info(f"Received {len(items_data)} items from NaraJangter API")
+        items = [BidItem(**item) for item in items_data]
 
-            return BidApiResponse(
-                items=items,
-                totalCount=body.get("totalCount", 0),
-                numOfRows=body.get("numOfRows", 0),
-                pageNo=body.get("pageNo", 1),
-            )
+        return BidApiResponse(
+            items=items,
+            totalCount=body.get("totalCount", 0),
+            numOfRows=body.get("numOfRows", 0),
+            pageNo=body.get("pageNo", 1),
+        )
 
     async def get_bid_notice_by_no(
         self, bidNtceNo: str, bid_type: str = "cnstwk"
@@ -158,29 +181,28 @@ class NaraJangterService:
 
         logger.info(f"get_bid_notice_by_no called for {bidNtceNo}, type={bid_type}")
 
-        async with httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT_SECONDS) as client:
-            try:
-                response = await client.get(url=url, params=query_params)
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code in (404, 429):
-                    return None
-                raise
-
-            items_data, body = self._safe_parse_response(
-                response, f"get_bid_notice_by_no({bidNtceNo})"
-            )
-            if not items_data:
+        response = await self._get(url, query_params)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
                 return None
+            raise
 
-            item = next(
-                (d for d in items_data if d.get("bidNtceNo") == bidNtceNo),
-                items_data[0] if items_data else None,
-            )
-            if not item:
-                return None
+        items_data, body = self._safe_parse_response(
+            response, f"get_bid_notice_by_no({bidNtceNo})"
+        )
+        if not items_data:
+            return None
+
+        item = next(
+            (d for d in items_data if d.get("bidNtceNo") == bidNtceNo),
+            items_data[0] if items_data else None,
+        )
+        if not item:
+            return None
 
-            return BidItem(**item)
+        return BidItem(**item)
 
     async def get_bid_a_value(self, bidNtceNo: str, bid_type: str = "cnstwk") -> Optional[BidAValueItem]:
         """Get A-value and base amount information for a specific bid notice."""
@@ -199,43 +221,39 @@ class NaraJangterService:
 
         logger.info(f"NaraJangterService.get_bid_a_value called for bidNtceNo: {bidNtceNo}, type: {bid_type}")
 
-        async with httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT_SECONDS) as client:
-            response = await client.get(target_url, params=query_params)
-
-            logger.debug(f"Raw API Response for A-value: {response.text}")
+        response = await self._get(target_url, query_params)
 
-            try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    logger.info(f"A-value API returned 404 for bidNtceNo: {bidNtceNo}. Treating as no data found.")
-                    return None
-                if e.response.status_code == 429:
-                    logger.warning(f"A-value API returned 429 (rate limited) for bidNtceNo: {bidNtceNo}.")
-                    return None
-                raise e
+        logger.debug(f"Raw API Response for A-value: {response.text}")
 
-            items_data, body = self._safe_parse_response(response, f"get_bid_a_value({bidNtceNo})")
-            if body is None:
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.info(f"A-value API returned 404 for bidNtceNo: {bidNtceNo}. Treating as no data found.")
                 return None
+            raise e
 
-            if not items_data:
-                logger.info(f"No A-value data found for bidNtceNo: {bidNtceNo}")
-                return None
+        items_data, body = self._safe_parse_response(response, f"get_bid_a_value({bidNtceNo})")
+        if body is None:
+            return None
 
-            item = None
-            for item_data in items_data:
-                if item_data.get('bidNtceNo') == bidNtceNo:
-                    item = item_data
-                    break
+        if not items_data:
+            logger.info(f"No A-value data found for bidNtceNo: {bidNtceNo}")
+            return None
 
-            if not item and items_data:
-                item = items_data[0]
+        item = None
+        for item_data in items_data:
+            if item_data.get('bidNtceNo') == bidNtceNo:
+                item = item_data
+                break
 
-            if not item:
-                return None
+        if not item and items_data:
+            item = items_data[0]
 
-            return BidAValueItem(**item)
+        if not item:
+            return None
+
+        return BidAValueItem(**item)
 
     async def get_prtcpt_psbl_rgn_by_date(
         self,
@@ -256,19 +274,18 @@ class NaraJangterService:
         }
         logger.info(f"get_prtcpt_psbl_rgn_by_date: {inqryBgnDt} ~ {inqryEndDt}, page={pageNo}")
 
-        async with httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT_SECONDS) as client:
-            response = await client.get(self.PRTCPT_PSBL_RGN_URL, params=query_params)
+        response = await self._get(self.PRTCPT_PSBL_RGN_URL, query_params)
 
-            try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code in (404, 429):
-                    logger.warning(f"get_prtcpt_psbl_rgn_by_date: HTTP {e.response.status_code}")
-                    return []
-                raise e
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.warning(f"get_prtcpt_psbl_rgn_by_date: HTTP {e.response.status_code}")
+                return []
+            raise e
 
-            items_data, _ = self._safe_parse_response(response, "get_prtcpt_psbl_rgn_by_date")
-            return [PrtcptPsblRgnItem(**item) for item in items_data]
+        items_data, _ = self._safe_parse_response(response, "get_prtcpt_psbl_rgn_by_date")
+        return [PrtcptPsblRgnItem(**item) for item in items_data]
 
     async def get_prtcpt_psbl_rgn_by_bid(
         self,
@@ -287,19 +304,18 @@ class NaraJangterService:
         }
         logger.info(f"get_prtcpt_psbl_rgn_by_bid: {bidNtceNo}-{bidNtceOrd}")
 
-        async with httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT_SECONDS) as client:
-            response = await client.get(self.PRTCPT_PSBL_RGN_URL, params=query_params)
+        response = await self._get(self.PRTCPT_PSBL_RGN_URL, query_params)
 
-            try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code in (404, 429):
-                    logger.warning(f"get_prtcpt_psbl_rgn_by_bid: HTTP {e.response.status_code}")
-                    return []
-                raise e
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.warning(f"get_prtcpt_psbl_rgn_by_bid: HTTP {e.response.status_code}")
+                return []
+            raise e
 
-            items_data, _ = self._safe_parse_response(response, "get_prtcpt_psbl_rgn_by_bid")
-            return [PrtcptPsblRgnItem(**item) for item in items_data]
+        items_data, _ = self._safe_parse_response(response, "get_prtcpt_psbl_rgn_by_bid")
+        return [PrtcptPsblRgnItem(**item) for item in items_data]
 
     async def get_license_limit_by_date(
         self,
@@ -320,19 +336,18 @@ class NaraJangterService:
         }
         logger.info(f"get_license_limit_by_date: {inqryBgnDt} ~ {inqryEndDt}, page={pageNo}")
 
-        async with httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT_SECONDS) as client:
-            response = await client.get(self.LICENSE_LIMIT_URL, params=query_params)
+        response = await self._get(self.LICENSE_LIMIT_URL, query_params)
 
-            try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code in (404, 429):
-                    logger.warning(f"get_license_limit_by_date: HTTP {e.response.status_code}")
-                    return []
-                raise e
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.warning(f"get_license_limit_by_date: HTTP {e.response.status_code}")
+                return []
+            raise e
 
-            items_data, _ = self._safe_parse_response(response, "get_license_limit_by_date")
-            return [LicenseLimitItem(**item) for item in items_data]
+        items_data, _ = self._safe_parse_response(response, "get_license_limit_by_date")
+        return [LicenseLimitItem(**item) for item in items_data]
 
     async def get_bid_opening_results(
         self,
@@ -350,19 +365,18 @@ class NaraJangterService:
         }
         logger.info(f"get_bid_opening_results: bidNtceNo={bidNtceNo}")
 
-        async with httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT_SECONDS) as client:
-            response = await client.get(self.OPENG_RESULT_URL, params=query_params)
-
-            try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code in (404, 429):
-                    logger.warning(f"get_bid_opening_results: HTTP {e.response.status_code}")
-                    return []
-                raise e
+        response = await self._get(self.OPENG_RESULT_URL, query_params)
 
-            items_data, _ = self._safe_parse_response(response, "get_bid_opening_results")
-            return [BidResultItem(**item) for item in items_data]
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.warning(f"get_bid_opening_results: HTTP {e.response.status_code}")
+                return []
+            raise e
+
+        items_data, _ = self._safe_parse_response(response, "get_bid_opening_results")
+        return [BidResultItem(**item) for item in items_data]
 
 
 narajangter_service = NaraJangterService()
@@ -0,0 +1,471 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import and_, func, select, tuple_, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import AsyncSessionLocal
+from app.models.bid import (
+    BidLicenseLimit,
+    BidNotice,
+    BidPrtcptPsblRgn,
+    BidRegionEligibility,
+)
+from app.schemas.bid import BidSearchParams
+
+logger = logging.getLogger(__name__)
+
+# 개찰일시 없음 (openg_at NULL)
+_NO_TIME = np.iinfo(np.int64).min
+_SUPPORTED_ORDER = {None, "", "rgstDt", "bidClseDt", "presmptPrce", "bdgtAmt"}
+
+NoticeKey = Tuple[str, str, str]  # (bid_ntce_no, bid_ntce_ord, rgst_dt)
+
+
+def _epoch(dt: Optional[datetime]) -> int:
+    return _NO_TIME if dt is None else int(dt.timestamp())
+
+
+def _kst_epoch(date_str: str) -> Optional[int]:
+    try:
+        dt = datetime.strptime(date_str[:12], "%Y%m%d%H%M")
+    except ValueError:
+        return None
+    return int(dt.replace(tzinfo=timezone(timedelta(hours=9))).timestamp())
+
+
+def _date_key(date_str: str) -> int:
+    """YYYYMMDDHHMM 접두 문자열 → 정수 (문자열 비교와 같은 순서가 되도록 0 채움)."""
+    return int(date_str[:12].ljust(12, "0"))
+
+
+def _price(value: Optional[str]) -> int:
+    try:
+        return int(float(value)) if value else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+@dataclass
+class HotNotice:
+    """핫셋에 적재되는 공고 1건 (검색 필터/정렬에 필요한 컬럼만)"""
+
+    rgst_dt: str
+    openg_at: Optional[datetime]
+    bid_close_at: datetime
+    presmpt_prce: Optional[int]
+    bdgt_amt: Optional[int]
+    cnstrtsite_rgn_nm: str
+    region_codes: Tuple[str, ...] = ()
+    industries: Tuple[str, ...] = ()
+
+
+class OpenBidHotSet:
+    """진행 중(입찰마감 전) 공고의 인메모리 컬럼형 검색 인덱스
+
+    bidClseExcpYn=Y 검색은 전체 공고 중 일부인 진행 중 공고만 대상이므로
+    필터/정렬/건수를 numpy 배열 위에서 처리하고, 페이지에 해당하는 공고만
+    PK로 DB에서 읽습니다.
+
+    - 컬럼: 등록일시/개찰·마감 epoch/추정가격/예산금액 (int64 배열)
+    - 지역코드·업종: 문자열을 정수 id로 intern한 (소유 공고 index, id) 쌍 배열
+    - 갱신: REFRESH_INTERVAL마다 (또는 mark_stale 후) fetched_at 기준으로 변경된
+      공고만 다시 읽는 증분 갱신, FULL_RELOAD_INTERVAL마다 전체 재로드
+      → 검색 요청은 schedule_refresh로 백그라운드 작업만 시작하고 현재
+      스냅샷으로 응답 (첫 로드 완료 전에는 SQL 경로)
+    - 마감 시각이 지난 공고는 검색 시점의 now로 제외
+    - 업종/공사현장 키워드는 부분 문자열 매칭 (SQL 경로는 escape_like로 동일)
+    """
+
+    REFRESH_INTERVAL = 60
+    FULL_RELOAD_INTERVAL = 3600
+    # fetched_at(트랜잭션 시작 시각)보다 늦게 커밋되는 row를 놓치지 않기 위한 여유
+    REFRESH_OVERLAP = timedelta(minutes=5)
+
+    def __init__(self):
+        self._notices: Dict[Tuple[str, str], HotNotice] = {}
+        self._keys: List[NoticeKey] = []
+        self._columns: Dict[str, np.ndarray] = {}
+        self._region_ids: Dict[str, int] = {}
+        self._industry_texts: List[str] = []
+        self._site_texts: List[str] = []
+        self._loaded_at: Optional[float] = None
+        self._refreshed_at: Optional[float] = None
+        self._watermark: Optional[datetime] = None
+        self._stale = False
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    # --- 로드 / 갱신 ---
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def mark_stale(self) -> None:
+        """동기화 윈도우 완료 후 다음 검색에서 증분 갱신하도록 표시합니다."""
+        self._stale = True
+
+    def can_serve(self, params: BidSearchParams) -> bool:
+        return (
+            params.bidClseExcpYn == "Y"
+            and params.orderBy in _SUPPORTED_ORDER
+            and params.inqryBgnDt[:12].isdigit()
+            and params.inqryEndDt[:12].isdigit()
+        )
+
+    def schedule_refresh(self) -> None:
+        """갱신이 필요하면 백그라운드 로드/증분 갱신을 시작합니다 (기다리지 않음)."""
+        if self._is_fresh(time.monotonic()):
+            return
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._refresh_in_background())
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                await self.ensure_fresh(db)
+        except Exception as e:
+            logger.warning(f"Open bid hot set refresh failed: {e}")
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        now = time.monotonic()
+        if self._is_fresh(now):
+            return
+        async with self._lock:
+            now = time.monotonic()
+            if self._is_fresh(now):
+                return
+            if (
+                self._loaded_at is None
+                or now - self._loaded_at >= self.FULL_RELOAD_INTERVAL
+            ):
+                await self.reload(db)
+            else:
+                await self.refresh(db)
+
+    def _is_fresh(self, now: float) -> bool:
+        return (
+            self._refreshed_at is not None
+            and not self._stale
+            and now - self._refreshed_at < self.REFRESH_INTERVAL
+            and now - self._loaded_at < self.FULL_RELOAD_INTERVAL
+        )
+
+    async def reload(self, db: AsyncSession) -> None:
+        """진행 중 공고 전체를 다시 읽습니다."""
+        started = datetime.now(timezone.utc)
+        self._stale = False
+        notices = await self._fetch(db, None)
+        self._notices = notices
+        self._rebuild()
+        self._watermark = started - self.REFRESH_OVERLAP
+        self._loaded_at = self._refreshed_at = time.monotonic()
+        logger.info(f"Open bid hot set loaded: {len(notices)} notices")
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """watermark 이후 변경된 공고(공고/지역/면허제한)만 다시 읽어 병합합니다."""
+        started = datetime.now(timezone.utc)
+        self._stale = False
+        since = self._watermark
+        changed = union(
+            select(BidNotice.bid_ntce_no, BidNotice.bid_ntce_ord).where(
+                BidNotice.fetched_at >= since
+            ),
+            select(
+                BidPrtcptPsblRgn.bid_ntce_no, BidPrtcptPsblRgn.bid_ntce_ord
+            ).where(BidPrtcptPsblRgn.fetched_at >= since),
+            select(
+                BidLicenseLimit.bid_ntce_no, BidLicenseLimit.bid_ntce_ord
+            ).where(BidLicenseLimit.fetched_at >= since),
+        ).subquery()
+        keys = [
+            (row[0], row[1])
+            for row in (await db.execute(select(changed))).all()
+        ]
+        if keys:
+            updated = await self._fetch(db, keys)
+            for key in keys:
+                self._notices.pop(key, None)
+            self._notices.update(updated)
+        self._prune()
+        self._rebuild()
+        self._watermark = started - self.REFRESH_OVERLAP
+        self._refreshed_at = time.monotonic()
+        if keys:
+            logger.info(f"Open bid hot set refreshed: {len(keys)} changed notices")
+
+    async def _fetch(
+        self, db: AsyncSession, keys: Optional[List[Tuple[str, str]]]
+    ) -> Dict[Tuple[str, str], HotNotice]:
+        """진행 중 공고의 검색 컬럼 + 지역코드 + 업종 텍스트를 읽습니다."""
+        notice_query = select(
+            BidNotice.bid_ntce_no,
+            BidNotice.bid_ntce_ord,
+            BidNotice.rgst_dt,
+            BidNotice.openg_at,
+            BidNotice.bid_close_at,
+            BidNotice.presmpt_prce,
+            BidNotice.bdgt_amt,
+            BidNotice.data["cnstrtsiteRgnNm"].astext,
+        ).where(BidNotice.bid_close_at > func.now())
+        if keys is not None:
+            notice_query = notice_query.where(
+                tuple_(BidNotice.bid_ntce_no, BidNotice.bid_ntce_ord).in_(keys)
+            )
+        notices: Dict[Tuple[str, str], HotNotice] = {}
+        for row in (await db.execute(notice_query)).all():
+            notices[(row[0], row[1])] = HotNotice(
+                rgst_dt=row[2],
+                openg_at=row[3],
+                bid_close_at=row[4],
+                presmpt_prce=row[5],
+                bdgt_amt=row[6],
+                cnstrtsite_rgn_nm=(row[7] or "").lower(),
+            )
+        if not notices:
+            return notices
+
+        regions: Dict[Tuple[str, str], List[str]] = {}
+        region_query = self._restrict(
+            select(
+                BidRegionEligibility.bid_ntce_no,
+                BidRegionEligibility.bid_ntce_ord,
+                BidRegionEligibility.region_code,
+            ),
+            BidRegionEligibility,
+            keys,
+        )
+        for no, ord_, code in (await db.execute(region_query)).all():
+            regions.setdefault((no, ord_), []).append(code)
+
+        industries: Dict[Tuple[str, str], List[str]] = {}
+        license_query = self._restrict(
+            select(
+                BidLicenseLimit.bid_ntce_no,
+                BidLicenseLimit.bid_ntce_ord,
+                BidLicenseLimit.lcns_lmt_nm,
+                BidLicenseLimit.permsn_indstryty_list,
+            ),
+            BidLicenseLimit,
+            keys,
+        )
+        license_result = await db.execute(license_query)
+        for no, ord_, lcns_lmt_nm, permsn in license_result.all():
+            # \0 구분 → 두 컬럼에 걸친 부분 문자열은 매칭되지 않음 (ILIKE 각각과 동일)
+            text = f"{lcns_lmt_nm or ''}\0{permsn or ''}".lower()
+            industries.setdefault((no, ord_), []).append(text)
+
+        for key, notice in notices.items():
+            notice.region_codes = tuple(regions.get(key, ()))
+            notice.industries = tuple(industries.get(key, ()))
+        return notices
+
+    @staticmethod
+    def _restrict(query, model, keys: Optional[List[Tuple[str, str]]]):
+        """자식 테이블 조회를 진행 중 공고(또는 지정 키)로 한정합니다."""
+        if keys is not None:
+            return query.where(
+                tuple_(model.bid_ntce_no, model.bid_ntce_ord).in_(keys)
+            )
+        return query.join(
+            BidNotice,
+            and_(
+                BidNotice.bid_ntce_no == model.bid_ntce_no,
+                BidNotice.bid_ntce_ord == model.bid_ntce_ord,
+            ),
+        ).where(BidNotice.bid_close_at > func.now())
+
+    def load(self, notices: Dict[Tuple[str, str], HotNotice]) -> None:
+        """공고 목록으로 인덱스를 구성합니다 (벤치마크/테스트용)."""
+        self._notices = dict(notices)
+        self._rebuild()
+        self._loaded_at = self._refreshed_at = time.monotonic()
+
+    def _prune(self) -> None:
+        now = datetime.now(timezone.utc)
+        self._notices = {
+            key: notice
+            for key, notice in self._notices.items()
+            if notice.bid_close_at > now
+        }
+
+    def _rebuild(self) -> None:
+        """공고 dict에서 컬럼 배열을 다시 만듭니다."""
+        items = list(self._notices.items())
+        n = len(items)
+        self._keys = [(no, ord_, notice.rgst_dt) for (no, ord_), notice in items]
+
+        rgst = np.zeros(n, dtype=np.int64)
+        openg = np.full(n, _NO_TIME, dtype=np.int64)
+        close = np.zeros(n, dtype=np.int64)
+        presmpt = np.zeros(n, dtype=np.int64)
+        presmpt_null = np.zeros(n, dtype=bool)
+        bdgt = np.zeros(n, dtype=np.int64)
+        bdgt_null = np.zeros(n, dtype=bool)
+        site = np.zeros(n, dtype=np.int32)
+
+        self._region_ids = {}
+        region_owner: List[int] = []
+        region_values: List[int] = []
+        industry_ids: Dict[str, int] = {}
+        industry_owner: List[int] = []
+        industry_values: List[int] = []
+        site_ids: Dict[str, int] = {}
+
+        for i, (_, notice) in enumerate(items):
+            rgst[i] = int(notice.rgst_dt) if notice.rgst_dt.isdigit() else 0
+            openg[i] = _epoch(notice.openg_at)
+            close[i] = _epoch(notice.bid_close_at)
+            if notice.presmpt_prce is None:
+                presmpt_null[i] = True
+            else:
+                presmpt[i] = notice.presmpt_prce
+            if notice.bdgt_amt is None:
+                bdgt_null[i] = True
+            else:
+                bdgt[i] = notice.bdgt_amt
+            site[i] = site_ids.setdefault(notice.cnstrtsite_rgn_nm, len(site_ids))
+            for code in notice.region_codes:
+                region_owner.append(i)
+                region_values.append(
+                    self._region_ids.setdefault(code, len(self._region_ids))
+                )
+            for text in notice.industries:
+                industry_owner.append(i)
+                industry_values.append(
+                    industry_ids.setdefault(text, len(industry_ids))
+                )
+
+        self._industry_texts = list(industry_ids)
+        self._site_texts = list(site_ids)
+        self._columns = {
+            "rgst": rgst,
+            "openg": openg,
+            "close": close,
+            "presmpt": presmpt,
+            "presmpt_null": presmpt_null,
+            "bdgt": bdgt,
+            "bdgt_null": bdgt_null,
+            "site": site,
+            "region_owner": np.array(region_owner, dtype=np.int64),
+            "region_id": np.array(region_values, dtype=np.int32),
+            "industry_owner": np.array(industry_owner, dtype=np.int64),
+            "industry_id": np.array(industry_values, dtype=np.int32),
+        }
+
+    # --- 검색 ---
+
+    def search(
+        self,
+        params: BidSearchParams,
+        region_codes: Iterable[str] = (),
+        now: Optional[datetime] = None,
+    ) -> Tuple[List[NoticeKey], int]:
+        """조건에 맞는 페이지의 공고 키와 전체 건수를 반환합니다.
+
+        build_search_queries(bidClseExcpYn=Y)와 같은 조건/정렬을 적용합니다.
+        """
+        cols = self._columns
+        n = len(self._keys)
+        if n == 0:
+            return [], 0
+        now = now or datetime.now(timezone.utc)
+        mask = cols["close"] > int(now.timestamp())
+
+        bgn = _date_key(params.inqryBgnDt)
+        end = _date_key(params.inqryEndDt)
+        if params.inqryDiv == "1":
+            mask &= (cols["rgst"] >= bgn) & (cols["rgst"] <= end)
+        else:
+            openg_bgn = _kst_epoch(params.inqryBgnDt)
+            openg_end = _kst_epoch(params.inqryEndDt)
+            if openg_bgn is not None:
+                mask &= (cols["openg"] != _NO_TIME) & (cols["openg"] >= openg_bgn)
+            if openg_end is not None:
+                mask &= (cols["openg"] != _NO_TIME) & (cols["openg"] <= openg_end)
+            mask &= cols["rgst"] <= end
+
+        region_codes = list(region_codes)
+        if region_codes:
+            wanted = [
+                self._region_ids[c] for c in region_codes if c in self._region_ids
+            ]
+            mask &= self._owners_matching(
+                n, cols["region_owner"], cols["region_id"], wanted
+            )
+
+        if params.indstrytyNm:
+            needles = [
+                i.strip().lower() for i in params.indstrytyNm.split(",")
+            ]
+            wanted = [
+                text_id
+                for text_id, text in enumerate(self._industry_texts)
+                if any(needle in part for part in text.split("\0") for needle in needles)
+            ]
+            mask &= self._owners_matching(
+                n, cols["industry_owner"], cols["industry_id"], wanted
+            )
+
+        price_bgn = _price(params.presmptPrceBgn)
+        if price_bgn > 0:
+            mask &= ~cols["presmpt_null"] & (cols["presmpt"] >= price_bgn)
+        price_end = _price(params.presmptPrceEnd)
+        if price_end > 0:
+            mask &= ~cols["presmpt_null"] & (cols["presmpt"] <= price_end)
+
+        if params.cnstrtsiteRgnNm:
+            needle = params.cnstrtsiteRgnNm.lower()
+            wanted = [
+                site_id
+                for site_id, text in enumerate(self._site_texts)
+                if needle in text
+            ]
+            mask &= np.isin(cols["site"], wanted)
+
+        indices = np.flatnonzero(mask)
+        total = int(indices.size)
+        order = self._order(indices, params)
+        offset = (params.pageNo - 1) * params.numOfRows
+        page = indices[order[offset:offset + params.numOfRows]]
+        return [self._keys[i] for i in page], total
+
+    @staticmethod
+    def _owners_matching(
+        n: int, owners: np.ndarray, ids: np.ndarray, wanted: List[int]
+    ) -> np.ndarray:
+        """(공고 index, id) 쌍 중 wanted id를 하나라도 가진 공고의 마스크."""
+        matched = np.zeros(n, dtype=bool)
+        if wanted:
+            matched[owners[np.isin(ids, wanted)]] = True
+        return matched
+
+    def _order(self, indices: np.ndarray, params: BidSearchParams) -> np.ndarray:
+        cols = self._columns
+        descending = params.orderDir != "asc"
+        if params.orderBy == "bidClseDt":
+            values, nulls = cols["close"][indices], None
+        elif params.orderBy == "presmptPrce":
+            values, nulls = cols["presmpt"][indices], cols["presmpt_null"][indices]
+        elif params.orderBy == "bdgtAmt":
+            values, nulls = cols["bdgt"][indices], cols["bdgt_null"][indices]
+        else:
+            # 기본 정렬: 등록일시 내림차순
+            values, nulls = cols["rgst"][indices], None
+            descending = params.orderBy != "rgstDt" or params.orderDir != "asc"
+
+        keys = -values if descending else values
+        if nulls is None:
+            return np.argsort(keys, kind="stable")
+        # NULLS LAST: lexsort는 마지막 키가 1순위
+        return np.lexsort((keys, nulls))
+
+
+open_bid_hot_set = OpenBidHotSet()
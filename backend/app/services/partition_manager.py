@@ -0,0 +1,166 @@
+import logging
+import re
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.sync_coverage import sync_coverage
+
+logger = logging.getLogger(__name__)
+
+# (테이블, 파티션 키 컬럼) — 키는 YYYYMM으로 시작하는 문자열
+PARTITIONED_TABLES = (
+    ("bid_notices", "rgst_dt"),
+    ("bid_prtcpt_psbl_rgns", "rgst_month"),
+    ("bid_license_limits", "rgst_month"),
+    ("bid_region_eligibility", "rgst_month"),
+)
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{6})$")
+
+
+def month_key(dt: datetime) -> str:
+    return dt.strftime("%Y%m")
+
+
+def add_months(month: str, n: int) -> str:
+    """YYYYMM 문자열에 n개월을 더합니다 (음수 가능)."""
+    index = int(month[:4]) * 12 + int(month[4:6]) - 1 + n
+    return f"{index // 12:04d}{index % 12 + 1:02d}"
+
+
+def partition_name(table: str, month: str) -> str:
+    return f"{table}_p{month}"
+
+
+def partition_month(name: str) -> Optional[str]:
+    """파티션 이름에서 YYYYMM을 추출합니다 (default 파티션은 None)."""
+    match = _PARTITION_SUFFIX.search(name)
+    return match.group(1) if match else None
+
+
+class PartitionManager:
+    """월별 RANGE 파티션 관리
+
+    - ensure_partitions: 현재 월부터 MONTHS_AHEAD개월 뒤까지 파티션 생성
+      (이미 default 파티션에 들어간 해당 월 row는 새 파티션으로 이동)
+    - drop_expired: 보관 기간(개월)이 지난 월 파티션 DROP → DELETE/VACUUM 없이 정리
+      (같은 기간의 data_sync_log도 삭제하여 동기화 완료로 남지 않게 함)
+    """
+
+    MONTHS_AHEAD = 3
+
+    async def maintain(
+        self, db: AsyncSession, now: datetime, retention_months: int = 0
+    ) -> None:
+        created = await self.ensure_partitions(db, now)
+        dropped = await self.drop_expired(db, now, retention_months)
+        if created or dropped:
+            logger.info(
+                f"Partition maintenance: created {created}, dropped {dropped}"
+            )
+
+    async def ensure_partitions(
+        self, db: AsyncSession, now: datetime
+    ) -> List[str]:
+        current = month_key(now)
+        return await self.ensure_range(
+            db, current, add_months(current, self.MONTHS_AHEAD)
+        )
+
+    async def ensure_range(
+        self, db: AsyncSession, first_month: str, last_month: str
+    ) -> List[str]:
+        """[first_month, last_month] (YYYYMM) 구간의 누락된 월 파티션을 생성합니다."""
+        months = []
+        month = first_month
+        while month <= last_month:
+            months.append(month)
+            month = add_months(month, 1)
+
+        created = []
+        for table, column in PARTITIONED_TABLES:
+            existing = await self._list_partitions(db, table)
+            for month in months:
+                name = partition_name(table, month)
+                if name in existing:
+                    continue
+                await self._create_partition(db, table, column, month)
+                created.append(name)
+        return created
+
+    async def drop_expired(
+        self, db: AsyncSession, now: datetime, retention_months: int
+    ) -> List[str]:
+        if retention_months <= 0:
+            return []
+        cutoff = add_months(month_key(now), -retention_months)
+        dropped = []
+        for table, column in PARTITIONED_TABLES:
+            for name in sorted(await self._list_partitions(db, table)):
+                month = partition_month(name)
+                if month is not None and month < cutoff:
+                    await db.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
+                    dropped.append(name)
+            # 범위 밖으로 default 파티션에 들어간 오래된 row
+            await db.execute(
+                text(
+                    f'DELETE FROM "{table}_pdefault" '
+                    f"WHERE {column} <> '' AND {column} < :cutoff"
+                ),
+                {"cutoff": cutoff},
+            )
+        # 데이터가 사라진 기간은 미동기화 상태로 (sync_timestamp YYYYMMDDHHMM < YYYYMM)
+        await db.execute(
+            text("DELETE FROM data_sync_log WHERE sync_timestamp < :cutoff"),
+            {"cutoff": cutoff},
+        )
+        await db.commit()
+        sync_coverage.invalidate()
+        return dropped
+
+    async def _list_partitions(self, db: AsyncSession, table: str) -> set[str]:
+        result = await db.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :table"
+            ),
+            {"table": table},
+        )
+        return {row[0] for row in result.all()}
+
+    async def _create_partition(
+        self, db: AsyncSession, table: str, column: str, month: str
+    ) -> None:
+        """월 파티션을 생성합니다.
+
+        default 파티션에 해당 월 row가 있으면 CREATE가 실패하므로 한 트랜잭션
+        안에서 임시 테이블로 옮긴 뒤 파티션 생성 후 다시 넣습니다.
+        """
+        lower, upper = month, add_months(month, 1)
+        name = partition_name(table, month)
+        in_range = f"{column} >= '{lower}' AND {column} < '{upper}'"
+        await db.execute(
+            text(
+                f"CREATE TEMP TABLE _partition_move ON COMMIT DROP AS "
+                f'SELECT * FROM "{table}_pdefault" WHERE {in_range}'
+            )
+        )
+        await db.execute(text(f'DELETE FROM "{table}_pdefault" WHERE {in_range}'))
+        await db.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+        )
+        await db.execute(
+            text(f'INSERT INTO "{table}" SELECT * FROM _partition_move')
+        )
+        await db.commit()
+
+
+partition_manager = PartitionManager()
@@ -0,0 +1,95 @@
+from typing import Dict, Iterable, List, Optional
+
+# 지역 제한 없음 (참가가능지역 없음 또는 "전체")
+UNRESTRICTED = "00"
+# 하위 지역 제한 표시 접두어: ">41" = 41(경기도)의 하위 지역으로 제한
+DESCENDANT_PREFIX = ">"
+
+# (시도 코드, 정식 명칭, 별칭) — 행정표준코드 앞 2자리
+SIDO = (
+    ("11", "서울특별시", ("서울", "서울시")),
+    ("26", "부산광역시", ("부산", "부산시")),
+    ("27", "대구광역시", ("대구", "대구시")),
+    ("28", "인천광역시", ("인천", "인천시")),
+    ("29", "광주광역시", ("광주", "광주시")),
+    ("30", "대전광역시", ("대전", "대전시")),
+    ("31", "울산광역시", ("울산", "울산시")),
+    ("36", "세종특별자치시", ("세종", "세종시")),
+    ("41", "경기도", ("경기",)),
+    ("43", "충청북도", ("충북",)),
+    ("44", "충청남도", ("충남",)),
+    ("46", "전라남도", ("전남",)),
+    ("47", "경상북도", ("경북",)),
+    ("48", "경상남도", ("경남",)),
+    ("50", "제주특별자치도", ("제주", "제주도")),
+    ("51", "강원특별자치도", ("강원", "강원도")),
+    ("52", "전북특별자치도", ("전북", "전라북도")),
+)
+
+_SIDO_CODES: Dict[str, str] = {}
+for _code, _name, _aliases in SIDO:
+    for _key in (_name, *_aliases):
+        _SIDO_CODES[_key] = _code
+
+
+def region_code(name: Optional[str]) -> str:
+    """지역명을 계층 코드로 변환합니다.
+
+    시도는 2자리 코드, 시군구 이하는 '/'로 이어 붙입니다.
+    예: "경기도 성남시 분당구" → "41/성남시/분당구", "전체" → "00"
+    알 수 없는 시도명은 이름을 그대로 최상위 코드로 사용합니다.
+    """
+    parts = (name or "").split()
+    if not parts or parts == ["전체"]:
+        return UNRESTRICTED
+    parts[0] = _SIDO_CODES.get(parts[0], parts[0])
+    return "/".join(parts)
+
+
+def ancestor_codes(code: str) -> List[str]:
+    """상위 지역 코드 목록 (자기 자신 제외, 상위부터)."""
+    if code == UNRESTRICTED:
+        return []
+    parts = code.split("/")
+    return ["/".join(parts[:i]) for i in range(1, len(parts))]
+
+
+def eligibility_codes(names: Iterable[Optional[str]]) -> List[str]:
+    """공고의 참가가능지역 목록을 bid_region_eligibility 코드로 확장합니다.
+
+    - 지역이 없거나 "전체"/빈 값 → "00"
+    - 각 지역 코드 자체 + 상위 지역마다 ">상위코드"
+    """
+    codes = set()
+    for name in names:
+        code = region_code(name)
+        codes.add(code)
+        for ancestor in ancestor_codes(code):
+            codes.add(DESCENDANT_PREFIX + ancestor)
+    return sorted(codes) or [UNRESTRICTED]
+
+
+def location_match_codes(location_name: str) -> List[str]:
+    """소재지 기준 참가가능 공고를 찾기 위한 코드 목록.
+
+    소재지의 상위/자기 지역으로 제한된 공고와 소재지의 하위 지역으로
+    제한된 공고, 제한 없는 공고를 매칭합니다.
+    예: "경기도 성남시" → ["00", "41", "41/성남시", ">41/성남시"]
+    """
+    code = region_code(location_name)
+    if code == UNRESTRICTED:
+        return [UNRESTRICTED]
+    return [
+        UNRESTRICTED, *ancestor_codes(code), code, DESCENDANT_PREFIX + code
+    ]
+
+
+def filter_match_codes(names: Iterable[str]) -> List[str]:
+    """지역 필터(prtcptLmtRgnNm) 매칭 코드 목록 — 해당 지역과 하위 지역."""
+    codes = [UNRESTRICTED]
+    for name in names:
+        code = region_code(name)
+        if code == UNRESTRICTED:
+            continue
+        codes.extend([code, DESCENDANT_PREFIX + code])
+    return codes
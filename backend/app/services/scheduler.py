@@ -101,11 +101,16 @@ class NotificationScheduler:
             pageNo=1
         )
         
-        # Search for bid notices
+        # Search every work type (saved conditions have no work type filter)
+        items = []
+        for work_type in narajangter_service.url_dict:
+            try:
+                response = await narajangter_service.search_bids(work_type, search_params)
+                items.extend(response.items)
+            except Exception as e:
+                print(f"Failed to search {work_type} bids for user {user.username}: {str(e)}")
+        
         try:
-            response = await narajangter_service.search_bids(search_params)
-            items = response.items
-            
             if items:
                 # Send email notification
                 await email_service.send_bid_notification(
@@ -117,7 +122,7 @@ class NotificationScheduler:
                 print(f"Sent notification to {user.username}: {len(items)} new bids")
                 
         except Exception as e:
-            print(f"Failed to search bids for user {user.username}: {str(e)}")
+            print(f"Failed to notify user {user.username}: {str(e)}")
     
     def _should_notify(self, preference: UserPreference, frequency: str) -> bool:
         """
@@ -0,0 +1,247 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional
+
+from sqlalchemy import and_, delete, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.bid import SearchCacheGeneration, SearchResponseCacheEntry
+from app.schemas.bid import BidSearchParams
+
+logger = logging.getLogger(__name__)
+
+
+def search_cache_key(
+    params: BidSearchParams, location_name: Optional[str] = None
+) -> str:
+    """검색 조건(+ 소재지 필터 시 소재지)의 정규화된 캐시 키.
+
+    필드 순서/기본값 생략 여부와 무관하게 같은 조건은 같은 키가 됩니다.
+    """
+    payload = params.model_dump()
+    if params.useLocationFilter:
+        payload["_location"] = location_name
+    encoded = json.dumps(
+        payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CacheLookup(NamedTuple):
+    """캐시 조회 결과
+
+    generation은 조회 시점의 세대입니다. 미적중이면 이 값을 검색 전에 잡아
+    두었다가 set()에 넘겨, 검색 도중 동기화가 끝났으면 저장하지 않습니다.
+    """
+
+    body: Optional[bytes]
+    generation: Optional[int]
+
+
+MISS = CacheLookup(None, None)
+
+
+class MemorySearchCacheBackend:
+    """프로세스 로컬 LRU 캐시 (단일 워커용)
+
+    세대 카운터도 프로세스 로컬이므로 다른 워커의 동기화 완료는 TTL
+    만료로만 반영됩니다. 멀티 워커에서는 PostgresSearchCacheBackend를 사용하세요.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[int, float, bytes]] = OrderedDict()
+        self._generation = 0
+
+    async def get(self, db: AsyncSession, key: str) -> CacheLookup:
+        entry = self._entries.get(key)
+        if entry is None:
+            return CacheLookup(None, self._generation)
+        generation, expires_at, body = entry
+        if generation != self._generation or expires_at <= time.monotonic():
+            del self._entries[key]
+            return CacheLookup(None, self._generation)
+        self._entries.move_to_end(key)
+        return CacheLookup(body, generation)
+
+    async def set(
+        self, db: AsyncSession, key: str, body: bytes, ttl: int, generation: int
+    ) -> None:
+        if generation != self._generation:
+            return
+        self._entries[key] = (self._generation, time.monotonic() + ttl, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def bump(self, db: AsyncSession) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    async def purge(self, db: AsyncSession) -> int:
+        now = time.monotonic()
+        expired = [k for k, (_, exp, _) in self._entries.items() if exp <= now]
+        for key in expired:
+            del self._entries[key]
+        return len(expired)
+
+
+class PostgresSearchCacheBackend:
+    """Postgres 테이블 기반 공유 캐시 (멀티 워커/레플리카용)
+
+    - search_cache_generation: 단일 row 세대 카운터 (동기화 완료 시 +1)
+    - search_response_cache: 키별 응답 JSON bytes + 저장 당시 세대
+    조회는 현재 세대와 일치하고 만료되지 않은 항목만 반환합니다.
+    응답 테이블은 WAL을 쓰지 않는 UNLOGGED 테이블이라 크래시 시 비워지지만
+    캐시이므로 무방합니다.
+    """
+
+    async def get(self, db: AsyncSession, key: str) -> CacheLookup:
+        result = await db.execute(
+            select(SearchResponseCacheEntry.body, SearchCacheGeneration.generation)
+            .select_from(SearchCacheGeneration)
+            .outerjoin(
+                SearchResponseCacheEntry,
+                and_(
+                    SearchResponseCacheEntry.generation
+                    == SearchCacheGeneration.generation,
+                    SearchResponseCacheEntry.cache_key == key,
+                    SearchResponseCacheEntry.expires_at
+                    > datetime.now(timezone.utc),
+                ),
+            )
+        )
+        row = result.one_or_none()
+        if row is None:
+            return MISS
+        return CacheLookup(row[0], row[1])
+
+    async def set(
+        self, db: AsyncSession, key: str, body: bytes, ttl: int, generation: int
+    ) -> None:
+        # 조회 시점 세대로 저장하고, 그 사이 세대가 올라갔으면 저장하지 않음
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl)
+        stmt = insert(SearchResponseCacheEntry).from_select(
+            ["cache_key", "generation", "body", "expires_at"],
+            select(
+                literal(key),
+                SearchCacheGeneration.generation,
+                literal(body, SearchResponseCacheEntry.body.type),
+                literal(expires_at, SearchResponseCacheEntry.expires_at.type),
+            ).where(SearchCacheGeneration.generation == generation),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["cache_key"],
+            set_={
+                "generation": stmt.excluded.generation,
+                "body": stmt.excluded.body,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+        await db.execute(stmt)
+        await db.commit()
+
+    async def bump(self, db: AsyncSession) -> None:
+        # 호출자의 트랜잭션 안에서 실행 (동기화 로그 기록과 함께 커밋)
+        await db.execute(
+            update(SearchCacheGeneration).values(
+                generation=SearchCacheGeneration.generation + 1
+            )
+        )
+
+    async def purge(self, db: AsyncSession) -> int:
+        current = select(SearchCacheGeneration.generation).scalar_subquery()
+        result = await db.execute(
+            delete(SearchResponseCacheEntry).where(
+                or_(
+                    SearchResponseCacheEntry.expires_at
+                    <= datetime.now(timezone.utc),
+                    SearchResponseCacheEntry.generation != current,
+                )
+            )
+        )
+        await db.commit()
+        return result.rowcount or 0
+
+
+class SearchResponseCache:
+    """/bids/search 응답 캐시
+
+    직렬화된 JSON bytes를 저장하여 적중 시 SQL/Pydantic 처리를 모두 건너뜁니다.
+    mark_window_synced마다 세대가 올라가 이전 응답은 모두 무효화되고,
+    진행 중 공고 필터(마감 시각 기준)를 위해 TTL도 함께 적용합니다.
+    캐시 오류는 검색을 실패시키지 않습니다 (미적중으로 처리).
+
+    SEARCH_CACHE_BACKEND: "memory" | "postgres" | "" (비활성)
+    """
+
+    def __init__(self, backend=None):
+        self._backend = backend
+        self._configured = backend is not None
+
+    @property
+    def backend(self):
+        if not self._configured:
+            kind = settings.SEARCH_CACHE_BACKEND
+            if kind == "memory":
+                self._backend = MemorySearchCacheBackend(
+                    settings.SEARCH_CACHE_MAX_ENTRIES
+                )
+            elif kind == "postgres":
+                self._backend = PostgresSearchCacheBackend()
+            elif kind:
+                logger.warning(f"Unknown SEARCH_CACHE_BACKEND: {kind}")
+            self._configured = True
+        return self._backend
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    async def get(self, db: AsyncSession, key: str) -> CacheLookup:
+        """캐시 조회. 미적중이면 body=None (generation은 set()에 전달)."""
+        if self.backend is None:
+            return MISS
+        try:
+            return await self.backend.get(db, key)
+        except Exception as e:
+            logger.warning(f"Search cache read failed: {e}")
+            await db.rollback()
+            return MISS
+
+    async def set(
+        self,
+        db: AsyncSession,
+        key: str,
+        body: bytes,
+        generation: Optional[int],
+    ) -> None:
+        """get() 시점 세대(generation)가 그대로일 때만 저장합니다."""
+        if self.backend is None or generation is None:
+            return
+        try:
+            await self.backend.set(
+                db, key, body, settings.SEARCH_CACHE_TTL, generation
+            )
+        except Exception as e:
+            logger.warning(f"Search cache write failed: {e}")
+            await db.rollback()
+
+    async def bump_generation(self, db: AsyncSession) -> None:
+        """동기화 완료 → 캐시된 응답 전체 무효화."""
+        if self.backend is not None:
+            await self.backend.bump(db)
+
+    async def purge_expired(self, db: AsyncSession) -> int:
+        if self.backend is None:
+            return 0
+        return await self.backend.purge(db)
+
+
+search_cache = SearchResponseCache()
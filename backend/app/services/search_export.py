@@ -0,0 +1,262 @@
+import csv
+import io
+import logging
+import re
+import zipfile
+from typing import AsyncIterator, Iterable, List, Sequence
+from xml.sax.saxutils import escape
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.bid import BidNotice
+from app.schemas.bid import BidSearchParams
+from app.services.bid_data_service import bid_data_service, parse_amount
+
+logger = logging.getLogger(__name__)
+
+# (BidItem 필드, 헤더) — 스프레드시트에 옮겨 쓰는 항목만
+EXPORT_COLUMNS = (
+    ("bidNtceNo", "입찰공고번호"),
+    ("bidNtceOrd", "차수"),
+    ("bidNtceNm", "공고명"),
+    ("ntceInsttNm", "공고기관"),
+    ("dminsttNm", "수요기관"),
+    ("mainCnsttyNm", "주공종"),
+    ("cntrctCnclsMthdNm", "계약방법"),
+    ("sucsfbidMthdNm", "낙찰방법"),
+    ("rgstDt", "등록일시"),
+    ("bidBeginDt", "입찰시작일시"),
+    ("bidClseDt", "입찰마감일시"),
+    ("opengDt", "개찰일시"),
+    ("presmptPrce", "추정가격"),
+    ("bdgtAmt", "예산금액"),
+    ("asignBdgtAmt", "배정예산금액"),
+    ("sucsfbidLwltRate", "낙찰하한율"),
+    ("cnstrtsiteRgnNm", "공사현장지역"),
+    ("prtcptPsblRgnNms", "참가가능지역"),
+    ("permsnIndstrytyListNms", "허용업종"),
+    ("indstrytyMfrcFldListNms", "주력분야"),
+    ("bidNtceDtlUrl", "공고상세URL"),
+)
+AMOUNT_FIELDS = {"presmptPrce", "bdgtAmt", "asignBdgtAmt"}
+
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+XLSX_MEDIA_TYPE = (
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+)
+# XML 1.0에서 허용되지 않는 제어문자 (원본 데이터에 섞여 있으면 제거)
+XML_ILLEGAL_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+# 엑셀이 수식으로 해석하는 시작 문자 (CSV/수식 인젝션)
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def export_values(row: dict) -> list:
+    """검색 row → EXPORT_COLUMNS 순서의 셀 값 (금액은 숫자).
+
+    수식 시작 문자로 시작하는 문자열은 앞에 '를 붙여 텍스트로 열리게 합니다.
+    """
+    values = []
+    for field, _ in EXPORT_COLUMNS:
+        value = row.get(field)
+        if field in AMOUNT_FIELDS:
+            value = parse_amount(value)
+        elif isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+            value = "'" + value
+        values.append(value)
+    return values
+
+
+class CsvWriter:
+    """UTF-8 BOM CSV (엑셀에서 한글이 깨지지 않도록 BOM 포함)."""
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def header(self) -> bytes:
+        self._writer.writerow([title for _, title in EXPORT_COLUMNS])
+        return ("\ufeff" + self._drain()).encode("utf-8")
+
+    def rows(self, rows: Iterable[list]) -> bytes:
+        self._writer.writerows(
+            ["" if value is None else value for value in values] for values in rows
+        )
+        return self._drain().encode("utf-8")
+
+    def footer(self) -> bytes:
+        return b""
+
+    def _drain(self) -> str:
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return text
+
+
+class _ChunkSink:
+    """zipfile 출력용 비탐색(non-seekable) 버퍼 — 쓴 만큼 꺼내 스트리밍합니다."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+_XLSX_STATIC_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="입찰공고" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+
+class XlsxWriter:
+    """단일 시트 XLSX 스트리밍 writer
+
+    시트 XML을 zip 엔트리에 행 단위로 압축해 쓰고 압축된 bytes를 바로
+    내보냅니다 (문자열은 inlineStr이라 sharedStrings 테이블이 필요 없음).
+    zip은 비탐색 출력이면 data descriptor 방식으로 기록되므로 파일 전체를
+    메모리나 임시 파일에 모으지 않습니다.
+    """
+
+    def __init__(self):
+        self._sink = _ChunkSink()
+        self._zip = zipfile.ZipFile(
+            self._sink, mode="w", compression=zipfile.ZIP_DEFLATED
+        )
+        self._sheet = None
+
+    def header(self) -> bytes:
+        for name, content in _XLSX_STATIC_PARTS.items():
+            self._zip.writestr(name, content)
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", mode="w")
+        self._sheet.write(
+            b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            b'<sheetData>'
+        )
+        self._write_rows([[title for _, title in EXPORT_COLUMNS]])
+        return self._sink.drain()
+
+    def rows(self, rows: Iterable[list]) -> bytes:
+        self._write_rows(rows)
+        return self._sink.drain()
+
+    def footer(self) -> bytes:
+        self._sheet.write(b"</sheetData></worksheet>")
+        self._sheet.close()
+        self._zip.close()
+        return self._sink.drain()
+
+    def _write_rows(self, rows: Iterable[list]) -> None:
+        parts = []
+        for values in rows:
+            parts.append("<row>")
+            for value in values:
+                if value is None or value == "":
+                    parts.append("<c/>")
+                elif isinstance(value, (int, float)):
+                    parts.append(f"<c><v>{value}</v></c>")
+                else:
+                    text = escape(XML_ILLEGAL_CHARS.sub("", str(value)))
+                    parts.append(f'<c t="inlineStr"><is><t>{text}</t></is></c>')
+            parts.append("</row>")
+        self._sheet.write("".join(parts).encode("utf-8"))
+
+
+WRITERS = {
+    "csv": (CsvWriter, CSV_MEDIA_TYPE),
+    "xlsx": (XlsxWriter, XLSX_MEDIA_TYPE),
+}
+
+
+class SearchExporter:
+    """검색 결과 전체를 CSV/XLSX로 스트리밍
+
+    /bids/search와 같은 조건(페이지 제외)으로 서버 측 커서(yield_per)에서
+    CHUNK_SIZE개씩 읽어 지역/업종을 붙이고 바로 인코딩해 내보내므로,
+    결과 건수와 무관하게 메모리는 청크 하나 분량만 사용합니다.
+    """
+
+    CHUNK_SIZE = 1000
+    MAX_ROWS = 100_000
+
+    async def stream(
+        self,
+        db: AsyncSession,
+        params: BidSearchParams,
+        fmt: str,
+        user_id=None,
+    ) -> AsyncIterator[bytes]:
+        writer = WRITERS[fmt][0]()
+        _, query = await bid_data_service.build_search_queries(db, params, user_id)
+        query = (
+            query.with_only_columns(
+                BidNotice.bid_ntce_no, BidNotice.rgst_dt, BidNotice.data
+            )
+            .offset(None)
+            .limit(self.MAX_ROWS)
+            .execution_options(yield_per=self.CHUNK_SIZE)
+        )
+
+        yield writer.header()
+        total = 0
+        result = await db.stream(query)
+        async for chunk in result.partitions():
+            yield writer.rows(await self._enrich(db, chunk))
+            total += len(chunk)
+        yield writer.footer()
+        logger.info(f"Search export ({fmt}): {total} rows")
+
+    async def _enrich(self, db: AsyncSession, chunk: Sequence) -> List[list]:
+        rgn_map, lic_map, mfrc_map = await bid_data_service.get_enrichment_maps(
+            db,
+            list({no for no, _, _ in chunk}),
+            {rgst_dt[:6] for _, rgst_dt, _ in chunk},
+        )
+        rows = []
+        for no, _, data in chunk:
+            rows.append(export_values({
+                **data,
+                "prtcptPsblRgnNms": ", ".join(rgn_map.get(no, [])),
+                "permsnIndstrytyListNms": ", ".join(lic_map.get(no, [])),
+                "indstrytyMfrcFldListNms": ", ".join(mfrc_map.get(no, [])),
+            }))
+        return rows
+
+
+search_exporter = SearchExporter()
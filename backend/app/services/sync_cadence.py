@@ -0,0 +1,171 @@
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class SyncPlan:
+    """다음 동기화 사이클 계획"""
+
+    interval: int  # 다음 사이클까지 대기 시간 (초)
+    window_hours: int  # 재동기화할 최근 시간별 윈도우 수
+    busy_factor: float  # 현재 시간대 도착률 / 평균 도착률
+
+
+class AdaptiveSyncCadence:
+    """요일·시간대별 공고 도착률 기반 동기화 주기 조절기
+
+    - DataSyncLog 시간별 윈도우의 total_notices로 (요일, 시) 슬롯별
+      도착률을 EWMA로 학습 (최근 주가 더 큰 가중치)
+    - 바쁜 시간대: 주기 단축 + 윈도우 축소 (오버랩 1시간)
+    - 한산한 시간대: 주기 연장 + 윈도우 확대 (공백 없이 커버)
+    - 일일 API 호출 예산: 남은 예산을 자정(KST)까지 균등 배분
+      (사용량은 호출 측이 DB에 누적하고 load_usage로 복원)
+    - 예산 때문에 주기가 늘어나면 윈도우도 늘어난 주기 + 오버랩으로 다시 계산
+    """
+
+    BASE_INTERVAL = 3600
+    MIN_INTERVAL = 900  # 15분
+    MAX_INTERVAL = 3 * 3600
+    MIN_WINDOW_HOURS = 2
+    MAX_WINDOW_HOURS = 6
+    BUSY_FACTOR = 1.5
+    EWMA_ALPHA = 0.3
+    CALLS_PER_WINDOW = 4  # 초기값: 공사 + 용역 + 지역 + 면허제한 각 1페이지
+    MAX_BUDGET_WINDOW_HOURS = 24  # 예산으로 늘어난 주기를 덮는 윈도우 상한
+    HISTORY_DAYS = 28
+
+    def __init__(self, daily_budget: int):
+        self.daily_budget = daily_budget
+        self._rates: dict[Tuple[int, int], float] = {}
+        self._calls_per_window = float(self.CALLS_PER_WINDOW)
+        self._budget_day: Optional[str] = None
+        self._calls_today = 0
+
+    # --- 도착률 학습 ---
+
+    @staticmethod
+    def _slot(dt: datetime) -> Tuple[int, int]:
+        return dt.weekday(), dt.hour
+
+    def reset(self) -> None:
+        self._rates = {}
+
+    def observe(self, window_start: str, total_notices: int) -> None:
+        """시간별 윈도우(YYYYMMDDHH00) 하나의 공고 수를 반영합니다."""
+        try:
+            dt = datetime.strptime(window_start[:10], "%Y%m%d%H")
+        except ValueError:
+            return
+        slot = self._slot(dt)
+        prev = self._rates.get(slot)
+        value = float(total_notices or 0)
+        if prev is None:
+            self._rates[slot] = value
+        else:
+            self._rates[slot] = prev + self.EWMA_ALPHA * (value - prev)
+
+    def load(self, rows: Iterable[Tuple[str, int]]) -> None:
+        """(sync_timestamp, total_notices) 이력으로 도착률을 다시 학습합니다."""
+        self.reset()
+        for window_start, total_notices in sorted(rows):
+            self.observe(window_start, total_notices)
+
+    def expected_rate(self, now: datetime) -> Optional[float]:
+        """현재 슬롯의 예상 시간당 공고 수 (학습 데이터 없으면 None)."""
+        return self._rates.get(self._slot(now))
+
+    def busy_factor(self, now: datetime) -> float:
+        """현재 슬롯 도착률 / 전체 평균 도착률 (데이터 없으면 1.0)."""
+        rate = self.expected_rate(now)
+        if rate is None or not self._rates:
+            return 1.0
+        mean = sum(self._rates.values()) / len(self._rates)
+        if mean <= 0:
+            return 1.0
+        return rate / mean
+
+    # --- 일일 예산 ---
+
+    def _roll_day(self, now: datetime) -> None:
+        day = now.strftime("%Y%m%d")
+        if day != self._budget_day:
+            self._budget_day = day
+            self._calls_today = 0
+
+    def load_usage(self, now: datetime, calls: int) -> None:
+        """DB에 누적된 오늘 사용량을 반영합니다 (재시작/다른 레플리카 사용분 포함)."""
+        self._roll_day(now)
+        self._calls_today = max(self._calls_today, calls)
+
+    def record_calls(self, calls: int, now: datetime, windows: int = 0) -> None:
+        """사용한 API 요청 수를 기록합니다 (windows: 동기화한 윈도우 수).
+
+        calls는 피드 수가 아니라 실제 페이지 요청 수입니다.
+        """
+        self._roll_day(now)
+        self._calls_today += calls
+        if windows > 0 and calls > 0:
+            observed = calls / windows
+            self._calls_per_window += self.EWMA_ALPHA * (
+                observed - self._calls_per_window
+            )
+
+    def remaining_budget(self, now: datetime) -> int:
+        self._roll_day(now)
+        return max(self.daily_budget - self._calls_today, 0)
+
+    @staticmethod
+    def _seconds_until_midnight(now: datetime) -> int:
+        midnight = (now + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        return max(int((midnight - now).total_seconds()), 1)
+
+    # --- 계획 ---
+
+    def _window_hours(self, interval: int, overlap: int, limit: int) -> int:
+        """주기 동안 지나간 시간 + 오버랩을 덮는 윈도우 수."""
+        window_hours = math.ceil(interval / 3600) + overlap
+        return min(max(window_hours, self.MIN_WINDOW_HOURS), limit)
+
+    def plan(self, now: datetime) -> SyncPlan:
+        """현재 시각 기준 다음 사이클 주기와 윈도우 크기를 계산합니다."""
+        factor = self.busy_factor(now)
+        if factor <= 0:
+            interval = self.MAX_INTERVAL
+        else:
+            interval = int(self.BASE_INTERVAL / factor)
+        interval = min(max(interval, self.MIN_INTERVAL), self.MAX_INTERVAL)
+
+        overlap = 1 if factor >= self.BUSY_FACTOR else 2
+        window_hours = self._window_hours(interval, overlap, self.MAX_WINDOW_HOURS)
+
+        # 예산 제약: 남은 호출을 자정까지의 사이클에 균등 배분.
+        # 주기가 늘어나면 그 사이 시간도 덮도록 윈도우를 다시 계산하고,
+        # 늘어난 윈도우 비용으로 주기를 재계산 (몇 번이면 수렴)
+        remaining = self.remaining_budget(now)
+        until_midnight = self._seconds_until_midnight(now)
+        if remaining <= 0:
+            interval = until_midnight + 60
+            window_hours = self._window_hours(
+                interval, overlap, self.MAX_BUDGET_WINDOW_HOURS
+            )
+        else:
+            for _ in range(3):
+                cost = window_hours * self._calls_per_window
+                affordable_cycles = max(remaining / cost, 1.0)
+                budget_interval = int(until_midnight / affordable_cycles)
+                if budget_interval <= interval:
+                    break
+                interval = budget_interval
+                window_hours = self._window_hours(
+                    interval, overlap, self.MAX_BUDGET_WINDOW_HOURS
+                )
+
+        return SyncPlan(
+            interval=interval,
+            window_hours=window_hours,
+            busy_factor=round(factor, 3),
+        )
@@ -0,0 +1,180 @@
+import asyncio
+import bisect
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.bid import DataSyncLog
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(2000, 1, 1)
+
+
+def to_minute(ts: str) -> int:
+    """YYYYMMDDHHMM 타임스탬프를 분 단위 서수로 변환합니다."""
+    dt = datetime.strptime(ts[:12], "%Y%m%d%H%M")
+    return int((dt - _EPOCH).total_seconds()) // 60
+
+
+def from_minute(minute: int) -> str:
+    return (_EPOCH + timedelta(minutes=minute)).strftime("%Y%m%d%H%M")
+
+
+def is_daily_window(sync_timestamp: str, window_end: str) -> bool:
+    return sync_timestamp.endswith("0000") and window_end.endswith("2359")
+
+
+class SyncCoverageIndex:
+    """data_sync_log 기반 인메모리 동기화 커버리지 인덱스
+
+    - 완료 커버리지: 일별 윈도우(YYYYMMDD0000~2359)를 분 단위 반개구간
+      [start, end)으로 병합한 정렬 구간 집합 → bisect로 포함/공백 판정
+    - 윈도우 엔트리: sync_timestamp → (window_end, synced_at)
+      (시간별 윈도우의 재동기화 주기 판단용, 일별 윈도우는 구간에만 반영하여
+      같은 시작 시각의 00시 윈도우 엔트리를 덮지 않음)
+    - 최초 1회 전체 로드 후 mark_window_synced마다 갱신, 다른 프로세스의
+      기록은 RELOAD_INTERVAL마다 재로드하여 반영
+    """
+
+    RELOAD_INTERVAL = 300
+
+    def __init__(self):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._windows: Dict[str, Tuple[str, datetime]] = {}
+        self._loaded_at: Optional[float] = None
+        self._load_lock = asyncio.Lock()
+        # 로드 중 기록된 윈도우 (로드 결과 교체 후 재적용)
+        self._pending: Optional[List[Tuple[str, str, datetime]]] = None
+
+    # --- 로드 ---
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """미로드이거나 RELOAD_INTERVAL이 지났으면 data_sync_log에서 다시 읽습니다."""
+        if self._is_fresh():
+            return
+        async with self._load_lock:
+            if self._is_fresh():
+                return
+            self._pending = []
+            try:
+                result = await db.execute(
+                    select(
+                        DataSyncLog.sync_timestamp,
+                        DataSyncLog.window_end,
+                        DataSyncLog.synced_at,
+                    )
+                )
+                rows = result.all()
+            except Exception:
+                self._pending = None
+                raise
+            pending, self._pending = self._pending, None
+            self.load(rows)
+            for row in pending:
+                self.record(*row)
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.RELOAD_INTERVAL
+        )
+
+    def load(self, rows) -> None:
+        """(sync_timestamp, window_end, synced_at) 목록으로 인덱스를 재구성합니다."""
+        self._starts, self._ends, self._windows = [], [], {}
+        for sync_timestamp, window_end, synced_at in rows:
+            self._apply(sync_timestamp, window_end, synced_at)
+        self._loaded_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    # --- 갱신 ---
+
+    def record(
+        self,
+        sync_timestamp: str,
+        window_end: str,
+        synced_at: Optional[datetime] = None,
+    ) -> None:
+        """동기화 완료된 윈도우를 반영합니다."""
+        synced_at = synced_at or datetime.now(timezone.utc)
+        if self._pending is not None:
+            self._pending.append((sync_timestamp, window_end, synced_at))
+        self._apply(sync_timestamp, window_end, synced_at)
+
+    def discard(self, sync_timestamp: str) -> None:
+        """윈도우 엔트리를 제거합니다 (일별 압축으로 삭제된 시간별 윈도우)."""
+        self._windows.pop(sync_timestamp, None)
+
+    def _apply(
+        self, sync_timestamp: str, window_end: str, synced_at: datetime
+    ) -> None:
+        if not is_daily_window(sync_timestamp, window_end):
+            self._windows[sync_timestamp] = (window_end, synced_at)
+            return
+        try:
+            start = to_minute(sync_timestamp)
+            end = to_minute(window_end) + 1
+        except ValueError:
+            return
+        self._add_interval(start, end)
+
+    def _add_interval(self, start: int, end: int) -> None:
+        # 겹치거나 맞닿은 구간을 하나로 병합
+        i = bisect.bisect_left(self._ends, start)
+        j = bisect.bisect_right(self._starts, end)
+        if i < j:
+            start = min(start, self._starts[i])
+            end = max(end, self._ends[j - 1])
+        self._starts[i:j] = [start]
+        self._ends[i:j] = [end]
+
+    # --- 조회 ---
+
+    def entry(self, sync_timestamp: str) -> Optional[Tuple[str, datetime]]:
+        """일별이 아닌 윈도우의 (window_end, synced_at)을 반환합니다 (없으면 None)."""
+        return self._windows.get(sync_timestamp)
+
+    def is_covered(self, start_ts: str, end_ts: str) -> bool:
+        """[start_ts, end_ts] (YYYYMMDDHHMM, 끝 포함)가 완전히 동기화되었는지 확인합니다."""
+        start, end = to_minute(start_ts), to_minute(end_ts) + 1
+        i = bisect.bisect_right(self._starts, start) - 1
+        return i >= 0 and self._ends[i] >= end
+
+    def gaps(self, start_ts: str, end_ts: str) -> List[Tuple[str, str]]:
+        """[start_ts, end_ts] 중 동기화되지 않은 구간 목록 (끝 포함 타임스탬프)."""
+        start, end = to_minute(start_ts), to_minute(end_ts) + 1
+        result: List[Tuple[int, int]] = []
+        cursor = start
+        i = bisect.bisect_right(self._ends, start)
+        while i < len(self._starts) and self._starts[i] < end:
+            if self._starts[i] > cursor:
+                result.append((cursor, self._starts[i]))
+            cursor = max(cursor, self._ends[i])
+            i += 1
+        if cursor < end:
+            result.append((cursor, end))
+        return [(from_minute(s), from_minute(e - 1)) for s, e in result]
+
+    def missing_days(self, start_date: str, end_date: str) -> List[str]:
+        """[start_date, end_date] (YYYYMMDD) 중 일별 커버리지가 없는 날짜 목록."""
+        days: List[str] = []
+        gaps = self.gaps(start_date[:8] + "0000", end_date[:8] + "2359")
+        for gap_start, gap_end in gaps:
+            first = datetime.strptime(gap_start[:8], "%Y%m%d")
+            last = datetime.strptime(gap_end[:8], "%Y%m%d")
+            current = first
+            while current <= last:
+                days.append(current.strftime("%Y%m%d"))
+                current += timedelta(days=1)
+        return days
+
+
+sync_coverage = SyncCoverageIndex()
@@ -0,0 +1,218 @@
+import logging
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import and_, case, delete, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.bid import SyncJob
+from app.services.sync_coverage import is_daily_window
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 (클수록 먼저 처리)
+PRIORITY_BACKFILL = 0
+PRIORITY_MANUAL = 10
+PRIORITY_SEARCH = 100
+
+ACTIVE_STATUSES = ("pending", "running")
+
+KST = timezone(timedelta(hours=9))
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class SyncJobQueue:
+    """sync_jobs 테이블 기반 영속 작업 큐
+
+    - enqueue: 같은 윈도우의 활성 작업이 있으면 우선순위만 상향
+    - claim: FOR UPDATE SKIP LOCKED로 한 건 선점 (heartbeat가 끊긴
+      running 작업도 재선점하여 마지막 체크포인트부터 재개)
+    - checkpoint: 피드별 마지막 완료 페이지 기록 + heartbeat 갱신
+    """
+
+    STALE_LOCK_SECONDS = 600
+    MAX_ATTEMPTS = 5
+    RETENTION_DAYS = 7
+
+    async def enqueue(
+        self,
+        db: AsyncSession,
+        window_start: str,
+        window_end: str,
+        priority: int = PRIORITY_BACKFILL,
+    ) -> int:
+        """윈도우 동기화 작업을 등록하고 job_id를 반환합니다.
+
+        오늘(KST) 이후 날짜의 일별 윈도우는 등록하지 않습니다 — 완료 시 그날
+        전체가 동기화된 것으로 기록되어 이후 등록되는 공고를 놓치므로, 아직
+        끝나지 않은 날은 시간별 동기화가 담당합니다.
+
+        Raises:
+            ValueError: 오늘 이후 날짜의 일별 윈도우
+        """
+        today = datetime.now(KST).strftime("%Y%m%d")
+        if is_daily_window(window_start, window_end) and window_start[:8] >= today:
+            raise ValueError(
+                f"Daily sync window for {window_start[:8]} is not allowed "
+                f"before the day has ended"
+            )
+        stmt = insert(SyncJob).values(
+            window_start=window_start,
+            window_end=window_end,
+            priority=priority,
+            status="pending",
+            checkpoints={},
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["window_start", "window_end"],
+            index_where=SyncJob.status.in_(ACTIVE_STATUSES),
+            set_={
+                "priority": func.greatest(
+                    SyncJob.priority, stmt.excluded.priority
+                ),
+                "updated_at": func.now(),
+            },
+        ).returning(SyncJob.job_id)
+        job_id = (await db.execute(stmt)).scalar_one()
+        await db.commit()
+        return job_id
+
+    async def claim(
+        self, db: AsyncSession, worker_id: str
+    ) -> Optional[SyncJob]:
+        """처리할 작업 한 건을 선점합니다 (없으면 None)."""
+        stale_before = datetime.now(timezone.utc) - timedelta(
+            seconds=self.STALE_LOCK_SECONDS
+        )
+        result = await db.execute(
+            select(SyncJob)
+            .where(
+                or_(
+                    SyncJob.status == "pending",
+                    and_(
+                        SyncJob.status == "running",
+                        SyncJob.heartbeat_at < stale_before,
+                    ),
+                )
+            )
+            .order_by(SyncJob.priority.desc(), SyncJob.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job = result.scalar_one_or_none()
+        if job is None:
+            await db.rollback()
+            return None
+
+        if job.status == "running":
+            logger.warning(
+                f"Reclaiming stale sync job {job.job_id} "
+                f"(locked by {job.locked_by})"
+            )
+        job.status = "running"
+        job.locked_by = worker_id
+        job.heartbeat_at = func.now()
+        job.attempts = (job.attempts or 0) + 1
+        await db.commit()
+        await db.refresh(job)
+        return job
+
+    async def checkpoint(
+        self,
+        db: AsyncSession,
+        job_id: int,
+        feed: str,
+        page: int,
+        count: int,
+        done: bool = False,
+    ) -> None:
+        """피드의 마지막 완료 페이지를 기록합니다."""
+        value = {feed: {"page": page, "count": count, "done": done}}
+        await db.execute(
+            update(SyncJob)
+            .where(SyncJob.job_id == job_id)
+            .values(
+                checkpoints=SyncJob.checkpoints.op("||")(
+                    literal(value, JSONB)
+                ),
+                heartbeat_at=func.now(),
+            )
+        )
+        await db.commit()
+
+    async def complete(self, db: AsyncSession, job_id: int) -> None:
+        await db.execute(
+            update(SyncJob)
+            .where(SyncJob.job_id == job_id)
+            .values(status="done", locked_by=None, last_error=None)
+        )
+        await db.commit()
+
+    async def release(
+        self, db: AsyncSession, job_id: int, error: str
+    ) -> None:
+        """실패한 작업을 재시도 대기로 되돌립니다 (한도 초과 시 failed)."""
+        await db.execute(
+            update(SyncJob)
+            .where(SyncJob.job_id == job_id)
+            .values(
+                status=case(
+                    (SyncJob.attempts >= self.MAX_ATTEMPTS, "failed"),
+                    else_="pending",
+                ),
+                locked_by=None,
+                last_error=error[:2000],
+            )
+        )
+        await db.commit()
+
+    async def defer(
+        self, db: AsyncSession, job_id: int, error: str
+    ) -> None:
+        """업스트림 호출 제한/서킷 open으로 중단된 작업을 시도 횟수 차감 없이 되돌립니다."""
+        await db.execute(
+            update(SyncJob)
+            .where(SyncJob.job_id == job_id)
+            .values(
+                status="pending",
+                attempts=func.greatest(SyncJob.attempts - 1, 0),
+                locked_by=None,
+                last_error=error[:2000],
+            )
+        )
+        await db.commit()
+
+    async def get_active_jobs(
+        self, db: AsyncSession, window_starts: List[str]
+    ) -> List[SyncJob]:
+        """윈도우 시작 시각 목록에 해당하는 활성(대기/실행) 작업을 조회합니다."""
+        if not window_starts:
+            return []
+        result = await db.execute(
+            select(SyncJob).where(
+                SyncJob.window_start.in_(window_starts),
+                SyncJob.status.in_(ACTIVE_STATUSES),
+            )
+        )
+        return list(result.scalars().all())
+
+    async def purge_finished(self, db: AsyncSession) -> int:
+        """보관 기간이 지난 완료/실패 작업을 삭제합니다."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.RETENTION_DAYS)
+        result = await db.execute(
+            delete(SyncJob).where(
+                SyncJob.status.in_(("done", "failed")),
+                SyncJob.updated_at < cutoff,
+            )
+        )
+        await db.commit()
+        return result.rowcount or 0
+
+
+sync_job_queue = SyncJobQueue()
@@ -0,0 +1,338 @@
+"""나라장터 API 호출 복원력 계층 (재시도 + 엔드포인트별 서킷 브레이커)
+
+응답 분류 (공공데이터포털 resultCode 기준):
+- 정상: 200 + 00, NODATA(03), 404 → 그대로 반환 (호출자가 "데이터 없음" 처리)
+- 호출 제한: 429 → Retry-After(초 또는 HTTP-date)만큼, 없으면 백오프 후 재시도
+- 일일 한도 초과: resultCode 22 → 재시도 없이 서킷을 QUOTA_COOLDOWN_SECONDS 동안 open
+- 일시 오류: 5xx, 연결 오류/타임아웃, resultCode 01/02/04/05/99
+  → 지수 백오프(full jitter)로 최대 RetryPolicy.max_attempts회 시도
+- 영구 오류: 그 밖의 4xx, resultCode 10~32 → 재시도 없이 UpstreamRejected
+
+엔드포인트별 연속 실패가 FAILURE_THRESHOLD회에 이르거나 Retry-After가
+max_retry_after보다 길면 서킷이 열리고, 열려 있는 동안은 호출 없이
+CircuitOpenError를 올립니다. 대기 시간이 지나면 half-open 상태에서 한 번만
+시험 호출하여 성공하면 닫고, 실패하면 다시 엽니다. 취소된 호출은 실패로
+세지 않습니다 (half-open 시험 호출이었다면 다시 엽니다).
+"""
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+import httpx
+
+from app.core.metrics import (
+    UPSTREAM_CIRCUIT_REJECTED,
+    UPSTREAM_CIRCUIT_STATE,
+    UPSTREAM_RETRIES,
+    result_code_of,
+)
+
+logger = logging.getLogger(__name__)
+
+RESULT_OK = "00"
+RESULT_NODATA = "03"
+RESULT_QUOTA_EXCEEDED = "22"  # LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR
+TRANSIENT_RESULT_CODES = frozenset({"01", "02", "04", "05", "99"})
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class UpstreamError(Exception):
+    """재시도 후에도 실패한 나라장터 API 호출."""
+
+    kind = "error"
+
+    def __init__(
+        self, endpoint: str, reason: str, retry_after: Optional[float] = None
+    ):
+        super().__init__(f"{endpoint}: {reason}")
+        self.endpoint = endpoint
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class UpstreamThrottled(UpstreamError):
+    """호출 제한 (429)."""
+
+    kind = "throttled"
+
+
+class UpstreamQuotaExceeded(UpstreamThrottled):
+    """일일 호출 한도 초과 (resultCode 22)."""
+
+    kind = "quota"
+
+
+class UpstreamUnavailable(UpstreamError):
+    """5xx, 연결 오류/타임아웃, 일시 오류 resultCode."""
+
+    kind = "unavailable"
+
+
+class UpstreamRejected(UpstreamError):
+    """재시도해도 결과가 같은 오류 (그 밖의 4xx, 영구 오류 resultCode)."""
+
+    kind = "rejected"
+
+
+class CircuitOpenError(UpstreamError):
+    """서킷이 열려 있어 호출하지 않았습니다. retry_after 후 재시도 가능."""
+
+    kind = "circuit_open"
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[datetime] = None
+) -> Optional[float]:
+    """Retry-After 헤더 → 대기 시간(초). 초 단위 정수와 HTTP-date를 지원합니다."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max((when - now).total_seconds(), 0.0)
+
+
+def check_response(
+    endpoint: str, response: httpx.Response
+) -> Optional[UpstreamError]:
+    """응답을 분류합니다. 정상(데이터 없음 포함)이면 None."""
+    status = response.status_code
+    if status == 429:
+        return UpstreamThrottled(
+            endpoint, "HTTP 429",
+            parse_retry_after(response.headers.get("Retry-After")),
+        )
+    if status >= 500:
+        return UpstreamUnavailable(
+            endpoint, f"HTTP {status}",
+            parse_retry_after(response.headers.get("Retry-After")),
+        )
+    if status == 404:
+        return None
+    if status >= 400:
+        return UpstreamRejected(endpoint, f"HTTP {status}")
+
+    code = result_code_of(response.content)
+    if code in ("none", RESULT_OK, RESULT_NODATA):
+        return None
+    if code == RESULT_QUOTA_EXCEEDED:
+        return UpstreamQuotaExceeded(endpoint, f"resultCode {code}")
+    if code in TRANSIENT_RESULT_CODES:
+        return UpstreamUnavailable(endpoint, f"resultCode {code}")
+    return UpstreamRejected(endpoint, f"resultCode {code}")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """재시도 횟수와 대기 시간"""
+
+    max_attempts: int = 3  # 첫 호출 포함
+    base_delay: float = 1.0  # 첫 재시도 백오프 상한 (초), 이후 2배씩
+    max_delay: float = 10.0
+    max_retry_after: float = 30.0  # 이보다 긴 Retry-After는 기다리지 않고 서킷 open
+
+    def backoff(
+        self, attempt: int, retry_after: Optional[float], rng: random.Random
+    ) -> float:
+        """attempt번째 호출 실패 후 대기 시간 (Retry-After 우선, 없으면 full jitter)."""
+        if retry_after is not None:
+            return retry_after
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return rng.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """엔드포인트 하나의 서킷 상태 (closed → open → half-open → closed)."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        failure_threshold: int,
+        cooldown: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self._open_until = 0.0
+        self._probing = False
+
+    def _set_state(self, state: str) -> None:
+        if state != self.state:
+            logger.warning(
+                f"Circuit for {self.endpoint}: {self.state} -> {state}"
+            )
+        self.state = state
+        UPSTREAM_CIRCUIT_STATE.labels(self.endpoint).set(_STATE_VALUES[state])
+
+    def retry_after(self) -> float:
+        """다시 호출할 수 있을 때까지 남은 시간 (초). 닫혀 있으면 0."""
+        if self.state != OPEN:
+            return 0.0
+        return max(self._open_until - self._clock(), 0.0)
+
+    def before_call(self) -> None:
+        """호출 전 확인. 열려 있거나 시험 호출 중이면 CircuitOpenError."""
+        if self.state == OPEN:
+            remaining = self.retry_after()
+            if remaining > 0:
+                UPSTREAM_CIRCUIT_REJECTED.labels(self.endpoint).inc()
+                raise CircuitOpenError(self.endpoint, "circuit open", remaining)
+            self._set_state(HALF_OPEN)
+            self._probing = False
+        if self.state == HALF_OPEN:
+            if self._probing:
+                UPSTREAM_CIRCUIT_REJECTED.labels(self.endpoint).inc()
+                raise CircuitOpenError(
+                    self.endpoint, "circuit half-open, probe in flight",
+                    self.cooldown,
+                )
+            self._probing = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._probing = False
+        self._set_state(CLOSED)
+
+    def record_failure(self) -> None:
+        self._probing = False
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.open(self.cooldown)
+
+    def abort_probe(self) -> None:
+        """결과 없이 끝난 호출. half-open 시험 호출이면 다시 열어 대기 후 재시험."""
+        if self.state == HALF_OPEN and self._probing:
+            self.open(self.cooldown)
+
+    def open(self, seconds: float) -> None:
+        """seconds 동안 호출을 막습니다 (이미 더 오래 열려 있으면 유지)."""
+        self._probing = False
+        self.failures = 0
+        self._open_until = max(self._open_until, self._clock() + seconds)
+        self._set_state(OPEN)
+
+
+class UpstreamGuard:
+    """엔드포인트별 서킷 브레이커와 재시도 정책으로 API 호출을 감쌉니다."""
+
+    FAILURE_THRESHOLD = 5  # 연속 실패 (재시도 포함) 횟수
+    COOLDOWN_SECONDS = 60.0
+    QUOTA_COOLDOWN_SECONDS = 3600.0  # 한도 초과 후 시험 호출까지 대기
+
+    def __init__(
+        self,
+        policy: RetryPolicy = RetryPolicy(),
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        self.policy = policy
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._sleep = asyncio.sleep
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                endpoint, self.FAILURE_THRESHOLD, self.COOLDOWN_SECONDS,
+                self._clock,
+            )
+            self._breakers[endpoint] = breaker
+        return breaker
+
+    def paused_for(self, endpoints: Iterable[str]) -> float:
+        """주어진 엔드포인트의 서킷이 모두 호출을 허용할 때까지 남은 시간 (초)."""
+        return max(
+            (self.breaker(endpoint).retry_after() for endpoint in endpoints),
+            default=0.0,
+        )
+
+    def reset(self) -> None:
+        self._breakers.clear()
+
+    async def call(
+        self,
+        endpoint: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """send()를 재시도 정책에 따라 호출하고 정상 응답을 반환합니다.
+
+        Raises:
+            UpstreamError: 재시도 후에도 실패 (하위 클래스로 원인 구분)
+        """
+        breaker = self.breaker(endpoint)
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker.before_call()
+            try:
+                response = await send()
+            except httpx.TransportError as e:
+                error: Optional[UpstreamError] = UpstreamUnavailable(
+                    endpoint, type(e).__name__
+                )
+            except httpx.HTTPError:
+                # 디코딩 오류 등 응답 처리 실패는 업스트림 실패로 기록
+                breaker.record_failure()
+                raise
+            except BaseException:
+                # 취소(클라이언트 연결 종료, 요청 타임아웃) 등은 업스트림 상태와
+                # 무관 — 실패로 세지 않고, half-open 시험 호출만 다시 open
+                breaker.abort_probe()
+                raise
+            else:
+                error = check_response(endpoint, response)
+                if error is None:
+                    breaker.record_success()
+                    return response
+
+            if isinstance(error, UpstreamRejected):
+                # 업스트림은 정상 응답 중 — 요청 자체의 문제
+                breaker.record_success()
+                raise error
+            if isinstance(error, UpstreamQuotaExceeded):
+                breaker.open(self.QUOTA_COOLDOWN_SECONDS)
+                error.retry_after = breaker.retry_after()
+                raise error
+
+            breaker.record_failure()
+            if (
+                error.retry_after is not None
+                and error.retry_after > self.policy.max_retry_after
+            ):
+                breaker.open(error.retry_after)
+                raise error
+            if attempt >= self.policy.max_attempts:
+                raise error
+
+            delay = self.policy.backoff(attempt, error.retry_after, self._rng)
+            UPSTREAM_RETRIES.labels(endpoint, error.kind).inc()
+            logger.warning(
+                f"{error} (attempt {attempt}/{self.policy.max_attempts}), "
+                f"retrying in {delay:.1f}s"
+            )
+            await self._sleep(delay)
+
+
+upstream_guard = UpstreamGuard()
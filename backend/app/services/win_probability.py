@@ -0,0 +1,310 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.bid import (
+    AssessmentRateSample,
+    BidBasisAmount,
+    BidNotice,
+    BidOpeningResult,
+)
+from app.schemas.bid import (
+    WinProbabilityPoint,
+    WinProbabilityRequest,
+    WinProbabilityResponse,
+)
+from app.services.assessment_rate_stats import Bucket, bucket_of
+from app.services.bid_data_service import bid_data_service
+from app.services.bid_price_engine import (
+    DEFAULT_LOWER_LIMIT_RATE,
+    RANGE_HIGH_PCT,
+    RANGE_LOW_PCT,
+    a_value_of,
+    pick_basis_amount,
+    safe_num,
+)
+
+logger = logging.getLogger(__name__)
+
+PRELIMINARY_PRICES = 15  # 복수예비가격 개수
+DRAWN_PRICES = 4  # 예정가격 산정에 추첨되는 예비가격 개수
+RATIO_BOUNDS = (0.5, 1.2)  # 투찰금액 / 기초금액 — 이 범위 밖은 데이터 오류로 제외
+
+
+class WinProbabilityError(Exception):
+    """시뮬레이션에 필요한 데이터가 없음"""
+
+
+@dataclass
+class CompetitorModel:
+    """경쟁사 투찰 분포 (과거 개찰결과)
+
+    ratios: 투찰금액 / 기초금액 (정렬, 최대 WinProbabilityService.QUANTILES개로 압축)
+    bidder_counts / bidder_weights: 공고별 투찰 업체 수 분포
+    """
+
+    ratios: np.ndarray
+    bidder_counts: np.ndarray
+    bidder_weights: np.ndarray
+    notices: int
+    bids: int
+
+    def with_competitors(self, competitors: int) -> "CompetitorModel":
+        """경쟁사 수를 고정한 모델."""
+        return CompetitorModel(
+            ratios=self.ratios,
+            bidder_counts=np.array([competitors]),
+            bidder_weights=np.array([1.0]),
+            notices=self.notices,
+            bids=self.bids,
+        )
+
+
+def simulate_lower_limits(
+    basis_amount: float,
+    a_value: float,
+    lower_limit_rate: float,
+    range_bgn_rate: float,
+    range_end_rate: float,
+    simulations: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """예정가격 추첨을 반복하여 낙찰하한가 표본을 만듭니다.
+
+    기초금액 ±범위를 15등분한 구간마다 예비가격이 하나씩 균등분포로
+    정해지고, 그중 4개(서로 다른 구간)의 산술평균이 예정가격이 됩니다.
+    선택된 4개 구간의 값만 뽑으면 되므로 구간 index + U(0,1)로 계산합니다.
+    """
+    keys = rng.random((simulations, PRELIMINARY_PRICES))
+    slots = np.argpartition(keys, DRAWN_PRICES, axis=1)[:, :DRAWN_PRICES]
+    positions = (slots + rng.random((simulations, DRAWN_PRICES))).mean(axis=1)
+    width = (range_end_rate - range_bgn_rate) / PRELIMINARY_PRICES
+    planned = basis_amount * (1 + (range_bgn_rate + positions * width) / 100)
+    return np.ceil((planned - a_value) * lower_limit_rate / 100 + a_value)
+
+
+def win_probability_curve(
+    lower_limits: np.ndarray,
+    prices: np.ndarray,
+    basis_amount: float,
+    model: CompetitorModel,
+) -> np.ndarray:
+    """후보 투찰가별 낙찰 확률.
+
+    낙찰하한가 L 이상인 최저가가 낙찰된다고 보고, 경쟁사 n곳이 각각 독립적으로
+    [L, P) 구간에 투찰할 확률 F(P) − F(L)에서 P(낙찰 | L) = E_n[(1 − F(P) + F(L))^n]
+    (투찰 업체 수 분포의 확률생성함수)를 계산합니다.
+    F는 경쟁사 표본 M개의 계단 함수라 F(P) − F(L) = d/M (d: 정수)이므로
+    E_n[(1 − d/M)^n]을 d = 0..M에 대해 미리 계산해 두고, 시뮬레이션은 F(L)
+    계단별로 묶어(L ≤ P인 건수를 누적합으로 집계) 묶음 × 후보 가격 단위로만
+    평가합니다.
+    """
+    ratios = model.ratios
+    steps = np.searchsorted(ratios, lower_limits / basis_amount)
+    price_steps = np.searchsorted(ratios, prices / basis_amount)
+    survive = np.power(
+        1 - np.arange(len(ratios) + 1)[:, None] / len(ratios),
+        model.bidder_counts[None, :],
+    ) @ model.bidder_weights
+
+    groups, group_index = np.unique(steps, return_inverse=True)
+    # 시뮬레이션별 L ≤ prices[j]가 처음 성립하는 j
+    first_price = np.searchsorted(prices, lower_limits, side="left")
+    width = len(prices) + 1
+    counts = np.bincount(
+        group_index * width + first_price, minlength=len(groups) * width
+    ).reshape(len(groups), width)
+    qualified = np.cumsum(counts, axis=1)[:, :-1]
+
+    # qualified > 0인 칸은 L ≤ P라 d ≥ 0
+    gaps = np.maximum(price_steps[None, :] - groups[:, None], 0)
+    return (survive[gaps] * qualified).sum(axis=0) / len(lower_limits)
+
+
+class WinProbabilityService:
+    """후보 투찰가별 낙찰 확률 (몬테카를로)
+
+    예정가격 추첨(기초금액·예비가격범위)과 같은 버킷(지역범위 × 면허유형 ×
+    금액범위)의 과거 경쟁사 투찰 분포로 낙찰 확률 곡선을 계산합니다.
+    경쟁사 분포는 assessment_rate_samples의 최근 공고 개찰결과에서 만들고
+    버킷별로 HISTORY_CACHE_TTL 동안 캐시합니다.
+    """
+
+    HISTORY_NOTICES = 300
+    MIN_HISTORY_NOTICES = 30  # 버킷 표본이 이보다 적으면 전체 공고 사용
+    QUANTILES = 2000
+    HISTORY_CACHE_TTL = 600
+
+    def __init__(self):
+        # 버킷(None = 전체) → (적재 시각, 모델)
+        self._models: Dict[
+            Optional[Bucket], Tuple[float, Optional[CompetitorModel]]
+        ] = {}
+
+    async def competitor_model(
+        self, db: AsyncSession, bucket: Optional[Bucket]
+    ) -> Optional[CompetitorModel]:
+        """버킷(None이면 전체)의 경쟁사 분포 (표본 부족 시 None)."""
+        cached = self._models.get(bucket)
+        now = time.monotonic()
+        if cached and now - cached[0] < self.HISTORY_CACHE_TTL:
+            return cached[1]
+
+        query = select(
+            AssessmentRateSample.bid_ntce_no,
+            AssessmentRateSample.basis_amount,
+            AssessmentRateSample.bidder_count,
+        ).where(AssessmentRateSample.rate.is_not(None))
+        if bucket is not None:
+            query = query.where(
+                AssessmentRateSample.region_scope == bucket[0],
+                AssessmentRateSample.license_group == bucket[1],
+                AssessmentRateSample.amount_range == bucket[2],
+            )
+        result = await db.execute(
+            query.order_by(AssessmentRateSample.computed_at.desc())
+            .limit(self.HISTORY_NOTICES)
+        )
+        samples = result.all()
+
+        model = None
+        if len(samples) >= self.MIN_HISTORY_NOTICES:
+            model = await self._build_model(db, samples)
+        self._models[bucket] = (now, model)
+        return model
+
+    async def _build_model(
+        self, db: AsyncSession, samples: list
+    ) -> Optional[CompetitorModel]:
+        basis = {no: amount for no, amount, _ in samples}
+        result = await db.execute(
+            select(BidOpeningResult.bid_ntce_no, BidOpeningResult.data).where(
+                BidOpeningResult.bid_ntce_no.in_(list(basis))
+            )
+        )
+        basis_amounts: List[float] = []
+        amounts: List[float] = []
+        for no, items in result.all():
+            for item in items or ():
+                basis_amounts.append(basis[no])
+                amounts.append(safe_num(item.get("bidprcAmt")) or 0.0)
+
+        ratios = np.array(amounts, dtype=np.float64) / np.array(basis_amounts)
+        low, high = RATIO_BOUNDS
+        ratios = np.sort(ratios[(ratios >= low) & (ratios <= high)])
+        if not len(ratios):
+            return None
+        bids = len(ratios)
+        if bids > self.QUANTILES:
+            ratios = np.quantile(
+                ratios, (np.arange(self.QUANTILES) + 0.5) / self.QUANTILES
+            )
+
+        counts, frequency = np.unique(
+            np.array([count for _, _, count in samples], dtype=np.int64),
+            return_counts=True,
+        )
+        return CompetitorModel(
+            ratios=ratios,
+            bidder_counts=counts,
+            bidder_weights=frequency / frequency.sum(),
+            notices=len(samples),
+            bids=bids,
+        )
+
+    async def _load_notice(self, db: AsyncSession, bid_ntce_no: str):
+        """(공고 data, 기초금액 data, 기초금액, 버킷)"""
+        notice_result = await db.execute(
+            select(BidNotice.data)
+            .where(BidNotice.bid_ntce_no == bid_ntce_no)
+            .order_by(BidNotice.bid_ntce_ord.desc())
+            .limit(1)
+        )
+        notice = notice_result.scalar_one_or_none() or {}
+
+        basis_result = await db.execute(
+            select(BidBasisAmount.bid_type, BidBasisAmount.data).where(
+                BidBasisAmount.bid_ntce_no == bid_ntce_no
+            )
+        )
+        basis = pick_basis_amount(notice, dict(basis_result.all()))
+        basis_amount = safe_num(basis.get("bssamt")) if basis else None
+        if not basis_amount or basis_amount <= 0:
+            raise WinProbabilityError("기초금액이 아직 공개되지 않았습니다.")
+
+        rgn_map, lic_map, _ = await bid_data_service.get_enrichment_maps(
+            db, [bid_ntce_no]
+        )
+        bucket = bucket_of(
+            rgn_map.get(bid_ntce_no, []), lic_map.get(bid_ntce_no, []), basis_amount
+        )
+        return notice, basis, basis_amount, bucket
+
+    async def simulate(
+        self, db: AsyncSession, bid_ntce_no: str, request: WinProbabilityRequest
+    ) -> WinProbabilityResponse:
+        notice, basis, basis_amount, bucket = await self._load_notice(db, bid_ntce_no)
+
+        model = await self.competitor_model(db, bucket)
+        if model is None:
+            model = await self.competitor_model(db, None)
+        if model is None:
+            raise WinProbabilityError("경쟁사 분포를 만들 개찰결과가 부족합니다.")
+        if request.competitors is not None:
+            model = model.with_competitors(request.competitors)
+
+        a_value = a_value_of(basis)
+        lower_limit_rate = (
+            safe_num(notice.get("sucsfbidLwltRate")) or DEFAULT_LOWER_LIMIT_RATE
+        )
+        range_bgn = safe_num(basis.get("rsrvtnPrceRngBgnRate"))
+        range_end = safe_num(basis.get("rsrvtnPrceRngEndRate"))
+        if range_bgn is None or range_end is None or range_bgn >= range_end:
+            range_bgn, range_end = RANGE_LOW_PCT - 100.0, RANGE_HIGH_PCT - 100.0
+
+        rng = np.random.default_rng(request.seed)
+        lower_limits = simulate_lower_limits(
+            basis_amount, a_value, lower_limit_rate, range_bgn, range_end,
+            request.simulations, rng,
+        )
+        if request.prices:
+            prices = np.unique(np.array(request.prices, dtype=np.float64))
+        else:
+            # 낙찰하한가 분포 전체 + 상단 1% 여유
+            prices = np.ceil(np.linspace(
+                lower_limits.min(), lower_limits.max() * 1.01, request.points
+            ))
+        probabilities = win_probability_curve(
+            lower_limits, prices, basis_amount, model
+        )
+
+        best = int(np.argmax(probabilities))
+        return WinProbabilityResponse(
+            bidNtceNo=bid_ntce_no,
+            basisAmount=basis_amount,
+            aValue=a_value,
+            lowerLimitRate=lower_limit_rate,
+            rangeBgnRate=range_bgn,
+            rangeEndRate=range_end,
+            simulations=request.simulations,
+            historyNotices=model.notices,
+            historyBids=model.bids,
+            bestPrice=int(prices[best]),
+            bestProbability=float(probabilities[best]),
+            points=[
+                WinProbabilityPoint(
+                    price=int(price),
+                    bidRate=price / basis_amount * 100,
+                    winProbability=probability,
+                )
+                for price, probability in zip(prices.tolist(), probabilities.tolist())
+            ],
+        )
+
+
+win_probability_service = WinProbabilityService()
@@ -0,0 +1,117 @@
+"""핫 경로 회귀 벤치마크 (pytest-benchmark)
+
+- test_bench_sync: 나라장터 대역(tests.fakes.narajangter)으로 윈도우 전체 동기화
+- test_bench_search: search_from_db 필터 조합 (scripts/bench_search_queries 형태)
+- test_bench_bookmarks: 북마크 목록 enrichment
+- test_bench_notifications: 알림 조건 매칭 (DB 불필요)
+- test_synthetic_copy: 합성 데이터 COPY 적재 스모크 (벤치마크 아님)
+
+벤치마크 전용 DB(BENCH_DATABASE_URL, alembic upgrade head 완료)가 있어야
+DB 벤치마크가 실행되며, 없으면 해당 항목은 skip 됩니다.
+
+사용법:
+    pip install -r requirements-dev.txt
+
+    # 기준선 저장 (benchmarks/.baselines/<머신>/NNNN_<커밋>.json)
+    BENCH_DATABASE_URL=postgresql+asyncpg://.../bench_db \\
+        pytest benchmarks --benchmark-storage=benchmarks/.baselines \\
+        --benchmark-autosave
+
+    # 마지막 기준선과 비교 — 중앙값이 15% 넘게 느려지면 실패
+    BENCH_DATABASE_URL=postgresql+asyncpg://.../bench_db \\
+        pytest benchmarks --benchmark-storage=benchmarks/.baselines \\
+        --benchmark-compare --benchmark-compare-fail=median:15%
+
+환경 변수:
+    BENCH_ROWS: 검색/북마크용 합성 공고 수 (기본 50000)
+    BENCH_NO_SEED=1: 이미 시드된 DB를 그대로 사용
+    BENCH_FAKE_LATENCY_MS: 나라장터 대역 응답 지연 (기본 20)
+"""
+import asyncio
+import os
+from datetime import datetime
+
+import pytest
+
+BENCH_DATABASE_URL = os.environ.get("BENCH_DATABASE_URL")
+if BENCH_DATABASE_URL:
+    # app.db.database의 엔진(동기화 스케줄러가 직접 사용)도 벤치마크 DB로
+    os.environ["DATABASE_URL"] = BENCH_DATABASE_URL
+
+BENCH_ROWS = int(os.environ.get("BENCH_ROWS", "50000"))
+BENCH_NO_SEED = os.environ.get("BENCH_NO_SEED") == "1"
+BENCH_FAKE_LATENCY_MS = float(os.environ.get("BENCH_FAKE_LATENCY_MS", "20"))
+# 시드 기준 시각 — 검색 형태(build_shapes)도 같은 값을 씁니다
+NOW = datetime.now()
+
+try:
+    import pytest_benchmark  # noqa: F401
+    HAS_BENCHMARK = True
+except ImportError:
+    HAS_BENCHMARK = False
+
+
+def pytest_collection_modifyitems(config, items):
+    if HAS_BENCHMARK:
+        return
+    marker = pytest.mark.skip(reason="pytest-benchmark가 설치되어 있지 않습니다")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(marker)
+
+
+@pytest.fixture(scope="session")
+def run():
+    """벤치마크 전체가 공유하는 이벤트 루프에서 코루틴 함수를 실행합니다.
+
+    asyncpg 커넥션은 생성된 루프에 묶이므로 라운드마다 새 루프를 쓰지 않습니다.
+    """
+    loop = asyncio.new_event_loop()
+
+    def _run(coro_fn, *args, **kwargs):
+        return loop.run_until_complete(coro_fn(*args, **kwargs))
+
+    yield _run
+
+    if BENCH_DATABASE_URL:
+        from app.db.database import engine
+
+        loop.run_until_complete(engine.dispose())
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def bench_db(run):
+    """벤치마크 DB 세션 팩토리 (SQL 로그 출력은 끕니다)."""
+    if not BENCH_DATABASE_URL:
+        pytest.skip("BENCH_DATABASE_URL이 설정되지 않았습니다")
+
+    from sqlalchemy import text
+
+    from app.db.database import AsyncSessionLocal, engine
+
+    engine.sync_engine.echo = False
+
+    async def ping():
+        async with AsyncSessionLocal() as db:
+            await db.execute(text("SELECT 1"))
+
+    try:
+        run(ping)
+    except Exception as e:
+        pytest.skip(f"벤치마크 DB에 연결할 수 없습니다: {e}")
+    return AsyncSessionLocal
+
+
+@pytest.fixture(scope="session")
+def seeded(run, bench_db):
+    """BENCH 접두사 합성 공고 BENCH_ROWS건 (scripts/bench_search_queries.seed)"""
+    from scripts.bench_search_queries import seed
+
+    async def _seed():
+        async with bench_db() as db:
+            await seed(db, BENCH_ROWS, NOW)
+
+    if not BENCH_NO_SEED:
+        run(_seed)
+    return bench_db
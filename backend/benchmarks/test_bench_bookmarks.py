@@ -0,0 +1,95 @@
+"""북마크 목록 enrichment (GET /bids/bookmarks)
+
+BENCH 공고 BOOKMARKS건을 북마크한 사용자 한 명의 목록 조회 시간입니다.
+절반은 투찰 완료 + 개찰결과(BIDDERS명)가 있어 낙찰자/내 순위 계산을 거칩니다.
+"""
+import uuid
+
+import pytest
+from sqlalchemy import delete, select
+
+from app.api.bids import get_bookmarks
+from app.models.bid import BidNotice, BidOpeningResult
+from app.models.user import User, UserBookmark
+
+BOOKMARKS = 200
+BIDDERS = 150
+BENCH_USERNAME = "bench_bookmarks"
+BENCH_BIZNO = "1234500000"
+
+
+def opening_results(no: str) -> list:
+    results = [
+        {
+            "opengRank": str(rank) if rank <= BIDDERS * 0.7 else "",
+            "prcbdrBizno": f"{1234500000 + rank:010d}",
+            "prcbdrNm": f"벤치업체{rank}",
+            "bidprcAmt": str(100_000_000 - rank * 1000),
+            "bidprcrt": f"{88.5 - rank * 0.01:.3f}",
+        }
+        for rank in range(1, BIDDERS + 1)
+    ]
+    # 사용자 업체는 미달 구간 (마이너스 등수 계산 경로)
+    results[-10]["prcbdrBizno"] = BENCH_BIZNO
+    return results
+
+
+@pytest.fixture(scope="module")
+def bookmark_user(run, seeded):
+    async def _prepare():
+        async with seeded() as db:
+            await db.execute(delete(User).where(User.username == BENCH_USERNAME))
+            user = User(
+                user_id=uuid.uuid4(),
+                username=BENCH_USERNAME,
+                email=f"{BENCH_USERNAME}@example.com",
+                password_hash="-",
+                business_number=BENCH_BIZNO,
+            )
+            db.add(user)
+
+            nos = (await db.execute(
+                select(BidNotice.bid_ntce_no)
+                .where(BidNotice.bid_ntce_no.like("BENCH%"))
+                .order_by(BidNotice.bid_ntce_no)
+                .limit(BOOKMARKS)
+            )).scalars().all()
+            await db.execute(
+                delete(BidOpeningResult).where(BidOpeningResult.bid_ntce_no.in_(nos))
+            )
+            for i, no in enumerate(nos):
+                completed = i % 2 == 0
+                db.add(UserBookmark(
+                    user_id=user.user_id,
+                    bid_notice_no=no,
+                    bid_notice_name=f"벤치마크 공고 {no}",
+                    status="bid_completed" if completed else "interested",
+                    bid_price=99_000_000 if completed else None,
+                ))
+                if completed:
+                    db.add(BidOpeningResult(bid_ntce_no=no, data=opening_results(no)))
+            await db.commit()
+            return user
+
+    async def _cleanup(user):
+        async with seeded() as db:
+            await db.execute(
+                delete(UserBookmark).where(UserBookmark.user_id == user.user_id)
+            )
+            await db.execute(delete(User).where(User.user_id == user.user_id))
+            await db.commit()
+
+    user = run(_prepare)
+    yield user
+    run(_cleanup, user)
+
+
+def test_get_bookmarks(benchmark, run, seeded, bookmark_user):
+    async def list_bookmarks():
+        async with seeded() as db:
+            return await get_bookmarks(
+                bookmark_status=None, current_user=bookmark_user, db=db
+            )
+
+    bookmarks = benchmark(run, list_bookmarks)
+    assert len(bookmarks) == BOOKMARKS
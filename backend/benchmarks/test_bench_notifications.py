@@ -0,0 +1,72 @@
+"""알림 조건 매칭 (NotificationScheduler.notify_user)
+
+사용자 USERS명의 저장 조건으로 나라장터 대역을 조회하고 메일 발송 대상을
+고르는 시간입니다 (메일 발송 자체는 mock). DB가 필요 없습니다.
+"""
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.models.user import User, UserPreference
+from app.services.scheduler import NotificationScheduler
+from benchmarks.conftest import BENCH_FAKE_LATENCY_MS
+from tests.fakes.narajangter import FakeNaraJangter, generate_dataset
+
+USERS = 50
+REGIONS = ["경기도", "서울특별시", None]
+PRICE_RANGES = [("100000000", "1000000000"), (None, None)]
+
+
+def user_preferences():
+    pairs = []
+    for i in range(USERS):
+        presmpt_bgn, presmpt_end = PRICE_RANGES[i % len(PRICE_RANGES)]
+        user = User(
+            user_id=uuid.uuid4(),
+            username=f"bench{i}",
+            email=f"bench{i}@example.com",
+            password_hash="-",
+        )
+        preference = UserPreference(
+            user_id=user.user_id,
+            search_conditions={
+                "inqryDiv": "1",
+                "region": REGIONS[i % len(REGIONS)],
+                "presmptPrceBgn": presmpt_bgn,
+                "presmptPrceEnd": presmpt_end,
+            },
+            email_notifications_enabled=True,
+            notification_frequency=("realtime", "daily", "weekly")[i % 3],
+            last_notification_at=None,
+        )
+        pairs.append((user, preference))
+    return pairs
+
+
+@pytest.fixture(scope="module")
+def fake():
+    # 최근 하루에 공고가 몰리도록 오늘 0시부터 생성
+    start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return FakeNaraJangter(
+        generate_dataset(notices=2000, start=start, days=1),
+        latency_ms=BENCH_FAKE_LATENCY_MS,
+    )
+
+
+def test_notify_users(benchmark, run, fake):
+    scheduler = NotificationScheduler()
+    pairs = user_preferences()
+    send = AsyncMock()
+
+    async def notify_all():
+        for user, preference in pairs:
+            await scheduler.notify_user(user, preference)
+
+    with fake.install(), patch(
+        "app.services.scheduler.email_service.send_bid_notification", send
+    ):
+        benchmark.pedantic(run, args=(notify_all,), rounds=5, iterations=1)
+
+    assert send.await_count > 0
@@ -0,0 +1,28 @@
+"""search_from_db 필터 조합별 응답 시간
+
+scripts/bench_search_queries.py와 같은 검색 형태(build_shapes)를 시드된
+BENCH 공고 위에서 실행합니다. EXPLAIN ANALYZE만 보는 스크립트와 달리
+건수 쿼리, enrichment, 핫셋 경로, pydantic 변환까지 포함한 전체 시간입니다.
+"""
+import pytest
+
+from app.schemas.bid import BidSearchParams
+from app.services.bid_data_service import bid_data_service
+from benchmarks.conftest import NOW
+from scripts.bench_search_queries import build_shapes
+
+SHAPES = build_shapes(NOW)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [kwargs for _, kwargs in SHAPES], ids=[name for name, _ in SHAPES]
+)
+def test_search_from_db(benchmark, run, seeded, kwargs):
+    params = BidSearchParams(numOfRows=100, pageNo=1, **kwargs)
+
+    async def search():
+        async with seeded() as db:
+            return await bid_data_service.search_from_db(db, params)
+
+    response = benchmark(run, search)
+    benchmark.extra_info["total_count"] = response.totalCount
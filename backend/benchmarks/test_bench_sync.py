@@ -0,0 +1,105 @@
+"""윈도우 전체 동기화 (공사/용역 공고 + 참가가능지역 + 면허제한)
+
+나라장터 대역이 하루치 합성 공고를 BENCH_FAKE_LATENCY_MS 지연으로 돌려주고,
+페이지/윈도우 간 대기(_throttle)는 빼고 측정합니다.
+- cold: 매 라운드 전에 합성 공고를 지워 전부 신규 저장
+- resync: 이미 저장된 윈도우 재조회 (content_hash가 같아 대부분 변경 없음)
+- degraded: 5% 503 + 5% 429 응답 (재시도 백오프/Retry-After 대기 포함,
+  재시도 후에도 실패한 피드는 중단되고 윈도우는 완료로 기록되지 않음)
+"""
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+
+from benchmarks.conftest import BENCH_FAKE_LATENCY_MS
+from tests.fakes.narajangter import FakeNaraJangter, generate_dataset
+
+SYNC_NOTICES = 2000
+WINDOW_START = datetime(2026, 3, 1)
+WINDOW = ("202603010000", "202603012359")
+ROUNDS = 5
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    return generate_dataset(notices=SYNC_NOTICES, start=WINDOW_START, days=1)
+
+
+@pytest.fixture
+def scheduler():
+    from app.services.bid_sync_scheduler import BidDataSyncScheduler
+
+    async def no_wait(seconds, reason):
+        pass
+
+    with patch.object(BidDataSyncScheduler, "_throttle", staticmethod(no_wait)):
+        yield BidDataSyncScheduler()
+
+
+@pytest.fixture(scope="module")
+def partitions(run, bench_db):
+    from app.services.partition_manager import month_key, partition_manager
+
+    async def _ensure():
+        async with bench_db() as db:
+            month = month_key(WINDOW_START)
+            await partition_manager.ensure_range(db, month, month)
+
+    run(_ensure)
+    return bench_db
+
+
+def clear_window(run, bench_db):
+    async def _clear():
+        async with bench_db() as db:
+            for table in (
+                "bid_license_limits", "bid_prtcpt_psbl_rgns",
+                "bid_region_eligibility", "bid_notices",
+            ):
+                await db.execute(
+                    text(f"DELETE FROM {table} WHERE bid_ntce_no LIKE 'R26BK%'")
+                )
+            await db.commit()
+
+    run(_clear)
+
+
+@pytest.mark.parametrize(
+    "error_rate,throttle_rate",
+    [(0.0, 0.0), (0.05, 0.05)],
+    ids=["healthy", "degraded"],
+)
+def test_sync_window_cold(
+    benchmark, run, partitions, dataset, scheduler, error_rate, throttle_rate
+):
+    fake = FakeNaraJangter(
+        dataset,
+        latency_ms=BENCH_FAKE_LATENCY_MS,
+        error_rate=error_rate,
+        throttle_rate=throttle_rate,
+    )
+    with fake.install():
+        benchmark.pedantic(
+            run,
+            args=(scheduler.sync_window, *WINDOW),
+            setup=lambda: clear_window(run, partitions),
+            rounds=ROUNDS,
+            iterations=1,
+        )
+    benchmark.extra_info["requests"] = {
+        f"{op}:{outcome}": count for (op, outcome), count in fake.requests.items()
+    }
+
+
+def test_sync_window_resync(benchmark, run, partitions, dataset, scheduler):
+    fake = FakeNaraJangter(dataset, latency_ms=BENCH_FAKE_LATENCY_MS)
+    with fake.install():
+        run(scheduler.sync_window, *WINDOW)
+        benchmark.pedantic(
+            run,
+            args=(scheduler.sync_window, *WINDOW),
+            rounds=ROUNDS,
+            iterations=1,
+        )
@@ -0,0 +1,80 @@
+"""합성 데이터 COPY 적재 스모크 테스트 (scripts/generate_synthetic_data)
+
+공고/사용자 레코드 몇 건을 copy_records(asyncpg copy_records_to_table,
+binary)로 테이블마다 적재한 뒤 다시 읽어 컬럼 타입 인코딩을 확인합니다.
+기존 합성 데이터를 지우고 적재하지만 같은 트랜잭션에서 롤백하므로 DB는
+그대로입니다 (월 파티션 생성 제외).
+벤치마크가 아니므로 pytest-benchmark 없이도 실행됩니다.
+"""
+from datetime import timedelta
+
+from sqlalchemy import text
+
+from benchmarks.conftest import NOW
+from scripts.generate_synthetic_data import (
+    COLUMNS,
+    FieldProfile,
+    SyntheticDataGenerator,
+    copy_records,
+    delete_synthetic,
+)
+from app.services.partition_manager import add_months, month_key, partition_manager
+
+NOTICES = 20
+USERS = 3
+
+
+def test_copy_records_round_trip(run, bench_db):
+    start = NOW - timedelta(days=60)  # 개찰결과가 생기도록 지난 공고 포함
+    generator = SyntheticDataGenerator(
+        FieldProfile(), start, NOW, NOW, companies=100, seed=7
+    )
+    chunk = generator.notices(0, NOTICES)
+    users, preferences, bookmarks = generator.users(USERS, NOTICES, 2.0)
+    tables = {
+        "bid_notices": chunk.notices,
+        "bid_prtcpt_psbl_rgns": chunk.regions,
+        "bid_region_eligibility": chunk.eligibility,
+        "bid_license_limits": chunk.licenses,
+        "bid_basis_amounts": chunk.basis,
+        "bid_opening_results": chunk.results,
+        "users": users,
+        "user_preferences": preferences,
+        "user_bookmarks": bookmarks,
+    }
+
+    async def _round_trip():
+        async with bench_db() as db:
+            await partition_manager.ensure_range(
+                db, month_key(start), add_months(month_key(NOW), 1)
+            )
+            await db.commit()
+            try:
+                await delete_synthetic(db)
+                counts = {}
+                for table, records in tables.items():
+                    await copy_records(db, table, records)
+                    key = COLUMNS[table][0]
+                    counts[table] = (await db.execute(text(
+                        f"SELECT count(*) FROM {table} WHERE {key} = ANY(:keys)"
+                    ), {"keys": list({r[0] for r in records})})).scalar()
+                notices = (await db.execute(text(
+                    "SELECT bid_ntce_no, presmpt_prce, content_hash, "
+                    "data->>'bidNtceNo' FROM bid_notices "
+                    "WHERE bid_ntce_no = ANY(:nos) ORDER BY bid_ntce_no"
+                ), {"nos": [r[0] for r in chunk.notices]})).all()
+            finally:
+                await db.rollback()
+        return counts, notices
+
+    counts, notices = run(_round_trip)
+
+    for table, records in tables.items():
+        assert records, table
+        assert counts[table] == len(records), table
+    assert len(notices) == NOTICES
+    expected = sorted(chunk.notices)
+    for row, record in zip(notices, expected):
+        assert row[0] == record[0] == row[3]
+        assert row[1] == record[5]
+        assert row[2] == record[10]
@@ -0,0 +1,147 @@
+"""진행 중 공고 핫셋 vs SQL 검색 벤치마크
+
+bidClseExcpYn=Y 검색 형태별로 search_from_db를 SQL 경로와 핫셋 경로로 각각
+실행하여 응답 시간을 비교합니다.
+
+사용법:
+    # scripts/bench_search_queries.py로 시드된 벤치마크 DB 사용
+    BENCH_DATABASE_URL=postgresql+asyncpg://.../bench_db \\
+        python scripts/bench_open_bids.py --runs 20
+
+    # DB 없이 합성 공고로 핫셋 필터/정렬만 측정
+    python scripts/bench_open_bids.py --memory-only --rows 50000
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+# Add backend directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.schemas.bid import BidSearchParams
+from app.services.bid_data_service import bid_data_service
+from app.services.open_bid_hot_set import HotNotice, OpenBidHotSet, open_bid_hot_set
+from app.services.region_hierarchy import filter_match_codes
+from bench_search_queries import INDUSTRIES, REGIONS, build_shapes
+
+
+def open_shapes(now: datetime):
+    """bench_search_queries 형태에 진행 중 공고 조건을 붙인 목록"""
+    return [
+        (name, {**kwargs, "bidClseExcpYn": "Y"})
+        for name, kwargs in build_shapes(now)
+    ]
+
+
+def synthetic_notices(rows: int, now: datetime) -> dict:
+    rng = random.Random(42)
+    notices = {}
+    for i in range(rows):
+        rgst = now - timedelta(minutes=rng.randint(0, 60 * 24 * 30))
+        close = now + timedelta(hours=rng.randint(1, 24 * 20))
+        price = int(10 ** rng.uniform(7, 10))
+        region = REGIONS[i % len(REGIONS)]
+        industry = INDUSTRIES[i % len(INDUSTRIES)]
+        notices[(f"BENCH{i:010d}", "000")] = HotNotice(
+            rgst_dt=rgst.strftime("%Y%m%d%H%M"),
+            openg_at=close + timedelta(hours=1),
+            bid_close_at=close,
+            presmpt_prce=price,
+            bdgt_amt=None if i % 5 == 0 else int(price * 1.1),
+            cnstrtsite_rgn_nm=region.lower(),
+            region_codes=tuple(
+                filter_match_codes([region])[1:2] if i % 10 < 7 else ["00"]
+            ),
+            industries=(f"{industry}/0001\0{industry}".lower(),),
+        )
+    return notices
+
+
+def timed(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        began = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - began) * 1000)
+    return statistics.median(samples)
+
+
+def run_memory_only(args) -> None:
+    now = datetime.now(timezone.utc)
+    hot_set = OpenBidHotSet()
+    began = time.perf_counter()
+    hot_set.load(synthetic_notices(args.rows, now))
+    print(f"Built hot set of {args.rows} notices in {time.perf_counter() - began:.2f}s")
+
+    for name, kwargs in open_shapes(now):
+        params = BidSearchParams(numOfRows=100, pageNo=1, **kwargs)
+        codes = (
+            filter_match_codes(params.prtcptLmtRgnNm.split(","))
+            if params.prtcptLmtRgnNm else []
+        )
+        ms = timed(lambda: hot_set.search(params, codes), args.runs)
+        print(f"{name:32s} hot set {ms:8.3f}ms")
+
+
+async def run_database(args) -> None:
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    now = datetime.now()
+
+    async with session_factory() as db:
+        began = time.perf_counter()
+        await open_bid_hot_set.reload(db)
+        print(f"Loaded hot set in {time.perf_counter() - began:.2f}s")
+
+        for name, kwargs in open_shapes(now):
+            params = BidSearchParams(numOfRows=100, pageNo=1, **kwargs)
+            results = {}
+            for label, enabled in (("sql", False), ("hot set", True)):
+                settings.OPEN_BIDS_HOT_SET_ENABLED = enabled
+                samples = []
+                for _ in range(args.runs):
+                    began = time.perf_counter()
+                    response = await bid_data_service.search_from_db(db, params)
+                    samples.append((time.perf_counter() - began) * 1000)
+                results[label] = (statistics.median(samples), response.totalCount)
+            (sql_ms, sql_total), (hot_ms, hot_total) = results.values()
+            mismatch = "" if sql_total == hot_total else (
+                f"  (count mismatch: sql {sql_total}, hot set {hot_total})"
+            )
+            print(
+                f"{name:32s} sql {sql_ms:9.2f}ms  hot set {hot_ms:9.2f}ms  "
+                f"x{sql_ms / hot_ms:6.1f}{mismatch}"
+            )
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url", default=os.environ.get("BENCH_DATABASE_URL"),
+        help="벤치마크 전용 DB (기본: BENCH_DATABASE_URL)",
+    )
+    parser.add_argument("--memory-only", action="store_true")
+    parser.add_argument("--rows", type=int, default=50_000, help="--memory-only 공고 수")
+    parser.add_argument("--runs", type=int, default=20, help="형태별 반복 횟수 (중앙값)")
+    args = parser.parse_args()
+
+    if args.memory_only:
+        run_memory_only(args)
+        return
+    if not args.database_url:
+        parser.error("--database-url 또는 BENCH_DATABASE_URL이 필요합니다 (또는 --memory-only)")
+    asyncio.run(run_database(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""/bids/search 쿼리 형태별 EXPLAIN ANALYZE 벤치마크
+
+실제 search_from_db가 만드는 쿼리(build_search_queries)를 그대로 컴파일하여
+형태별로 EXPLAIN (ANALYZE, BUFFERS)를 실행하고 실행 시간/사용 인덱스를 기록합니다.
+
+사용법:
+    BENCH_DATABASE_URL=postgresql+asyncpg://.../bench_db \\
+        python scripts/bench_search_queries.py --rows 1000000 --output bench.json
+
+- 벤치마크 전용 DB에서만 실행하세요 (BENCH_DATABASE_URL 필수).
+- 합성 공고는 bid_ntce_no가 'BENCH'로 시작하며 재실행 시 삭제 후 다시 생성합니다.
+- --no-seed: 기존 데이터로 측정만 수행
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Add backend directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.schemas.bid import BidSearchParams
+from app.services.bid_data_service import bid_data_service
+from app.services.partition_manager import add_months, month_key, partition_manager
+from app.services.region_hierarchy import UNRESTRICTED, region_code
+
+SEED_DAYS = 730
+SEED_CHUNK = 100_000
+
+REGIONS = [
+    "서울특별시", "부산광역시", "대구광역시", "인천광역시", "광주광역시",
+    "대전광역시", "울산광역시", "세종특별자치시", "경기도", "강원특별자치도",
+    "충청북도", "충청남도", "전북특별자치도", "전라남도", "경상북도",
+    "경상남도", "제주특별자치도",
+]
+INDUSTRIES = [
+    "토목공사업", "건축공사업", "토목건축공사업", "전기공사업", "정보통신공사업",
+    "소방시설공사업", "조경공사업", "실내건축공사업", "철근콘크리트공사업",
+    "상하수도설비공사업",
+]
+
+
+def _sql_array(values) -> str:
+    return "ARRAY[" + ", ".join(f"'{v}'" for v in values) + "]"
+
+
+def build_shapes(now: datetime):
+    """측정할 /bids/search 쿼리 형태 목록 (이름, BidSearchParams 인자)"""
+    def rgst_range(days: int):
+        return {
+            "inqryBgnDt": (now - timedelta(days=days)).strftime("%Y%m%d0000"),
+            "inqryEndDt": now.strftime("%Y%m%d2359"),
+        }
+
+    month = rgst_range(30)
+    return [
+        ("div1_week", {**rgst_range(7)}),
+        ("div1_month", {**month}),
+        ("div1_quarter", {**rgst_range(90)}),
+        ("div1_month_open_only", {**month, "bidClseExcpYn": "Y"}),
+        ("div1_month_price_range", {
+            **month, "presmptPrceBgn": "100000000", "presmptPrceEnd": "1000000000",
+        }),
+        ("div1_month_region", {**month, "prtcptLmtRgnNm": "경기도"}),
+        ("div1_month_industry", {**month, "indstrytyNm": "전기공사업"}),
+        ("div1_month_combined", {
+            **month, "bidClseExcpYn": "Y", "prtcptLmtRgnNm": "경기도",
+            "indstrytyNm": "전기공사업", "presmptPrceBgn": "100000000",
+        }),
+        ("div1_month_sort_bdgt_desc", {**month, "orderBy": "bdgtAmt", "orderDir": "desc"}),
+        ("div1_month_sort_close_asc", {**month, "orderBy": "bidClseDt", "orderDir": "asc"}),
+        ("div1_month_sort_presmpt_desc", {
+            **month, "orderBy": "presmptPrce", "orderDir": "desc",
+        }),
+        ("div2_week", {
+            "inqryDiv": "2",
+            "inqryBgnDt": now.strftime("%Y%m%d0000"),
+            "inqryEndDt": (now + timedelta(days=7)).strftime("%Y%m%d2359"),
+        }),
+    ]
+
+
+async def seed(db: AsyncSession, rows: int, now: datetime) -> None:
+    start = now - timedelta(days=SEED_DAYS)
+    await partition_manager.ensure_range(
+        db, month_key(start), add_months(month_key(now), 1)
+    )
+
+    print("Removing previous BENCH rows...")
+    for table in (
+        "bid_license_limits", "bid_prtcpt_psbl_rgns", "bid_region_eligibility",
+        "bid_notices",
+    ):
+        await db.execute(text(f"DELETE FROM {table} WHERE bid_ntce_no LIKE 'BENCH%'"))
+    await db.commit()
+
+    # g번째 공고의 등록일시: [start, now] 구간에 균등 분포
+    ts = (
+        "(CAST(:start AS timestamp) "
+        "+ ((g - 1) * CAST(:span AS bigint) / CAST(:rows AS bigint)) "
+        "* interval '1 second')"
+    )
+    span = int((now - start).total_seconds())
+    for lo in range(1, rows + 1, SEED_CHUNK):
+        hi = min(lo + SEED_CHUNK - 1, rows)
+        await db.execute(
+            text(
+                f"""
+                INSERT INTO bid_notices (
+                    bid_ntce_no, bid_ntce_ord, rgst_dt, openg_at, bid_close_at,
+                    presmpt_prce, bdgt_amt, main_cnsty_nm, data, content_hash
+                )
+                SELECT
+                    no, '000', to_char(t, 'YYYYMMDDHH24MI'),
+                    (t + open_after) AT TIME ZONE 'Asia/Seoul',
+                    (t + open_after - interval '1 hour') AT TIME ZONE 'Asia/Seoul',
+                    price,
+                    CASE WHEN g % 5 = 0 THEN NULL ELSE (price * 1.1)::bigint END,
+                    ({_sql_array(INDUSTRIES)})[1 + g % {len(INDUSTRIES)}],
+                    jsonb_build_object(
+                        'bidNtceNo', no, 'bidNtceOrd', '000',
+                        'bidNtceNm', '벤치마크 공고 ' || g,
+                        'ntceInsttNm', '벤치마크기관'
+                    ),
+                    md5(no)
+                FROM (
+                    SELECT
+                        g,
+                        'BENCH' || lpad(g::text, 10, '0') AS no,
+                        {ts} AS t,
+                        (3 + random() * 20) * interval '1 day' AS open_after,
+                        (10 ^ (7 + random() * 3))::bigint AS price
+                    FROM generate_series(CAST(:lo AS bigint), CAST(:hi AS bigint)) AS g
+                ) s
+                """
+            ),
+            {"start": start, "span": span, "rows": rows, "lo": lo, "hi": hi},
+        )
+        await db.commit()
+        print(f"  notices {hi}/{rows}")
+
+    # 70%는 참가가능지역 1건, 나머지는 제한 없음
+    await db.execute(
+        text(
+            f"""
+            INSERT INTO bid_prtcpt_psbl_rgns (
+                bid_ntce_no, bid_ntce_ord, lmt_sno, rgst_month,
+                prtcpt_psbl_rgn_nm, rgst_dt
+            )
+            SELECT
+                bid_ntce_no, bid_ntce_ord, 1, left(rgst_dt, 6),
+                ({_sql_array(REGIONS)})[1 + substr(bid_ntce_no, 6)::bigint % {len(REGIONS)}],
+                rgst_dt
+            FROM bid_notices
+            WHERE bid_ntce_no LIKE 'BENCH%'
+              AND substr(bid_ntce_no, 6)::bigint % 10 < 7
+            """
+        )
+    )
+    # 지역코드 (시도 단위라 상위 지역 확장 없음)
+    codes = ", ".join(f"('{name}', '{region_code(name)}')" for name in REGIONS)
+    await db.execute(
+        text(
+            f"""
+            INSERT INTO bid_region_eligibility (
+                bid_ntce_no, bid_ntce_ord, region_code, rgst_month
+            )
+            SELECT n.bid_ntce_no, n.bid_ntce_ord, coalesce(c.code, '{UNRESTRICTED}'),
+                   left(n.rgst_dt, 6)
+            FROM bid_notices n
+            LEFT JOIN bid_prtcpt_psbl_rgns r
+              ON r.bid_ntce_no = n.bid_ntce_no AND r.bid_ntce_ord = n.bid_ntce_ord
+            LEFT JOIN (VALUES {codes}) AS c(name, code)
+              ON c.name = r.prtcpt_psbl_rgn_nm
+            WHERE n.bid_ntce_no LIKE 'BENCH%'
+            """
+        )
+    )
+    await db.execute(
+        text(
+            """
+            INSERT INTO bid_license_limits (
+                bid_ntce_no, bid_ntce_ord, lmt_grp_no, lmt_sno, rgst_month,
+                lcns_lmt_nm, permsn_indstryty_list, rgst_dt
+            )
+            SELECT
+                bid_ntce_no, bid_ntce_ord, '1', '1', left(rgst_dt, 6),
+                main_cnsty_nm || '/0001', main_cnsty_nm, rgst_dt
+            FROM bid_notices
+            WHERE bid_ntce_no LIKE 'BENCH%'
+            """
+        )
+    )
+    await db.commit()
+
+    for table in (
+        "bid_notices", "bid_prtcpt_psbl_rgns", "bid_region_eligibility",
+        "bid_license_limits",
+    ):
+        await db.execute(text(f"ANALYZE {table}"))
+    await db.commit()
+
+
+def _walk(plan: dict, indexes: set, nodes: set) -> None:
+    nodes.add(plan.get("Node Type"))
+    if plan.get("Index Name"):
+        indexes.add(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        _walk(child, indexes, nodes)
+
+
+async def explain(db: AsyncSession, query, runs: int) -> dict:
+    sql = str(
+        query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    # 리터럴 안의 ':'가 바인드 파라미터로 해석되지 않도록 이스케이프
+    sql = sql.replace(":", "\\:")
+    times = []
+    plan = None
+    for _ in range(runs):
+        result = await db.execute(
+            text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")
+        )
+        raw = result.scalar()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+        times.append(plan["Execution Time"])
+
+    indexes, nodes = set(), set()
+    _walk(plan["Plan"], indexes, nodes)
+    return {
+        "execution_ms": round(statistics.median(times), 3),
+        "planning_ms": round(plan["Planning Time"], 3),
+        "shared_hit": plan["Plan"].get("Shared Hit Blocks", 0),
+        "shared_read": plan["Plan"].get("Shared Read Blocks", 0),
+        "indexes": sorted(indexes),
+        "nodes": sorted(n for n in nodes if n),
+    }
+
+
+async def run(args) -> None:
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    now = datetime.now()
+
+    async with session_factory() as db:
+        if not args.no_seed:
+            began = time.perf_counter()
+            await seed(db, args.rows, now)
+            print(f"Seeded {args.rows} notices in {time.perf_counter() - began:.1f}s")
+
+        results = []
+        for name, kwargs in build_shapes(now):
+            params = BidSearchParams(numOfRows=100, pageNo=1, **kwargs)
+            count_query, page_query = await bid_data_service.build_search_queries(
+                db, params
+            )
+            entry = {
+                "shape": name,
+                "count": await explain(db, count_query, args.runs),
+                "page": await explain(db, page_query, args.runs),
+            }
+            results.append(entry)
+            print(
+                f"{name:32s} count {entry['count']['execution_ms']:9.2f}ms  "
+                f"page {entry['page']['execution_ms']:9.2f}ms  "
+                f"{', '.join(entry['page']['indexes']) or '-'}"
+            )
+
+    await engine.dispose()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"rows": args.rows, "runs": args.runs, "results": results},
+                f, ensure_ascii=False, indent=2,
+            )
+        print(f"Wrote {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url", default=os.environ.get("BENCH_DATABASE_URL"),
+        help="벤치마크 전용 DB (기본: BENCH_DATABASE_URL)",
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=3, help="형태별 반복 횟수 (중앙값)")
+    parser.add_argument("--no-seed", action="store_true")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("--database-url 또는 BENCH_DATABASE_URL이 필요합니다")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
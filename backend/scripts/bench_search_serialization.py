@@ -0,0 +1,96 @@
+"""검색 응답 직렬화 벤치마크
+
+DB 없이 합성 공고 data dict로 /bids/search 응답 생성 비용을 비교합니다.
+    - before: BidItem(**data) → BidApiResponse → FastAPI response_model 경로
+              (재검증 + jsonable_encoder + json.dumps)
+    - after:  BidItem 필드 순서 dict → SearchPage.to_json (orjson)
+
+사용법:
+    python scripts/bench_search_serialization.py --rows 100 --runs 200
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+# Add backend directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.encoders import jsonable_encoder
+
+from app.schemas.bid import BidApiResponse, BidItem
+from app.services.bid_data_service import ITEM_FIELDS, SearchPage
+
+
+def synthetic_rows(rows: int) -> list:
+    """API 원본처럼 BidItem에 없는 필드도 섞인 data dict"""
+    items = []
+    for i in range(rows):
+        data = {
+            field: f"{field}-{i}" for field in ITEM_FIELDS
+            if field not in ("prtcptPsblRgnNms", "permsnIndstrytyListNms",
+                             "indstrytyMfrcFldListNms")
+        }
+        data.update({f"extraField{j}": str(j) for j in range(20)})
+        items.append(data)
+    return items
+
+
+def before(rows: list) -> bytes:
+    items = [
+        BidItem(
+            **data, prtcptPsblRgnNms="경기도", permsnIndstrytyListNms="",
+            indstrytyMfrcFldListNms="",
+        )
+        for data in rows
+    ]
+    response = BidApiResponse(
+        items=items, totalCount=len(rows), numOfRows=len(rows), pageNo=1
+    )
+    # FastAPI serialize_response: response_model로 재검증 후 인코딩
+    validated = BidApiResponse.model_validate(response.model_dump())
+    return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+
+def after(rows: list) -> bytes:
+    page_rows = []
+    for data in rows:
+        row = {field: data.get(field) for field in ITEM_FIELDS}
+        row["prtcptPsblRgnNms"] = "경기도"
+        row["permsnIndstrytyListNms"] = ""
+        row["indstrytyMfrcFldListNms"] = ""
+        page_rows.append(row)
+    return SearchPage(
+        rows=page_rows, total_count=len(rows), num_of_rows=len(rows), page_no=1
+    ).to_json()
+
+
+def timed(fn, rows: list, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        began = time.perf_counter()
+        fn(rows)
+        samples.append(time.perf_counter() - began)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100, help="페이지당 공고 수")
+    parser.add_argument("--runs", type=int, default=200, help="반복 횟수 (중앙값)")
+    args = parser.parse_args()
+
+    rows = synthetic_rows(args.rows)
+    assert json.loads(before(rows)) == json.loads(after(rows))
+
+    before_s = timed(before, rows, args.runs)
+    after_s = timed(after, rows, args.runs)
+    print(f"before {before_s * 1000:8.3f}ms/page  {args.rows / before_s:12,.0f} rows/s")
+    print(f"after  {after_s * 1000:8.3f}ms/page  {args.rows / after_s:12,.0f} rows/s")
+    print(f"speedup x{before_s / after_s:.1f}")
+
+
+if __name__ == "__main__":
+    main()
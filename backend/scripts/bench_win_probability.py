@@ -0,0 +1,99 @@
+"""낙찰 확률 몬테카를로 벤치마크
+
+DB 없이 합성 경쟁사 분포로 simulate_lower_limits + win_probability_curve의
+실행 시간을 측정합니다 (목표: 10만 회 < 100ms, 단일 코어).
+
+사용법:
+    python scripts/bench_win_probability.py --simulations 100000 --runs 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add backend directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from app.services.win_probability import (
+    CompetitorModel,
+    WinProbabilityService,
+    simulate_lower_limits,
+    win_probability_curve,
+)
+
+BASIS_AMOUNT = 1_000_000_000
+A_VALUE = 23_000_000
+LOWER_LIMIT_RATE = 87.745
+
+
+def synthetic_model(bids: int, notices: int, rng: np.random.Generator) -> CompetitorModel:
+    """낙찰하한 부근에 몰린 투찰 비율 + 로그정규 업체 수 분포"""
+    ratios = np.sort(np.concatenate([
+        rng.normal(0.880, 0.006, int(bids * 0.8)),
+        rng.uniform(0.85, 1.0, bids - int(bids * 0.8)),
+    ]))
+    quantiles = WinProbabilityService.QUANTILES
+    if len(ratios) > quantiles:
+        ratios = np.quantile(ratios, (np.arange(quantiles) + 0.5) / quantiles)
+    counts, frequency = np.unique(
+        np.maximum(rng.lognormal(5, 1, notices).astype(np.int64), 1),
+        return_counts=True,
+    )
+    return CompetitorModel(
+        ratios=ratios,
+        bidder_counts=counts,
+        bidder_weights=frequency / frequency.sum(),
+        notices=notices,
+        bids=bids,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--simulations", type=int, default=100_000)
+    parser.add_argument("--points", type=int, default=60, help="후보 투찰가 수")
+    parser.add_argument("--bids", type=int, default=50_000, help="합성 경쟁사 투찰 수")
+    parser.add_argument("--notices", type=int, default=300, help="합성 과거 공고 수")
+    parser.add_argument("--runs", type=int, default=20, help="반복 횟수 (중앙값)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    model = synthetic_model(args.bids, args.notices, rng)
+    print(
+        f"model: {len(model.ratios)} ratio steps, "
+        f"{len(model.bidder_counts)} distinct bidder counts "
+        f"(max {model.bidder_counts.max()})"
+    )
+
+    draw_ms, curve_ms = [], []
+    for _ in range(args.runs):
+        began = time.perf_counter()
+        lower_limits = simulate_lower_limits(
+            BASIS_AMOUNT, A_VALUE, LOWER_LIMIT_RATE, -3.0, 3.0,
+            args.simulations, rng,
+        )
+        drawn = time.perf_counter()
+        prices = np.ceil(np.linspace(
+            lower_limits.min(), lower_limits.max() * 1.01, args.points
+        ))
+        curve = win_probability_curve(lower_limits, prices, BASIS_AMOUNT, model)
+        finished = time.perf_counter()
+        draw_ms.append((drawn - began) * 1000)
+        curve_ms.append((finished - drawn) * 1000)
+
+    draw, evaluate = statistics.median(draw_ms), statistics.median(curve_ms)
+    best = int(np.argmax(curve))
+    print(f"draws  {draw:8.2f}ms")
+    print(f"curve  {evaluate:8.2f}ms")
+    print(f"total  {draw + evaluate:8.2f}ms  ({args.simulations:,} simulations)")
+    print(
+        f"best price {int(prices[best]):,} "
+        f"({prices[best] / BASIS_AMOUNT * 100:.3f}%) p={curve[best]:.4f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
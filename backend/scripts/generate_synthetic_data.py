@@ -0,0 +1,700 @@
+"""운영 규모 합성 데이터 생성기 (COPY 적재)
+
+입찰공고(bid_notices) + 참가가능지역/지역코드/면허제한 + 기초금액 + 개찰결과와
+사용자/기본 검색조건/북마크를 원하는 규모로 생성하여 COPY로 적재합니다.
+부하 테스트, 인덱스 실험용 — 벤치마크 전용 DB에서만 실행하세요.
+
+필드 분포는 기본값(FieldProfile)을 쓰거나, 실제 데이터가 있는 DB에서 추출해
+씁니다 (공종/업종/지역/계약방법/낙찰하한율/기관 빈도, 추정가격·투찰 업체 수
+로그 분포, 낙찰하한율 대비 투찰률 분포).
+
+사용법:
+    # 실제 DB에서 분포 추출 → 파일 저장
+    python scripts/generate_synthetic_data.py --profile-from "$DATABASE_URL" \\
+        --save-profile profile.json --notices 0
+
+    # 100만 건 + 사용자 1만 명 적재
+    BENCH_DATABASE_URL=postgresql+asyncpg://.../bench_db \\
+        python scripts/generate_synthetic_data.py --profile profile.json \\
+        --notices 1000000 --users 10000
+
+    # 합성 데이터 삭제 (공고번호 SYN*, 사용자 syn_user_*)
+    BENCH_DATABASE_URL=... python scripts/generate_synthetic_data.py --clean --notices 0
+
+합성 사용자의 비밀번호는 모두 SYNTHETIC_PASSWORD입니다 (부하 테스트 로그인용).
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Sequence, Tuple
+
+# Add backend directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import orjson
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.security import get_password_hash
+from app.schemas.bid import BidItem
+from app.services.bid_data_service import compute_content_hash
+from app.services.partition_manager import add_months, month_key, partition_manager
+from app.services.region_hierarchy import eligibility_codes
+
+KST = timezone(timedelta(hours=9))
+NOTICE_PREFIX = "SYN"
+USERNAME_PREFIX = "syn_user_"
+SYNTHETIC_PASSWORD = "synthetic-password"
+CHUNK_SIZE = 50_000
+USERS_STREAM = 2 ** 32 - 1  # 사용자 난수 스트림 (공고 청크 시작 번호와 겹치지 않게)
+
+# 요일(월~일)/시간대별 공고 등록 비중 — 평일 업무시간에 몰림
+WEEKDAY_WEIGHTS = (1.0, 1.0, 1.0, 1.0, 0.95, 0.06, 0.03)
+HOUR_WEIGHTS = (
+    0.2, 0.1, 0.1, 0.1, 0.1, 0.2, 0.4, 1.0, 3.0, 6.0, 8.0, 8.0,
+    4.0, 6.0, 8.0, 8.0, 7.0, 5.0, 2.0, 1.0, 0.6, 0.4, 0.3, 0.2,
+)
+
+NOTICE_TABLES = (
+    "bid_license_limits", "bid_prtcpt_psbl_rgns", "bid_region_eligibility",
+    "bid_basis_amounts", "bid_opening_results", "bid_notices",
+)
+USER_TABLES = ("user_bookmarks", "user_preferences", "users")
+
+
+@dataclass
+class FieldProfile:
+    """합성 데이터 필드 분포 (범주형은 값 → 가중치)"""
+
+    cnstwk_rate: float = 0.55  # 공사(주공종 있음) 비율, 나머지는 용역
+    cnstwk_industries: Dict[str, float] = field(default_factory=lambda: {
+        "토목공사업": 14, "건축공사업": 10, "토목건축공사업": 9, "전기공사업": 16,
+        "정보통신공사업": 9, "소방시설공사업": 5, "조경공사업": 4,
+        "조경식재공사업": 2, "실내건축공사업": 8, "철근콘크리트공사업": 5,
+        "상하수도설비공사업": 4, "포장공사업": 4, "기계설비공사업": 5,
+        "금속창호지붕건축물조립공사업": 3, "도장습식방수석공사업": 2,
+    })
+    servc_industries: Dict[str, float] = field(default_factory=lambda: {
+        "엔지니어링사업": 20, "소프트웨어사업자": 18, "건설기술용역업": 15,
+        "측량업": 6, "폐기물수집운반업": 8, "건축사사무소": 10,
+        "시설물유지관리업": 7, "경비업": 5, "학술연구용역": 6, "기타자유업": 5,
+    })
+    regions: Dict[str, float] = field(default_factory=lambda: {
+        "경기도": 20, "서울특별시": 9, "경상북도": 8, "전라남도": 8,
+        "경상남도": 8, "충청남도": 7, "강원특별자치도": 6, "전북특별자치도": 6,
+        "충청북도": 5, "부산광역시": 4, "인천광역시": 4, "대구광역시": 3,
+        "광주광역시": 2, "대전광역시": 2, "울산광역시": 2, "제주특별자치도": 2,
+        "세종특별자치시": 1, "경기도 성남시": 1, "경기도 수원시": 1,
+        "경기도 화성시": 1, "경상북도 포항시": 1, "전라남도 여수시": 1,
+    })
+    unrestricted_rate: float = 0.3  # 참가가능지역 없음 (전국)
+    region_counts: Dict[str, float] = field(
+        default_factory=lambda: {"1": 82, "2": 12, "3": 6}
+    )
+    license_counts: Dict[str, float] = field(
+        default_factory=lambda: {"1": 78, "2": 17, "3": 5}
+    )
+    mfrc_rate: float = 0.15  # 주력분야 평가 대상 비율
+    contract_methods: Dict[str, float] = field(default_factory=lambda: {
+        "제한경쟁": 62, "일반경쟁": 24, "지명경쟁": 2, "수의계약": 12,
+    })
+    lower_limit_rates: Dict[str, float] = field(default_factory=lambda: {
+        "87.745": 46, "86.745": 14, "89.745": 6, "88.745": 4,
+        "84.245": 8, "80.495": 6, "60": 4, "": 12,
+    })
+    institutions: Dict[str, float] = field(default_factory=lambda: {
+        "조달청": 30, "한국토지주택공사": 8, "한국도로공사": 5,
+        "경기도 화성시": 4, "서울특별시 교육청": 4, "한국전력공사": 4,
+        "경상북도 포항시": 3, "전라남도 여수시": 3, "국방부": 3,
+        "한국수자원공사": 3, "부산광역시 교육청": 2, "강원특별자치도 원주시": 2,
+    })
+    price_log10_mean: float = 8.1  # 추정가격 log10 (약 1.3억)
+    price_log10_std: float = 0.6
+    bdgt_missing_rate: float = 0.2
+    opened_rate: float = 0.85  # 개찰일이 지난 공고 중 개찰결과가 있는 비율
+    basis_rate: float = 0.8    # 기초금액 공개 비율
+    bidders_log_mean: float = 4.3  # 투찰 업체 수 ln (약 75곳)
+    bidders_log_std: float = 0.9
+    bid_rate_offset_mean: float = 0.35  # 투찰률 - 낙찰하한율 (%p)
+    bid_rate_offset_std: float = 0.9
+
+    @classmethod
+    def load(cls, path: str) -> "FieldProfile":
+        with open(path, encoding="utf-8") as f:
+            return cls(**json.load(f))
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    async def from_database(cls, db: AsyncSession) -> "FieldProfile":
+        """기존 DB의 실제 데이터에서 분포를 추출합니다 (표본이 없는 항목은 기본값)."""
+        profile = cls()
+
+        async def counts(sql: str, limit: int = 300) -> Dict[str, float]:
+            rows = (await db.execute(text(f"{sql} LIMIT {limit}"))).all()
+            return {str(value): float(n) for value, n in rows if value is not None}
+
+        def group(expr: str, source: str = "bid_notices", where: str = "") -> str:
+            return (
+                f"SELECT {expr}, count(*) FROM {source} {where} "
+                f"GROUP BY 1 ORDER BY 2 DESC"
+            )
+
+        totals = (await db.execute(text(
+            "SELECT count(*), count(*) FILTER (WHERE data->>'mainCnsttyNm' <> '') "
+            "FROM bid_notices"
+        ))).one()
+        if not totals[0]:
+            return profile
+        profile.cnstwk_rate = totals[1] / totals[0]
+
+        found = {
+            "cnstwk_industries": await counts(group(
+                "data->>'mainCnsttyNm'", where="WHERE data->>'mainCnsttyNm' <> ''"
+            )),
+            "servc_industries": await counts(group(
+                "l.permsn_indstryty_list",
+                "bid_license_limits l JOIN bid_notices n USING (bid_ntce_no, bid_ntce_ord)",
+                "WHERE coalesce(n.data->>'mainCnsttyNm', '') = '' "
+                "AND l.permsn_indstryty_list <> ''",
+            )),
+            "regions": await counts(group(
+                "prtcpt_psbl_rgn_nm", "bid_prtcpt_psbl_rgns",
+                "WHERE prtcpt_psbl_rgn_nm NOT IN ('', '전체')",
+            )),
+            "region_counts": await counts(group(
+                "n", "(SELECT count(*) AS n FROM bid_prtcpt_psbl_rgns "
+                "GROUP BY bid_ntce_no, bid_ntce_ord) s",
+            ), 10),
+            "license_counts": await counts(group(
+                "n", "(SELECT count(*) AS n FROM bid_license_limits "
+                "GROUP BY bid_ntce_no, bid_ntce_ord) s",
+            ), 10),
+            "contract_methods": await counts(group("data->>'cntrctCnclsMthdNm'"), 20),
+            "lower_limit_rates": await counts(
+                group("coalesce(data->>'sucsfbidLwltRate', '')"), 30
+            ),
+            "institutions": await counts(group("data->>'ntceInsttNm'")),
+        }
+        for name, value in found.items():
+            if value:
+                setattr(profile, name, value)
+
+        restricted = (await db.execute(text(
+            "SELECT count(DISTINCT (bid_ntce_no, bid_ntce_ord)) FROM bid_prtcpt_psbl_rgns"
+        ))).scalar()
+        profile.unrestricted_rate = max(0.0, 1 - restricted / totals[0])
+
+        price = (await db.execute(text(
+            "SELECT avg(log(presmpt_prce)), stddev(log(presmpt_prce)), "
+            "avg((bdgt_amt IS NULL)::int) FROM bid_notices WHERE presmpt_prce > 0"
+        ))).one()
+        if price[0] is not None:
+            profile.price_log10_mean = float(price[0])
+            profile.price_log10_std = float(price[1] or profile.price_log10_std)
+            profile.bdgt_missing_rate = float(price[2])
+
+        bidders = (await db.execute(text(
+            "SELECT avg(ln(jsonb_array_length(data))), "
+            "stddev(ln(jsonb_array_length(data))) "
+            "FROM bid_opening_results WHERE jsonb_array_length(data) > 0"
+        ))).one()
+        if bidders[0] is not None:
+            profile.bidders_log_mean = float(bidders[0])
+            profile.bidders_log_std = float(bidders[1] or profile.bidders_log_std)
+
+        offset = (await db.execute(text(
+            """
+            SELECT avg(r.rate - n.lwlt), stddev(r.rate - n.lwlt)
+            FROM (
+                SELECT o.bid_ntce_no, (e->>'bidprcrt')::float AS rate
+                FROM bid_opening_results o, jsonb_array_elements(o.data) e
+                WHERE e->>'bidprcrt' ~ '^[0-9]+(\\.[0-9]+)?$'
+            ) r
+            JOIN (
+                SELECT DISTINCT ON (bid_ntce_no)
+                    bid_ntce_no, (data->>'sucsfbidLwltRate')::float AS lwlt
+                FROM bid_notices
+                WHERE data->>'sucsfbidLwltRate' ~ '^[0-9]+(\\.[0-9]+)?$'
+            ) n USING (bid_ntce_no)
+            WHERE abs(r.rate - n.lwlt) < 10
+            """
+        ))).one()
+        if offset[0] is not None:
+            profile.bid_rate_offset_mean = float(offset[0])
+            profile.bid_rate_offset_std = float(offset[1] or profile.bid_rate_offset_std)
+        return profile
+
+
+class Categorical:
+    """값 → 가중치 사전에서 numpy로 한꺼번에 뽑는 샘플러."""
+
+    def __init__(self, weights: Dict[str, float]):
+        self.values = np.array(list(weights.keys()), dtype=object)
+        p = np.array(list(weights.values()), dtype=np.float64)
+        self.p = p / p.sum()
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return self.values[rng.choice(len(self.values), size=size, p=self.p)]
+
+
+def _kst(ts: datetime) -> str:
+    return ts.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _json(value) -> str:
+    return orjson.dumps(value).decode()
+
+
+@dataclass
+class NoticeChunk:
+    """COPY 대상 테이블별 레코드 (컬럼 순서는 COLUMNS 참고)"""
+
+    notices: List[tuple] = field(default_factory=list)
+    regions: List[tuple] = field(default_factory=list)
+    eligibility: List[tuple] = field(default_factory=list)
+    licenses: List[tuple] = field(default_factory=list)
+    basis: List[tuple] = field(default_factory=list)
+    results: List[tuple] = field(default_factory=list)
+
+
+COLUMNS = {
+    "bid_notices": (
+        "bid_ntce_no", "bid_ntce_ord", "rgst_dt", "openg_at", "bid_close_at",
+        "presmpt_prce", "bdgt_amt", "asign_bdgt_amt", "main_cnsty_nm", "data",
+        "content_hash",
+    ),
+    "bid_prtcpt_psbl_rgns": (
+        "bid_ntce_no", "bid_ntce_ord", "lmt_sno", "rgst_month",
+        "prtcpt_psbl_rgn_nm", "rgst_dt", "bsns_div_nm",
+    ),
+    "bid_region_eligibility": (
+        "bid_ntce_no", "bid_ntce_ord", "region_code", "rgst_month",
+    ),
+    "bid_license_limits": (
+        "bid_ntce_no", "bid_ntce_ord", "lmt_grp_no", "lmt_sno", "rgst_month",
+        "lcns_lmt_nm", "permsn_indstryty_list", "bsns_div_nm", "rgst_dt",
+        "indstryty_mfrc_fld_list",
+    ),
+    "bid_basis_amounts": ("bid_ntce_no", "bid_ntce_ord", "bid_type", "data"),
+    "bid_opening_results": ("bid_ntce_no", "data"),
+    "users": (
+        "user_id", "username", "email", "password_hash", "business_number",
+        "company_name", "representative_name",
+    ),
+    "user_preferences": (
+        "preference_id", "user_id", "search_conditions",
+        "email_notifications_enabled", "notification_frequency",
+    ),
+    "user_bookmarks": (
+        "bookmark_id", "user_id", "bid_notice_no", "bid_notice_name",
+        "bid_notice_ord", "status", "bid_price",
+    ),
+}
+
+
+class SyntheticDataGenerator:
+    """FieldProfile 분포를 따르는 공고/사용자 레코드 생성기
+
+    공고 g(0부터)의 번호는 SYN + 10자리이며 같은 seed면 같은 데이터가
+    나옵니다. 개찰결과 투찰 업체는 companies곳 중에서 Zipf 분포로 뽑으므로
+    자주 투찰하는 업체가 생겨 경쟁사 통계가 운영 데이터와 비슷한 모양이 됩니다.
+    """
+
+    def __init__(
+        self,
+        profile: FieldProfile,
+        start: datetime,
+        end: datetime,
+        now: datetime,
+        companies: int = 30_000,
+        seed: int = 0,
+    ):
+        self.profile = profile
+        self.start = start
+        self.end = end
+        self.now = now
+        self.seed = seed
+        self._cnstwk = Categorical(profile.cnstwk_industries)
+        self._servc = Categorical(profile.servc_industries)
+        self._regions = Categorical(profile.regions)
+        self._region_counts = Categorical(profile.region_counts)
+        self._license_counts = Categorical(profile.license_counts)
+        self._methods = Categorical(profile.contract_methods)
+        self._lower_limits = Categorical(profile.lower_limit_rates)
+        self._institutions = Categorical(profile.institutions)
+
+        days = (end.date() - start.date()).days + 1
+        self._days = np.array(
+            [start.date() + timedelta(days=d) for d in range(days)], dtype=object
+        )
+        day_p = np.array([WEEKDAY_WEIGHTS[d.weekday()] for d in self._days])
+        self._day_p = day_p / day_p.sum()
+        hour_p = np.array(HOUR_WEIGHTS)
+        self._hour_p = hour_p / hour_p.sum()
+
+        rng = np.random.default_rng(seed)
+        self.biznos = np.array(
+            [f"{n:010d}" for n in rng.choice(9 * 10 ** 9, companies, replace=False)
+             + 10 ** 9],
+            dtype=object,
+        )
+        zipf = 1.0 / np.arange(1, companies + 1) ** 0.9
+        self._company_cdf = np.cumsum(zipf) / zipf.sum()
+        self._company_cdf[-1] = 1.0
+
+    @staticmethod
+    def notice_no(g: int) -> str:
+        return f"{NOTICE_PREFIX}{g:010d}"
+
+    def notices(self, lo: int, hi: int) -> NoticeChunk:
+        """공고 [lo, hi) 범위의 레코드를 생성합니다."""
+        p = self.profile
+        rng = np.random.default_rng([self.seed, lo])
+        n = hi - lo
+        chunk = NoticeChunk()
+
+        days = self._days[rng.choice(len(self._days), n, p=self._day_p)]
+        hours = rng.choice(24, n, p=self._hour_p)
+        minutes = rng.integers(0, 60, n)
+        is_cnstwk = rng.random(n) < p.cnstwk_rate
+        industries = np.where(
+            is_cnstwk, self._cnstwk.sample(rng, n), self._servc.sample(rng, n)
+        )
+        prices = np.round(
+            10 ** np.clip(rng.normal(p.price_log10_mean, p.price_log10_std, n), 6, 11.5),
+            -3,
+        ).astype(np.int64)
+        no_bdgt = rng.random(n) < p.bdgt_missing_rate
+        open_after = rng.integers(3, 22, n)
+        open_hour = rng.choice((10, 11, 14, 15), n)
+        methods = self._methods.sample(rng, n)
+        lower_limits = self._lower_limits.sample(rng, n)
+        institutions = self._institutions.sample(rng, n)
+        restricted = rng.random(n) >= p.unrestricted_rate
+        region_counts = self._region_counts.sample(rng, n).astype(int)
+        license_counts = self._license_counts.sample(rng, n).astype(int)
+        mfrc = rng.random(n) < p.mfrc_rate
+        has_basis = rng.random(n) < p.basis_rate
+        opened = rng.random(n) < p.opened_rate
+        assessment = rng.normal(100.0, 1.2, n)  # 사정율 (%)
+
+        for i in range(n):
+            g = lo + i
+            no = self.notice_no(g)
+            rgst = datetime(
+                days[i].year, days[i].month, days[i].day, int(hours[i]), int(minutes[i])
+            )
+            openg = datetime.combine(
+                rgst.date() + timedelta(days=int(open_after[i])),
+                datetime.min.time(),
+            ).replace(hour=int(open_hour[i]))
+            close = openg - timedelta(hours=1)
+            rgst_dt = rgst.strftime("%Y%m%d%H%M")
+            month = rgst_dt[:6]
+            price = int(prices[i])
+            bdgt = None if no_bdgt[i] else int(price * 1.1)
+            industry = industries[i]
+            kind = "cnstwk" if is_cnstwk[i] else "servc"
+            div_nm = "공사" if is_cnstwk[i] else "용역"
+
+            item = BidItem(
+                bidNtceNo=no,
+                bidNtceOrd="000",
+                bidNtceNm=f"{institutions[i]} {industry} 합성공고 {g}",
+                ntceInsttNm=institutions[i],
+                dminsttNm=institutions[i],
+                bidMethdNm="전자입찰",
+                mainCnsttyNm=industry if is_cnstwk[i] else None,
+                cntrctCnclsMthdNm=methods[i],
+                bidBeginDt=_kst(rgst + timedelta(days=1)),
+                bidClseDt=_kst(close),
+                opengDt=_kst(openg),
+                bdgtAmt=None if bdgt is None else str(bdgt),
+                presmptPrce=str(price),
+                sucsfbidLwltRate=lower_limits[i] or None,
+                sucsfbidMthdNm="적격심사" if lower_limits[i] else "최저가",
+                rgstDt=_kst(rgst),
+                bidNtceDtlUrl=(
+                    "https://www.g2b.go.kr/link/PNPE027_01/single/"
+                    f"?bidPbancNo={no}&bidPbancOrd=000"
+                ),
+                indstrytyLmtYn="Y",
+                indstrytyMfrcFldEvlYn="Y" if mfrc[i] else "N",
+            )
+            chunk.notices.append((
+                no, "000", rgst_dt,
+                openg.replace(tzinfo=KST), close.replace(tzinfo=KST),
+                price, bdgt, None, item.mainCnsttyNm,
+                _json(item.model_dump()), compute_content_hash(item),
+            ))
+
+            names = []
+            if restricted[i]:
+                names = list(dict.fromkeys(
+                    self._regions.sample(rng, int(region_counts[i]))
+                ))
+                for sno, name in enumerate(names, start=1):
+                    chunk.regions.append(
+                        (no, "000", sno, month, name, _kst(rgst), div_nm)
+                    )
+            for code in eligibility_codes(names):
+                chunk.eligibility.append((no, "000", code, month))
+
+            licenses = [industry] + list(
+                (self._cnstwk if is_cnstwk[i] else self._servc).sample(
+                    rng, int(license_counts[i]) - 1
+                )
+            )
+            for grp, name in enumerate(dict.fromkeys(licenses), start=1):
+                chunk.licenses.append((
+                    no, "000", str(grp), "1", month, f"{name}/{grp:04d}",
+                    name, div_nm, _kst(rgst), name if mfrc[i] else None,
+                ))
+
+            basis_amount = int(price * 1.1) // 1000 * 1000
+            if has_basis[i]:
+                chunk.basis.append((no, "000", kind, _json({
+                    "bidNtceNo": no,
+                    "bidNtceOrd": "000",
+                    "bssamt": str(basis_amount),
+                    "rsrvtnPrceRngBgnRate": "-2",
+                    "rsrvtnPrceRngEndRate": "+2",
+                    "bssamtOpenDt": _kst(close - timedelta(days=2)),
+                })))
+
+            if opened[i] and openg < self.now and lower_limits[i]:
+                planned = basis_amount * assessment[i] / 100
+                chunk.results.append((
+                    no, _json(self._opening_results(rng, planned, float(lower_limits[i]))),
+                ))
+        return chunk
+
+    def _opening_results(
+        self, rng: np.random.Generator, planned: float, lower_limit: float
+    ) -> List[dict]:
+        """개찰결과 — 낙찰하한율 이상은 하한에 가까운 순으로 순위, 미만은 미달(순위 없음)."""
+        p = self.profile
+        bidders = int(np.clip(
+            rng.lognormal(p.bidders_log_mean, p.bidders_log_std), 1, 3000
+        ))
+        # 복원추출 후 중복 제거 (비복원 + 가중치 추출은 업체 풀 크기만큼 느림)
+        biznos = np.unique(
+            np.searchsorted(self._company_cdf, rng.random(bidders), side="right")
+        )
+        rng.shuffle(biznos)
+        rates = lower_limit + rng.normal(
+            p.bid_rate_offset_mean, p.bid_rate_offset_std, len(biznos)
+        )
+        qualified = rates >= lower_limit
+        rank_of = np.full(len(biznos), 0)
+        order = np.where(qualified)[0][np.argsort(rates[qualified])]
+        rank_of[order] = np.arange(1, len(order) + 1)
+        results = []
+        for idx in np.argsort(-qualified.astype(int) * 10_000 + rank_of):
+            bizno = self.biznos[biznos[idx]]
+            results.append({
+                "opengRank": str(rank_of[idx]) if rank_of[idx] else "",
+                "prcbdrBizno": bizno,
+                "prcbdrNm": f"합성건설{bizno}",
+                "bidprcAmt": str(int(planned * rates[idx] / 100)),
+                "bidprcrt": f"{rates[idx]:.3f}",
+            })
+        return results
+
+    def users(
+        self, count: int, notices: int, bookmarks_per_user: float
+    ) -> Tuple[List[tuple], List[tuple], List[tuple]]:
+        """(users, user_preferences, user_bookmarks) 레코드"""
+        rng = np.random.default_rng([self.seed, USERS_STREAM])
+        password_hash = get_password_hash(SYNTHETIC_PASSWORD)
+        users, preferences, bookmarks = [], [], []
+        frequencies = np.array(["realtime", "daily", "weekly"], dtype=object)
+        for i in range(count):
+            user_id = uuid.UUID(int=int(rng.integers(0, 2 ** 63)) << 64 | i)
+            bizno = self.biznos[int(np.searchsorted(self._company_cdf, rng.random(), side="right"))]
+            users.append((
+                user_id, f"{USERNAME_PREFIX}{i}", f"{USERNAME_PREFIX}{i}@example.com",
+                password_hash, bizno, f"합성건설{bizno}", "홍길동",
+            ))
+
+            if rng.random() < 0.6:
+                conditions = {
+                    "inqryDiv": "1",
+                    "regions": list(dict.fromkeys(
+                        self._regions.sample(rng, int(rng.integers(0, 3)))
+                    )),
+                    "industries": list(dict.fromkeys(
+                        self._cnstwk.sample(rng, int(rng.integers(0, 3)))
+                    )),
+                    "bidClseExcpYn": "Y" if rng.random() < 0.7 else "N",
+                }
+                if rng.random() < 0.4:
+                    conditions["presmptPrceBgn"] = "100000000"
+                    conditions["presmptPrceEnd"] = "1000000000"
+                preferences.append((
+                    uuid.UUID(int=user_id.int ^ 1), user_id, _json(conditions),
+                    bool(rng.random() < 0.5),
+                    str(frequencies[rng.choice(3, p=(0.1, 0.7, 0.2))]),
+                ))
+
+            if not notices:
+                continue
+            # 최근 공고 위주로 북마크
+            picks = notices - 1 - np.unique(np.minimum(
+                rng.exponential(notices * 0.05, rng.poisson(bookmarks_per_user)),
+                notices - 1,
+            ).astype(np.int64))
+            for g in picks:
+                completed = rng.random() < 0.4
+                bookmarks.append((
+                    uuid.UUID(int=user_id.int ^ (int(g) + 2)), user_id,
+                    self.notice_no(int(g)), f"합성공고 {int(g)}", "000",
+                    "bid_completed" if completed else "interested",
+                    int(rng.integers(10 ** 7, 10 ** 9)) if completed else None,
+                ))
+        return users, preferences, bookmarks
+
+
+async def copy_records(db: AsyncSession, table: str, records: Sequence[tuple]) -> None:
+    """asyncpg COPY (binary)로 적재합니다 (파티션 테이블은 부모로 COPY)."""
+    if not records:
+        return
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table, records=records, columns=list(COLUMNS[table])
+    )
+
+
+async def delete_synthetic(db: AsyncSession) -> None:
+    """합성 공고(SYN*)/사용자(syn_user_*)를 삭제합니다 (커밋하지 않음)."""
+    for table in NOTICE_TABLES:
+        await db.execute(text(
+            f"DELETE FROM {table} WHERE bid_ntce_no LIKE '{NOTICE_PREFIX}%'"
+        ))
+    user_ids = f"SELECT user_id FROM users WHERE username LIKE '{USERNAME_PREFIX}%'"
+    await db.execute(text(f"DELETE FROM user_bookmarks WHERE user_id IN ({user_ids})"))
+    await db.execute(text(f"DELETE FROM user_preferences WHERE user_id IN ({user_ids})"))
+    await db.execute(text(f"DELETE FROM users WHERE username LIKE '{USERNAME_PREFIX}%'"))
+
+
+async def clean(db: AsyncSession) -> None:
+    print("Removing synthetic rows...")
+    await delete_synthetic(db)
+    await db.commit()
+
+
+async def load_notices(
+    db: AsyncSession, generator: SyntheticDataGenerator, count: int
+) -> None:
+    began = time.perf_counter()
+    for lo in range(0, count, CHUNK_SIZE):
+        hi = min(lo + CHUNK_SIZE, count)
+        chunk = generator.notices(lo, hi)
+        for table, records in (
+            ("bid_notices", chunk.notices),
+            ("bid_prtcpt_psbl_rgns", chunk.regions),
+            ("bid_region_eligibility", chunk.eligibility),
+            ("bid_license_limits", chunk.licenses),
+            ("bid_basis_amounts", chunk.basis),
+            ("bid_opening_results", chunk.results),
+        ):
+            await copy_records(db, table, records)
+        await db.commit()
+        rate = hi / (time.perf_counter() - began)
+        print(f"  notices {hi}/{count} ({rate:,.0f}/s)")
+
+
+async def run(args) -> None:
+    now = datetime.now()
+
+    if args.profile_from:
+        source = create_async_engine(args.profile_from)
+        async with async_sessionmaker(source)() as db:
+            profile = await FieldProfile.from_database(db)
+        await source.dispose()
+    elif args.profile:
+        profile = FieldProfile.load(args.profile)
+    else:
+        profile = FieldProfile()
+    if args.save_profile:
+        profile.save(args.save_profile)
+        print(f"Wrote {args.save_profile}")
+
+    if not (args.notices or args.users or args.clean):
+        return
+
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    start = now - timedelta(days=args.days)
+    generator = SyntheticDataGenerator(
+        profile, start, now, now, companies=args.companies, seed=args.seed
+    )
+
+    async with session_factory() as db:
+        if args.clean:
+            await clean(db)
+
+        if args.notices:
+            await partition_manager.ensure_range(
+                db, month_key(start), add_months(month_key(now), 1)
+            )
+            print(f"Loading {args.notices} notices ({start:%Y-%m-%d} ~ {now:%Y-%m-%d})...")
+            await load_notices(db, generator, args.notices)
+
+        if args.users:
+            users, preferences, bookmarks = generator.users(
+                args.users, args.notices, args.bookmarks
+            )
+            await copy_records(db, "users", users)
+            await copy_records(db, "user_preferences", preferences)
+            await copy_records(db, "user_bookmarks", bookmarks)
+            await db.commit()
+            print(
+                f"Loaded {len(users)} users, {len(preferences)} preferences, "
+                f"{len(bookmarks)} bookmarks"
+            )
+
+        if args.notices or args.users:
+            for table in (*NOTICE_TABLES, *USER_TABLES):
+                await db.execute(text(f"ANALYZE {table}"))
+            await db.commit()
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url", default=os.environ.get("BENCH_DATABASE_URL"),
+        help="적재 대상 DB (기본: BENCH_DATABASE_URL)",
+    )
+    parser.add_argument("--notices", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=730, help="등록일시 분포 기간")
+    parser.add_argument("--users", type=int, default=0)
+    parser.add_argument("--bookmarks", type=float, default=8.0, help="사용자당 평균 북마크 수")
+    parser.add_argument("--companies", type=int, default=30_000, help="투찰 업체 풀 크기")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profile", help="FieldProfile JSON 파일")
+    parser.add_argument("--profile-from", help="분포를 추출할 DB URL")
+    parser.add_argument("--save-profile", help="사용한 분포를 JSON으로 저장")
+    parser.add_argument("--clean", action="store_true", help="기존 합성 데이터 삭제 후 적재")
+    args = parser.parse_args()
+
+    if not args.database_url and (args.notices or args.users or args.clean):
+        parser.error("--database-url 또는 BENCH_DATABASE_URL이 필요합니다")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
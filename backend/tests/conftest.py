@@ -1,8 +1,21 @@
+import json
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 
+from app.services.upstream_resilience import upstream_guard
+
+
+@pytest.fixture(autouse=True)
+def reset_upstream_guard():
+    """서킷 상태가 테스트 간에 이어지지 않게 하고 재시도 백오프는 기다리지 않습니다."""
+    upstream_guard.reset()
+    with patch.object(upstream_guard, "_sleep", AsyncMock()) as sleep:
+        yield sleep
+    upstream_guard.reset()
+
 
 def make_mock_response(
     json_data: dict | None = None,
@@ -10,6 +23,7 @@ def make_mock_response(
     text: str = "",
     raise_for_status_error: httpx.HTTPStatusError | None = None,
     json_raises: bool = False,
+    headers: dict | None = None,
 ) -> MagicMock:
     """httpx.Response mock factory.
 
@@ -19,10 +33,16 @@ def make_mock_response(
         text: response.text
         raise_for_status_error: if set, raise_for_status() raises this
         json_raises: if True, response.json() raises ValueError
+        headers: response.headers (예: Retry-After)
     """
     mock_response = MagicMock()
     mock_response.status_code = status_code
     mock_response.text = text or str(json_data)
+    mock_response.headers = httpx.Headers(headers or {})
+    mock_response.content = (
+        text.encode() if json_raises or json_data is None
+        else json.dumps(json_data).encode()
+    )
 
     if json_raises:
         mock_response.json.side_effect = ValueError("Invalid JSON")
@@ -0,0 +1,319 @@
+"""나라장터 API 대역 (테스트/벤치마크용)
+
+녹화한 JSON 응답이나 합성 데이터를 실제 API와 같은 envelope로 페이지 단위
+재생하는 ASGI 앱입니다. 응답 지연, 오류(503), 호출 제한(429, Retry-After),
+일일 한도 초과(HTTP 200 + resultCode 22) 비율을 설정할 수 있습니다.
+
+오퍼레이션은 URL 마지막 경로(예: getBidPblancListInfoPrtcptPsblRgn)로 구분하므로
+NaraJangterService의 URL을 바꾸지 않고 transport만 교체해 붙일 수 있습니다:
+
+    fake = FakeNaraJangter(generate_dataset(notices=2000), latency_ms=50)
+    with fake.install():
+        await narajangter_service.search_bids("contract", params)
+
+단독 서버로 띄우기 (curl/프론트엔드 수동 확인용):
+    python -m tests.fakes.narajangter --port 8001 --notices 5000 \\
+        --latency-ms 200 --throttle-rate 0.05
+    curl 'localhost:8001/1230000/ad/BidPublicInfoService/getBidPblancListInfoCnstwkPPSSrch?inqryDiv=1&inqryBgnDt=202603010000&inqryEndDt=202603012359&pageNo=1&numOfRows=10'
+
+녹화 데이터는 디렉터리에 <오퍼레이션>.json으로 둡니다. 파일 내용은 item 목록,
+API 응답 한 페이지, 또는 응답 페이지 목록 중 하나입니다 (load_fixtures).
+"""
+import argparse
+import asyncio
+import json
+import random
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from unittest.mock import patch
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Route
+
+from app.services.bid_data_service import normalize_date_str
+
+CNSTWK_NOTICES = "getBidPblancListInfoCnstwkPPSSrch"
+SERVC_NOTICES = "getBidPblancListInfoServcPPSSrch"
+CNSTWK_BSSAMT = "getBidPblancListInfoCnstwkBsisAmount"
+SERVC_BSSAMT = "getBidPblancListInfoServcBsisAmount"
+PRTCPT_PSBL_RGN = "getBidPblancListInfoPrtcptPsblRgn"
+LICENSE_LIMIT = "getBidPblancListInfoLicenseLimit"
+OPENG_RESULT = "getOpengResultListInfoOpengCompt"
+
+QUOTA_EXCEEDED_CODE = "22"
+QUOTA_EXCEEDED_MSG = "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR"
+
+REGIONS = [
+    "서울특별시", "부산광역시", "경기도", "경기도 성남시", "경기도 수원시",
+    "강원특별자치도", "충청남도", "전라남도", "경상북도", "경상남도",
+]
+INDUSTRIES = [
+    "토목공사업", "건축공사업", "토목건축공사업", "전기공사업", "정보통신공사업",
+    "소방시설공사업", "조경공사업", "실내건축공사업",
+]
+
+
+def envelope(
+    items: list,
+    total_count: int,
+    page_no: int,
+    num_of_rows: int,
+    result_code: str = "00",
+    result_msg: str = "NORMAL SERVICE.",
+) -> dict:
+    """나라장터 API 공통 응답 형식"""
+    return {
+        "response": {
+            "header": {"resultCode": result_code, "resultMsg": result_msg},
+            "body": {
+                "items": items,
+                "totalCount": total_count,
+                "numOfRows": num_of_rows,
+                "pageNo": page_no,
+            },
+        }
+    }
+
+
+def generate_dataset(
+    notices: int = 1000,
+    start: Optional[datetime] = None,
+    days: int = 7,
+    bidders: int = 30,
+    seed: int = 0,
+) -> Dict[str, List[dict]]:
+    """합성 공고/참가가능지역/면허제한/개찰결과 (오퍼레이션 → item 목록)
+
+    공고 등록일시는 [start, start + days) 구간에 균등 분포하고 공사/용역을
+    번갈아 배정합니다. 개찰결과는 앞쪽 1/4 공고에만 bidders명씩 생성합니다.
+    """
+    rng = random.Random(seed)
+    start = start or datetime(2026, 3, 1)
+    span = days * 24 * 60
+    data: Dict[str, List[dict]] = {
+        CNSTWK_NOTICES: [], SERVC_NOTICES: [], PRTCPT_PSBL_RGN: [],
+        LICENSE_LIMIT: [], OPENG_RESULT: [],
+    }
+    for i in range(notices):
+        no = f"R26BK{i:08d}"
+        rgst = start + timedelta(minutes=i * span // max(notices, 1))
+        openg = rgst + timedelta(days=rng.randint(3, 20))
+        price = int(10 ** rng.uniform(7, 10))
+        industry = INDUSTRIES[i % len(INDUSTRIES)]
+        rgst_dt = rgst.strftime("%Y-%m-%d %H:%M:%S")
+        data[CNSTWK_NOTICES if i % 2 == 0 else SERVC_NOTICES].append({
+            "bidNtceNo": no,
+            "bidNtceOrd": "000",
+            "bidNtceNm": f"합성 공고 {i}",
+            "ntceInsttNm": "합성기관",
+            "dminsttNm": "합성수요기관",
+            "mainCnsttyNm": industry,
+            "cntrctCnclsMthdNm": "제한경쟁",
+            "sucsfbidMthdNm": "적격심사",
+            "sucsfbidLwltRate": "87.745",
+            "bidBeginDt": rgst_dt,
+            "bidClseDt": (openg - timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S"),
+            "opengDt": openg.strftime("%Y-%m-%d %H:%M:%S"),
+            "presmptPrce": str(price),
+            "bdgtAmt": str(int(price * 1.1)),
+            "rgstDt": rgst_dt,
+        })
+        # 70%는 참가가능지역 1건, 나머지는 제한 없음
+        if rng.random() < 0.7:
+            data[PRTCPT_PSBL_RGN].append({
+                "bidNtceNo": no,
+                "bidNtceOrd": "000",
+                "lmtSno": 1,
+                "prtcptPsblRgnNm": rng.choice(REGIONS),
+                "rgstDt": rgst_dt,
+            })
+        data[LICENSE_LIMIT].append({
+            "bidNtceNo": no,
+            "bidNtceOrd": "000",
+            "lmtGrpNo": "1",
+            "lmtSno": "1",
+            "lcnsLmtNm": f"{industry}/0001",
+            "permsnIndstrytyList": industry,
+            "rgstDt": rgst_dt,
+        })
+        if i < notices // 4:
+            rates = sorted(
+                (rng.gauss(88.0, 0.6) for _ in range(bidders)), reverse=True
+            )
+            for rank, rate in enumerate(rates, start=1):
+                data[OPENG_RESULT].append({
+                    "bidNtceNo": no,
+                    "bidNtceOrd": "000",
+                    "opengRank": str(rank) if rate >= 87.745 else "",
+                    "prcbdrBizno": f"{rng.randrange(10 ** 9, 10 ** 10)}",
+                    "prcbdrNm": f"합성업체{rank}",
+                    "bidprcAmt": str(int(price * rate / 100)),
+                    "bidprcrt": f"{rate:.3f}",
+                })
+    return data
+
+
+def _items_of(payload) -> List[dict]:
+    """녹화 파일 내용 → item 목록 (item 목록 / 응답 페이지 / 페이지 목록)"""
+    if isinstance(payload, dict):
+        payload = [payload]
+    items: List[dict] = []
+    for entry in payload:
+        if "response" not in entry:
+            items.append(entry)
+            continue
+        page = (entry["response"].get("body") or {}).get("items") or []
+        items.extend([page] if isinstance(page, dict) else page)
+    return items
+
+
+def load_fixtures(directory) -> Dict[str, List[dict]]:
+    """<오퍼레이션>.json 파일들을 읽어 오퍼레이션 → item 목록으로 합칩니다."""
+    return {
+        path.stem: _items_of(json.loads(path.read_text(encoding="utf-8")))
+        for path in sorted(Path(directory).glob("*.json"))
+    }
+
+
+class FakeNaraJangter:
+    """설정 가능한 지연/오류율을 가진 나라장터 API 대역
+
+    요청마다 latency_ms ± jitter_ms 만큼 기다린 뒤, 각 비율에 따라 503 /
+    429 / 한도 초과 응답을 돌려주고 나머지는 정상 페이지를 돌려줍니다.
+    seed가 같으면 같은 순서의 요청에 같은 응답이 나옵니다.
+    """
+
+    def __init__(
+        self,
+        dataset: Optional[Dict[str, List[dict]]] = None,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        quota_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int = 0,
+    ):
+        self.dataset = dataset if dataset is not None else {}
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.quota_rate = quota_rate
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        # (오퍼레이션, 결과) 별 요청 수 — 결과: ok / error / throttled / quota
+        self.requests: Counter = Counter()
+        self.app = Starlette(routes=[
+            Route("/{path:path}", self._handle, methods=["GET"]),
+        ])
+
+    async def _handle(self, request: Request):
+        operation = request.path_params["path"].rstrip("/").rsplit("/", 1)[-1]
+        delay = self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        roll = self._rng.random()
+        if roll < self.error_rate:
+            self.requests[operation, "error"] += 1
+            return PlainTextResponse("Service Unavailable", status_code=503)
+        roll -= self.error_rate
+        if roll < self.throttle_rate:
+            self.requests[operation, "throttled"] += 1
+            return PlainTextResponse(
+                "API rate limit exceeded",
+                status_code=429,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        roll -= self.throttle_rate
+        if roll < self.quota_rate:
+            self.requests[operation, "quota"] += 1
+            return JSONResponse(
+                envelope([], 0, 1, 0, QUOTA_EXCEEDED_CODE, QUOTA_EXCEEDED_MSG)
+            )
+
+        params = request.query_params
+        page_no = int(params.get("pageNo") or 1)
+        num_of_rows = int(params.get("numOfRows") or 10)
+        matched = self._select(operation, params)
+        offset = (page_no - 1) * num_of_rows
+        self.requests[operation, "ok"] += 1
+        return JSONResponse(envelope(
+            matched[offset:offset + num_of_rows], len(matched), page_no, num_of_rows
+        ))
+
+    def _select(self, operation: str, params) -> List[dict]:
+        """공고번호 또는 등록일시 구간(inqryDiv=1)으로 item을 거릅니다."""
+        items = self.dataset.get(operation, [])
+        bid_no = params.get("bidNtceNo")
+        if bid_no:
+            return [item for item in items if item.get("bidNtceNo") == bid_no]
+        bgn, end = params.get("inqryBgnDt"), params.get("inqryEndDt")
+        if params.get("inqryDiv", "1") == "1" and bgn and end:
+            return [
+                item for item in items
+                if bgn <= normalize_date_str(item.get("rgstDt")) <= end
+            ]
+        return list(items)
+
+    def transport(self) -> httpx.ASGITransport:
+        return httpx.ASGITransport(app=self.app)
+
+    @contextmanager
+    def install(self, service=None) -> Iterator["FakeNaraJangter"]:
+        """NaraJangterService의 HTTP 클라이언트를 이 대역으로 교체합니다."""
+        if service is None:
+            from app.services.narajangter import narajangter_service as service
+
+        def client() -> httpx.AsyncClient:
+            return httpx.AsyncClient(
+                transport=self.transport(),
+                timeout=service.DEFAULT_TIMEOUT_SECONDS,
+            )
+
+        with patch.object(service, "_client", client):
+            yield self
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--fixtures", help="녹화 응답 디렉터리 (없으면 합성 데이터)")
+    parser.add_argument("--notices", type=int, default=1000, help="합성 공고 수")
+    parser.add_argument("--days", type=int, default=7, help="합성 공고 등록 기간")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--quota-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    dataset = (
+        load_fixtures(args.fixtures) if args.fixtures
+        else generate_dataset(args.notices, days=args.days, seed=args.seed)
+    )
+    fake = FakeNaraJangter(
+        dataset,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        quota_rate=args.quota_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(fake.app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models.bid import AssessmentRateStat
+from app.services.assessment_rate_stats import (
+    AssessmentRateStats,
+    bucket_stats,
+    extract_rates,
+)
+from app.services.bid_price_engine import RATE_TABLE
+
+FETCHED = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def bids(*pairs) -> list:
+    return [{"bidprcAmt": str(amount), "bidprcrt": str(rate)} for amount, rate in pairs]
+
+
+def stat(bucket, count, p50) -> AssessmentRateStat:
+    return AssessmentRateStat(
+        region_scope=bucket[0], license_group=bucket[1], amount_range=bucket[2],
+        sample_count=count, mean=p50, std=0.1,
+        p10=p50, p25=p50, p50=p50, p75=p50, p90=p50,
+    )
+
+
+# ---------------------------------------------------------------------------
+# extract_rates
+# ---------------------------------------------------------------------------
+
+class TestExtractRates:
+    def test_median_planned_price_over_basis(self):
+        # 예정가격 1억 100만 → 기초금액 1억 대비 100.1%
+        results = [
+            bids((88_000_000, 87.9121), (90_000_000, 89.9101), (1, 0), (95_000_000, 94.9051)),
+            None,
+        ]
+
+        rates, bidders = extract_rates(results, np.array([100_000_000, 1.0]))
+
+        assert rates[0] == pytest.approx(100.1, abs=1e-3)
+        assert np.isnan(rates[1])
+        assert bidders.tolist() == [3, 0]
+
+    def test_out_of_bounds_and_missing_basis_are_nan(self):
+        results = [bids((50_000_000, 99)), bids((100_000_000, 100))]
+
+        rates, _ = extract_rates(results, np.array([100_000_000, np.nan]))
+
+        assert np.isnan(rates).all()
+
+
+# ---------------------------------------------------------------------------
+# bucket_stats / build_rate_table
+# ---------------------------------------------------------------------------
+
+class TestBucketStats:
+    def test_percentiles_per_bucket(self):
+        a = ("province", "general", "over3")
+        b = ("city", "general", "under1")
+        buckets = [a, b, a, a, b]
+        rates = np.array([100.0, 99.0, 102.0, 101.0, 99.5])
+
+        stats = bucket_stats(buckets, rates)
+
+        assert stats[a]["sample_count"] == 3
+        assert stats[a]["p50"] == 101.0
+        assert stats[a]["mean"] == pytest.approx(101.0)
+        assert stats[b]["p10"] == pytest.approx(99.05)
+        assert bucket_stats([], np.array([])) == {}
+
+    def test_rate_table_uses_learned_median_with_enough_samples(self):
+        table = AssessmentRateStats.build_rate_table([
+            stat(("province", "general", "over3"), 30, 100.5),
+            stat(("city", "landscaping", "under1"), 29, 98.0),
+        ])
+
+        assert table[0, 0, 2] == 100.5
+        assert table[1, 1, 0] == RATE_TABLE[1, 1, 0]
+        assert RATE_TABLE[0, 0, 2] == 100.140
+
+
+# ---------------------------------------------------------------------------
+# refresh
+# ---------------------------------------------------------------------------
+
+def result(rows=None, **attrs):
+    mock = MagicMock()
+    mock.all.return_value = rows or []
+    for name, value in attrs.items():
+        setattr(mock, name, value)
+    return mock
+
+
+class TestRefresh:
+    @pytest.mark.asyncio
+    async def test_saves_samples_and_recomputes_touched_buckets(self):
+        candidates = result([
+            ("A", bids((90_000_000, 89.9101)), FETCHED, None, None, None),
+            # 기초금액 없음 → rate NULL 표본, 이전 버킷은 재집계 대상
+            ("B", bids((90_000_000, 90)), FETCHED, "city", "general", "under1"),
+        ])
+        notices = result([("A", {"mainCnsttyNm": "토목"}), ("B", {})])
+        basis = result([("A", "cnstwk", {"bssamt": "100000000"})])
+        regions = result([("A", "경기도")])
+        licenses = result([])
+        recompute = result([("province", "general", "from1to3", 100.1)])
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            candidates, notices, basis, regions, licenses,
+            MagicMock(),  # 표본 upsert
+            recompute,
+            MagicMock(),  # 빈 버킷 삭제
+            MagicMock(),  # 통계 upsert
+        ])
+        db.commit = AsyncMock()
+
+        assert await AssessmentRateStats().refresh(db) == 1
+
+        sample_sql = db.execute.await_args_list[5].args[0]
+        values = sample_sql.compile().params
+        assert values["amount_range_m0"] == "from1to3"
+        assert values["rate_m0"] == pytest.approx(100.1, abs=1e-3)
+        assert values["rate_m1"] is None
+        delete_sql = str(db.execute.await_args_list[7].args[0])
+        assert "DELETE FROM assessment_rate_stats" in delete_sql
+        stats_sql = str(db.execute.await_args_list[8].args[0])
+        assert "ON CONFLICT (region_scope, license_group, amount_range)" in stats_sql
+
+    @pytest.mark.asyncio
+    async def test_nothing_new(self):
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result([]))
+        db.commit = AsyncMock()
+
+        assert await AssessmentRateStats().refresh(db) == 0
+        db.execute.assert_awaited_once()
+        sql = str(db.execute.await_args.args[0])
+        assert "LEFT OUTER JOIN assessment_rate_samples" in sql
+        assert "greatest(" in sql
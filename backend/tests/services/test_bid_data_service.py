@@ -0,0 +1,645 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+
+from app.schemas.bid import BidItem, BidSearchParams, DaySyncStatus, PrtcptPsblRgnItem
+from app.services.bid_data_service import (
+    BidDataService,
+    NoticeUpsertResult,
+    SearchPage,
+    KST,
+    compute_content_hash,
+    diff_notice_data,
+    format_kst,
+    normalize_date_str,
+    parse_amount,
+    parse_kst_datetime,
+    parse_price,
+)
+from app.services.sync_coverage import SyncCoverageIndex
+
+
+def make_item(**overrides) -> BidItem:
+    data = {
+        "bidNtceNo": "R26BK00000001",
+        "bidNtceOrd": "000",
+        "bidNtceNm": "테스트 공사",
+        "ntceInsttNm": "조달청",
+        "rgstDt": "2026-02-11 13:05:00",
+        "presmptPrce": "100000000",
+    }
+    data.update(overrides)
+    return BidItem(**data)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class TestHelpers:
+    def test_normalize_date_str(self):
+        assert normalize_date_str("2026-02-11 13:05:00") == "202602111305"
+        assert normalize_date_str("20260211") == "202602110000"
+        assert normalize_date_str(None) == ""
+
+    def test_parse_price(self):
+        assert parse_price("1000.7") == 1000
+        assert parse_price("abc") == 0
+        assert parse_price(None) == 0
+
+    def test_parse_kst_datetime(self):
+        assert parse_kst_datetime("2026-02-11 13:05:00") == datetime(
+            2026, 2, 11, 13, 5, tzinfo=KST
+        )
+        assert parse_kst_datetime("") is None
+        assert parse_kst_datetime("2026-02-30 10:00") is None
+
+    def test_format_kst(self):
+        utc = datetime(2026, 2, 11, 4, 5, tzinfo=timezone.utc)
+        assert format_kst(utc) == "202602111305"
+        assert format_kst(None) is None
+
+    def test_parse_amount(self):
+        assert parse_amount("1500000000") == 1500000000
+        assert parse_amount("") is None
+        assert parse_amount(None) is None
+        assert parse_amount("n/a") is None
+
+
+# ---------------------------------------------------------------------------
+# compute_content_hash
+# ---------------------------------------------------------------------------
+
+class TestContentHash:
+    def test_same_content_same_hash(self):
+        assert compute_content_hash(make_item()) == compute_content_hash(make_item())
+
+    def test_changed_field_changes_hash(self):
+        assert compute_content_hash(make_item()) != compute_content_hash(
+            make_item(presmptPrce="200000000")
+        )
+
+    def test_search_only_fields_ignored(self):
+        assert compute_content_hash(make_item()) == compute_content_hash(
+            make_item(prtcptPsblRgnNms="경기도")
+        )
+
+
+# ---------------------------------------------------------------------------
+# diff_notice_data
+# ---------------------------------------------------------------------------
+
+class TestDiffNoticeData:
+    def test_only_changed_fields(self):
+        old = {"bidClseDt": "2026-02-20 10:00", "bdgtAmt": "100", "x": "same"}
+        new = {"bidClseDt": "2026-02-27 10:00", "bdgtAmt": "100", "x": "same"}
+        assert diff_notice_data(old, new) == {
+            "bidClseDt": ["2026-02-20 10:00", "2026-02-27 10:00"],
+        }
+
+    def test_added_and_removed_fields(self):
+        assert diff_notice_data({"a": "1"}, {"b": "2"}) == {
+            "a": ["1", None],
+            "b": [None, "2"],
+        }
+
+    def test_search_only_fields_ignored(self):
+        assert diff_notice_data(
+            {"prtcptPsblRgnNms": "서울"}, {"prtcptPsblRgnNms": "경기"}
+        ) == {}
+
+
+# ---------------------------------------------------------------------------
+# save_bid_notices
+# ---------------------------------------------------------------------------
+
+class TestSaveBidNotices:
+    @pytest.mark.asyncio
+    async def test_counts_inserted_updated_unchanged(self):
+        db = MagicMock()
+        db.commit = AsyncMock()
+        execute_result = MagicMock()
+        # RETURNING은 실제 쓰인 row만 반환 (xmax = 0 → 신규)
+        execute_result.scalars.return_value.all.return_value = [True, False]
+        db.execute = AsyncMock(return_value=execute_result)
+
+        items = [
+            make_item(bidNtceNo="A"),
+            make_item(bidNtceNo="B"),
+            make_item(bidNtceNo="C"),
+        ]
+        result = await BidDataService().save_bid_notices(db, items)
+
+        assert result == NoticeUpsertResult(inserted=1, updated=1, unchanged=1)
+        assert result.total == 3
+        # 기존 해시 조회 1회 + upsert 1회 + 지역코드 placeholder 1회 (변경 이력 없음)
+        assert db.execute.await_count == 3
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_keys_collapsed(self):
+        db = MagicMock()
+        db.commit = AsyncMock()
+        execute_result = MagicMock()
+        execute_result.scalars.return_value.all.return_value = []
+        db.execute = AsyncMock(return_value=execute_result)
+
+        items = [make_item(), make_item(presmptPrce="1")]
+        result = await BidDataService().save_bid_notices(db, items)
+
+        assert result.unchanged == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_notice_records_revision(self):
+        old_item = make_item(presmptPrce="100")
+        new_item = make_item(presmptPrce="200")
+
+        hashes = MagicMock()
+        hashes.all.return_value = [
+            ("R26BK00000001", "000", "202602111305", "stale"),
+        ]
+        base = MagicMock()
+        base.all.return_value = [
+            ("R26BK00000001", "000", old_item.model_dump()),
+        ]
+        written = MagicMock()
+        written.scalars.return_value.all.return_value = [False]
+
+        db = MagicMock()
+        db.commit = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[hashes, base, MagicMock(), written, MagicMock()]
+        )
+
+        result = await BidDataService().save_bid_notices(db, [new_item])
+
+        assert result.updated == 1
+        revision_stmt = db.execute.await_args_list[2].args[0]
+        params = revision_stmt.compile().params
+        assert params["revision_type_m0"] == "update"
+        assert params["changes_m0"] == {"presmptPrce": ["100", "200"]}
+
+    @pytest.mark.asyncio
+    async def test_new_order_records_reissue(self):
+        hashes = MagicMock()
+        hashes.all.return_value = [
+            ("R26BK00000001", "000", "202602111305", "h"),
+        ]
+        base = MagicMock()
+        base.all.return_value = [
+            ("R26BK00000001", "000", make_item().model_dump()),
+        ]
+        written = MagicMock()
+        written.scalars.return_value.all.return_value = [True]
+
+        db = MagicMock()
+        db.commit = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[hashes, base, MagicMock(), written, MagicMock()]
+        )
+
+        await BidDataService().save_bid_notices(
+            db, [make_item(bidNtceOrd="001")]
+        )
+
+        params = db.execute.await_args_list[2].args[0].compile().params
+        assert params["revision_type_m0"] == "reissue"
+        assert params["prev_ord_m0"] == "000"
+        assert params["changes_m0"] == {"bidNtceOrd": ["000", "001"]}
+
+    @pytest.mark.asyncio
+    async def test_changed_rgst_dt_moves_partition(self):
+        hashes = MagicMock()
+        hashes.all.return_value = [
+            ("R26BK00000001", "000", "202601311305", "stale"),
+        ]
+        base = MagicMock()
+        base.all.return_value = [
+            (
+                "R26BK00000001",
+                "000",
+                make_item(rgstDt="2026-01-31 13:05").model_dump(),
+            ),
+        ]
+        written = MagicMock()
+        written.scalars.return_value.all.return_value = [True]
+
+        db = MagicMock()
+        db.commit = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[hashes, base, MagicMock(), MagicMock(), written, MagicMock()]
+        )
+
+        result = await BidDataService().save_bid_notices(db, [make_item()])
+
+        # 기존 파티션 row 삭제 후 재삽입 → 갱신으로 집계
+        delete_stmt = db.execute.await_args_list[3].args[0]
+        assert delete_stmt.compile().params["param_1"] == [
+            ("R26BK00000001", "000", "202601311305"),
+        ]
+        assert result == NoticeUpsertResult(inserted=0, updated=1, unchanged=0)
+
+
+# ---------------------------------------------------------------------------
+# save_prtcpt_psbl_rgns
+# ---------------------------------------------------------------------------
+
+class TestSaveRegionEligibility:
+    @pytest.mark.asyncio
+    async def test_expands_codes_and_drops_placeholder(self):
+        db = MagicMock()
+        db.commit = AsyncMock()
+        db.execute = AsyncMock()
+        regions = [
+            PrtcptPsblRgnItem(
+                bidNtceNo="A", bidNtceOrd="000", lmtSno=1,
+                prtcptPsblRgnNm="경기도 성남시", rgstDt="2026-02-11 13:05:00",
+            ),
+        ]
+
+        await BidDataService().save_prtcpt_psbl_rgns(db, regions)
+
+        eligibility = db.execute.await_args_list[1].args[0].compile().params
+        assert sorted(
+            v for k, v in eligibility.items() if k.startswith("region_code")
+        ) == ["41/성남시", ">41"]
+        assert eligibility["rgst_month_m0"] == "202602"
+        placeholder = db.execute.await_args_list[2].args[0].compile().params
+        assert "00" in placeholder.values()
+
+    @pytest.mark.asyncio
+    async def test_unrestricted_notice_keeps_placeholder(self):
+        db = MagicMock()
+        db.commit = AsyncMock()
+        db.execute = AsyncMock()
+        regions = [
+            PrtcptPsblRgnItem(
+                bidNtceNo="A", bidNtceOrd="000", lmtSno=1,
+                prtcptPsblRgnNm="전체", rgstDt="2026-02-11 13:05:00",
+            ),
+        ]
+
+        await BidDataService().save_prtcpt_psbl_rgns(db, regions)
+
+        # 지역 row 1회 + 지역코드 1회 (placeholder 삭제 없음)
+        assert db.execute.await_count == 2
+
+
+# ---------------------------------------------------------------------------
+# get_range_sync_status
+# ---------------------------------------------------------------------------
+
+class TestRangeSyncStatus:
+    @pytest.fixture
+    def coverage(self):
+        coverage = SyncCoverageIndex()
+        coverage.load([])
+        coverage.ensure_loaded = AsyncMock()
+        with patch("app.services.bid_data_service.sync_coverage", coverage):
+            yield coverage
+
+    @pytest.mark.asyncio
+    async def test_combines_coverage_and_jobs(self, coverage):
+        coverage.record("202602100000", "202602102359")
+        coverage.record("202602110000", "202602110059")  # 시간별은 일별 완료 아님
+        jobs = MagicMock()
+        jobs.all.return_value = [
+            ("202602110000", "running"),
+            ("202602120000", "done"),
+            ("202602130000", "failed"),
+        ]
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=jobs)
+
+        result = await BidDataService().get_range_sync_status(
+            db, "20260210", "20260214"
+        )
+
+        # 동기화 기록은 SQL로 읽지 않고 작업 상태만 조회 (미동기화 날짜만)
+        db.execute.assert_awaited_once()
+        params = db.execute.await_args.args[0].compile().params
+        assert "202602100000" not in params.values()
+
+        assert [(d.date, d.status) for d in result] == [
+            ("20260210", "synced"),
+            ("20260211", "running"),
+            ("20260212", "missing"),
+            ("20260213", "failed"),
+            ("20260214", "missing"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_today_and_later_are_live(self, coverage):
+        today = datetime.now(KST)
+        days = [(today + timedelta(days=n)).strftime("%Y%m%d") for n in (-1, 0, 1)]
+        empty = MagicMock()
+        empty.all.return_value = []
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=empty)
+
+        result = await BidDataService().get_range_sync_status(db, days[0], days[-1])
+
+        assert [d.status for d in result] == ["missing", "live", "live"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_range(self, coverage):
+        db = MagicMock()
+        db.execute = AsyncMock()
+        assert await BidDataService().get_range_sync_status(db, "x", "y") == []
+        db.execute.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# Hourly-to-daily compaction
+# ---------------------------------------------------------------------------
+
+class TestCompactHourlyWindows:
+    def _rows(self, hours):
+        rows = []
+        for h in hours:
+            row = MagicMock()
+            row.sync_timestamp = f"20260211{h:02d}00"
+            row.total_notices = h
+            row.total_regions = 1
+            row.total_license_limits = 0
+            row.notices_inserted = 1
+            row.notices_updated = 0
+            row.notices_unchanged = 0
+            row.synced_at = datetime(2026, 2, 12, 1, h, tzinfo=timezone.utc)
+            rows.append(row)
+        return rows
+
+    @pytest.mark.asyncio
+    async def test_merges_24_hours_into_daily_row(self):
+        selected = MagicMock()
+        selected.scalars.return_value.all.return_value = self._rows(range(24))
+        db = MagicMock()
+        db.commit = AsyncMock()
+        db.execute = AsyncMock(side_effect=[selected, MagicMock(), MagicMock()])
+
+        with patch("app.services.bid_data_service.sync_coverage") as coverage:
+            assert await BidDataService().compact_hourly_windows(db, "20260211")
+
+        params = db.execute.await_args_list[1].args[0].compile().params
+        assert params["sync_timestamp"] == "202602110000"
+        assert params["window_end"] == "202602112359"
+        assert params["total_notices"] == sum(range(24))
+        assert params["hourly_notices"] == list(range(24))
+        # 00시 행도 일별 행과 키가 다르므로 함께 삭제
+        assert coverage.discard.call_count == 24
+        coverage.record.assert_called_once()
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_incomplete_day_not_compacted(self):
+        selected = MagicMock()
+        selected.scalars.return_value.all.return_value = self._rows(range(23))
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=selected)
+
+        assert not await BidDataService().compact_hourly_windows(db, "20260211")
+        db.execute.assert_awaited_once()
+
+
+class TestMarkDailyWindowSynced:
+    def _db(self, hourly_rows):
+        selected = MagicMock()
+        selected.scalars.return_value.all.return_value = hourly_rows
+        db = MagicMock()
+        db.commit = AsyncMock()
+        db.execute = AsyncMock(side_effect=[selected, MagicMock(), MagicMock()])
+        return db
+
+    async def _mark(self, db):
+        with patch(
+            "app.services.bid_data_service.sync_coverage"
+        ) as coverage, patch(
+            "app.services.bid_data_service.search_cache"
+        ) as cache, patch(
+            "app.services.bid_data_service.open_bid_hot_set"
+        ):
+            cache.bump_generation = AsyncMock()
+            await BidDataService().mark_window_synced(
+                db, "202602110000", "202602112359", 300, 20
+            )
+        return coverage
+
+    @pytest.mark.asyncio
+    async def test_folds_all_hourly_rows(self):
+        db = self._db(TestCompactHourlyWindows()._rows(range(24)))
+        coverage = await self._mark(db)
+
+        params = db.execute.await_args_list[1].args[0].compile().params
+        assert params["window_end"] == "202602112359"
+        assert params["total_notices"] == 300
+        assert params["hourly_notices"] == list(range(24))
+        assert coverage.discard.call_count == 24
+        coverage.record.assert_called_once_with("202602110000", "202602112359")
+
+    @pytest.mark.asyncio
+    async def test_partial_hours_are_dropped_without_history(self):
+        db = self._db(TestCompactHourlyWindows()._rows(range(10)))
+        coverage = await self._mark(db)
+
+        params = db.execute.await_args_list[1].args[0].compile().params
+        assert "hourly_notices" not in params
+        assert coverage.discard.call_count == 10
+
+
+class TestHourlySyncHistory:
+    @pytest.mark.asyncio
+    async def test_expands_compacted_days(self):
+        hourly = MagicMock()
+        hourly.all.return_value = [("202602120000", 3)]
+        compacted = MagicMock()
+        compacted.all.return_value = [("202602110000", list(range(24)))]
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[hourly, compacted])
+
+        history = await BidDataService().get_hourly_sync_history(
+            db, "202602112200", "202602120100"
+        )
+
+        assert history == [
+            ("202602112200", 22),
+            ("202602112300", 23),
+            ("202602120000", 3),
+        ]
+
+
+# ---------------------------------------------------------------------------
+# SearchPage
+# ---------------------------------------------------------------------------
+
+class TestSearchPage:
+    def test_json_matches_pydantic_response(self):
+        row = make_item(bidNtceNo="A", prtcptPsblRgnNms="경기도").model_dump()
+        page = SearchPage(rows=[row], total_count=1, num_of_rows=10, page_no=1)
+        status = [DaySyncStatus(date="20260210", status="pending")]
+
+        expected = page.to_response()
+        expected.syncComplete = False
+        expected.syncStatus = status
+        assert orjson.loads(page.to_json(False, status)) == expected.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_rows_follow_item_fields(self):
+        data = make_item(bidNtceNo="A").model_dump()
+        del data["dminsttNm"]           # 스키마 추가 이전에 저장된 row
+        data["legacyField"] = "x"       # 스키마에서 제거된 필드
+        notice = MagicMock(bid_ntce_no="A", rgst_dt="202602101000", data=data)
+        notices = MagicMock()
+        notices.scalars.return_value.all.return_value = [notice]
+        count = MagicMock()
+        count.scalar.return_value = 1
+        empty = MagicMock()
+        empty.all.return_value = []
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[count, notices, empty, empty])
+
+        page = await BidDataService().search_page(
+            db, BidSearchParams(inqryBgnDt="202602010000", inqryEndDt="202602282359")
+        )
+
+        assert list(page.rows[0]) == list(BidItem.model_fields)
+        assert page.rows[0]["dminsttNm"] is None
+        assert page.rows[0]["prtcptPsblRgnNms"] == ""
+
+
+# ---------------------------------------------------------------------------
+# search_from_db
+# ---------------------------------------------------------------------------
+
+class TestSearchFromDb:
+    async def _search(self, **params):
+        count = MagicMock()
+        count.scalar.return_value = 0
+        rows = MagicMock()
+        rows.scalars.return_value.all.return_value = []
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[count, rows])
+
+        search = BidSearchParams(
+            inqryBgnDt="202602010000", inqryEndDt="202602282359", **params
+        )
+        await BidDataService().search_from_db(db, search)
+        return str(db.execute.await_args_list[1].args[0])
+
+    @pytest.mark.asyncio
+    async def test_budget_sort_uses_typed_column(self):
+        sql = await self._search(orderBy="bdgtAmt", orderDir="desc")
+        assert "ORDER BY bid_notices.bdgt_amt DESC NULLS LAST" in sql
+
+    @pytest.mark.asyncio
+    async def test_open_bids_filter_uses_timestamp(self):
+        with patch(
+            "app.services.bid_data_service.settings.OPEN_BIDS_HOT_SET_ENABLED",
+            False,
+        ):
+            sql = await self._search(bidClseExcpYn="Y")
+        assert "bid_notices.bid_close_at > now()" in sql
+
+    @pytest.mark.asyncio
+    async def test_opening_date_search(self):
+        sql = await self._search(inqryDiv="2")
+        assert "bid_notices.openg_at >=" in sql
+        assert "bid_notices.rgst_dt <=" in sql
+        # rgst_dt는 NOT NULL (없으면 '') → IS NULL 조건 불필요
+        assert "IS NULL" not in sql
+
+    @pytest.mark.asyncio
+    async def test_child_exists_filters_are_bounded_by_month(self):
+        sql = await self._search(prtcptLmtRgnNm="경기도", indstrytyNm="토목")
+        for table in ("bid_region_eligibility", "bid_license_limits_1"):
+            assert f"{table}.rgst_month IN (left(bid_notices.rgst_dt, " in sql
+            assert f"{table}.rgst_month BETWEEN" in sql
+
+    @pytest.mark.asyncio
+    async def test_enrichment_reads_only_notice_months(self):
+        rgn = MagicMock()
+        rgn.all.return_value = []
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=rgn)
+
+        await BidDataService().get_enrichment_maps(db, ["A"], {"202602"})
+
+        for call in db.execute.await_args_list:
+            stmt = call.args[0]
+            assert ".rgst_month IN" in str(stmt)
+            assert ["", "202602"] in stmt.compile().params.values()
+
+    @pytest.mark.asyncio
+    async def test_region_filter_uses_eligibility_codes(self):
+        sql = await self._search(prtcptLmtRgnNm="경기도")
+        assert "FROM bid_region_eligibility" in sql
+        assert "bid_region_eligibility.region_code IN" in sql
+        assert "LIKE" not in sql
+
+    @pytest.mark.asyncio
+    async def test_keyword_wildcards_are_escaped(self):
+        count = MagicMock()
+        count.scalar.return_value = 0
+        rows = MagicMock()
+        rows.scalars.return_value.all.return_value = []
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[count, rows])
+
+        await BidDataService().search_from_db(db, BidSearchParams(
+            inqryBgnDt="202602010000", inqryEndDt="202602282359",
+            indstrytyNm="50%_전기", cnstrtsiteRgnNm="경기_",
+        ))
+
+        stmt = db.execute.await_args_list[1].args[0]
+        assert "ESCAPE" in str(stmt)
+        values = set(stmt.compile().params.values())
+        assert "%50\\%\\_전기%" in values
+        assert "%경기\\_%" in values
+
+    @pytest.mark.asyncio
+    async def test_hot_set_not_loaded_uses_sql_and_loads_in_background(self):
+        hot_set = MagicMock()
+        hot_set.can_serve.return_value = True
+        hot_set.is_loaded = False
+
+        with patch("app.services.bid_data_service.open_bid_hot_set", hot_set):
+            sql = await self._search(bidClseExcpYn="Y")
+
+        hot_set.schedule_refresh.assert_called_once()
+        hot_set.search.assert_not_called()
+        assert "bid_notices.bid_close_at > now()" in sql
+
+    @pytest.mark.asyncio
+    async def test_open_bids_served_from_hot_set(self):
+        notice = MagicMock(
+            bid_ntce_no="A", bid_ntce_ord="000", rgst_dt="202602101000",
+            data=make_item(bidNtceNo="A").model_dump(),
+        )
+        page = MagicMock()
+        page.scalars.return_value.all.return_value = [notice]
+        empty = MagicMock()
+        empty.all.return_value = []
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[page, empty, empty])
+        hot_set = MagicMock()
+        hot_set.can_serve.return_value = True
+        hot_set.is_loaded = True
+        hot_set.search.return_value = ([("A", "000", "202602101000")], 42)
+
+        with patch("app.services.bid_data_service.open_bid_hot_set", hot_set):
+            result = await BidDataService().search_from_db(
+                db,
+                BidSearchParams(
+                    inqryBgnDt="202602010000", inqryEndDt="202602282359",
+                    bidClseExcpYn="Y",
+                ),
+            )
+
+        assert result.totalCount == 42
+        assert [item.bidNtceNo for item in result.items] == ["A"]
+        # 건수/정렬 SQL 없이 페이지 공고만 PK로 조회
+        page_sql = str(db.execute.await_args_list[0].args[0])
+        assert "count(" not in page_sql
+        assert "(bid_notices.bid_ntce_no, bid_notices.bid_ntce_ord, bid_notices.rgst_dt) IN" in page_sql
@@ -0,0 +1,210 @@
+import math
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.bid_price_engine import (
+    CITY,
+    GENERAL,
+    LANDSCAPING,
+    PROVINCE,
+    BidPriceEngine,
+    BidPriceInputs,
+    a_value_of,
+    compute_bid_prices,
+    determine_license_group,
+    determine_region_scope,
+)
+
+A_VALUE_DATA = {
+    "bssamt": "1000000000",
+    "sftyMngcst": "10000000",
+    "sftyChckMngcst": "5000000",
+    "rtrfundNon": "3000000",
+    "mrfnHealthInsrprm": "2000000",
+    "npnInsrprm": "1500000",
+    "odsnLngtrmrcprInsrprm": "500000",
+    "envCnsrvcst": "1000000",
+    "qltyMngcstAObjYn": "N",
+    "qltyMngcst": "0",
+}
+
+
+def row(**overrides) -> dict:
+    data = {
+        "key": ("A", "000"),
+        "bssamt": "1000000000",
+        "asignBdgtAmt": None,
+        "aValue": 23_000_000,
+        "sucsfbidLwltRate": "87.745",
+        "prtcptPsblRgnNms": "경기도",
+        "permsnIndstrytyListNms": "토공사업",
+    }
+    data.update(overrides)
+    return data
+
+
+def calc(**overrides):
+    return compute_bid_prices(BidPriceInputs.from_rows([row(**overrides)])).to_items()[0]
+
+
+# ---------------------------------------------------------------------------
+# 분류 (지역범위 / 면허유형)
+# ---------------------------------------------------------------------------
+
+class TestClassification:
+    @pytest.mark.parametrize("names,expected", [
+        (None, PROVINCE),
+        ("경기도", PROVINCE),
+        ("서울특별시, 경기도", PROVINCE),
+        ("경기도 수원시, 경기도 성남시", PROVINCE),
+        ("경기도 성남시", CITY),
+        ("경기도 양평군", CITY),
+        ("서울특별시 강남구", CITY),
+        ("전국", PROVINCE),
+    ])
+    def test_region_scope(self, names, expected):
+        assert determine_region_scope(names) == expected
+
+    @pytest.mark.parametrize("names,expected", [
+        (None, GENERAL),
+        ("토공사업", GENERAL),
+        ("조경식재ㆍ시설물공사업", LANDSCAPING),
+        ("나무병원(1종)", LANDSCAPING),
+        ("일반건설업, 조경식재공사업", LANDSCAPING),
+    ])
+    def test_license_group(self, names, expected):
+        assert determine_license_group(names) == expected
+
+    def test_a_value_flags(self):
+        assert a_value_of(A_VALUE_DATA) == 23_000_000
+        assert a_value_of({
+            **A_VALUE_DATA,
+            "qltyMngcstAObjYn": "Y", "qltyMngcst": "2000000",
+            "smkpAmtYn": "Y", "smkpAmt": "3000000",
+        }) == 28_000_000
+        assert a_value_of(None) == 0
+
+
+# ---------------------------------------------------------------------------
+# compute_bid_prices
+# ---------------------------------------------------------------------------
+
+class TestComputeBidPrices:
+    @pytest.mark.parametrize("regions,licenses,amount,rate", [
+        ("경기도", "토공사업", "500000000", 100.140),
+        ("경기도", "토공사업", "80000000", 99.930),
+        ("경기도", "토공사업", "200000000", 100.092),
+        ("경기도", "조경식재ㆍ시설물공사업", "200000000", 99.822),
+        ("경기도", "나무병원(1종)", "500000000", 99.502),
+        ("경기도 성남시", "토공사업", "80000000", 99.536),
+        ("경기도 수원시", "토공사업", "200000000", 99.994),
+        # 시군 테이블에 없음 → 도 / 도+조경 fallback
+        ("경기도 성남시", "토공사업", "500000000", 100.140),
+        ("경기도 성남시", "조경식재ㆍ시설물공사업", "200000000", 99.822),
+        (None, None, "1000000000", 100.140),
+    ])
+    def test_assessment_rate_lookup(self, regions, licenses, amount, rate):
+        result = calc(
+            prtcptPsblRgnNms=regions, permsnIndstrytyListNms=licenses, bssamt=amount
+        )
+        assert result.assessmentRate == rate
+
+    def test_matches_frontend_formula(self):
+        result = calc()
+
+        estimated = math.floor(1_000_000_000 * 100.140 / 100 + 0.5)
+        lower_bound = math.ceil((estimated - 23_000_000) * 87.745 / 100 + 23_000_000)
+        assert result.ok
+        assert result.estimatedPrice == estimated
+        assert result.estimatedLowerBound == lower_bound
+        assert result.optimalBidPrice == math.ceil(lower_bound * 1.001)
+        assert result.confidenceRange.low == math.ceil(
+            (1_000_000_000 * 97 / 100 - 23_000_000) * 87.745 / 100 + 23_000_000
+        )
+        assert result.confidenceRange.high == math.ceil(
+            (1_000_000_000 * 103 / 100 - 23_000_000) * 87.745 / 100 + 23_000_000
+        )
+        assert result.basisAmount == 1_000_000_000
+        assert result.usedFallback is False
+        assert result.margin == "0.01%"
+
+    def test_default_lower_limit_rate(self):
+        assert calc(sucsfbidLwltRate=None).lowerLimitRate == 87.745
+        assert calc(sucsfbidLwltRate="86.745").lowerLimitRate == 86.745
+
+    @pytest.mark.parametrize("bssamt", [None, "", "0", "abc"])
+    def test_falls_back_to_assigned_budget(self, bssamt):
+        result = calc(bssamt=bssamt, asignBdgtAmt="500000000")
+
+        assert result.ok
+        assert result.usedFallback is True
+        assert result.basisAmount == 500_000_000
+
+    def test_missing_basis_is_error(self):
+        result = calc(bssamt=None, asignBdgtAmt="0")
+
+        assert result.ok is False
+        assert "기초금액" in result.error
+        assert result.optimalBidPrice is None
+
+    def test_batch_keeps_row_order(self):
+        rows = [
+            row(key=("A", "000"), bssamt="80000000"),
+            row(key=("B", "000"), bssamt=None),
+            row(key=("C", "001"), bssamt="500000000"),
+        ]
+        items = compute_bid_prices(BidPriceInputs.from_rows(rows)).to_items()
+
+        assert [(i.bidNtceNo, i.ok) for i in items] == [
+            ("A", True), ("B", False), ("C", True),
+        ]
+        assert [i.assessmentRate for i in items if i.ok] == [99.930, 100.140]
+
+
+# ---------------------------------------------------------------------------
+# BidPriceEngine.calculate
+# ---------------------------------------------------------------------------
+
+class TestCalculate:
+    @pytest.mark.asyncio
+    async def test_loads_inputs_and_reports_missing(self):
+        notices = MagicMock()
+        notices.all.return_value = [
+            ("A", "000", {"mainCnsttyNm": "토목", "sucsfbidLwltRate": "87.745"}),
+            ("B", "000", {"asignBdgtAmt": "200000000"}),
+        ]
+        basis = MagicMock()
+        basis.all.return_value = [
+            # 공사 row에 bssamt 없음 → 용역 row 사용
+            ("A", "cnstwk", {**A_VALUE_DATA, "bssamt": ""}),
+            ("A", "servc", A_VALUE_DATA),
+        ]
+        regions = MagicMock()
+        regions.all.return_value = [("A", "경기도 성남시")]
+        licenses = MagicMock()
+        licenses.all.return_value = []
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[notices, basis, regions, licenses])
+
+        items = await BidPriceEngine().calculate(
+            db, [("C", "000"), ("A", "000"), ("B", "000"), ("A", "000")]
+        )
+
+        assert [i.bidNtceNo for i in items] == ["C", "A", "B"]
+        missing, a, b = items
+        assert missing.ok is False and "공고" in missing.error
+        assert a.basisAmount == 1_000_000_000
+        assert a.aValue == 23_000_000
+        # 시군 + 3억 이상 → 도 rate fallback
+        assert a.assessmentRate == 100.140
+        assert b.usedFallback is True
+        assert b.aValue == 0
+
+    @pytest.mark.asyncio
+    async def test_empty_request_skips_db(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        assert await BidPriceEngine().calculate(db, []) == []
+        db.execute.assert_not_awaited()
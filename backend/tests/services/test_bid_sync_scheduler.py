@@ -0,0 +1,427 @@
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.bid_sync_scheduler import KST, BidDataSyncScheduler
+from app.services.narajangter import NaraJangterService
+from app.services.sync_coverage import SyncCoverageIndex
+from app.services.upstream_resilience import UpstreamThrottled
+
+
+@pytest.fixture
+def scheduler():
+    return BidDataSyncScheduler()
+
+
+# ---------------------------------------------------------------------------
+# Job checkpoints
+# ---------------------------------------------------------------------------
+
+class TestFeedResume:
+    def test_no_job_starts_from_first_page(self):
+        assert BidDataSyncScheduler._feed_resume(None, "contract") == (1, 0, False)
+
+    def test_resumes_after_last_completed_page(self):
+        job = MagicMock()
+        job.checkpoints = {"regions": {"page": 3, "count": 2997, "done": False}}
+        assert BidDataSyncScheduler._feed_resume(job, "regions") == (4, 2997, False)
+        assert BidDataSyncScheduler._feed_resume(job, "contract") == (1, 0, False)
+
+    def test_done_feed(self):
+        job = MagicMock()
+        job.checkpoints = {"service": {"page": 2, "count": 150, "done": True}}
+        assert BidDataSyncScheduler._feed_resume(job, "service") == (3, 150, True)
+
+
+class TestFetchRegionsCheckpoint:
+    @pytest.mark.asyncio
+    async def test_resume_and_checkpoint_each_page(self, scheduler):
+        full_page = [MagicMock()] * NaraJangterService.MAX_PAGE_SIZE
+        last_page = [MagicMock()] * 10
+        fetch = AsyncMock(side_effect=[full_page, last_page])
+        checkpoint = AsyncMock()
+
+        with patch(
+            "app.services.bid_sync_scheduler.narajangter_service"
+        ) as nara, patch(
+            "app.services.bid_sync_scheduler.bid_data_service"
+        ) as data, patch("asyncio.sleep", new_callable=AsyncMock):
+            nara.get_prtcpt_psbl_rgn_by_date = fetch
+            data.save_prtcpt_psbl_rgns = AsyncMock()
+            total, finished, requests = await scheduler._fetch_regions(
+                MagicMock(), "202602110000", "202602112359",
+                start_page=4, prior_count=100, checkpoint=checkpoint,
+            )
+
+        assert finished is True
+        assert requests == 2
+        assert total == 100 + NaraJangterService.MAX_PAGE_SIZE + 10
+        assert [c.args[2] for c in fetch.await_args_list] == [4, 5]
+        assert checkpoint.await_args_list[-1].args == (5, total, True)
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_mark_done(self, scheduler):
+        checkpoint = AsyncMock()
+
+        with patch(
+            "app.services.bid_sync_scheduler.narajangter_service"
+        ) as nara:
+            nara.get_prtcpt_psbl_rgn_by_date = AsyncMock(
+                side_effect=Exception("boom")
+            )
+            total, finished, requests = await scheduler._fetch_regions(
+                MagicMock(), "202602110000", "202602112359",
+                start_page=2, prior_count=999, checkpoint=checkpoint,
+            )
+
+        assert (total, finished, requests) == (999, False, 1)
+        checkpoint.assert_not_awaited()
+
+
+    @pytest.mark.asyncio
+    async def test_throttled_page_is_not_finished(self, scheduler):
+        """429로 멈춘 피드는 빈 페이지(끝)와 구분되어 완료 처리되지 않음"""
+        full_page = [MagicMock()] * NaraJangterService.MAX_PAGE_SIZE
+        checkpoint = AsyncMock()
+
+        with patch(
+            "app.services.bid_sync_scheduler.narajangter_service"
+        ) as nara, patch(
+            "app.services.bid_sync_scheduler.bid_data_service"
+        ) as data, patch("asyncio.sleep", new_callable=AsyncMock):
+            nara.get_prtcpt_psbl_rgn_by_date = AsyncMock(side_effect=[
+                full_page, UpstreamThrottled("rgn", "HTTP 429"),
+            ])
+            data.save_prtcpt_psbl_rgns = AsyncMock()
+            total, finished, requests = await scheduler._fetch_regions(
+                MagicMock(), "202602110000", "202602112359",
+                checkpoint=checkpoint,
+            )
+
+        assert (total, finished) == (NaraJangterService.MAX_PAGE_SIZE, False)
+        assert requests == 2
+        assert [c.args for c in checkpoint.await_args_list] == [
+            (1, NaraJangterService.MAX_PAGE_SIZE)
+        ]
+
+
+    @pytest.mark.asyncio
+    async def test_circuit_open_is_not_counted_as_request(self, scheduler):
+        from app.services.upstream_resilience import CircuitOpenError
+
+        with patch(
+            "app.services.bid_sync_scheduler.narajangter_service"
+        ) as nara:
+            nara.get_license_limit_by_date = AsyncMock(
+                side_effect=CircuitOpenError("lic", "circuit open", 30)
+            )
+            result = await scheduler._fetch_license_limits(
+                MagicMock(), "202602110000", "202602112359"
+            )
+
+        assert result == (0, False, 0)
+
+
+# ---------------------------------------------------------------------------
+# Window completion / upstream pause
+# ---------------------------------------------------------------------------
+
+class TestWindowCompletion:
+    async def _sync(self, scheduler, finished, job=None, paused=0.0):
+        """피드별 완료 여부(finished)로 윈도우를 동기화하고 (data, queue)를 반환."""
+        scheduler._fetch_notices = AsyncMock(
+            side_effect=[(10, finished["contract"], 3), (5, finished["service"], 1)]
+        )
+        scheduler._fetch_regions = AsyncMock(
+            return_value=(3, finished["regions"], 1)
+        )
+        scheduler._fetch_license_limits = AsyncMock(
+            return_value=(2, finished["license_limits"], 2)
+        )
+        with patch(
+            "app.services.bid_sync_scheduler.AsyncSessionLocal"
+        ), patch(
+            "app.services.bid_sync_scheduler.bid_data_service"
+        ) as data, patch(
+            "app.services.bid_sync_scheduler.sync_job_queue"
+        ) as queue, patch(
+            "app.services.bid_sync_scheduler.upstream_guard"
+        ) as guard:
+            guard.paused_for.return_value = paused
+            data.mark_window_synced = AsyncMock()
+            queue.complete = AsyncMock()
+            queue.release = AsyncMock()
+            queue.defer = AsyncMock()
+            self.api_calls = await scheduler._sync_window_internal(
+                "202602110900", "202602110959", job=job
+            )
+        return data, queue
+
+    @staticmethod
+    def feeds(**overrides):
+        return {
+            "contract": True, "service": True,
+            "regions": True, "license_limits": True, **overrides,
+        }
+
+    @staticmethod
+    def job():
+        job = MagicMock()
+        job.job_id = 7
+        job.checkpoints = {}
+        return job
+
+    @pytest.mark.asyncio
+    async def test_all_feeds_finished_marks_window(self, scheduler):
+        data, queue = await self._sync(scheduler, self.feeds(), job=self.job())
+        data.mark_window_synced.assert_awaited_once()
+        assert data.mark_window_synced.await_args.args[3:6] == (15, 3, 2)
+        # 피드 수가 아니라 실제 페이지 요청 수
+        assert self.api_calls == 7
+        queue.complete.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_partial_feed_leaves_window_unmarked(self, scheduler):
+        data, queue = await self._sync(
+            scheduler, self.feeds(regions=False), job=self.job()
+        )
+        data.mark_window_synced.assert_not_awaited()
+        queue.complete.assert_not_awaited()
+        queue.release.assert_awaited_once()
+        assert queue.release.await_args.args[1:] == (7, "incomplete feeds: regions")
+        assert scheduler._failed_windows == ["202602110900~202602110959"]
+
+    @pytest.mark.asyncio
+    async def test_circuit_open_defers_job_without_attempt(self, scheduler):
+        _, queue = await self._sync(
+            scheduler, self.feeds(contract=False), job=self.job(), paused=60.0
+        )
+        queue.release.assert_not_awaited()
+        queue.defer.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_hourly_window_without_job_is_not_marked(self, scheduler):
+        data, queue = await self._sync(
+            scheduler, self.feeds(license_limits=False)
+        )
+        data.mark_window_synced.assert_not_awaited()
+        queue.release.assert_not_awaited()
+
+
+class TestUpstreamPause:
+    @pytest.mark.asyncio
+    async def test_job_worker_does_not_claim_while_paused(self, scheduler):
+        with patch(
+            "app.services.bid_sync_scheduler.upstream_guard"
+        ) as guard, patch(
+            "app.services.bid_sync_scheduler.sync_job_queue"
+        ) as queue:
+            guard.paused_for.return_value = 120.0
+            queue.claim = AsyncMock()
+            assert await scheduler.process_next_job() is False
+        queue.claim.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_job_is_claimed_only_after_sync_lock(self, scheduler):
+        held_during_claim = []
+
+        async def claim(db, worker_id):
+            held_during_claim.append(scheduler._sync_lock.locked())
+            return None
+
+        with patch(
+            "app.services.bid_sync_scheduler.upstream_guard"
+        ) as guard, patch(
+            "app.services.bid_sync_scheduler.AsyncSessionLocal"
+        ), patch(
+            "app.services.bid_sync_scheduler.sync_job_queue"
+        ) as queue:
+            guard.paused_for.return_value = 0
+            queue.claim = AsyncMock(side_effect=claim)
+            assert await scheduler.process_next_job() is False
+        assert held_during_claim == [True]
+
+    @pytest.mark.parametrize("start, end, hours", [
+        ("202602110900", "202602110959", 1),
+        ("202602110000", "202602112359", 24),
+    ])
+    def test_window_hours(self, start, end, hours):
+        assert BidDataSyncScheduler._window_hours(start, end) == hours
+
+    @pytest.mark.asyncio
+    async def test_daily_job_calls_are_spread_over_its_hours(self, scheduler):
+        job = MagicMock(window_start="202602110000", window_end="202602112359")
+        scheduler._sync_window_internal = AsyncMock(return_value=48)
+        scheduler._record_calls = AsyncMock()
+        with patch(
+            "app.services.bid_sync_scheduler.upstream_guard"
+        ) as guard, patch(
+            "app.services.bid_sync_scheduler.AsyncSessionLocal"
+        ), patch(
+            "app.services.bid_sync_scheduler.sync_job_queue"
+        ) as queue, patch("asyncio.sleep", new_callable=AsyncMock):
+            guard.paused_for.return_value = 0
+            queue.claim = AsyncMock(return_value=job)
+            assert await scheduler.process_next_job() is True
+        scheduler._record_calls.assert_awaited_once_with(48, 24)
+
+    @pytest.mark.asyncio
+    async def test_recent_sync_stops_while_paused(self, scheduler):
+        scheduler._sync_window_internal = AsyncMock(return_value=4)
+        with patch(
+            "app.services.bid_sync_scheduler.upstream_guard"
+        ) as guard, patch(
+            "app.services.bid_sync_scheduler.AsyncSessionLocal"
+        ), patch(
+            "app.services.bid_sync_scheduler.sync_coverage"
+        ) as coverage:
+            guard.paused_for.return_value = 30.0
+            coverage.ensure_loaded = AsyncMock()
+            assert await scheduler._sync_recent_hours(0) == 0
+        scheduler._sync_window_internal.assert_not_awaited()
+
+    def test_pause_covers_every_sync_endpoint(self, scheduler):
+        from app.services.bid_sync_scheduler import SYNC_ENDPOINTS
+        from app.services.upstream_resilience import upstream_guard
+
+        upstream_guard.breaker(SYNC_ENDPOINTS[-1]).open(45)
+        assert 0 < scheduler._upstream_pause() <= 45
+
+
+# ---------------------------------------------------------------------------
+# Hourly-to-daily compaction
+# ---------------------------------------------------------------------------
+
+NOW = datetime(2026, 2, 12, 9, 0, tzinfo=KST)
+
+
+def make_coverage(date_str: str, hours, synced_at: datetime) -> SyncCoverageIndex:
+    index = SyncCoverageIndex()
+    index.load([
+        (f"{date_str}{h:02d}00", f"{date_str}{h:02d}59", synced_at)
+        for h in hours
+    ])
+    return index
+
+
+class TestClassifyHours:
+    def test_all_settled(self, scheduler):
+        coverage = make_coverage("20260211", range(24), NOW)
+        with patch("app.services.bid_sync_scheduler.sync_coverage", coverage):
+            settled, waiting, repair = scheduler._classify_hours("20260211", NOW)
+        assert len(settled) == 24
+        assert waiting == [] and repair == []
+
+    def test_unsettled_and_missing_hours(self, scheduler):
+        # 마지막 동기화 23:30 → 22시 윈도우는 확정 시점(00:00) 전 데이터
+        synced_at = datetime(2026, 2, 11, 23, 30, tzinfo=KST)
+        coverage = make_coverage("20260211", range(23), synced_at)
+        now = datetime(2026, 2, 12, 0, 30, tzinfo=KST)
+        with patch("app.services.bid_sync_scheduler.sync_coverage", coverage):
+            settled, waiting, repair = scheduler._classify_hours("20260211", now)
+        assert len(settled) == 22
+        assert repair == [("202602112200", "202602112259")]
+        # 23시는 확정 시점(익일 01:00) 전이므로 대기
+        assert waiting == ["202602112300"]
+
+
+class TestBackfillCompaction:
+    async def _run(self, scheduler, coverage):
+        with patch(
+            "app.services.bid_sync_scheduler.sync_coverage", coverage
+        ), patch(
+            "app.services.bid_sync_scheduler.datetime"
+        ) as dt, patch(
+            "app.services.bid_sync_scheduler.AsyncSessionLocal"
+        ), patch(
+            "app.services.bid_sync_scheduler.bid_data_service"
+        ) as data, patch(
+            "app.services.bid_sync_scheduler.sync_job_queue"
+        ) as queue:
+            dt.now.return_value = NOW
+            dt.strptime = datetime.strptime
+            coverage.ensure_loaded = AsyncMock()
+            data.compact_hourly_windows = AsyncMock(return_value=True)
+            queue.enqueue = AsyncMock()
+            scheduler.BACKFILL_DAYS = 1
+            await scheduler._backfill_past_days(0)
+        return data, queue
+
+    @pytest.mark.asyncio
+    async def test_settled_day_is_compacted_without_api(self, scheduler):
+        coverage = make_coverage("20260211", range(24), NOW)
+        data, queue = await self._run(scheduler, coverage)
+        data.compact_hourly_windows.assert_awaited_once()
+        assert data.compact_hourly_windows.await_args.args[1] == "20260211"
+        queue.enqueue.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_few_missing_hours_enqueue_hourly_repairs(self, scheduler):
+        coverage = make_coverage("20260211", range(22), NOW)
+        data, queue = await self._run(scheduler, coverage)
+        data.compact_hourly_windows.assert_not_awaited()
+        assert [c.args[1:3] for c in queue.enqueue.await_args_list] == [
+            ("202602112200", "202602112259"),
+            ("202602112300", "202602112359"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_busy_day_gets_one_daily_settle_fetch(self, scheduler):
+        # 바쁜 시간대 윈도우(2시간)는 종료 1시간 이내에만 재조회됨
+        coverage = SyncCoverageIndex()
+        coverage.load([
+            (
+                f"20260211{h:02d}00", f"20260211{h:02d}59",
+                datetime(2026, 2, 11, h, 45, tzinfo=KST) + timedelta(hours=1),
+            )
+            for h in range(24)
+        ])
+        data, queue = await self._run(scheduler, coverage)
+        data.compact_hourly_windows.assert_not_awaited()
+        assert [c.args[1:3] for c in queue.enqueue.await_args_list] == [
+            ("202602110000", "202602112359"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_day_with_waiting_hours_is_deferred(self, scheduler):
+        coverage = make_coverage("20260211", [], NOW)
+        with patch.object(scheduler, "_classify_hours", return_value=(
+            [], ["202602112300"],
+            [(f"20260211{h:02d}00", f"20260211{h:02d}59") for h in range(23)],
+        )):
+            data, queue = await self._run(scheduler, coverage)
+        queue.enqueue.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_no_hourly_history_enqueues_full_day(self, scheduler):
+        coverage = make_coverage("20260211", [], NOW)
+        _, queue = await self._run(scheduler, coverage)
+        assert [c.args[1:3] for c in queue.enqueue.await_args_list] == [
+            ("202602110000", "202602112359"),
+        ]
+
+
+class TestManualSync:
+    @pytest.mark.asyncio
+    async def test_today_is_never_enqueued_as_daily_window(self, scheduler):
+        coverage = SyncCoverageIndex()
+        coverage.load([])
+        with patch(
+            "app.services.bid_sync_scheduler.sync_coverage", coverage
+        ), patch(
+            "app.services.bid_sync_scheduler.datetime"
+        ) as dt, patch(
+            "app.services.bid_sync_scheduler.AsyncSessionLocal"
+        ), patch(
+            "app.services.bid_sync_scheduler.sync_job_queue"
+        ) as queue:
+            dt.now.return_value = NOW
+            coverage.ensure_loaded = AsyncMock()
+            queue.enqueue = AsyncMock()
+            assert await scheduler.sync_recent_data(days=2) == 2
+
+        assert [c.args[1:3] for c in queue.enqueue.await_args_list] == [
+            ("202602100000", "202602102359"),
+            ("202602110000", "202602112359"),
+        ]
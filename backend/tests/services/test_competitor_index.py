@@ -0,0 +1,198 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.competitor_index import (
+    RATE_BIN_EDGES,
+    CompetitorIndex,
+    aggregate_stats,
+    flatten_results,
+    notice_segments,
+    segment_of,
+)
+
+OPENED_AT = datetime(2026, 3, 2, 2, 0, tzinfo=timezone.utc)
+
+
+def result(no, *rows):
+    data = [
+        {
+            "prcbdrBizno": bizno,
+            "prcbdrNm": f"업체{bizno[-1]}",
+            "bidprcAmt": "88000000",
+            "bidprcrt": rate,
+            "opengRank": rank,
+        }
+        for bizno, rate, rank in rows
+    ]
+    return (no, data, OPENED_AT)
+
+
+def scalars(values):
+    res = MagicMock()
+    res.scalars.return_value.all.return_value = values
+    return res
+
+
+def rows(values):
+    res = MagicMock()
+    res.all.return_value = values
+    return res
+
+
+# ---------------------------------------------------------------------------
+# 세그먼트 / 개찰결과 펼치기
+# ---------------------------------------------------------------------------
+
+class TestSegments:
+    def test_notice_segments(self):
+        segments = notice_segments(
+            ["경기도 성남시", "경기도 수원시", "서울특별시"], ["토공사업"]
+        )
+
+        assert segments == [
+            "*", "rgn:41", "rgn:11", "ind:토공사업",
+            "rgn:41|ind:토공사업", "rgn:11|ind:토공사업",
+        ]
+
+    def test_unrestricted_region(self):
+        assert notice_segments([], []) == ["*", "rgn:00"]
+
+    def test_segment_of_matches_notice_segments(self):
+        assert segment_of() == "*"
+        assert segment_of("경기 성남시") == "rgn:41"
+        assert segment_of("경기도", "토공사업") == "rgn:41|ind:토공사업"
+        assert segment_of(industry="토공사업") in notice_segments([], ["토공사업"])
+
+    def test_flatten_results(self):
+        bids = flatten_results([
+            {"prcbdrBizno": "123-45-67890", "bidprcAmt": "88000000",
+             "bidprcrt": "87.9", "opengRank": "1"},
+            {"prcbdrBizno": "1234567890", "opengRank": "2"},
+            {"prcbdrBizno": "222-22-22222", "bidprcrt": "80.1", "opengRank": ""},
+            {"prcbdrBizno": None},
+        ])
+
+        assert [b["prcbdr_bizno"] for b in bids] == ["1234567890", "2222222222"]
+        first, second = bids
+        assert first["won"] is True and first["opening_rank"] == 1
+        assert first["bid_amount"] == 88_000_000 and first["bid_rate"] == 87.9
+        assert second["won"] is False and second["opening_rank"] is None
+
+
+# ---------------------------------------------------------------------------
+# aggregate_stats
+# ---------------------------------------------------------------------------
+
+class TestAggregateStats:
+    def test_counts_rates_and_histogram(self):
+        stats = aggregate_stats(
+            [("*", "A"), ("*", "A"), ("*", "B"), ("rgn:41", "A")],
+            np.array([87.6, 87.9, np.nan, 99.0]),
+            np.array([True, False, True, False]),
+            np.array([100.0, 200.0, np.nan, 50.0]),
+        )
+
+        a = stats[("*", "A")]
+        assert a["bid_count"] == 2 and a["win_count"] == 1
+        assert a["avg_bid_rate"] == pytest.approx(87.75)
+        assert a["last_opened_at"] == 200.0
+        assert len(a["rate_histogram"]) == len(RATE_BIN_EDGES) + 1
+        # 87.5 ≤ 87.6, 87.9 < 88.0 → 같은 칸
+        assert a["rate_histogram"][6] == 2 and sum(a["rate_histogram"]) == 2
+
+        b = stats[("*", "B")]
+        assert b["avg_bid_rate"] is None and b["last_opened_at"] is None
+        assert sum(b["rate_histogram"]) == 0
+
+        # 상한 이상은 마지막 칸
+        assert stats[("rgn:41", "A")]["rate_histogram"][-1] == 1
+
+    def test_empty(self):
+        assert aggregate_stats([], np.array([]), np.array([]), np.array([])) == {}
+
+
+# ---------------------------------------------------------------------------
+# CompetitorIndex.refresh
+# ---------------------------------------------------------------------------
+
+def fake_lock(acquired: bool):
+    @asynccontextmanager
+    async def lock(name):
+        yield acquired
+    return lock
+
+
+@pytest.fixture(autouse=True)
+def refresh_lock():
+    with patch(
+        "app.services.competitor_index.try_advisory_lock", fake_lock(True)
+    ) as lock:
+        yield lock
+
+
+class TestRefresh:
+    @pytest.mark.asyncio
+    async def test_indexes_and_recomputes_touched_companies(self):
+        db = MagicMock()
+        db.commit = AsyncMock()
+        db.execute = AsyncMock(side_effect=[
+            rows([result("A", ("111", "87.9", "1"), ("222", "88.2", "2"))]),  # 후보
+            rows([("A", OPENED_AT, "공고A")]),  # 공고
+            rows([("A", "경기도 성남시")]),  # 참가가능지역
+            rows([]),  # 허용업종
+            scalars(["333"]),  # 이전 기록 (재수집으로 빠진 업체)
+            MagicMock(),  # delete competitor_bids
+            MagicMock(),  # insert competitor_bids
+            MagicMock(),  # upsert competitor_indexed_notices
+            rows([  # 재집계 원천
+                ("*", "111", "업체1", 87.9, True, OPENED_AT),
+                ("rgn:41", "111", "업체1", 87.9, True, OPENED_AT),
+                ("*", "222", "업체2", 88.2, False, OPENED_AT),
+                ("rgn:41", "222", "업체2", 88.2, False, OPENED_AT),
+            ]),
+            MagicMock(),  # delete competitor_stats
+            MagicMock(),  # insert competitor_stats
+        ])
+
+        assert await CompetitorIndex().refresh(db) == 1
+
+        calls = [c.args[0] for c in db.execute.await_args_list]
+        bid_values = calls[6].compile().params
+        assert bid_values["segments_m0"] == ["*", "rgn:41"]
+        assert bid_values["bid_ntce_nm_m0"] == "공고A"
+
+        assert "prcbdr_bizno IN" in str(calls[9])
+        recompute_params = calls[9].compile().params
+        assert sorted(recompute_params["prcbdr_bizno_1"]) == ["111", "222", "333"]
+
+        stat_values = calls[10].compile().params
+        assert {
+            (stat_values[f"segment_m{i}"], stat_values[f"prcbdr_bizno_m{i}"])
+            for i in range(4)
+        } == {("*", "111"), ("rgn:41", "111"), ("*", "222"), ("rgn:41", "222")}
+        assert db.commit.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_index(self):
+        db = MagicMock()
+        db.commit = AsyncMock()
+        db.execute = AsyncMock(return_value=rows([]))
+
+        assert await CompetitorIndex().refresh(db) == 0
+        db.execute.assert_awaited_once()
+        db.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_skipped_while_another_refresh_holds_lock(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        with patch(
+            "app.services.competitor_index.try_advisory_lock", fake_lock(False)
+        ):
+            assert await CompetitorIndex().refresh(db) == 0
+        db.execute.assert_not_awaited()
@@ -0,0 +1,137 @@
+import json
+
+import pytest
+
+from app.schemas.bid import BidSearchParams
+from app.services.narajangter import NaraJangterService
+from app.services.upstream_resilience import (
+    CircuitOpenError,
+    UpstreamQuotaExceeded,
+    UpstreamThrottled,
+    UpstreamUnavailable,
+)
+from tests.fakes.narajangter import (
+    CNSTWK_NOTICES,
+    LICENSE_LIMIT,
+    OPENG_RESULT,
+    PRTCPT_PSBL_RGN,
+    SERVC_NOTICES,
+    FakeNaraJangter,
+    envelope,
+    generate_dataset,
+    load_fixtures,
+)
+
+
+@pytest.fixture
+def service():
+    return NaraJangterService()
+
+
+def window_params(page: int, rows: int = 100) -> BidSearchParams:
+    return BidSearchParams(
+        inqryDiv="1",
+        inqryBgnDt="202603010000",
+        inqryEndDt="202603012359",
+        numOfRows=rows,
+        pageNo=page,
+    )
+
+
+# ---------------------------------------------------------------------------
+# 합성 데이터 / 녹화 파일
+# ---------------------------------------------------------------------------
+
+class TestDataset:
+    def test_generate_dataset_is_deterministic(self):
+        first = generate_dataset(notices=40, seed=3)
+        assert first == generate_dataset(notices=40, seed=3)
+        assert len(first[CNSTWK_NOTICES]) + len(first[SERVC_NOTICES]) == 40
+        # 개찰결과는 앞쪽 1/4 공고만
+        assert {r["bidNtceNo"] for r in first[OPENG_RESULT]} == {
+            f"R26BK{i:08d}" for i in range(10)
+        }
+
+    def test_load_fixtures_accepts_items_pages_and_page_lists(self, tmp_path):
+        item = {"bidNtceNo": "R1", "prtcptPsblRgnNm": "경기도"}
+        (tmp_path / f"{PRTCPT_PSBL_RGN}.json").write_text(
+            json.dumps([envelope([item], 2, 1, 1), envelope(item, 2, 2, 1)])
+        )
+        (tmp_path / f"{OPENG_RESULT}.json").write_text(json.dumps([item]))
+
+        fixtures = load_fixtures(tmp_path)
+
+        assert fixtures[PRTCPT_PSBL_RGN] == [item, item]
+        assert fixtures[OPENG_RESULT] == [item]
+
+
+# ---------------------------------------------------------------------------
+# NaraJangterService ↔ FakeNaraJangter
+# ---------------------------------------------------------------------------
+
+class TestFakeServer:
+    @pytest.mark.asyncio
+    async def test_pages_window_results(self, service):
+        dataset = generate_dataset(notices=2 * 7 * 24 * 6, days=7)  # 10분마다 1건
+        fake = FakeNaraJangter(dataset)
+
+        with fake.install(service):
+            first = await service.search_bids("contract", window_params(1))
+            last = await service.search_bids("contract", window_params(2))
+
+        # 하루 288건 중 공사 144건
+        assert first.totalCount == 144
+        assert len(first.items) == 100 and len(last.items) == 44
+        assert first.items[0].rgstDt.startswith("2026-03-01")
+        assert fake.requests[CNSTWK_NOTICES, "ok"] == 2
+
+    @pytest.mark.asyncio
+    async def test_filters_by_bid_no(self, service):
+        fake = FakeNaraJangter(generate_dataset(notices=8, bidders=5))
+
+        with fake.install(service):
+            results = await service.get_bid_opening_results("R26BK00000001")
+
+        assert len(results) == 5
+        assert {r.bidNtceNo for r in results} == {"R26BK00000001"}
+
+    @pytest.mark.asyncio
+    async def test_throttled_and_quota_responses(self, service, reset_upstream_guard):
+        dataset = generate_dataset(notices=20)
+        throttled = FakeNaraJangter(dataset, throttle_rate=1.0, retry_after=7)
+        with throttled.install(service):
+            async with service._client() as client:
+                response = await client.get(
+                    f"{service.PRTCPT_PSBL_RGN_URL}?pageNo=1"
+                )
+            with pytest.raises(UpstreamThrottled):
+                await service.get_prtcpt_psbl_rgn_by_date(
+                    "202603010000", "202603012359"
+                )
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "7"
+        # 첫 요청 + 재시도 2회, 매번 Retry-After만큼 대기
+        assert throttled.requests[PRTCPT_PSBL_RGN, "throttled"] == 4
+        assert [c.args[0] for c in reset_upstream_guard.await_args_list] == [7, 7]
+
+        quota = FakeNaraJangter(dataset, quota_rate=1.0)
+        with quota.install(service):
+            with pytest.raises(UpstreamQuotaExceeded):
+                await service.get_license_limit_by_date(
+                    "202603010000", "202603012359"
+                )
+            # 한도 초과 후에는 서킷이 열려 요청을 보내지 않음
+            with pytest.raises(CircuitOpenError):
+                await service.get_license_limit_by_date(
+                    "202603010000", "202603012359"
+                )
+        assert quota.requests[LICENSE_LIMIT, "quota"] == 1
+
+    @pytest.mark.asyncio
+    async def test_server_errors_raise_after_retries(self, service):
+        fake = FakeNaraJangter(generate_dataset(notices=4), error_rate=1.0)
+
+        with fake.install(service):
+            with pytest.raises(UpstreamUnavailable):
+                await service.search_bids("contract", window_params(1))
+        assert fake.requests[CNSTWK_NOTICES, "error"] == 3
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.leader_election import LeaderElection, advisory_lock_key
+
+
+def make_election():
+    start = AsyncMock()
+    stop = AsyncMock()
+    election = LeaderElection("test_scheduler", start, stop)
+    election.RENEW_INTERVAL = 0
+    election.RETRY_INTERVAL = 0
+    return election, start, stop
+
+
+async def run_iterations(election, iterations: int):
+    """run() 루프를 지정 횟수만큼 돌린 뒤 종료합니다."""
+    real_sleep = asyncio.sleep
+    count = 0
+
+    async def fake_sleep(_):
+        nonlocal count
+        count += 1
+        if count >= iterations:
+            election.is_running = False
+        await real_sleep(0)
+
+    with patch("app.services.leader_election.asyncio.sleep", fake_sleep):
+        await election.run()
+
+
+class TestAdvisoryLockKey:
+    def test_stable_and_signed_64bit(self):
+        key = advisory_lock_key("bid_sync_scheduler")
+        assert key == advisory_lock_key("bid_sync_scheduler")
+        assert -(2**63) <= key < 2**63
+        assert key != advisory_lock_key("notification_scheduler")
+
+
+class TestLeaderElection:
+    @pytest.mark.asyncio
+    async def test_follower_does_not_start(self):
+        election, start, _ = make_election()
+        election._try_acquire = AsyncMock(return_value=False)
+
+        await run_iterations(election, 3)
+
+        assert election.is_leader is False
+        assert election._try_acquire.await_count == 3
+        start.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_leader_starts_and_renews(self):
+        election, start, stop = make_election()
+        election._try_acquire = AsyncMock(return_value=True)
+        election._renew = AsyncMock()
+
+        await run_iterations(election, 3)
+        await asyncio.sleep(0)
+
+        assert election.is_leader is True
+        election._try_acquire.assert_awaited_once()
+        assert election._renew.await_count == 2
+        start.assert_awaited_once()
+        stop.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lost_lease_steps_down(self):
+        election, start, stop = make_election()
+        election._try_acquire = AsyncMock(side_effect=[True, False])
+        election._renew = AsyncMock(side_effect=RuntimeError("connection lost"))
+
+        await run_iterations(election, 3)
+
+        assert election.is_leader is False
+        stop.assert_awaited_once()
+        assert election._try_acquire.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_shutdown_stops_leader(self):
+        election, _, stop = make_election()
+        election.is_leader = True
+
+        await election.shutdown()
+
+        assert election.is_leader is False
+        stop.assert_awaited_once()
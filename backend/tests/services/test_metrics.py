@@ -0,0 +1,137 @@
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from prometheus_client import REGISTRY
+
+from app.core.metrics import (
+    InstrumentedTransport,
+    instrument_methods,
+    metrics_authorized,
+    render_metrics,
+    result_code_of,
+    upstream_client_options,
+)
+
+URL = "https://apis.data.go.kr/1230000/ad/BidPublicInfoService/getBidPblancListInfoPrtcptPsblRgn"
+ENDPOINT = "getBidPblancListInfoPrtcptPsblRgn"
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+# ---------------------------------------------------------------------------
+# 나라장터 API
+# ---------------------------------------------------------------------------
+
+class TestUpstream:
+    @pytest.mark.parametrize("content,code", [
+        (b'{"response":{"header":{"resultCode":"00","resultMsg":"OK"}}}', "00"),
+        (b'{"response": {"header": {"resultCode": "22"}}}', "22"),
+        (
+            b"<OpenAPI_ServiceResponse><cmmMsgHeader>"
+            b"<returnReasonCode>22</returnReasonCode></cmmMsgHeader>",
+            "22",
+        ),
+        (b"Unexpected errors", "none"),
+    ])
+    def test_result_code_of(self, content, code):
+        assert result_code_of(content) == code
+
+    @pytest.mark.asyncio
+    async def test_response_hook_records_latency(self):
+        labels = {"endpoint": ENDPOINT, "status": "200", "result_code": "03"}
+        before = sample("narajangter_request_duration_seconds_count", **labels)
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(
+            200, json={"response": {"header": {"resultCode": "03"}}}
+        ))
+        hooks = upstream_client_options()["event_hooks"]
+        async with httpx.AsyncClient(transport=transport, event_hooks=hooks) as client:
+            response = await client.get(URL)
+
+        # 호출자는 평소처럼 본문을 읽을 수 있어야 함
+        assert response.json()["response"]["header"]["resultCode"] == "03"
+        assert sample(
+            "narajangter_request_duration_seconds_count", **labels
+        ) == before + 1
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_are_counted(self):
+        labels = {"endpoint": ENDPOINT, "error": "ConnectTimeout"}
+        before = sample("narajangter_request_errors_total", **labels)
+
+        with patch(
+            "httpx.AsyncHTTPTransport.handle_async_request",
+            new_callable=AsyncMock,
+            side_effect=httpx.ConnectTimeout("timed out"),
+        ):
+            with pytest.raises(httpx.ConnectTimeout):
+                await InstrumentedTransport().handle_async_request(
+                    httpx.Request("GET", URL)
+                )
+
+        assert sample("narajangter_request_errors_total", **labels) == before + 1
+
+
+# ---------------------------------------------------------------------------
+# instrument_methods
+# ---------------------------------------------------------------------------
+
+@instrument_methods()
+class _Service:
+    async def load(self, value: int) -> int:
+        """원본 docstring"""
+        return value * 2
+
+    async def fail(self) -> None:
+        raise RuntimeError("boom")
+
+    async def _private(self) -> int:
+        return 1
+
+
+class TestInstrumentMethods:
+    @pytest.mark.asyncio
+    async def test_records_outcome_per_method(self):
+        ok = {"method": "load", "outcome": "ok"}
+        error = {"method": "fail", "outcome": "error"}
+        before_ok = sample("bid_data_service_duration_seconds_count", **ok)
+        before_error = sample("bid_data_service_duration_seconds_count", **error)
+
+        service = _Service()
+        assert await service.load(value=2) == 4
+        with pytest.raises(RuntimeError):
+            await service.fail()
+        await service._private()
+
+        assert sample("bid_data_service_duration_seconds_count", **ok) == before_ok + 1
+        assert sample(
+            "bid_data_service_duration_seconds_count", **error
+        ) == before_error + 1
+        assert _Service.load.__doc__ == "원본 docstring"
+        assert sample(
+            "bid_data_service_duration_seconds_count",
+            method="_private", outcome="ok",
+        ) == 0
+
+    def test_render_metrics(self):
+        body, content_type = render_metrics()
+
+        assert content_type.startswith("text/plain")
+        assert b"sync_api_budget_remaining" in body
+
+    @pytest.mark.parametrize("authorization, allowed", [
+        ("Bearer s3cret", True),
+        ("bearer s3cret", True),
+        ("Bearer wrong", False),
+        ("Basic s3cret", False),
+        ("s3cret", False),
+        (None, False),
+    ])
+    def test_metrics_authorized(self, authorization, allowed):
+        assert metrics_authorized(authorization, "s3cret") is allowed
+
+    def test_metrics_disabled_without_token(self):
+        assert metrics_authorized("Bearer ", "") is False
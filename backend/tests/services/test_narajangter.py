@@ -4,6 +4,11 @@ from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
 
 from app.services.narajangter import NaraJangterService
+from app.services.upstream_resilience import (
+    UpstreamRejected,
+    UpstreamThrottled,
+    UpstreamUnavailable,
+)
 from app.schemas.bid import (
     BidAValueItem,
     BidApiResponse,
@@ -78,6 +83,12 @@ class TestParseApiResponse:
         assert items == []
         assert body is None
 
+    def test_nodata_result_code_returns_empty_body(self):
+        data = make_error_response("03", "NODATA_ERROR")
+        items, body = self.service._parse_api_response(data, "test")
+        assert items == []
+        assert body == {}
+
     def test_error_result_code_returns_empty(self):
         data = make_error_response("99", "FAIL")
         items, body = self.service._parse_api_response(data, "test")
@@ -129,14 +140,15 @@ class TestGetBidAValue:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_429_returns_none(self, service):
-        error = make_http_status_error(429)
-        mock_resp = make_mock_response(raise_for_status_error=error)
+    async def test_429_raises_throttled_after_retries(self, service):
+        """429는 "데이터 없음"이 아니라 재시도 후 UpstreamThrottled"""
+        mock_resp = make_mock_response(status_code=429)
 
-        with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
-            result = await service.get_bid_a_value("RATELIMITED")
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp) as mock_get:
+            with pytest.raises(UpstreamThrottled):
+                await service.get_bid_a_value("RATELIMITED")
 
-        assert result is None
+        assert mock_get.await_count == 3
 
     @pytest.mark.asyncio
     async def test_invalid_json_returns_none(self, service):
@@ -157,13 +169,36 @@ class TestGetBidAValue:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_api_error_code_returns_none(self, service):
-        mock_resp = make_mock_response(json_data=make_error_response())
+    async def test_transient_api_error_raises_after_retries(self, service):
+        mock_resp = make_mock_response(json_data=make_error_response("99"))
 
-        with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
-            result = await service.get_bid_a_value("APIERR")
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp) as mock_get:
+            with pytest.raises(UpstreamUnavailable):
+                await service.get_bid_a_value("APIERR")
+
+        assert mock_get.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_permanent_api_error_is_not_retried(self, service):
+        mock_resp = make_mock_response(
+            json_data=make_error_response("30", "SERVICE_KEY_IS_NOT_REGISTERED_ERROR")
+        )
+
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp) as mock_get:
+            with pytest.raises(UpstreamRejected):
+                await service.get_bid_a_value("BADKEY")
+
+        assert mock_get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_nodata_code_returns_none(self, service):
+        mock_resp = make_mock_response(json_data=make_error_response("03", "NODATA_ERROR"))
+
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp) as mock_get:
+            result = await service.get_bid_a_value("NODATA")
 
         assert result is None
+        assert mock_get.await_count == 1
 
     @pytest.mark.asyncio
     async def test_empty_items_returns_none(self, service):
@@ -228,24 +263,30 @@ class TestGetPrtcptPsblRgnByDate:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_api_error_returns_empty(self, service):
+    async def test_api_error_raises_unavailable(self, service):
         mock_resp = make_mock_response(json_data=make_error_response())
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
-            result = await service.get_prtcpt_psbl_rgn_by_date("x", "y")
-
-        assert result == []
+            with pytest.raises(UpstreamUnavailable):
+                await service.get_prtcpt_psbl_rgn_by_date("x", "y")
 
     @pytest.mark.asyncio
-    async def test_429_returns_empty(self, service):
-        error = make_http_status_error(429)
-        mock_resp = make_mock_response(raise_for_status_error=error)
+    async def test_nodata_code_returns_empty(self, service):
+        mock_resp = make_mock_response(json_data=make_error_response("03", "NODATA_ERROR"))
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
             result = await service.get_prtcpt_psbl_rgn_by_date("x", "y")
 
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_429_raises_throttled(self, service):
+        mock_resp = make_mock_response(status_code=429)
+
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
+            with pytest.raises(UpstreamThrottled):
+                await service.get_prtcpt_psbl_rgn_by_date("x", "y")
+
     @pytest.mark.asyncio
     async def test_default_num_of_rows_is_999(self, service):
         """기본 numOfRows가 999인지 확인"""
@@ -288,14 +329,12 @@ class TestGetPrtcptPsblRgnByBid:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_429_returns_empty(self, service):
-        error = make_http_status_error(429)
-        mock_resp = make_mock_response(raise_for_status_error=error)
+    async def test_429_raises_throttled(self, service):
+        mock_resp = make_mock_response(status_code=429)
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
-            result = await service.get_prtcpt_psbl_rgn_by_bid("RATELIMITED")
-
-        assert result == []
+            with pytest.raises(UpstreamThrottled):
+                await service.get_prtcpt_psbl_rgn_by_bid("RATELIMITED")
 
 
 # ---------------------------------------------------------------------------
@@ -325,24 +364,30 @@ class TestGetLicenseLimitByDate:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_api_error_returns_empty(self, service):
+    async def test_api_error_raises_unavailable(self, service):
         mock_resp = make_mock_response(json_data=make_error_response())
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
-            result = await service.get_license_limit_by_date("x", "y")
-
-        assert result == []
+            with pytest.raises(UpstreamUnavailable):
+                await service.get_license_limit_by_date("x", "y")
 
     @pytest.mark.asyncio
-    async def test_429_returns_empty(self, service):
-        error = make_http_status_error(429)
-        mock_resp = make_mock_response(raise_for_status_error=error)
+    async def test_nodata_code_returns_empty(self, service):
+        mock_resp = make_mock_response(json_data=make_error_response("03", "NODATA_ERROR"))
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
             result = await service.get_license_limit_by_date("x", "y")
 
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_429_raises_throttled(self, service):
+        mock_resp = make_mock_response(status_code=429)
+
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
+            with pytest.raises(UpstreamThrottled):
+                await service.get_license_limit_by_date("x", "y")
+
 
 # ---------------------------------------------------------------------------
 # get_bid_opening_results
@@ -371,14 +416,12 @@ class TestGetBidOpeningResults:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_429_returns_empty(self, service):
-        error = make_http_status_error(429)
-        mock_resp = make_mock_response(raise_for_status_error=error)
+    async def test_429_raises_throttled(self, service):
+        mock_resp = make_mock_response(status_code=429)
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
-            result = await service.get_bid_opening_results("RATELIMITED")
-
-        assert result == []
+            with pytest.raises(UpstreamThrottled):
+                await service.get_bid_opening_results("RATELIMITED")
 
     @pytest.mark.asyncio
     async def test_invalid_json_returns_empty(self, service):
@@ -390,13 +433,12 @@ class TestGetBidOpeningResults:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_api_error_returns_empty(self, service):
+    async def test_api_error_raises_unavailable(self, service):
         mock_resp = make_mock_response(json_data=make_error_response())
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
-            result = await service.get_bid_opening_results("ERR")
-
-        assert result == []
+            with pytest.raises(UpstreamUnavailable):
+                await service.get_bid_opening_results("ERR")
 
     @pytest.mark.asyncio
     async def test_missing_response_key_returns_empty(self, service):
@@ -462,7 +504,7 @@ class TestSearchBids:
 
     @pytest.mark.asyncio
     async def test_api_error_raises(self, service):
-        """search_bids는 API 에러 시 Exception을 raise"""
+        """search_bids는 일시 오류 resultCode면 재시도 후 UpstreamUnavailable을 raise"""
         mock_resp = make_mock_response(json_data=make_error_response())
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
@@ -471,9 +513,25 @@ class TestSearchBids:
                 inqryBgnDt="202402010000",
                 inqryEndDt="202402012359",
             )
-            with pytest.raises(Exception, match="API Error"):
+            with pytest.raises(UpstreamUnavailable, match="resultCode 99"):
                 await service.search_bids("contract", params)
 
+    @pytest.mark.asyncio
+    async def test_nodata_code_returns_empty_page(self, service):
+        """NODATA(03)는 오류가 아니라 빈 페이지"""
+        mock_resp = make_mock_response(json_data=make_error_response("03", "NODATA_ERROR"))
+
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock, return_value=mock_resp):
+            params = BidSearchParams(
+                inqryDiv="1",
+                inqryBgnDt="202402010000",
+                inqryEndDt="202402012359",
+            )
+            result = await service.search_bids("contract", params)
+
+        assert result.items == []
+        assert result.totalCount == 0
+
     @pytest.mark.asyncio
     async def test_404_raises_http_error(self, service):
         """search_bids는 404 시 HTTPStatusError를 propagate"""
@@ -0,0 +1,67 @@
+import uuid
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.models.user import User, UserPreference
+from app.services.scheduler import NotificationScheduler
+
+
+def user_preference():
+    user = User(
+        user_id=uuid.uuid4(), username="u", email="u@example.com", password_hash="-"
+    )
+    preference = UserPreference(
+        user_id=user.user_id,
+        search_conditions={"inqryDiv": "1"},
+        email_notifications_enabled=True,
+        notification_frequency="daily",
+        last_notification_at=None,
+    )
+    return user, preference
+
+
+# ---------------------------------------------------------------------------
+# notify_user
+# ---------------------------------------------------------------------------
+
+class TestNotifyUser:
+    @pytest.mark.asyncio
+    async def test_searches_every_work_type(self):
+        def search(work_type, params):
+            return MagicMock(items=[f"{work_type}-1"])
+
+        with patch(
+            "app.services.scheduler.narajangter_service"
+        ) as nara, patch(
+            "app.services.scheduler.email_service"
+        ) as email:
+            nara.url_dict = {"contract": "c", "service": "s"}
+            nara.search_bids = AsyncMock(side_effect=search)
+            email.send_bid_notification = AsyncMock()
+            await NotificationScheduler().notify_user(*user_preference())
+
+        assert [c.args[0] for c in nara.search_bids.await_args_list] == [
+            "contract", "service",
+        ]
+        assert email.send_bid_notification.await_args.kwargs["bid_notices"] == [
+            "contract-1", "service-1",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_work_type_does_not_drop_others(self):
+        with patch(
+            "app.services.scheduler.narajangter_service"
+        ) as nara, patch(
+            "app.services.scheduler.email_service"
+        ) as email:
+            nara.url_dict = {"contract": "c", "service": "s"}
+            nara.search_bids = AsyncMock(side_effect=[
+                RuntimeError("503"), MagicMock(items=["service-1"]),
+            ])
+            email.send_bid_notification = AsyncMock()
+            await NotificationScheduler().notify_user(*user_preference())
+
+        assert email.send_bid_notification.await_args.kwargs["bid_notices"] == [
+            "service-1",
+        ]
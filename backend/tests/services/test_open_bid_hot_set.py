@@ -0,0 +1,249 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.models.bid import BidLicenseLimit, BidNotice, BidPrtcptPsblRgn
+from app.schemas.bid import BidSearchParams
+from app.services.open_bid_hot_set import HotNotice, OpenBidHotSet
+
+KST = timezone(timedelta(hours=9))
+NOW = datetime(2026, 2, 15, 12, 0, tzinfo=KST)
+
+
+def notice(rgst_dt, close_days=3, **overrides) -> HotNotice:
+    data = {
+        "rgst_dt": rgst_dt,
+        "openg_at": NOW + timedelta(days=close_days, hours=1),
+        "bid_close_at": NOW + timedelta(days=close_days),
+        "presmpt_prce": 100_000_000,
+        "bdgt_amt": 110_000_000,
+        "cnstrtsite_rgn_nm": "",
+        "region_codes": ("00",),
+        "industries": (),
+    }
+    data.update(overrides)
+    return HotNotice(**data)
+
+
+def params(**overrides) -> BidSearchParams:
+    data = {
+        "inqryBgnDt": "202602010000",
+        "inqryEndDt": "202602282359",
+        "bidClseExcpYn": "Y",
+    }
+    data.update(overrides)
+    return BidSearchParams(**data)
+
+
+def make_hot_set(notices) -> OpenBidHotSet:
+    hot_set = OpenBidHotSet()
+    hot_set.load(notices)
+    return hot_set
+
+
+def nos(result):
+    keys, _ = result
+    return [key[0] for key in keys]
+
+
+# ---------------------------------------------------------------------------
+# can_serve
+# ---------------------------------------------------------------------------
+
+class TestCanServe:
+    def test_only_open_bid_searches(self):
+        hot_set = OpenBidHotSet()
+        assert hot_set.can_serve(params())
+        assert not hot_set.can_serve(params(bidClseExcpYn=None))
+        assert not hot_set.can_serve(params(orderBy="unknown"))
+
+
+# ---------------------------------------------------------------------------
+# search
+# ---------------------------------------------------------------------------
+
+class TestSearch:
+    def test_excludes_closed_and_out_of_range(self):
+        hot_set = make_hot_set({
+            ("A", "000"): notice("202602101000"),
+            ("B", "000"): notice("202602101000", close_days=-1),
+            ("C", "000"): notice("202601101000"),
+        })
+
+        assert nos(hot_set.search(params(), now=NOW)) == ["A"]
+
+    def test_default_order_and_paging(self):
+        hot_set = make_hot_set({
+            ("A", "000"): notice("202602101000"),
+            ("B", "000"): notice("202602121000"),
+            ("C", "000"): notice("202602111000"),
+        })
+
+        result = hot_set.search(params(numOfRows=2, pageNo=1), now=NOW)
+        assert nos(result) == ["B", "C"]
+        assert result[1] == 3
+        assert nos(hot_set.search(params(numOfRows=2, pageNo=2), now=NOW)) == ["A"]
+        assert result[0][0] == ("B", "000", "202602121000")
+
+    def test_budget_sort_nulls_last(self):
+        hot_set = make_hot_set({
+            ("A", "000"): notice("202602101000", bdgt_amt=None),
+            ("B", "000"): notice("202602101000", bdgt_amt=5),
+            ("C", "000"): notice("202602101000", bdgt_amt=9),
+        })
+
+        desc = params(orderBy="bdgtAmt", orderDir="desc")
+        asc = params(orderBy="bdgtAmt", orderDir="asc")
+        assert nos(hot_set.search(desc, now=NOW)) == ["C", "B", "A"]
+        assert nos(hot_set.search(asc, now=NOW)) == ["B", "C", "A"]
+
+    def test_opening_date_range(self):
+        hot_set = make_hot_set({
+            ("A", "000"): notice("202602101000", close_days=1),
+            ("B", "000"): notice("202602101000", close_days=10),
+            ("C", "000"): notice("202602101000", openg_at=None),
+        })
+
+        result = hot_set.search(
+            params(inqryDiv="2", inqryBgnDt="202602150000", inqryEndDt="202602202359"),
+            now=NOW,
+        )
+        assert nos(result) == ["A"]
+
+    def test_price_region_and_industry_filters(self):
+        hot_set = make_hot_set({
+            ("A", "000"): notice(
+                "202602101000", region_codes=("41/성남시", ">41"),
+                industries=("전기공사업/0001\x00전기공사업",),
+            ),
+            ("B", "000"): notice(
+                "202602101000", region_codes=("11",),
+                industries=("전기공사업/0001\x00",),
+            ),
+            ("C", "000"): notice(
+                "202602101000", presmpt_prce=1_000,
+                industries=("토목공사업/0002\x00",),
+            ),
+        })
+
+        assert nos(hot_set.search(params(), ["00", "41", ">41"], now=NOW)) == [
+            "A", "C",
+        ]
+        assert nos(hot_set.search(params(indstrytyNm="전기"), now=NOW)) == [
+            "A", "B",
+        ]
+        assert nos(
+            hot_set.search(params(presmptPrceBgn="10000"), now=NOW)
+        ) == ["A", "B"]
+        # 인덱스에 없는 지역코드만 요청 → 결과 없음
+        assert hot_set.search(params(), ["99"], now=NOW) == ([], 0)
+
+    def test_construction_site_filter(self):
+        hot_set = make_hot_set({
+            ("A", "000"): notice("202602101000", cnstrtsite_rgn_nm="경기도 성남시"),
+            ("B", "000"): notice("202602101000", cnstrtsite_rgn_nm="서울특별시"),
+        })
+
+        assert nos(
+            hot_set.search(params(cnstrtsiteRgnNm="성남"), now=NOW)
+        ) == ["A"]
+
+
+# ---------------------------------------------------------------------------
+# ensure_fresh / refresh
+# ---------------------------------------------------------------------------
+
+class TestRefresh:
+    @pytest.mark.asyncio
+    async def test_first_use_loads_then_stays_fresh(self):
+        hot_set = OpenBidHotSet()
+        hot_set.reload = AsyncMock(side_effect=lambda db: hot_set.load({}))
+        hot_set.refresh = AsyncMock()
+
+        await hot_set.ensure_fresh(MagicMock())
+        await hot_set.ensure_fresh(MagicMock())
+
+        hot_set.reload.assert_awaited_once()
+        hot_set.refresh.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stale_mark_triggers_incremental_refresh(self):
+        hot_set = OpenBidHotSet()
+        hot_set.load({})
+        hot_set.reload = AsyncMock()
+        hot_set.refresh = AsyncMock()
+
+        hot_set.mark_stale()
+        await hot_set.ensure_fresh(MagicMock())
+
+        hot_set.refresh.assert_awaited_once()
+        hot_set.reload.assert_not_awaited()
+
+    @pytest.mark.parametrize(
+        "model", [BidNotice, BidPrtcptPsblRgn, BidLicenseLimit]
+    )
+    def test_incremental_refresh_columns_are_indexed(self, model):
+        indexed = {
+            tuple(c.name for c in index.columns)
+            for index in model.__table__.indexes
+        }
+        assert ("fetched_at",) in indexed
+
+    @pytest.mark.asyncio
+    async def test_schedule_refresh_runs_in_background_once(self):
+        hot_set = OpenBidHotSet()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_reload(db):
+            started.set()
+            await release.wait()
+            hot_set.load({})
+
+        hot_set.reload = AsyncMock(side_effect=slow_reload)
+        with patch("app.services.open_bid_hot_set.AsyncSessionLocal"):
+            hot_set.schedule_refresh()
+            hot_set.schedule_refresh()  # 진행 중이면 새로 시작하지 않음
+            await started.wait()
+            assert not hot_set.is_loaded
+
+            release.set()
+            await hot_set._task
+            hot_set.schedule_refresh()  # 갱신 직후에는 시작하지 않음
+
+        hot_set.reload.assert_awaited_once()
+        assert hot_set.is_loaded
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_failure_is_logged(self):
+        hot_set = OpenBidHotSet()
+        hot_set.reload = AsyncMock(side_effect=RuntimeError("db down"))
+        with patch("app.services.open_bid_hot_set.AsyncSessionLocal"):
+            hot_set.schedule_refresh()
+            await hot_set._task
+        assert not hot_set.is_loaded
+
+    @pytest.mark.asyncio
+    async def test_refresh_replaces_changed_notices(self):
+        hot_set = OpenBidHotSet()
+        # refresh는 실제 현재 시각으로 마감 공고를 정리하므로 먼 미래 마감
+        hot_set.load({
+            ("A", "000"): notice("202602101000", close_days=3650),
+            ("B", "000"): notice("202602101000", close_days=3650),
+        })
+        hot_set._watermark = NOW
+        changed = MagicMock()
+        changed.all.return_value = [("A", "000"), ("C", "000")]
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=changed)
+        # A는 마감되어 빠지고 C가 새로 추가됨
+        hot_set._fetch = AsyncMock(
+            return_value={("C", "000"): notice("202602111000", close_days=3650)}
+        )
+
+        await hot_set.refresh(db)
+
+        hot_set._fetch.assert_awaited_once_with(db, [("A", "000"), ("C", "000")])
+        assert nos(hot_set.search(params())) == ["C", "B"]
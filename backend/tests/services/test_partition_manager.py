@@ -0,0 +1,111 @@
+from datetime import datetime
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.partition_manager import (
+    PartitionManager,
+    add_months,
+    partition_month,
+)
+
+
+def make_db(partitions):
+    listed = MagicMock()
+    listed.all.return_value = [(name,) for name in partitions]
+
+    async def execute(stmt, params=None):
+        return listed if "pg_inherits" in str(stmt) else MagicMock()
+
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=execute)
+    db.commit = AsyncMock()
+    return db
+
+
+def executed_sql(db):
+    return [str(c.args[0]) for c in db.execute.await_args_list]
+
+
+# ---------------------------------------------------------------------------
+# Month helpers
+# ---------------------------------------------------------------------------
+
+class TestMonthHelpers:
+    def test_add_months_across_years(self):
+        assert add_months("202611", 3) == "202702"
+        assert add_months("202601", -1) == "202512"
+        assert add_months("202603", -24) == "202403"
+
+    def test_partition_month(self):
+        assert partition_month("bid_notices_p202602") == "202602"
+        assert partition_month("bid_notices_pdefault") is None
+
+
+# ---------------------------------------------------------------------------
+# PartitionManager
+# ---------------------------------------------------------------------------
+
+class TestEnsurePartitions:
+    @pytest.mark.asyncio
+    async def test_creates_only_missing_months(self):
+        manager = PartitionManager()
+        manager.MONTHS_AHEAD = 1
+        db = make_db([
+            "bid_notices_p202602",
+            "bid_prtcpt_psbl_rgns_p202602",
+            "bid_prtcpt_psbl_rgns_p202603",
+            "bid_license_limits_p202602",
+            "bid_license_limits_p202603",
+            "bid_region_eligibility_p202602",
+            "bid_region_eligibility_p202603",
+        ])
+
+        created = await manager.ensure_partitions(db, datetime(2026, 2, 15))
+
+        assert created == ["bid_notices_p202603"]
+        sql = executed_sql(db)
+        assert any(
+            "PARTITION OF \"bid_notices\" FOR VALUES FROM ('202603') TO ('202604')"
+            in s for s in sql
+        )
+        # default 파티션에 들어간 해당 월 row 이동
+        assert any('FROM "bid_notices_pdefault"' in s for s in sql)
+
+
+class TestDropExpired:
+    @pytest.mark.asyncio
+    async def test_disabled_when_retention_zero(self):
+        db = make_db(["bid_notices_p201001"])
+        dropped = await PartitionManager().drop_expired(
+            db, datetime(2026, 2, 1), 0
+        )
+        assert dropped == []
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_drops_months_before_cutoff(self):
+        db = make_db([
+            "bid_notices_p202401",
+            "bid_notices_p202402",
+            "bid_notices_p202403",
+            "bid_notices_pdefault",
+        ])
+
+        with patch("app.services.partition_manager.sync_coverage") as coverage:
+            dropped = await PartitionManager().drop_expired(
+                db, datetime(2026, 2, 15), 24
+            )
+
+        # cutoff 202402: 202401만 삭제 (테이블별로 동일 목록 반환)
+        assert set(dropped) == {"bid_notices_p202401"}
+        assert "bid_notices_pdefault" not in dropped
+        db.commit.assert_awaited_once()
+
+        # 삭제된 기간의 동기화 기록도 제거 → 다시 동기화 대상
+        (sync_log,) = [
+            c for c in db.execute.await_args_list
+            if "data_sync_log" in str(c.args[0])
+        ]
+        assert sync_log.args[1] == {"cutoff": "202402"}
+        coverage.invalidate.assert_called_once()
@@ -0,0 +1,150 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.profiling import (
+    ProfilingMiddleware,
+    QueryTiming,
+    RequestProfile,
+    RequestProfiler,
+    current_profile,
+    phase,
+)
+
+
+def make_app(profiler: RequestProfiler) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, profiler=profiler)
+
+    @app.get("/search")
+    async def search():
+        with phase("count_query"):
+            pass
+        with phase("serialize"):
+            pass
+        return {"profiled": current_profile() is not None}
+
+    return app
+
+
+# ---------------------------------------------------------------------------
+# ProfilingMiddleware
+# ---------------------------------------------------------------------------
+
+class TestMiddleware:
+    def test_header_opt_in_records_phases(self):
+        profiler = RequestProfiler(
+            sample_rate=0.0, slow_ms=0, max_entries=5, secret="s3cret"
+        )
+        client = TestClient(make_app(profiler))
+
+        plain = client.get("/search")
+        profiled = client.get("/search?q=1", headers={"X-Profile": "s3cret"})
+
+        assert plain.json() == {"profiled": False}
+        assert "server-timing" not in plain.headers
+        assert profiled.json() == {"profiled": True}
+        timing = profiled.headers["server-timing"]
+        assert timing.startswith("count_query;dur=")
+        assert "serialize;dur=" in timing and "total;dur=" in timing
+
+        (profile,) = profiler.recent()
+        assert profile.path == "/search" and profile.query_string == "q=1"
+        assert profile.status_code == 200
+        assert [name for name, _ in profile.phases] == ["count_query", "serialize"]
+
+    def test_sampling(self):
+        profiler = RequestProfiler(sample_rate=1.0, slow_ms=0, max_entries=5)
+
+        assert TestClient(make_app(profiler)).get("/search").json() == {
+            "profiled": True
+        }
+        assert profiler.should_profile([(b"x-profile", b"0")]) is True
+
+    def test_header_requires_configured_secret(self):
+        unset = RequestProfiler(sample_rate=0.0, secret="")
+        assert unset.should_profile([(b"x-profile", b"1")]) is False
+        assert unset.should_profile([(b"x-profile", b"")]) is False
+
+        profiler = RequestProfiler(sample_rate=0.0, secret="s3cret")
+        assert profiler.should_profile([(b"x-profile", b"1")]) is False
+        assert profiler.should_profile([(b"x-profile", b"s3cret")]) is True
+
+    def test_fast_requests_are_not_kept(self):
+        profiler = RequestProfiler(sample_rate=1.0, slow_ms=60_000, max_entries=5)
+        TestClient(make_app(profiler)).get("/search")
+
+        assert profiler.recent() == []
+
+
+# ---------------------------------------------------------------------------
+# RequestProfiler
+# ---------------------------------------------------------------------------
+
+class TestProfiler:
+    @pytest.mark.asyncio
+    async def test_keeps_most_recent_n_slow_requests(self):
+        profiler = RequestProfiler(sample_rate=0.0, slow_ms=10, max_entries=2)
+        for ms in (50, 20, 80, 5, 30):
+            profile = RequestProfile(method="GET", path=f"/{ms}", query_string="")
+            token = profiler.start(profile)
+            profile.total_ms = ms
+            await profiler.finish(profile, token)
+
+        assert [p.total_ms for p in profiler.recent()] == [30, 80]
+        assert current_profile() is None
+
+    @pytest.mark.asyncio
+    async def test_sql_events_only_while_profiling(self):
+        conn = MagicMock()
+        conn.info = {}
+        args = (conn, None, "SELECT 1", ("a",), None, False)
+
+        RequestProfiler._before_execute(*args)
+        RequestProfiler._after_execute(*args)
+        assert conn.info == {}
+
+        profiler = RequestProfiler(sample_rate=0.0, slow_ms=60_000)
+        profile = RequestProfile(method="GET", path="/", query_string="")
+        token = profiler.start(profile)
+        RequestProfiler._before_execute(*args)
+        RequestProfiler._after_execute(*args)
+        await profiler.finish(profile, token)
+
+        (query,) = profile.queries
+        assert query.sql == "SELECT 1" and query.raw_params == ("a",)
+
+    @pytest.mark.asyncio
+    async def test_explains_slowest_selects(self):
+        conn = MagicMock()
+        result = MagicMock()
+        result.scalar.return_value = [{"Plan": {"Node Type": "Index Scan"}}]
+        conn.exec_driver_sql = AsyncMock(return_value=result)
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+        engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        profiler = RequestProfiler(sample_rate=0.0, slow_ms=0, max_entries=5)
+        profiler._engine = engine
+        profile = RequestProfile(method="POST", path="/bids/search", query_string="")
+        profile.queries = [
+            QueryTiming(sql="SELECT count(*) FROM bid_notices", params="()", ms=5),
+            QueryTiming(sql="UPDATE x SET y = $1", params="(1,)", ms=90,
+                        raw_params=(1,)),
+            QueryTiming(sql="SELECT * FROM bid_notices WHERE a = $1",
+                        params="('b',)", ms=40, raw_params=("b",)),
+        ]
+        token = profiler.start(profile)
+        profile.total_ms = 100
+        await profiler.finish(profile, token)
+
+        calls = [c.args for c in conn.exec_driver_sql.await_args_list]
+        assert calls == [
+            ("EXPLAIN (FORMAT JSON) SELECT * FROM bid_notices WHERE a = $1", ("b",)),
+            ("EXPLAIN (FORMAT JSON) SELECT count(*) FROM bid_notices", ()),
+        ]
+        assert profile.queries[2].plan[0]["Plan"]["Node Type"] == "Index Scan"
+        assert profile.queries[1].plan is None
+        assert profile.to_dict()["queries"][2]["params"] == "('b',)"
@@ -0,0 +1,65 @@
+from app.services.region_hierarchy import (
+    ancestor_codes,
+    eligibility_codes,
+    filter_match_codes,
+    location_match_codes,
+    region_code,
+)
+
+
+def matches(notice_regions, query_codes) -> bool:
+    return bool(set(eligibility_codes(notice_regions)) & set(query_codes))
+
+
+# ---------------------------------------------------------------------------
+# region_code
+# ---------------------------------------------------------------------------
+
+class TestRegionCode:
+    def test_sido_names_and_aliases(self):
+        assert region_code("경기도") == "41"
+        assert region_code("경기") == "41"
+        assert region_code("강원도") == region_code("강원특별자치도") == "51"
+        assert region_code("전라북도 전주시") == "52/전주시"
+
+    def test_unrestricted(self):
+        assert region_code("전체") == "00"
+        assert region_code("") == "00"
+        assert region_code(None) == "00"
+
+    def test_nested_and_unknown(self):
+        assert region_code("경기도  성남시 분당구") == "41/성남시/분당구"
+        assert region_code("해외 지역") == "해외/지역"
+
+    def test_ancestor_codes(self):
+        assert ancestor_codes("41/성남시/분당구") == ["41", "41/성남시"]
+        assert ancestor_codes("41") == []
+        assert ancestor_codes("00") == []
+
+
+# ---------------------------------------------------------------------------
+# eligibility / match codes
+# ---------------------------------------------------------------------------
+
+class TestEligibility:
+    def test_expands_ancestors(self):
+        assert eligibility_codes(["경기도 성남시"]) == ["41/성남시", ">41"]
+        assert eligibility_codes([]) == ["00"]
+        assert eligibility_codes(["전체", "서울특별시"]) == ["00", "11"]
+
+    def test_location_matches_ancestor_self_and_descendant(self):
+        codes = location_match_codes("경기도 성남시")
+        assert codes == ["00", "41", "41/성남시", ">41/성남시"]
+        assert matches([], codes)
+        assert matches(["경기도"], codes)
+        assert matches(["경기도 성남시"], codes)
+        assert matches(["경기도 성남시 분당구"], codes)
+        assert not matches(["경기도 수원시"], codes)
+        assert not matches(["서울특별시"], codes)
+
+    def test_filter_matches_region_and_descendants(self):
+        codes = filter_match_codes(["경기도 성남시"])
+        assert matches(["전체"], codes)
+        assert matches(["경기도 성남시 분당구"], codes)
+        assert not matches(["경기도"], codes)
+        assert matches(["경기도 수원시"], filter_match_codes(["경기"]))
@@ -0,0 +1,175 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.schemas.bid import BidSearchParams
+from app.services.search_cache import (
+    MISS,
+    CacheLookup,
+    MemorySearchCacheBackend,
+    PostgresSearchCacheBackend,
+    SearchResponseCache,
+    search_cache_key,
+)
+
+
+def params(**overrides) -> BidSearchParams:
+    data = {"inqryBgnDt": "202602010000", "inqryEndDt": "202602282359"}
+    data.update(overrides)
+    return BidSearchParams(**data)
+
+
+# ---------------------------------------------------------------------------
+# search_cache_key
+# ---------------------------------------------------------------------------
+
+class TestSearchCacheKey:
+    def test_defaults_and_explicit_values_share_key(self):
+        assert search_cache_key(params()) == search_cache_key(
+            params(inqryDiv="1", numOfRows=100, pageNo=1)
+        )
+        assert search_cache_key(params()) != search_cache_key(params(pageNo=2))
+
+    def test_location_only_counts_with_location_filter(self):
+        assert search_cache_key(params(), "경기도") == search_cache_key(params())
+        located = params(useLocationFilter=True)
+        assert search_cache_key(located, "경기도") != search_cache_key(
+            located, "서울특별시"
+        )
+
+
+# ---------------------------------------------------------------------------
+# MemorySearchCacheBackend
+# ---------------------------------------------------------------------------
+
+class TestMemoryBackend:
+    @pytest.mark.asyncio
+    async def test_generation_bump_invalidates(self):
+        backend = MemorySearchCacheBackend(max_entries=10)
+        await backend.set(None, "k", b"body", ttl=60, generation=0)
+        assert await backend.get(None, "k") == CacheLookup(b"body", 0)
+
+        await backend.bump(None)
+
+        assert await backend.get(None, "k") == CacheLookup(None, 1)
+
+    @pytest.mark.asyncio
+    async def test_bump_between_lookup_and_store_skips_store(self):
+        backend = MemorySearchCacheBackend(max_entries=10)
+        lookup = await backend.get(None, "k")
+        await backend.bump(None)  # 검색 도중 동기화 완료
+
+        await backend.set(None, "k", b"stale", ttl=60, generation=lookup.generation)
+
+        assert (await backend.get(None, "k")).body is None
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        backend = MemorySearchCacheBackend(max_entries=10)
+        await backend.set(None, "k", b"body", ttl=0, generation=0)
+
+        assert (await backend.get(None, "k")).body is None
+        assert await backend.purge(None) == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        backend = MemorySearchCacheBackend(max_entries=2)
+        await backend.set(None, "a", b"a", ttl=60, generation=0)
+        await backend.set(None, "b", b"b", ttl=60, generation=0)
+        await backend.get(None, "a")
+        await backend.set(None, "c", b"c", ttl=60, generation=0)
+
+        assert (await backend.get(None, "a")).body == b"a"
+        assert (await backend.get(None, "b")).body is None
+
+
+# ---------------------------------------------------------------------------
+# PostgresSearchCacheBackend
+# ---------------------------------------------------------------------------
+
+class TestPostgresBackend:
+    @pytest.mark.asyncio
+    async def test_get_requires_current_generation(self):
+        db = MagicMock()
+        result = MagicMock()
+        result.one_or_none.return_value = (b"body", 3)
+        db.execute = AsyncMock(return_value=result)
+
+        assert await PostgresSearchCacheBackend().get(db, "k") == CacheLookup(
+            b"body", 3
+        )
+        sql = str(db.execute.await_args.args[0])
+        assert "FROM search_cache_generation LEFT OUTER JOIN" in sql
+        assert "search_response_cache.generation = search_cache_generation.generation" in sql
+        assert "search_response_cache.expires_at >" in sql
+
+    @pytest.mark.asyncio
+    async def test_get_miss_returns_current_generation(self):
+        db = MagicMock()
+        result = MagicMock()
+        result.one_or_none.return_value = (None, 4)
+        db.execute = AsyncMock(return_value=result)
+
+        assert await PostgresSearchCacheBackend().get(db, "k") == CacheLookup(
+            None, 4
+        )
+
+    @pytest.mark.asyncio
+    async def test_set_stores_only_if_generation_unchanged(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+        db.commit = AsyncMock()
+
+        await PostgresSearchCacheBackend().set(
+            db, "k", b"body", ttl=60, generation=3
+        )
+
+        stmt = db.execute.await_args.args[0]
+        sql = str(stmt)
+        assert "SELECT" in sql
+        assert "WHERE search_cache_generation.generation = " in sql
+        assert "ON CONFLICT (cache_key) DO UPDATE" in sql
+        assert 3 in stmt.compile().params.values()
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_bump_does_not_commit(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+        db.commit = AsyncMock()
+
+        await PostgresSearchCacheBackend().bump(db)
+
+        assert "generation + " in str(db.execute.await_args.args[0])
+        db.commit.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# SearchResponseCache
+# ---------------------------------------------------------------------------
+
+class TestSearchResponseCache:
+    @pytest.mark.asyncio
+    async def test_disabled_backend(self):
+        with patch("app.services.search_cache.settings.SEARCH_CACHE_BACKEND", ""):
+            cache = SearchResponseCache()
+            assert cache.enabled is False
+            assert await cache.get(MagicMock(), "k") == MISS
+
+    @pytest.mark.asyncio
+    async def test_read_error_is_a_miss(self):
+        backend = MagicMock()
+        backend.get = AsyncMock(side_effect=RuntimeError("relation missing"))
+        db = MagicMock()
+        db.rollback = AsyncMock()
+
+        assert await SearchResponseCache(backend).get(db, "k") == MISS
+        db.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_set_without_lookup_generation_is_skipped(self):
+        backend = MagicMock()
+        backend.set = AsyncMock()
+
+        await SearchResponseCache(backend).set(MagicMock(), "k", b"body", None)
+
+        backend.set.assert_not_awaited()
@@ -0,0 +1,135 @@
+import csv
+import io
+import zipfile
+from xml.etree import ElementTree
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.schemas.bid import BidSearchParams
+from app.services.search_export import (
+    EXPORT_COLUMNS,
+    CsvWriter,
+    SearchExporter,
+    XlsxWriter,
+    export_values,
+)
+
+SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def params(**overrides) -> BidSearchParams:
+    data = {"inqryBgnDt": "202602010000", "inqryEndDt": "202602282359"}
+    data.update(overrides)
+    return BidSearchParams(**data)
+
+
+def sheet_rows(body: bytes) -> list:
+    with zipfile.ZipFile(io.BytesIO(body)) as archive:
+        assert "xl/workbook.xml" in archive.namelist()
+        root = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    rows = []
+    for row in root.iter(f"{SHEET_NS}row"):
+        cells = []
+        for cell in row:
+            text = cell.find(f"{SHEET_NS}is/{SHEET_NS}t")
+            value = cell.find(f"{SHEET_NS}v")
+            cells.append(
+                text.text if text is not None
+                else value.text if value is not None
+                else None
+            )
+        rows.append(cells)
+    return rows
+
+
+def render(writer, rows) -> bytes:
+    return writer.header() + writer.rows(rows) + writer.footer()
+
+
+# ---------------------------------------------------------------------------
+# writers
+# ---------------------------------------------------------------------------
+
+class TestWriters:
+    @pytest.mark.parametrize("title", ["=HYPERLINK(\"x\")", "+1", "-2", "@SUM(A1)", "\tA"])
+    def test_export_values_neutralizes_formulas(self, title):
+        values = export_values({"bidNtceNm": title, "ntceInsttNm": "조달청"})
+        assert values[2] == "'" + title
+        assert values[3] == "조달청"
+
+    def test_export_values_parses_amounts(self):
+        values = export_values({"bidNtceNo": "A", "presmptPrce": "1500000.0"})
+        fields = [field for field, _ in EXPORT_COLUMNS]
+
+        assert values[fields.index("bidNtceNo")] == "A"
+        assert values[fields.index("presmptPrce")] == 1_500_000
+        assert values[fields.index("bdgtAmt")] is None
+
+    def test_csv_has_bom_and_header(self):
+        body = render(CsvWriter(), [export_values({"bidNtceNm": "공고, \"A\""})])
+
+        assert body.startswith(b"\xef\xbb\xbf")
+        header, row = list(csv.reader(io.StringIO(body.decode("utf-8-sig"))))
+        assert header == [title for _, title in EXPORT_COLUMNS]
+        assert row[2] == '공고, "A"'
+
+    def test_xlsx_is_valid_workbook(self):
+        writer = XlsxWriter()
+        body = writer.header()
+        # 청크마다 압축된 bytes가 바로 나와야 함
+        for i in range(3):
+            body += writer.rows([
+                export_values({"bidNtceNo": f"N{i}", "bidNtceNm": "a<b>&\x0bc",
+                               "presmptPrce": "1000"})
+            ])
+        body += writer.footer()
+
+        header, *rows = sheet_rows(body)
+        assert header == [title for _, title in EXPORT_COLUMNS]
+        assert [row[0] for row in rows] == ["N0", "N1", "N2"]
+        assert rows[0][2] == "a<b>&c"
+        assert rows[0][12] == "1000"
+
+
+# ---------------------------------------------------------------------------
+# SearchExporter.stream
+# ---------------------------------------------------------------------------
+
+class TestStream:
+    @pytest.mark.asyncio
+    async def test_streams_partitions_with_enrichment(self):
+        async def partitions():
+            yield [("A", "202602101000", {"bidNtceNo": "A", "bidNtceNm": "공고A"})]
+            yield [("B", "202601051000", {"bidNtceNo": "B", "bidNtceNm": "공고B"})]
+
+        result = MagicMock()
+        result.partitions = partitions
+        db = MagicMock()
+        db.stream = AsyncMock(return_value=result)
+        enrichment = AsyncMock(side_effect=[
+            ({"A": ["경기도"]}, {"A": ["토공사업"]}, {}),
+            ({}, {}, {}),
+        ])
+
+        exporter = SearchExporter()
+        with patch(
+            "app.services.search_export.bid_data_service.get_enrichment_maps",
+            enrichment,
+        ):
+            chunks = [
+                chunk async for chunk in exporter.stream(db, params(pageNo=3), "csv")
+            ]
+
+        # header + 파티션 2개 + footer
+        assert len(chunks) == 4
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8-sig"))))
+        assert [row[0] for row in rows[1:]] == ["A", "B"]
+        assert rows[1][17:19] == ["경기도", "토공사업"]
+        assert enrichment.await_args_list[0].args[1:] == (["A"], {"202602"})
+
+        query = db.stream.await_args.args[0]
+        sql = str(query)
+        assert "OFFSET" not in sql
+        assert query.get_execution_options()["yield_per"] == exporter.CHUNK_SIZE
+        assert query.compile().params["param_1"] == exporter.MAX_ROWS
@@ -0,0 +1,110 @@
+from datetime import datetime
+
+from app.services.sync_cadence import AdaptiveSyncCadence
+
+
+# 2026-02-09 is a Monday
+MONDAY_09 = datetime(2026, 2, 9, 9, 5)
+MONDAY_03 = datetime(2026, 2, 9, 3, 5)
+
+
+def _history(busy_hour: int = 9, busy: int = 120, quiet: int = 2) -> list:
+    rows = []
+    for day in ("20260202", "20260209"):
+        for hour in range(24):
+            count = busy if hour == busy_hour else quiet
+            rows.append((f"{day}{hour:02d}00", count))
+    return rows
+
+
+class TestArrivalRates:
+    def test_no_history_uses_defaults(self):
+        cadence = AdaptiveSyncCadence(daily_budget=10_000)
+        plan = cadence.plan(MONDAY_09)
+        assert plan.busy_factor == 1.0
+        assert plan.interval == AdaptiveSyncCadence.BASE_INTERVAL
+        assert plan.window_hours == 3
+
+    def test_ewma_weights_recent_weeks(self):
+        cadence = AdaptiveSyncCadence(daily_budget=10_000)
+        cadence.load([("202602020900", 100), ("202602090900", 0)])
+        rate = cadence.expected_rate(MONDAY_09)
+        assert rate == 100 * (1 - AdaptiveSyncCadence.EWMA_ALPHA)
+
+    def test_invalid_timestamp_ignored(self):
+        cadence = AdaptiveSyncCadence(daily_budget=10_000)
+        cadence.observe("garbage", 10)
+        assert cadence.expected_rate(MONDAY_09) is None
+
+
+class TestPlan:
+    def test_busy_slot_shortens_interval_and_window(self):
+        cadence = AdaptiveSyncCadence(daily_budget=10_000)
+        cadence.load(_history())
+        plan = cadence.plan(MONDAY_09)
+        assert plan.busy_factor > AdaptiveSyncCadence.BUSY_FACTOR
+        assert plan.interval == AdaptiveSyncCadence.MIN_INTERVAL
+        assert plan.window_hours == AdaptiveSyncCadence.MIN_WINDOW_HOURS
+
+    def test_quiet_slot_backs_off(self):
+        cadence = AdaptiveSyncCadence(daily_budget=10_000)
+        cadence.load(_history())
+        plan = cadence.plan(MONDAY_03)
+        assert plan.interval == AdaptiveSyncCadence.MAX_INTERVAL
+        # 3시간 주기 + 2시간 오버랩 → 공백 없이 커버
+        assert plan.window_hours == 5
+
+    def test_budget_stretches_interval(self):
+        cadence = AdaptiveSyncCadence(daily_budget=100)
+        cadence.load(_history())
+        cadence.record_calls(90, MONDAY_09, windows=2)
+        plan = cadence.plan(MONDAY_09)
+        assert plan.interval > AdaptiveSyncCadence.MIN_INTERVAL
+
+    def test_exhausted_budget_waits_until_midnight(self):
+        cadence = AdaptiveSyncCadence(daily_budget=10)
+        cadence.record_calls(10, MONDAY_09)
+        plan = cadence.plan(MONDAY_09)
+        assert plan.interval > 14 * 3600
+        assert cadence.remaining_budget(MONDAY_09) == 0
+
+    def test_budget_resets_next_day(self):
+        cadence = AdaptiveSyncCadence(daily_budget=10)
+        cadence.record_calls(10, MONDAY_09)
+        tuesday = datetime(2026, 2, 10, 0, 1)
+        assert cadence.remaining_budget(tuesday) == 10
+
+    def test_budget_stretched_interval_keeps_window_contiguous(self):
+        """예산으로 주기가 늘어나도 윈도우가 주기 + 오버랩을 덮음 (공백 없음)"""
+        cadence = AdaptiveSyncCadence(daily_budget=100)
+        cadence.load(_history())
+        cadence.record_calls(90, MONDAY_09, windows=2)
+        plan = cadence.plan(MONDAY_09)
+        assert plan.interval > AdaptiveSyncCadence.MIN_INTERVAL
+        # 바쁜 시간대 오버랩 1시간
+        assert plan.window_hours * 3600 >= plan.interval + 3600
+
+    def test_exhausted_budget_covers_until_next_cycle(self):
+        cadence = AdaptiveSyncCadence(daily_budget=10)
+        cadence.record_calls(10, MONDAY_09)
+        plan = cadence.plan(MONDAY_09)
+        # 자정 이후 첫 사이클이 오늘 남은 시간을 모두 재조회
+        assert plan.window_hours * 3600 >= plan.interval
+
+
+class TestPersistedUsage:
+    def test_load_usage_restores_budget_after_restart(self):
+        restarted = AdaptiveSyncCadence(daily_budget=100)
+        restarted.load_usage(MONDAY_09, 70)
+        assert restarted.remaining_budget(MONDAY_09) == 30
+
+    def test_load_usage_never_lowers_local_count(self):
+        cadence = AdaptiveSyncCadence(daily_budget=100)
+        cadence.record_calls(40, MONDAY_09)
+        cadence.load_usage(MONDAY_09, 25)
+        assert cadence.remaining_budget(MONDAY_09) == 60
+
+    def test_previous_day_usage_does_not_carry_over(self):
+        cadence = AdaptiveSyncCadence(daily_budget=100)
+        cadence.load_usage(MONDAY_09, 100)
+        assert cadence.remaining_budget(datetime(2026, 2, 10, 0, 1)) == 100
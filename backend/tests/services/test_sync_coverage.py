@@ -0,0 +1,101 @@
+from datetime import datetime, timezone
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.sync_coverage import SyncCoverageIndex, from_minute, to_minute
+
+SYNCED_AT = datetime(2026, 2, 15, tzinfo=timezone.utc)
+
+
+def make_index(*days: str) -> SyncCoverageIndex:
+    index = SyncCoverageIndex()
+    index.load([(d + "0000", d + "2359", SYNCED_AT) for d in days])
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Minute ordinals
+# ---------------------------------------------------------------------------
+
+class TestMinuteOrdinal:
+    def test_round_trip(self):
+        assert from_minute(to_minute("202602111305")) == "202602111305"
+
+    def test_day_is_1440_minutes(self):
+        assert to_minute("202602120000") - to_minute("202602110000") == 1440
+
+
+# ---------------------------------------------------------------------------
+# Interval set
+# ---------------------------------------------------------------------------
+
+class TestCoverage:
+    def test_adjacent_days_merge(self):
+        index = make_index("20260210", "20260212", "20260211")
+        assert index._starts == [to_minute("202602100000")]
+        assert index.is_covered("202602100000", "202602122359")
+
+    def test_partial_range_not_covered(self):
+        index = make_index("20260210", "20260212")
+        assert index.is_covered("202602100000", "202602102359")
+        assert not index.is_covered("202602100000", "202602122359")
+        assert not index.is_covered("202602090000", "202602092359")
+
+    def test_hourly_windows_not_counted_as_coverage(self):
+        index = SyncCoverageIndex()
+        index.load([("202602101300", "202602101359", SYNCED_AT)])
+        assert not index.is_covered("202602101300", "202602101359")
+        assert index.entry("202602101300") == ("202602101359", SYNCED_AT)
+
+    def test_daily_window_keeps_midnight_hourly_entry(self):
+        index = SyncCoverageIndex()
+        index.load([
+            ("202602100000", "202602100059", SYNCED_AT),
+            ("202602100000", "202602102359", SYNCED_AT),
+        ])
+        assert index.is_covered("202602100000", "202602102359")
+        assert index.entry("202602100000") == ("202602100059", SYNCED_AT)
+
+    def test_gaps(self):
+        index = make_index("20260210", "20260213")
+        assert index.gaps("202602090000", "202602142359") == [
+            ("202602090000", "202602092359"),
+            ("202602110000", "202602122359"),
+            ("202602140000", "202602142359"),
+        ]
+
+    def test_missing_days(self):
+        index = make_index("20260210", "20260213")
+        assert index.missing_days("20260210", "20260214") == [
+            "20260211", "20260212", "20260214",
+        ]
+
+    def test_record_updates_coverage(self):
+        index = make_index("20260210")
+        index.record("202602110000", "202602112359")
+        assert index.is_covered("202602100000", "202602112359")
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+class TestEnsureLoaded:
+    @pytest.mark.asyncio
+    async def test_loads_once_until_reload_interval(self):
+        result = MagicMock()
+        result.all.return_value = [("202602100000", "202602102359", SYNCED_AT)]
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+
+        index = SyncCoverageIndex()
+        await index.ensure_loaded(db)
+        await index.ensure_loaded(db)
+
+        db.execute.assert_awaited_once()
+        assert index.is_covered("202602100000", "202602102359")
+
+        index.invalidate()
+        await index.ensure_loaded(db)
+        assert db.execute.await_count == 2
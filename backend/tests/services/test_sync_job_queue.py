@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.sync_job_queue import KST, SyncJobQueue
+
+NOW = datetime(2026, 2, 12, 9, 0, tzinfo=KST)
+
+
+@pytest.fixture
+def db():
+    result = MagicMock()
+    result.scalar_one.return_value = 1
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+    return db
+
+
+async def enqueue(db, window_start, window_end):
+    with patch("app.services.sync_job_queue.datetime") as dt:
+        dt.now.return_value = NOW
+        return await SyncJobQueue().enqueue(db, window_start, window_end)
+
+
+# ---------------------------------------------------------------------------
+# 일별 윈도우 제한
+# ---------------------------------------------------------------------------
+
+class TestEnqueueWindow:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("day", ["20260212", "20260213"])
+    async def test_daily_window_for_today_or_later_is_rejected(self, db, day):
+        with pytest.raises(ValueError):
+            await enqueue(db, day + "0000", day + "2359")
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_past_daily_window_is_enqueued(self, db):
+        yesterday = (NOW - timedelta(days=1)).strftime("%Y%m%d")
+        assert await enqueue(db, yesterday + "0000", yesterday + "2359") == 1
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_todays_hourly_window_is_enqueued(self, db):
+        assert await enqueue(db, "202602120800", "202602120859") == 1
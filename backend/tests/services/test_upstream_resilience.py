@@ -0,0 +1,304 @@
+import asyncio
+import random
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.services.upstream_resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitOpenError,
+    RetryPolicy,
+    UpstreamGuard,
+    UpstreamQuotaExceeded,
+    UpstreamRejected,
+    UpstreamThrottled,
+    UpstreamUnavailable,
+    check_response,
+    parse_retry_after,
+)
+from tests.conftest import make_error_response, make_success_response
+
+ENDPOINT = "getBidPblancListInfoPrtcptPsblRgn"
+REQUEST = httpx.Request("GET", f"https://apis.data.go.kr/{ENDPOINT}")
+
+
+def response(status_code=200, json=None, headers=None) -> httpx.Response:
+    return httpx.Response(
+        status_code, json=json, headers=headers, request=REQUEST
+    )
+
+
+OK = response(json=make_success_response([{"bidNtceNo": "R1"}]))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def guard(clock):
+    guard = UpstreamGuard(clock=clock, rng=random.Random(0))
+    guard._sleep = AsyncMock()
+    return guard
+
+
+def sender(*responses):
+    return AsyncMock(side_effect=list(responses))
+
+
+# ---------------------------------------------------------------------------
+# 응답 분류
+# ---------------------------------------------------------------------------
+
+class TestCheckResponse:
+    @pytest.mark.parametrize("code", ["00", "03"])
+    def test_normal_and_nodata_pass(self, code):
+        assert check_response(ENDPOINT, response(json=make_error_response(code))) is None
+
+    def test_404_passes(self):
+        assert check_response(ENDPOINT, response(404)) is None
+
+    def test_429_with_retry_after(self):
+        error = check_response(
+            ENDPOINT, response(429, headers={"Retry-After": "12"})
+        )
+        assert isinstance(error, UpstreamThrottled)
+        assert error.retry_after == 12
+
+    def test_quota_result_code(self):
+        error = check_response(ENDPOINT, response(json=make_error_response("22")))
+        assert isinstance(error, UpstreamQuotaExceeded)
+
+    def test_quota_in_portal_xml_error(self):
+        body = (
+            "<OpenAPI_ServiceResponse><cmmMsgHeader>"
+            "<returnReasonCode>22</returnReasonCode>"
+            "</cmmMsgHeader></OpenAPI_ServiceResponse>"
+        )
+        xml = httpx.Response(200, text=body, request=REQUEST)
+        assert isinstance(check_response(ENDPOINT, xml), UpstreamQuotaExceeded)
+
+    @pytest.mark.parametrize("code", ["01", "02", "04", "05", "99"])
+    def test_transient_result_codes(self, code):
+        error = check_response(ENDPOINT, response(json=make_error_response(code)))
+        assert isinstance(error, UpstreamUnavailable)
+
+    @pytest.mark.parametrize("code", ["10", "12", "30", "32"])
+    def test_permanent_result_codes(self, code):
+        error = check_response(ENDPOINT, response(json=make_error_response(code)))
+        assert isinstance(error, UpstreamRejected)
+
+    def test_5xx_and_other_4xx(self):
+        assert isinstance(check_response(ENDPOINT, response(503)), UpstreamUnavailable)
+        assert isinstance(check_response(ENDPOINT, response(400)), UpstreamRejected)
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("30") == 30.0
+
+    def test_http_date(self):
+        now = datetime(2026, 3, 1, 0, 0, tzinfo=timezone.utc)
+        assert parse_retry_after("Sun, 01 Mar 2026 00:01:30 GMT", now) == 90.0
+
+    def test_past_date_is_zero(self):
+        now = datetime(2026, 3, 1, 0, 0, tzinfo=timezone.utc)
+        assert parse_retry_after("Sat, 28 Feb 2026 23:00:00 GMT", now) == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value):
+        assert parse_retry_after(value) is None
+
+
+# ---------------------------------------------------------------------------
+# 재시도
+# ---------------------------------------------------------------------------
+
+class TestRetry:
+    @pytest.mark.asyncio
+    async def test_transient_error_then_success(self, guard):
+        send = sender(response(503), response(json=make_error_response("99")), OK)
+        assert await guard.call(ENDPOINT, send) is OK
+        assert send.await_count == 3
+        assert guard.breaker(ENDPOINT).failures == 0
+
+    @pytest.mark.asyncio
+    async def test_backoff_is_jittered_and_bounded(self, guard):
+        send = sender(response(503), response(503), response(503))
+        with pytest.raises(UpstreamUnavailable):
+            await guard.call(ENDPOINT, send)
+
+        delays = [c.args[0] for c in guard._sleep.await_args_list]
+        assert len(delays) == 2
+        assert 0 <= delays[0] <= 1.0 and 0 <= delays[1] <= 2.0
+
+    @pytest.mark.asyncio
+    async def test_transport_error_is_retried(self, guard):
+        send = sender(httpx.ConnectTimeout("timeout"), OK)
+        assert await guard.call(ENDPOINT, send) is OK
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honoured(self, guard):
+        send = sender(response(429, headers={"Retry-After": "5"}), OK)
+        assert await guard.call(ENDPOINT, send) is OK
+        guard._sleep.assert_awaited_once_with(5.0)
+
+    @pytest.mark.asyncio
+    async def test_long_retry_after_opens_circuit(self, guard):
+        send = sender(response(429, headers={"Retry-After": "120"}))
+        with pytest.raises(UpstreamThrottled):
+            await guard.call(ENDPOINT, send)
+
+        guard._sleep.assert_not_awaited()
+        assert guard.breaker(ENDPOINT).state == OPEN
+        assert guard.paused_for([ENDPOINT]) == 120
+
+    @pytest.mark.asyncio
+    async def test_permanent_error_is_not_retried(self, guard):
+        send = sender(response(json=make_error_response("30")))
+        with pytest.raises(UpstreamRejected):
+            await guard.call(ENDPOINT, send)
+        assert send.await_count == 1
+        assert guard.breaker(ENDPOINT).state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_quota_opens_circuit_without_retry(self, guard):
+        send = sender(response(json=make_error_response("22")))
+        with pytest.raises(UpstreamQuotaExceeded) as exc:
+            await guard.call(ENDPOINT, send)
+
+        assert send.await_count == 1
+        assert exc.value.retry_after == guard.QUOTA_COOLDOWN_SECONDS
+        assert guard.paused_for([ENDPOINT, "other"]) == guard.QUOTA_COOLDOWN_SECONDS
+
+    def test_backoff_ceiling_doubles_up_to_max(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=3.0)
+        top = random.Random()
+        top.uniform = lambda low, high: high
+        assert [policy.backoff(n, None, top) for n in (1, 2, 3, 4)] == [1, 2, 3, 3]
+
+
+# ---------------------------------------------------------------------------
+# 서킷 브레이커
+# ---------------------------------------------------------------------------
+
+class TestCircuitBreaker:
+    async def _fail_until_open(self, guard):
+        failing = AsyncMock(return_value=response(503))
+        while guard.breaker(ENDPOINT).state != OPEN:
+            # 재시도 도중 서킷이 열리면 남은 시도는 CircuitOpenError
+            with pytest.raises((UpstreamUnavailable, CircuitOpenError)):
+                await guard.call(ENDPOINT, failing)
+        return failing
+
+    @pytest.mark.asyncio
+    async def test_opens_after_consecutive_failures(self, guard):
+        failing = await self._fail_until_open(guard)
+        assert failing.await_count == guard.FAILURE_THRESHOLD
+
+        send = sender(OK)
+        with pytest.raises(CircuitOpenError) as exc:
+            await guard.call(ENDPOINT, send)
+        send.assert_not_awaited()
+        assert exc.value.retry_after == guard.COOLDOWN_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_other_endpoints_unaffected(self, guard):
+        await self._fail_until_open(guard)
+        assert await guard.call("getOtherOperation", sender(OK)) is OK
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_success_closes(self, guard, clock):
+        await self._fail_until_open(guard)
+        clock.now += guard.COOLDOWN_SECONDS
+
+        assert await guard.call(ENDPOINT, sender(OK)) is OK
+        assert guard.breaker(ENDPOINT).state == CLOSED
+        assert guard.paused_for([ENDPOINT]) == 0
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_failure_reopens(self, guard, clock):
+        await self._fail_until_open(guard)
+        clock.now += guard.COOLDOWN_SECONDS
+
+        send = sender(response(503))
+        with pytest.raises(CircuitOpenError):
+            await guard.call(ENDPOINT, send)
+        # 시험 호출은 한 번만
+        assert send.await_count == 1
+        assert guard.breaker(ENDPOINT).state == OPEN
+
+    def test_concurrent_half_open_calls_wait_for_probe(self, clock):
+        guard = UpstreamGuard(clock=clock)
+        breaker = guard.breaker(ENDPOINT)
+        breaker.open(10)
+        clock.now += 10
+
+        breaker.before_call()
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_reopens_circuit(self, guard, clock):
+        await self._fail_until_open(guard)
+        clock.now += guard.COOLDOWN_SECONDS
+
+        with pytest.raises(asyncio.CancelledError):
+            await guard.call(ENDPOINT, sender(asyncio.CancelledError()))
+
+        breaker = guard.breaker(ENDPOINT)
+        assert breaker.state == OPEN
+        assert guard.paused_for([ENDPOINT]) == guard.COOLDOWN_SECONDS
+
+        # 대기 후 다음 시험 호출은 다시 허용
+        clock.now += guard.COOLDOWN_SECONDS
+        assert await guard.call(ENDPOINT, sender(OK)) is OK
+        assert breaker.state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_unexpected_probe_error_reopens_circuit(self, guard, clock):
+        await self._fail_until_open(guard)
+        clock.now += guard.COOLDOWN_SECONDS
+
+        with pytest.raises(httpx.DecodingError):
+            await guard.call(ENDPOINT, sender(httpx.DecodingError("bad gzip")))
+
+        assert guard.breaker(ENDPOINT).state == OPEN
+        assert guard.paused_for([ENDPOINT]) == guard.COOLDOWN_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_cancellation_in_closed_state_is_not_a_failure(self, guard):
+        for _ in range(guard.FAILURE_THRESHOLD + 1):
+            with pytest.raises(asyncio.CancelledError):
+                await guard.call(ENDPOINT, sender(asyncio.CancelledError()))
+
+        breaker = guard.breaker(ENDPOINT)
+        assert breaker.state == CLOSED
+        assert breaker.failures == 0
+        assert await guard.call(ENDPOINT, sender(OK)) is OK
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_in_closed_state_is_not_counted(self, guard):
+        with pytest.raises(KeyError):
+            await guard.call(ENDPOINT, sender(KeyError("bug")))
+        assert guard.breaker(ENDPOINT).failures == 0
+
+    @pytest.mark.asyncio
+    async def test_decoding_error_counts_as_failure(self, guard):
+        with pytest.raises(httpx.DecodingError):
+            await guard.call(ENDPOINT, sender(httpx.DecodingError("bad gzip")))
+        assert guard.breaker(ENDPOINT).failures == 1
@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.schemas.bid import WinProbabilityRequest
+from app.services.win_probability import (
+    CompetitorModel,
+    WinProbabilityError,
+    WinProbabilityService,
+    simulate_lower_limits,
+    win_probability_curve,
+)
+
+BASIS = 1_000_000_000
+
+
+def model(ratios, counts=(5,), weights=(1.0,)) -> CompetitorModel:
+    return CompetitorModel(
+        ratios=np.sort(np.array(ratios, dtype=np.float64)),
+        bidder_counts=np.array(counts),
+        bidder_weights=np.array(weights),
+        notices=len(counts),
+        bids=len(ratios),
+    )
+
+
+def result(rows=None, scalar=None):
+    mock = MagicMock()
+    mock.all.return_value = rows or []
+    mock.scalar_one_or_none.return_value = scalar
+    return mock
+
+
+# ---------------------------------------------------------------------------
+# simulate_lower_limits
+# ---------------------------------------------------------------------------
+
+class TestSimulateLowerLimits:
+    def test_planned_price_stays_in_range(self):
+        rng = np.random.default_rng(1)
+        limits = simulate_lower_limits(BASIS, 0, 100.0, -3.0, 3.0, 20_000, rng)
+
+        assert limits.min() >= BASIS * 0.97
+        assert limits.max() <= BASIS * 1.03
+        # 대칭 범위 → 예정가격 평균은 기초금액
+        assert limits.mean() == pytest.approx(BASIS, rel=1e-3)
+        # 4개 평균이라 양 끝보다 중앙에 몰림
+        assert np.mean(np.abs(limits / BASIS - 1) < 0.01) > 0.5
+
+    def test_lower_limit_formula(self):
+        rng = np.random.default_rng(1)
+        limits = simulate_lower_limits(BASIS, 20_000_000, 87.745, 0.0, 1e-9, 10, rng)
+
+        expected = np.ceil((BASIS - 20_000_000) * 87.745 / 100 + 20_000_000)
+        assert np.allclose(limits, expected, atol=1)
+
+
+# ---------------------------------------------------------------------------
+# win_probability_curve
+# ---------------------------------------------------------------------------
+
+class TestWinProbabilityCurve:
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(7)
+        competitors = model(
+            rng.normal(0.88, 0.01, 500), counts=(1, 4, 9), weights=(0.2, 0.5, 0.3)
+        )
+        limits = simulate_lower_limits(BASIS, 0, 87.745, -3.0, 3.0, 2_000, rng)
+        prices = np.linspace(limits.min() - 1e6, limits.max() * 1.01, 25)
+
+        curve = win_probability_curve(limits, prices, BASIS, competitors)
+
+        f = lambda x: np.searchsorted(competitors.ratios, x / BASIS) / 500
+        expected = []
+        for price in prices:
+            survive = 1 - f(price) + f(limits)
+            win = sum(w * survive ** n for n, w in zip((1, 4, 9), (0.2, 0.5, 0.3)))
+            expected.append(np.where(limits <= price, win, 0).mean())
+        assert np.allclose(curve, expected)
+        assert curve[0] == 0
+
+    def test_without_competitors_is_qualification_rate(self):
+        rng = np.random.default_rng(3)
+        limits = simulate_lower_limits(BASIS, 0, 87.745, -3.0, 3.0, 5_000, rng)
+        prices = np.array([np.median(limits)])
+
+        curve = win_probability_curve(
+            limits, prices, BASIS, model([0.88]).with_competitors(0)
+        )
+
+        assert curve[0] == pytest.approx(np.mean(limits <= prices[0]))
+
+
+# ---------------------------------------------------------------------------
+# WinProbabilityService
+# ---------------------------------------------------------------------------
+
+class TestWinProbabilityService:
+    @pytest.mark.asyncio
+    async def test_simulate_uses_bucket_history(self):
+        basis = {
+            "bssamt": "1000000000", "sftyMngcst": "10000000",
+            "rsrvtnPrceRngBgnRate": "-2", "rsrvtnPrceRngEndRate": "+2",
+        }
+        samples = [(f"H{i}", BASIS, 3) for i in range(30)]
+        opening = [
+            (f"H{i}", [{"bidprcAmt": str(int(BASIS * (0.87 + i * 0.001)))}])
+            for i in range(30)
+        ]
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            result(scalar={"mainCnsttyNm": "토목", "sucsfbidLwltRate": "87.745"}),
+            result([("cnstwk", basis)]),
+            result([("A", "경기도")]),
+            result([]),
+            result(samples),
+            result(opening),
+        ])
+
+        response = await WinProbabilityService().simulate(
+            db, "A", WinProbabilityRequest(simulations=5_000, points=20, seed=1)
+        )
+
+        assert response.aValue == 10_000_000
+        assert (response.rangeBgnRate, response.rangeEndRate) == (-2.0, 2.0)
+        assert response.historyNotices == 30
+        assert len(response.points) == 20
+        assert 0 < response.bestProbability <= 1
+        assert response.bestProbability == max(p.winProbability for p in response.points)
+        bucket_sql = str(db.execute.await_args_list[4].args[0])
+        assert "assessment_rate_samples.region_scope" in bucket_sql
+
+    @pytest.mark.asyncio
+    async def test_missing_basis_amount(self):
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[result(scalar=None), result([])])
+
+        with pytest.raises(WinProbabilityError):
+            await WinProbabilityService().simulate(db, "A", WinProbabilityRequest())